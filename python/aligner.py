@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: 按行对齐Text2Page0与DocxStdTxt。以DocxStdTxt的行为准，对两份文本的行序列做带状动态规划，
+       每一步可以是匹配、合并(Text两行对应Docx一行)、拆分(Text一行对应Docx两行)、
+       重排(Text两行对应Docx两行，按Docx字数重新断行)、补入(Text缺行，取Docx)以及多余(Text多出一行)
+@time: 2026/10/18
+"""
+
+
+class LineAligner(object):
+    """ 带状动态规划的行对齐，复杂度为O(行数×带宽)"""
+    INSERT_COST = 0.8  # 补入Docx一行
+    DELETE_COST = 1.0  # Text多出一行
+    OP_COST = 0.1  # 合并、拆分的额外代价，使其劣于同等相似度的匹配
+    SHIFT_COST = 0.05  # 重排的额外代价
+    BEAM = 1.5  # 剪枝阈值
+
+    def __init__(self, similar, qzw='', band=2):
+        self.similar = similar  # similar(t1, t2)返回两行的相似度，介于0与1之间
+        self.qzw = qzw  # 千字文，Docx行末的千字文编号可能在Text中缺失
+        self.band = band
+
+    @staticmethod
+    def is_sure(si, t1, t2):
+        """ 与is_similar(t1, t2, False)的阈值相同"""
+        return si >= 0.6 or (max(len(t1), len(t2)) <= 4 and si >= 0.5)
+
+    def get_similar(self, t1, t2):
+        if not t1 and not t2:
+            return 1.0
+        if not t1 or not t2:
+            return 0.0
+        return self.similar(t1, t2)
+
+    def match(self, t, d):
+        """ Text一行与Docx一行的匹配，返回(代价, 输出, 操作)"""
+        si = self.get_similar(t, d)
+        if d and d[-1] in self.qzw and len(t) == len(d) - 1:
+            si2 = self.get_similar(t, d[:-1])
+            if si2 > si:
+                return 1 - si2, [t + d[-1]], 'qzw'
+        return 1 - si, [t], 'match'
+
+    def align(self, txts_t, txts_d):
+        """ 返回对齐路径[(操作, Text行号, Docx行号, 输出)]"""
+        # 首尾完全相同的行直接匹配，只对中间部分做动态规划
+        s, m, n = 0, len(txts_t), len(txts_d)
+        while s < min(m, n) and txts_t[s] == txts_d[s]:
+            s += 1
+        e = 0
+        while e < min(m, n) - s and txts_t[m - 1 - e] == txts_d[n - 1 - e]:
+            e += 1
+        head = [('match', i, i, [txts_t[i]]) for i in range(s)]
+        tail = [('match', m - e + i, n - e + i, [txts_t[m - e + i]]) for i in range(e)]
+        steps = self.align_dp(txts_t[s:m - e], txts_d[s:n - e])
+        return head + [(op, i + s, j + s, out) for op, i, j, out in steps] + tail
+
+    def align_dp(self, txts_t, txts_d):
+        m, n = len(txts_t), len(txts_d)
+        lo, hi = min(0, m - n) - self.band, max(0, m - n) + self.band  # i - j的范围
+        inf = float('inf')
+        cost, back = {(0, 0): 0.0}, dict()
+
+        def relax(i, j, c, prev, op, out):
+            if c < cost.get((i, j), inf):
+                cost[(i, j)] = c
+                back[(i, j)] = (prev, op, out)
+
+        for i in range(m + 1):
+            cols = range(max(0, i - hi), min(n, i - lo) + 1)
+            row = [cost[(i, j)] for j in cols if (i, j) in cost]
+            # 剪去同一行中代价明显偏高的状态，末行须补入至Docx末尾，不剪枝
+            limit = min(row) + self.BEAM if row and i < m else inf
+            for j in cols:
+                c0 = cost.get((i, j))
+                if c0 is None or c0 > limit:
+                    continue
+                t1, d1 = txts_t[i] if i < m else None, txts_d[j] if j < n else None
+                t2, d2 = txts_t[i + 1] if i + 1 < m else None, txts_d[j + 1] if j + 1 < n else None
+                if d1 is not None:
+                    relax(i, j + 1, c0 + self.INSERT_COST, (i, j), 'insert', [d1])
+                if t1 is not None:
+                    relax(i + 1, j, c0 + self.DELETE_COST, (i, j), 'delete', [t1])
+                if t1 is None or d1 is None:
+                    continue
+                c, out, op = self.match(t1, d1)
+                relax(i + 1, j + 1, c0 + c, (i, j), op, out)
+                if c == 0:  # 完全相同时不必再尝试合并、拆分
+                    continue
+                if t2 is not None and len(t1) < len(d1):
+                    t12 = t1 + t2
+                    relax(i + 2, j + 1, c0 + 1 - self.get_similar(t12, d1) + self.OP_COST, (i, j), 'merge', [t12])
+                if t2 is not None and d2 is not None and len(t1) != len(d1):
+                    t12 = t1 + t2
+                    si = self.get_similar(t12, d1 + d2)
+                    out = [t12[:len(d1)], t12[len(d1):]]
+                    relax(i + 2, j + 2, c0 + 2 * (1 - si) + self.SHIFT_COST, (i, j), 'shift', out)
+                if d2 is not None and len(t1) > len(d1):
+                    si = self.get_similar(t1, d1 + d2)
+                    relax(i + 1, j + 2, c0 + 2 * (1 - si) + self.OP_COST, (i, j), 'split', [t1[:len(d1)], t1[len(d1):]])
+
+        steps, key = [], (m, n)
+        while key in back:
+            prev, op, out = back[key]
+            steps.append((op, prev[0], prev[1], out))
+            key = prev
+        return steps[::-1]
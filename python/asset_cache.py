@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: 字典的预编译缓存。字典解析后以pickle存于assets/.cache下，以源文件的修改时间、大小及摘要为键，
+       源文件未改动时直接读取缓存；同一进程内只读取一次，fork出的子进程沿用主进程已加载的结果。
+       loaded为进程内的字典登记表，get_cached不检查源文件，load_cached检查源文件是否改动，invalidate使之失效
+@time: 2026/10/18
+"""
+import os
+import pickle
+import hashlib
+import tempfile
+import os.path as path
+
+CACHE_VERSION = 3  # 解析函数改动时递增，使旧缓存失效
+CACHE_KEYS = {'version', 'mtime', 'size', 'digest', 'value'}
+loaded = dict()  # (源文件, 解析函数名) -> (修改时间, 大小, 结果)
+
+
+def get_cached(fn, parse, deps=()):
+    """ 同load_cached，已加载时不再检查源文件是否改动"""
+    memo = loaded.get((fn, parse.__name__))
+    return memo[2] if memo else load_cached(fn, parse, deps)
+
+
+def invalidate(fn=None):
+    """ 使fn(为None时全部)已加载的结果失效，下次使用时重新加载"""
+    for key in [key for key in loaded if fn is None or key[0] == fn]:
+        del loaded[key]
+
+
+def load_cached(fn, parse, deps=()):
+    """ 返回parse(fn)的结果，结果为只读，不可修改。deps为parse另外读取的源文件，其改动同样使缓存失效"""
+    files = [fn] + list(deps)
+    sts = [os.stat(f) for f in files]
+    mtime, size = tuple(st.st_mtime_ns for st in sts), tuple(st.st_size for st in sts)
+    key = (fn, parse.__name__)
+    memo = loaded.get(key)
+    if memo and memo[:2] == (mtime, size):
+        return memo[2]
+    cache_file = path.join(path.dirname(fn), '.cache', '%s.%s.pkl' % (path.basename(fn), parse.__name__))
+    data = read_cache(cache_file)
+    if data and data['version'] != CACHE_VERSION:
+        data = None
+    if data and (data['mtime'], data['size']) != (mtime, size):
+        # 修改时间不同而内容相同时(如重新检出)，仍可沿用缓存
+        if data['digest'] == get_digest(*files):
+            data.update(mtime=mtime, size=size)
+            write_cache(cache_file, data)
+        else:
+            data = None
+    if data is None:
+        data = dict(version=CACHE_VERSION, mtime=mtime, size=size, digest=get_digest(*files),
+                    value=pack(parse(fn)))
+        write_cache(cache_file, data)
+    value = unpack(data['value'])
+    loaded[key] = (mtime, size, value)
+    return value
+
+
+def pack(value):
+    """ 单字对单字的字典存为两个等长的字符串，读取时比逐项反序列化快得多"""
+    if isinstance(value, dict) and all(len(k) == 1 and isinstance(v, str) and len(v) == 1 for k, v in value.items()):
+        return 'pairs', ''.join(value), ''.join(value.values())
+    return 'raw', value
+
+
+def unpack(packed):
+    if packed[0] == 'pairs':
+        return dict(zip(packed[1], packed[2]))
+    return packed[1]
+
+
+def get_digest(*files):
+    sha1 = hashlib.sha1()
+    for fn in files:
+        with open(fn, 'rb') as rf:
+            sha1.update(rf.read())
+    return sha1.hexdigest()
+
+
+def read_cache(cache_file):
+    """ 读取缓存，不存在或已损坏(如写入时中断)时返回None，由调用方重新解析"""
+    if not path.exists(cache_file):
+        return None
+    try:
+        with open(cache_file, 'rb') as rf:
+            data = pickle.load(rf)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, KeyError, ValueError):
+        return None
+    if not isinstance(data, dict) or not CACHE_KEYS <= set(data):
+        return None
+    return data
+
+
+def write_cache(cache_file, data):
+    """ 先写入本进程独有的临时文件再替换，多个进程同时写入时互不干扰"""
+    tmp_file = None
+    try:
+        os.makedirs(path.dirname(cache_file), exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=path.dirname(cache_file), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as wf:
+            pickle.dump(data, wf, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # assets目录只读时不缓存
+        tmp_file and path.exists(tmp_file) and os.remove(tmp_file)
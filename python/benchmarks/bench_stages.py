@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: GlTool各阶段及variant函数的基准，在1倍、10倍、100倍规模的模拟语料上分别计时，结果存为JSON，
+       以便比较不同版本的耗时
+@time: 2026/10/18
+"""
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import os.path as path
+from contextlib import redirect_stdout
+
+PKG_DIR = path.dirname(path.dirname(path.abspath(__file__)))
+sys.path.insert(0, PKG_DIR)
+sys.path.insert(0, path.dirname(path.abspath(__file__)))
+
+import variant  # noqa: E402
+from gl_tool import GlTool  # noqa: E402
+from gen_corpus import gen_corpus  # noqa: E402
+
+# (名称, GlTool的方法, 由语料目录得到参数的函数)，按流水线的先后执行，后一阶段使用前一阶段的结果
+STAGES = [
+    ('oritxt0_to_oritxt', 'proc_oritxt0_to_oritxt', lambda d: ()),
+    ('oritxt_to_stdtxt', 'proc_oritxt_to_stdtxt', lambda d: ()),
+    ('text2page0_to_text2page', 'proc_text2page0_to_text2page', lambda d: (None, 0, 10 ** 9)),
+    ('patch_note_label', 'patch_note_label_to_text2page', lambda d: ()),
+    ('stdtxt_vs_text2page', 'stdtxt_vs_text2page', lambda d: (None, False, 'Text2Page', path.join(d, 'vs.jsonl'))),
+    ('char_freq', 'proc_char_freq', lambda d: ('DocxStdTxt', None, None, path.join(d, 'freq.csv'))),
+    ('pipeline', 'proc_pipeline', lambda d: (None, ['DocxOriTxt', 'DocxStdTxt', 'Text2Page'])),
+]
+
+
+def timeit(func, *args):
+    start = time.perf_counter()
+    ret = func(*args)
+    return time.perf_counter() - start, ret
+
+
+def read_std_txt(data_dir):
+    """ 语料中的全部正字文本"""
+    parts = []
+    for root, dirs, files in os.walk(path.join(data_dir, 'DocxStdTxt0')):
+        for fn in sorted(files):
+            with open(path.join(root, fn), 'r') as rf:
+                parts.append(rf.read())
+    return ''.join(parts)
+
+
+def bench_variant(txt):
+    """ variant各函数的耗时，txt为全部正字文本"""
+    chars = [ch for ch in txt if ch in variant.variant_index.group_ids]
+    pairs = [(ch, variant.variant_index.get_group(ch)[-1]) for ch in chars]
+    results = []
+    for name, func, args in [
+        ('normalize', variant.normalize, (txt,)),
+        ('normalize_lines', lambda lines: list(variant.normalize_lines(lines)), (txt.splitlines(True),)),
+        ('is_variant', lambda pairs: [variant.is_variant(a, b) for a, b in pairs], (pairs,)),
+        ('is_variants', lambda pairs: [variant.is_variants(pair) for pair in pairs], (pairs,)),
+    ]:
+        seconds = timeit(func, *args)[0]
+        results.append(dict(stage='variant.' + name, seconds=seconds, calls=len(args[0])))
+    return results
+
+
+def bench_scale(scale, jobs, work_dir):
+    """ 生成scale倍规模的语料，依次计时各阶段，返回[结果]"""
+    data_dir = path.join(work_dir, 'x%s' % scale)
+    seconds, (pages, chars) = timeit(gen_corpus, data_dir, scale)
+    print('[x%s]%s pages, %s chars, generated in %.2fs' % (scale, pages, chars, seconds))
+    GlTool.DATA_DIR = data_dir
+    GlTool.stores = dict()
+    GlTool.made_dirs = set()
+    tool = GlTool(jobs)
+    results = []
+    for name, func, get_args in STAGES:
+        with redirect_stdout(io.StringIO()):  # 各阶段的提示信息不打印
+            seconds = timeit(getattr(tool, func), *get_args(data_dir))[0]
+        results.append(dict(stage=name, seconds=seconds))
+    results.extend(bench_variant(read_std_txt(data_dir)))
+    for ret in results:
+        ret.update(scale=scale, pages=pages, chars=chars)
+        print('[x%s]%-28s%10.4f' % (scale, ret['stage'], ret['seconds']))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GlTool各阶段的基准测试')
+    parser.add_argument('--scales', default='1,10,100', help='语料规模的倍数，以逗号分隔')
+    parser.add_argument('--jobs', type=int, default=1, help='并行处理的进程数')
+    parser.add_argument('--out', default='bench_stages.json', help='结果文件')
+    parser.add_argument('--keep', action='store_true', help='保留生成的语料')
+    args = parser.parse_args()
+
+    out_file = path.abspath(args.out)
+    work_dir = tempfile.mkdtemp(prefix='gl_bench_')
+    results = []
+    try:
+        GlTool().load_variant_dict()  # 字典的解析及缓存不计入各阶段
+        GlTool().load_char2unicode()
+        GlTool().load_qzw()
+        for scale in [int(s) for s in args.scales.split(',')]:
+            results.extend(bench_scale(scale, args.jobs, work_dir))
+    finally:
+        if args.keep:
+            print('corpus kept in %s' % work_dir)
+        else:
+            shutil.rmtree(work_dir)
+    report = dict(
+        time=time.strftime('%Y-%m-%d %H:%M:%S'),
+        python=platform.python_version(),
+        platform=platform.platform(),
+        jobs=args.jobs,
+        results=results,
+    )
+    with open(out_file, 'w') as wf:
+        json.dump(report, wf, ensure_ascii=False, indent=2)
+    print('results written to %s' % out_file)
+
+
+if __name__ == '__main__':
+    main()
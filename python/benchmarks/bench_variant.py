@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: variant查询的微基准，对比旧的正则扫描与VariantIndex
+@time: 2026/10/18
+"""
+import re
+import sys
+import time
+import os.path as path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+import variant  # noqa: E402
+from variant import variants, variants_str  # noqa: E402
+
+
+def old_is_variant(a, b):
+    if len(a or '') != 1 or len(b or '') != 1:
+        return False
+    m = ord(a) > 255 and re.search(r'#[^#]*%s[^#]*#' % a, variants_str)
+    return a != b and m and b in m.group(0)
+
+
+def old_normalize(txt):
+    def get_normal(ch):
+        if ord(ch) < 255:
+            return ch
+        p1 = variants_str.find(ch)
+        if p1 == -1:
+            return ch
+        p2 = variants_str.rfind('#', p1 - 100, p1)
+        if p2 == -1:
+            return ch
+        return variants_str[p2 + 1]
+
+    return ''.join([get_normal(ch) for ch in txt])
+
+
+def timeit(func, *args):
+    start = time.perf_counter()
+    ret = func(*args)
+    return time.perf_counter() - start, ret
+
+
+def bench_is_variant():
+    # 每组的规范字与组内各字配对，再加上与下一组首字的反例
+    pairs = []
+    for i, group in enumerate(variants):
+        nxt = variants[(i + 1) % len(variants)][0]
+        pairs.extend((group[0], ch) for ch in group[1:])
+        pairs.append((group[-1], nxt))
+
+    def run(func):
+        return [bool(func(a, b)) for a, b in pairs]
+
+    t1, r1 = timeit(run, old_is_variant)
+    t2, r2 = timeit(run, variant.is_variant)
+    diff = sum(1 for x, y in zip(r1, r2) if x != y)
+    return 'is_variant', len(pairs), t1, t2, diff
+
+
+def bench_normalize():
+    txt = ''.join(variants)
+
+    def run(func):
+        return func(txt)
+
+    t1, r1 = timeit(run, old_normalize)
+    t2, r2 = timeit(run, variant.normalize)
+    diff = sum(1 for x, y in zip(r1, r2) if x != y)
+    return 'normalize', len(txt), t1, t2, diff
+
+
+def main():
+    print('groups: %s' % len(variants))
+    print('%-12s%10s%12s%12s%10s%8s' % ('func', 'calls', 'old(s)', 'new(s)', 'speedup', 'diff'))
+    for func in [bench_is_variant, bench_normalize]:
+        name, n, t1, t2, diff = func()
+        print('%-12s%10s%12.4f%12.4f%9.0fx%8s' % (name, n, t1, t2, t1 / max(t2, 1e-9), diff))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: 生成模拟的高丽藏语料，目录结构与实际数据相同，供基准测试使用：
+       DocxOriTxt0/<册>/GL_<册>_<经>_<页>.txt，行首为K..V..P..a..L;，含异体字类型编号、自造字、卍字噪音及星号组合；
+       Text2Page0为对应的通字文本，含夹注小字符号<>，部分页面的行被合并或拆分；正字文本另存于DocxStdTxt0以备核对
+@time: 2026/10/18
+"""
+import os
+import sys
+import json
+import random
+import argparse
+import os.path as path
+
+ASSETS_DIR = path.join(path.dirname(path.dirname(path.abspath(__file__))), 'assets')
+PAGES_PER_VOL = 20  # 每册的页数
+VOLS = 5  # 1倍规模的册数
+
+
+def load_assets():
+    """ 取千字文、两种异体字字典及自造字表，作为生成文本的字源，返回(千字文, 字典, 各字典的前2000字, 自造字表)"""
+    with open(path.join(ASSETS_DIR, 'qzw.txt'), 'r') as rf:
+        qzw = ''.join([ln.strip() for ln in rf.readlines()])
+    dicts = []
+    for fn in ['variants1.json', 'variants2.json']:
+        with open(path.join(ASSETS_DIR, fn), 'r') as rf:
+            dicts.append(json.load(rf))
+    with open(path.join(ASSETS_DIR, 'SelfChar2Unicode.txt'), 'r') as rf:
+        self_chars = [ln.strip().split('\t') for ln in rf.readlines()[1:]]
+    self_chars = {ch1: ch2 for ch1, ch2 in self_chars if len(ch1) == 1 and ch2}
+    return qzw, dicts, [list(d)[:2000] for d in dicts], self_chars
+
+
+def gen_page(rnd, assets, vol, page):
+    """ 生成一页，返回(DocxOriTxt0的行, 正字文本的行, Text2Page0的行)"""
+    qzw, dicts, keys, self_chars = assets
+    self_keys = list(self_chars)
+    ori, std = [], []
+    for lno in range(1, rnd.randint(3, 12)):
+        body, txt = '', ''
+        for i in range(rnd.randint(5, 20)):
+            r = rnd.random()
+            if r < 0.1:
+                ch = rnd.choice(keys[0])
+                body, txt = body + ch + '1', txt + dicts[0][ch]
+            elif r < 0.14:
+                ch = rnd.choice(keys[1])
+                body, txt = body + ch + '2', txt + dicts[1][ch]
+            elif r < 0.17:
+                ch = rnd.choice(self_keys)
+                body, txt = body + ch, txt + self_chars[ch]
+            elif r < 0.19:
+                body += '*3'
+            else:
+                ch = rnd.choice(qzw)
+                body, txt = body + ch, txt + ch
+        if rnd.random() < 0.1:
+            body = '卍' + body
+        ori.append('K%04dV%03dP%04da%02dL;%s\n' % (vol, vol, page, lno, body))
+        std.append(txt)
+    text = []
+    for txt in std:
+        if len(txt) > 4 and rnd.random() < 0.3:
+            i = rnd.randint(1, len(txt) - 3)
+            txt = txt[:i] + '<' + txt[i:i + 2] + '>' + txt[i + 2:]
+        text.append(txt)
+    if len(text) > 2 and rnd.random() < 0.1:
+        text[:2] = [text[0] + text[1]]  # 两行误合为一行
+    elif len(text[-1]) > 6 and rnd.random() < 0.1:
+        k = len(text[-1]) // 2
+        text[-1:] = [text[-1][:k], text[-1][k:]]  # 一行误拆为两行
+    std = ['%02d:%s\n' % (i + 1, txt) for i, txt in enumerate(std)]
+    text = ['%02d:%s\n' % (i + 1, txt) for i, txt in enumerate(text)]
+    return ori, std, text
+
+
+def gen_corpus(data_dir, scale=1, seed=0):
+    """ 在data_dir下生成scale倍规模的语料，返回(页数, 字数)"""
+    rnd = random.Random(seed)
+    assets = load_assets()
+    pages, chars = 0, 0
+    for vol in range(1, VOLS * scale + 1):
+        for page in range(1, PAGES_PER_VOL + 1):
+            name = 'GL_%d_1_%d' % (vol, page)
+            lines = dict(zip(['DocxOriTxt0', 'DocxStdTxt0', 'Text2Page0'], gen_page(rnd, assets, vol, page)))
+            for folder, folder_lines in lines.items():
+                dst_dir = path.join(data_dir, folder, str(vol))
+                os.makedirs(dst_dir, exist_ok=True)
+                with open(path.join(dst_dir, name + '.txt'), 'w') as wf:
+                    wf.writelines(folder_lines)
+            pages += 1
+            chars += sum(len(ln) - 4 for ln in lines['DocxStdTxt0'])
+    return pages, chars
+
+
+def main():
+    parser = argparse.ArgumentParser(description='生成模拟的高丽藏语料')
+    parser.add_argument('data_dir', help='语料的输出目录')
+    parser.add_argument('--scale', type=int, default=1, help='规模倍数，1倍为%s页' % (VOLS * PAGES_PER_VOL))
+    parser.add_argument('--seed', type=int, default=0, help='随机数种子，相同种子生成的语料相同')
+    args = parser.parse_args()
+    pages, chars = gen_corpus(args.data_dir, args.scale, args.seed)
+    print('%s: %s pages, %s chars' % (args.data_dir, pages, chars))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
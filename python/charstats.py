@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: 字种及字频统计。按Unicode区对各字分类，PUA区中的字即非Unicode字
+@time: 2026/10/18
+"""
+import re
+from bisect import bisect_right
+from collections import Counter
+
+BLOCKS = [
+    (0x0000, 0x007F, 'Basic Latin'),
+    (0x0080, 0x00FF, 'Latin-1 Supplement'),
+    (0x1100, 0x11FF, 'Hangul Jamo'),
+    (0x2000, 0x206F, 'General Punctuation'),
+    (0x2460, 0x24FF, 'Enclosed Alphanumerics'),
+    (0x25A0, 0x25FF, 'Geometric Shapes'),
+    (0x2E80, 0x2EFF, 'CJK Radicals Supplement'),
+    (0x2F00, 0x2FDF, 'Kangxi Radicals'),
+    (0x2FF0, 0x2FFF, 'Ideographic Description Characters'),
+    (0x3000, 0x303F, 'CJK Symbols and Punctuation'),
+    (0x3040, 0x309F, 'Hiragana'),
+    (0x30A0, 0x30FF, 'Katakana'),
+    (0x3100, 0x312F, 'Bopomofo'),
+    (0x3130, 0x318F, 'Hangul Compatibility Jamo'),
+    (0x3190, 0x319F, 'Kanbun'),
+    (0x31C0, 0x31EF, 'CJK Strokes'),
+    (0x3200, 0x32FF, 'Enclosed CJK Letters and Months'),
+    (0x3300, 0x33FF, 'CJK Compatibility'),
+    (0x3400, 0x4DBF, 'CJK Unified Ideographs Extension A'),
+    (0x4DC0, 0x4DFF, 'Yijing Hexagram Symbols'),
+    (0x4E00, 0x9FFF, 'CJK Unified Ideographs'),
+    (0xAC00, 0xD7AF, 'Hangul Syllables'),
+    (0xE000, 0xF8FF, 'Private Use Area'),
+    (0xF900, 0xFAFF, 'CJK Compatibility Ideographs'),
+    (0xFE30, 0xFE4F, 'CJK Compatibility Forms'),
+    (0xFF00, 0xFFEF, 'Halfwidth and Fullwidth Forms'),
+    (0x11580, 0x115FF, 'Siddham'),
+    (0x20000, 0x2A6DF, 'CJK Unified Ideographs Extension B'),
+    (0x2A700, 0x2B73F, 'CJK Unified Ideographs Extension C'),
+    (0x2B740, 0x2B81F, 'CJK Unified Ideographs Extension D'),
+    (0x2B820, 0x2CEAF, 'CJK Unified Ideographs Extension E'),
+    (0x2CEB0, 0x2EBEF, 'CJK Unified Ideographs Extension F'),
+    (0x2EBF0, 0x2EE5F, 'CJK Unified Ideographs Extension I'),
+    (0x2F800, 0x2FA1F, 'CJK Compatibility Ideographs Supplement'),
+    (0x30000, 0x3134F, 'CJK Unified Ideographs Extension G'),
+    (0x31350, 0x323AF, 'CJK Unified Ideographs Extension H'),
+    (0xF0000, 0xFFFFF, 'Supplementary Private Use Area-A'),
+    (0x100000, 0x10FFFF, 'Supplementary Private Use Area-B'),
+]
+BLOCK_STARTS = [start for start, end, name in BLOCKS]
+LNO_RE = re.compile(r'(?m)^\d+:|\n')  # 行首的行号及换行符不计入统计
+
+
+def get_block(ch):
+    """ ch所在的Unicode区，不在BLOCKS中时返回Other"""
+    cp = ord(ch)
+    k = bisect_right(BLOCK_STARTS, cp) - 1
+    if k >= 0 and cp <= BLOCKS[k][1]:
+        return BLOCKS[k][2]
+    return 'Other'
+
+
+def count_chars(pages):
+    """ 统计各页的字频，pages为各页的行，逐页累加，内存只与字种数有关"""
+    counter = Counter()
+    for lines in pages:
+        counter.update(LNO_RE.sub('', ''.join(lines or [])))
+    return counter
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: DocxOriTxt0的清洗规则。正则在进程内只编译一次，可合并的规则合为一次translate或一次替换
+@time: 2026/10/18
+"""
+import re
+from collections import Counter
+
+WAN_RES = [
+    (re.compile(r'(^[卍卐]+)([^\d字音者相下]|$)'), r'\2'),  # 去掉行首连续的万字符
+    (re.compile(r'(^\d\d:)([卍卐]+)'), r'\1'),  # 去掉行首连续的万字符
+    (re.compile(r'(^|[^聲作下])([卍卐]+$)'), r'\1'),  # 去掉行尾连续的万字符
+]
+
+
+def trim_wan(txt):
+    for regex, repl in WAN_RES:
+        txt = regex.sub(repl, txt)
+    return txt
+
+
+class OriTxtCleaner(object):
+    """ 将DocxOriTxt0的行清洗为DocxOriTxt的行，hits记录各规则的命中行数"""
+    HEAD_RE = re.compile(r'^K\d+V\d+P\d+[Labcdef]\s?(\d+)L?;(.*)$')
+    SPACE_RE = re.compile(r'\s+')
+    STAR_RE = re.compile(r'\*\d')
+    DIGIT_RE = re.compile(r'^\d+|(?<=\d)\d+')  # 连续数字仅保留第一位，并去掉起首的连续数字
+    SPECIAL = '+#ㅜㅡㅋ◦ㅍ◑ㅁ,;*\'`-]()/ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'  # 特殊字符
+    FH = '&'  # 特殊符号
+    FW = '𑖡𑖦𑖾𑖭𑖦𑖽𑖝𑖪𑖟𑖿𑖨𑖧𑖪𑖺𑖠𑖰𑖭𑖝𑖿𑖪𑖯𑖧𑖦𑖮𑖯𑖭𑖝𑖿𑖪𑖯𑖧𑖭𑖮𑖯𑖎𑖯𑖨𑗜𑖜𑖰𑖎𑖯𑖧𑖝𑖟𑖿𑖧𑖞𑖯𑖌𑖼𑖪𑖨𑖘𑖰𑖪𑖨𑖘𑖰𑖪𑖨𑖪𑖨𑖝𑖰𑖭𑖯𑖮𑖯'  # 梵文
+    VALID_RE = re.compile(r'[\u3400-\uFAD9\U00020000-\U0003134A\d〇%s%s]+' % (FH, FW))
+    FONT = str.maketrans({'3': '1', '4': '2', '5': None, '6': None, '7': None})  # 字体编号转换
+
+    def __init__(self, char2unicode_table=None):
+        self.char2unicode_table = char2unicode_table or dict()
+        self.special = str.maketrans(dict.fromkeys(self.SPECIAL))
+        # 自造字替换后才可能出现空白，否则行首已去掉全部空白，无需再处理
+        self.trim_space = any(self.SPACE_RE.search(v) for v in self.char2unicode_table.values())
+        self.hits = Counter()
+
+    def clean_txt(self, txt0):
+        """ 清洗一行的正文"""
+        hits = self.hits
+        txt = txt0.translate(self.char2unicode_table)  # 0.替换自造字
+        if txt != txt0:
+            hits['char2unicode'] += 1
+        if '*' in txt:
+            txt1, txt = txt, self.STAR_RE.sub('', txt)  # 1.去掉“星号+数字”组合
+            if txt != txt1:
+                hits['star'] += 1
+        txt1, txt = txt, txt.translate(self.special)  # 2.去掉特殊字符
+        if txt != txt1:
+            hits['special'] += 1
+        txt1, txt = txt, self.DIGIT_RE.sub('', txt)  # 3.连续数字仅保留第一位、4.去掉起首的连续数字
+        if txt != txt1:
+            hits['digit'] += 1
+        if self.trim_space:
+            txt1, txt = txt, self.SPACE_RE.sub('', txt)  # 5.去掉空白
+            if txt != txt1:
+                hits['space'] += 1
+        if '卍' in txt or '卐' in txt:
+            txt1, txt = txt, trim_wan(txt)  # 6.去掉万字符
+            if txt != txt1:
+                hits['wan'] += 1
+        return txt
+
+    def clean_lines(self, lines, fname=''):
+        """ 清洗一份文件的各行，返回(DocxOriTxt的行, 是否有效)"""
+        valid = True
+        ret, lno = [], 1
+        for ln in lines:
+            ln = self.SPACE_RE.sub('', ln)
+            mt = self.HEAD_RE.match(ln)
+            if not mt:
+                valid = False
+                self.hits['e1'] += 1
+                print('[e1]%s: %s' % (fname, ln))
+                continue
+            txt = self.clean_txt(mt.group(2))
+            if txt and not self.VALID_RE.fullmatch(txt):
+                valid = False
+                self.hits['e2'] += 1
+                print('[e2]%s: %s' % (fname, ln))
+                continue
+            txt = txt.translate(self.FONT)
+            if txt:
+                ret.append('%02d:%s\n' % (lno, txt))
+                lno += 1
+        return ret, valid
+
+    def clean_file(self, fn):
+        with open(fn, 'r') as rf:
+            return self.clean_lines(rf, fn.rsplit('/', 1)[1])
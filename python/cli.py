@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: 命令行入口gl-tool，各子命令对应GlTool的一个阶段或工具函数。
+       gl_tool及其依赖的字典较大，仅在执行子命令时才导入，以便--help等立即返回
+@time: 2026/10/18
+"""
+import argparse
+import os.path as path
+
+
+def get_names(value):
+    """ --names的取值：以逗号分隔的页名，或@文件名(每行一个页名)"""
+    if value.startswith('@'):
+        with open(value[1:], 'r') as rf:
+            return [ln.strip() for ln in rf if ln.strip()]
+    return [name for name in value.split(',') if name]
+
+
+def get_tool(args):
+    from gl_tool import GlTool
+    if args.data_dir:
+        GlTool.DATA_DIR = path.abspath(args.data_dir)
+    return GlTool(args.jobs, args.incremental, bool(args.profile))
+
+
+def run_stage(args):
+    """ 执行args.func对应的GlTool方法，参数为--names及子命令的各选项"""
+    tool = get_tool(args)
+    kwargs = {key: getattr(args, key) for key in args.kwargs}
+    getattr(tool, args.func)(**kwargs)
+    if args.profile:
+        from profiler import profiler
+        profiler.print_summary()
+        profiler.save_trace(args.profile)
+
+
+def get_parser():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--data-dir', help='gl-data所在目录，默认为环境变量GL_DATA_DIR')
+    common.add_argument('--names', type=get_names, help='只处理这些页面，以逗号分隔，或@文件名(每行一个页名)')
+    common.add_argument('--jobs', type=int, default=1, help='并行处理的进程数')
+    common.add_argument('--incremental', action='store_true', help='只处理输入或所用字典有改动的页面')
+    common.add_argument('--profile', nargs='?', const='profile_trace.json',
+                        help='记录各阶段的耗时及计数，打印汇总表并写入Chrome trace文件，默认为profile_trace.json')
+
+    parser = argparse.ArgumentParser(prog='gl-tool', description='高丽藏数据整理工具')
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    subparsers.required = True
+
+    def add_command(name, func, help_txt, kwargs=('names',)):
+        sub = subparsers.add_parser(name, parents=[common], help=help_txt, description=help_txt)
+        sub.set_defaults(func=func, kwargs=list(kwargs))
+        return sub
+
+    add_command('oritxt0-to-oritxt', 'proc_oritxt0_to_oritxt', '清洗DocxOriTxt0，结果存放至DocxOriTxt')
+    add_command('oritxt-to-stdtxt', 'proc_oritxt_to_stdtxt', '将DocxOriTxt转换为正字文本，结果存放至DocxStdTxt')
+    sub = add_command('text2page0-to-text2page', 'proc_text2page0_to_text2page',
+                      '根据DocxStdTxt检查、完善Text2Page0，结果存放至Text2Page',
+                      ['names', 'display', 'err_cnt', 'aligner', 'graph'])
+    sub.add_argument('--display', type=int, default=1, help='为1时打印行数不同的页面')
+    sub.add_argument('--err-cnt', type=int, default=100, help='行数不同的页面超过此数时停止')
+    sub.add_argument('--aligner', choices=['dp', 'cascade'], default='dp', help='逐行对齐的方法')
+    sub.add_argument('--variant-graph', dest='graph', action='store_true',
+                     help='以异体字图计算相似度，异体字字典1、2中的异体字也视为相同')
+    add_command('patch-note-label', 'patch_note_label_to_text2page', '将Text2Page0中的夹注小字符号回写至Text2Page')
+    sub = add_command('pipeline', 'proc_pipeline', '在内存中将DocxOriTxt0逐页转为Text2Page',
+                      ['names', 'keep', 'aligner'])
+    sub.add_argument('--keep', type=lambda v: v.split(','), help='要写入的文件夹，以逗号分隔，默认只写Text2Page')
+    sub.add_argument('--aligner', choices=['dp', 'cascade'], default='dp', help='逐行对齐的方法')
+    sub = add_command('vs', 'stdtxt_vs_text2page', '逐行比较DocxStdTxt与Text2Page，结果写入JSON lines报告',
+                      ['names', 'ignore_qzw', 'folder', 'report_file'])
+    sub.add_argument('--ignore-qzw', action='store_true', help='不报告行末多千字文的情况')
+    sub.add_argument('--folder', default='Text2Page', help='与DocxStdTxt比较的文件夹')
+    sub.add_argument('--report-file', default='vs_report.jsonl', help='比较报告')
+    sub = add_command('patch-qzw', 'patch_qzw_2_oritxt0', '根据比较报告将行末多出的千字文补入DocxOriTxt0',
+                      ['report_file'])
+    sub.add_argument('--report-file', default='vs_report.jsonl', help='vs生成的比较报告')
+
+    sub = add_command('find', 'find_txt', '查找含有(或不含)txt的页面，打印页名及上下文',
+                      ['names', 'txt', 'folder', 'encoding', 'cnt', 'existed', 'regex', 'refresh', 'fold'])
+    sub.add_argument('txt', help='要查找的字串，指定--regex时为匹配中必然出现的字串')
+    sub.add_argument('folder', help='查找的文件夹')
+    sub.add_argument('--encoding', default='utf-8', help='文件的编码')
+    sub.add_argument('--cnt', type=int, default=1, help='至多打印的页面数')
+    sub.add_argument('--missing', dest='existed', action='store_false', help='查找不含txt的页面')
+    sub.add_argument('--regex', help='查找此正则的匹配')
+    sub.add_argument('--refresh', action='store_true', default=None,
+                     help='先逐页检查并重新索引改动过的页面，未打包的文件夹改动后须指定')
+    sub.add_argument('--fold', action='store_true', help='不区分异体字')
+    sub = add_command('cmp', 'cmp_file', '逐行对照一份文件在三个文件夹中的内容', ['fn', 'folder1', 'folder2', 'folder3'])
+    sub.add_argument('fn', help='页名')
+    sub.add_argument('folder1', nargs='?', default='DocxOriTxt')
+    sub.add_argument('folder2', nargs='?', default='DocxStdTxt')
+    sub.add_argument('folder3', nargs='?', default='Text2Page')
+    sub = add_command('print', 'print_files', '打印--names各页的内容', ['names', 'folder'])
+    sub.add_argument('folder', nargs='?', default='DocxOriTxt')
+    sub = add_command('stats', 'proc_char_freq', '统计文件夹中的字种及字频，按字频降序写入CSV',
+                      ['names', 'folder', 'encoding', 'out_file'])
+    sub.add_argument('folder', nargs='?', default='DocxStdTxt')
+    sub.add_argument('--encoding', help='文件的编码')
+    sub.add_argument('--out-file', help='CSV文件，默认为char_freq_<folder>.csv')
+    return parser
+
+
+def main(argv=None):
+    parser = get_parser()
+    args = parser.parse_args(argv)
+    if args.func == 'print_files' and not args.names:
+        parser.error('print requires --names')
+    run_stage(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: 全藏的语词索引(KWIC)。将一个文件夹的全部页面去掉行号后依次连接，页与页之间以\x00分隔，
+       建立后缀数组及LCP数组，并记录各页、各行的起始位置。索引文件均为定长整数数组，查询时内存映射，无需加载
+@time: 2026/10/18
+"""
+import os
+import mmap
+import json
+import heapq
+import os.path as path
+from array import array
+from bisect import bisect_left, bisect_right
+from lazy_numpy import load_numpy
+
+SEP = '\x00'  # 页面分隔符
+SA_CHUNK = 1 << 22  # 建立后缀数组时每批重排的后缀数，按组切分，以限制临时数组所占的内存
+LCP_CHUNK = 1 << 16  # 计算LCP时每批的后缀对数
+LCP_BLOCKS = [1, 4, 16, 64]  # 计算LCP时每次比较的字数，公共前缀较长的后缀对逐次加大
+
+
+def build_sa(text):
+    """ 倍增法建立后缀数组，有numpy时返回int32数组，否则返回列表
+    numpy版本每轮只重排仍有多个后缀的组，后缀的名次为其所在组在后缀数组中的起始位置
+    """
+    n = len(text)
+    np = load_numpy()
+    if np:
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        sa = np.argsort(codes, kind='stable').astype(np.int32)
+        starts = np.ones(n + 1, dtype=bool)  # starts[i]表示sa[i]为组首，starts[n]为哨兵
+        starts[1:n] = codes[sa[1:]] != codes[sa[:-1]]
+        rank = np.empty(n, dtype=np.int32)
+        rank[sa] = np.maximum.accumulate(np.where(starts[:n], np.arange(n, dtype=np.int32), 0))
+        k = 1
+        while True:
+            act = np.flatnonzero(~(starts[:n] & starts[1:])).astype(np.int32)  # 所在组不止一个后缀的位置
+            if not len(act):
+                return sa
+            # 先取出本轮全部的后k字名次，再分批重排，各批写回的名次不影响其他批
+            nxt = sa[act] + k
+            inside = nxt < n
+            nxt[inside] = rank[nxt[inside]]
+            nxt[~inside] = -1
+            del inside
+            heads = np.append(np.flatnonzero(starts[act]), len(act))  # 各组在act中的起始位置
+            lo = 0
+            while lo < len(act):
+                hi = len(act)
+                if lo + SA_CHUNK < len(act):
+                    hi = heads[np.searchsorted(heads, lo + SA_CHUNK)]  # 不切开同一组
+                pos, s = act[lo:hi], sa[act[lo:hi]]
+                key = rank[s].astype(np.int64) * (n + 1) + nxt[lo:hi] + 1  # 按(组, 其后k字的名次)排序
+                order = np.argsort(key)
+                s, key = s[order], key[order]
+                sa[pos] = s
+                new = np.ones(len(pos), dtype=bool)
+                new[1:] = key[1:] != key[:-1]
+                starts[pos] = new
+                rank[s] = np.maximum.accumulate(np.where(new, pos, 0))
+                lo = hi
+            k *= 2
+    rank = [ord(ch) for ch in text]
+    sa, k = list(range(n)), 1
+    while True:
+        key = [(rank[i], rank[i + k] if i + k < n else -1) for i in range(n)]
+        sa.sort(key=key.__getitem__)
+        new = [0] * n
+        for j in range(1, n):
+            new[sa[j]] = new[sa[j - 1]] + (key[sa[j]] != key[sa[j - 1]])
+        rank = new
+        if n == 0 or rank[sa[-1]] == n - 1:
+            return sa
+        k *= 2
+
+
+def build_lcp(text, sa):
+    """ lcp[i]为sa[i-1]与sa[i]两个后缀的公共前缀长度，公共前缀不跨页
+    有numpy时分批比较相邻的后缀，每次比较LCP_BLOCK字，否则用Kasai算法
+    """
+    n = len(sa)
+    np = load_numpy()
+    if np:
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        lcp = np.zeros(n, dtype=np.int32)
+        for start in range(1, n, LCP_CHUNK):
+            idx = np.arange(start, min(n, start + LCP_CHUNK))
+            p, q = sa[idx].astype(np.int64), sa[idx - 1].astype(np.int64)
+            h = np.zeros(len(idx), dtype=np.int64)
+            rounds = 0
+            while len(idx):
+                size = LCP_BLOCKS[min(rounds, len(LCP_BLOCKS) - 1)]
+                block = np.arange(size, dtype=np.int64)
+                # 文本以分隔符结尾，越界的位置取末字即可
+                a = codes[np.minimum((p + h)[:, None] + block, n - 1)]
+                b = codes[np.minimum((q + h)[:, None] + block, n - 1)]
+                same = (a == b) & (a != ord(SEP))
+                run = np.where(same.all(axis=1), size, same.argmin(axis=1))
+                h += run
+                done = run < size
+                lcp[idx[done]] = h[done]
+                idx, p, q, h = idx[~done], p[~done], q[~done], h[~done]
+                rounds += 1
+        return lcp
+    rank = [0] * n
+    for i, p in enumerate(sa):
+        rank[p] = i
+    lcp, h = [0] * n, 0
+    for p in range(n):
+        r = rank[p]
+        if r == 0:
+            h = 0
+            continue
+        q = sa[r - 1]
+        while p + h < n and q + h < n and text[p + h] == text[q + h] and text[p + h] != SEP:
+            h += 1
+        lcp[r] = h
+        h = h and h - 1
+    return lcp
+
+
+class Concordance(object):
+    """ 一个文件夹的语词索引，root下的文件：
+    text.u32为连接后的文本(UTF-32)，sa.i32、lcp.i32为后缀数组及LCP数组，
+    pages.i64、lines.i64为各页、各行在文本中的起始位置，names.json为各页的页名
+    """
+
+    def __init__(self, root):
+        self.root = root
+        with open(path.join(root, 'names.json'), 'r') as rf:
+            self.names = json.load(rf)
+        self.maps = []
+        self.text = self.open_map('text.u32')
+        self.sa = memoryview(self.open_map('sa.i32')).cast('i')
+        self.lcp = memoryview(self.open_map('lcp.i32')).cast('i')
+        self.pages = memoryview(self.open_map('pages.i64')).cast('q')
+        self.lines = memoryview(self.open_map('lines.i64')).cast('q')
+
+    def open_map(self, fn):
+        with open(path.join(self.root, fn), 'rb') as rf:
+            if not os.fstat(rf.fileno()).st_size:
+                return b''
+            mm = mmap.mmap(rf.fileno(), 0, access=mmap.ACCESS_READ)
+        self.maps.append(mm)
+        return mm
+
+    def close(self):
+        for view in [self.sa, self.lcp, self.pages, self.lines]:
+            view.release()
+        for mm in self.maps:
+            mm.close()
+        self.maps = []
+
+    @classmethod
+    def build(cls, root, pages):
+        """ 由[(页名, 行)]建立索引，行首的行号不计入文本"""
+        names, parts, page_starts, line_starts, size = [], [], array('q'), array('q'), 0
+        for name, lines in pages:
+            names.append(name)
+            page_starts.append(size)
+            for ln in lines or []:
+                if not ln.strip():
+                    continue  # 空行不是页面中的行，不计行号
+                txt = ln.rstrip('\n').split(':', 1)[-1]
+                line_starts.append(size)
+                parts.append(txt)
+                size += len(txt)
+            parts.append(SEP)
+            size += 1
+        text = ''.join(parts)
+        sa = build_sa(text)
+        lcp = build_lcp(text, sa)
+        not path.exists(root) and os.makedirs(root)
+        with open(path.join(root, 'text.u32'), 'wb') as wf:
+            wf.write(text.encode('utf-32-le'))
+        for fn, typecode, values in [('sa.i32', 'i', sa), ('lcp.i32', 'i', lcp),
+                                     ('pages.i64', 'q', page_starts), ('lines.i64', 'q', line_starts)]:
+            with open(path.join(root, fn), 'wb') as wf:
+                (values if hasattr(values, 'tofile') else array(typecode, values)).tofile(wf)
+        with open(path.join(root, 'names.json'), 'w') as wf:
+            json.dump(names, wf, ensure_ascii=False)
+        return cls(root)
+
+    def __len__(self):
+        return len(self.sa)
+
+    def get_txt(self, start, end):
+        return self.text[start * 4:end * 4].decode('utf-32-le')
+
+    def find(self, phrase):
+        """ 以phrase开头的后缀在后缀数组中的范围[lo, hi)"""
+        sa, size = self.sa, len(phrase)
+        lo, hi = 0, len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.get_txt(sa[mid], sa[mid] + size) < phrase:
+                lo = mid + 1
+            else:
+                hi = mid
+        start, hi = lo, len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.get_txt(sa[mid], sa[mid] + size) <= phrase:
+                lo = mid + 1
+            else:
+                hi = mid
+        return start, lo
+
+    def count(self, phrase):
+        """ phrase在全部页面中出现的次数"""
+        lo, hi = self.find(phrase)
+        return hi - lo
+
+    def locate(self, pos):
+        """ 文本位置pos所在的(页名, 行号, 页的起止位置)，行号自1起"""
+        pages, lines = self.pages, self.lines
+        k = bisect_right(pages, pos) - 1
+        start = pages[k]
+        end = pages[k + 1] - 1 if k + 1 < len(pages) else len(self.sa) - 1  # 页尾的分隔符
+        lno = bisect_right(lines, pos) - bisect_left(lines, start)
+        return self.names[k], lno, start, end
+
+    def kwic(self, phrase, width=10, limit=None):
+        """ phrase的各处出现，按页面顺序返回[(页名, 行号, 上文, 下文)]，上下文至多width字且不跨页"""
+        lo, hi = self.find(phrase)
+        if not phrase or lo == hi:
+            return []
+        ret = []
+        for pos in sorted(self.sa[lo:hi])[:limit]:
+            name, lno, start, end = self.locate(pos)
+            left = self.get_txt(max(start, pos - width), pos)
+            right = self.get_txt(pos + len(phrase), min(end, pos + len(phrase) + width))
+            ret.append((name, lno, left, right))
+        return ret
+
+    def frequent(self, size, top=20):
+        """ 长为size的重复字串中出现最多的top个，返回[(字串, 次数)]"""
+        counts, start = [], 0
+        lcp, n = self.lcp, len(self.sa)
+        for i in range(1, n + 1):
+            if i < n and lcp[i] >= size:
+                continue
+            i - start > 1 and counts.append((i - start, start))
+            start = i
+        ret = []
+        for cnt, i in heapq.nlargest(top, counts):
+            ret.append((self.get_txt(self.sa[i], self.sa[i] + size), cnt))
+        return ret
+
+    def repeated(self, min_count=2, top=10):
+        """ 至少出现min_count次的最长字串，返回至多top个[(字串, 次数)]，已返回字串的子串不再返回"""
+        k = max(1, min_count - 1)  # 相邻k个lcp的最小值为k+1个后缀的公共前缀长度
+        np = load_numpy()
+        if np:
+            lcp = np.frombuffer(self.lcp, dtype=np.int32)
+            if len(lcp) <= k:
+                return []
+            mins = np.lib.stride_tricks.sliding_window_view(lcp[1:], k).min(axis=1)
+            order = np.argsort(-mins, kind='stable')[:top * 20]
+            cands = [(int(mins[i]), int(i) + 1) for i in order]
+        else:
+            lcp, windows = self.lcp, []
+            for i in range(1, len(lcp) - k + 1):
+                windows.append((min(lcp[i:i + k]), -i))
+            cands = [(v, -i) for v, i in heapq.nlargest(top * 20, windows)]
+        ret = []
+        for size, i in cands:
+            if not size or len(ret) >= top:
+                break
+            txt = self.get_txt(self.sa[i], self.sa[i] + size)
+            if any(txt in t for t, cnt in ret):
+                continue
+            ret.append((txt, self.count(txt)))
+        return ret
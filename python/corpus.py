@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: 打包存放的文件夹。将一个文件夹下的全部页面存为一个folder.pack，并以folder.pack.idx记录各页的偏移，
+       读取时内存映射，写入时只在末尾追加，以减少网络文件系统上逐页打开文件的开销
+@time: 2026/10/18
+"""
+import os
+import mmap
+import os.path as path
+
+
+def split_lines(txt):
+    """ 与file.readlines()相同，只按换行符分行"""
+    lines = txt.split('\n')
+    ret = [ln + '\n' for ln in lines[:-1]]
+    lines[-1] and ret.append(lines[-1])
+    return ret
+
+
+class PackedFolder(object):
+    """ 以单个文件存放的文件夹，同一页多次写入时以最后一次为准"""
+
+    def __init__(self, pack_file):
+        self.pack_file = pack_file
+        self.idx_file = pack_file + '.idx'
+        self.index = dict()  # 页名 -> (偏移, 字节数)
+        self.size = 0
+        self.mm = None
+        self.wf = self.idx_wf = None  # 写入时打开，此后一直追加
+        if path.exists(self.idx_file):
+            with open(self.idx_file, 'r') as rf:
+                for ln in rf:
+                    if not ln.endswith('\n'):  # 其他进程正在追加的行
+                        break
+                    name, offset, length = ln.rstrip('\n').split('\t')
+                    self.index[name] = (int(offset), int(length))
+        self.size = path.exists(pack_file) and path.getsize(pack_file) or 0
+
+    def names(self):
+        return sorted(self.index)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def read(self, name):
+        """ 读取一页的内容，不存在时返回None"""
+        if name not in self.index:
+            return None
+        offset, length = self.index[name]
+        if not length:
+            return ''
+        if self.mm is None or offset + length > len(self.mm):
+            self.mm and self.mm.close()
+            with open(self.pack_file, 'rb') as rf:
+                self.mm = mmap.mmap(rf.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.mm[offset:offset + length].decode('utf-8')
+
+    def write(self, name, txt):
+        """ 将一页追加至末尾，并追加其索引"""
+        if self.wf is None:
+            self.wf = open(self.pack_file, 'ab')
+            self.idx_wf = open(self.idx_file, 'a')
+        data = txt.encode('utf-8')
+        self.wf.write(data)
+        self.wf.flush()
+        self.idx_wf.write('%s\t%s\t%s\n' % (name, self.size, len(data)))
+        self.idx_wf.flush()
+        self.index[name] = (self.size, len(data))
+        self.size += len(data)
+
+    def close(self):
+        self.mm and self.mm.close()
+        self.wf and self.wf.close()
+        self.idx_wf and self.idx_wf.close()
+        self.mm = self.wf = self.idx_wf = None
+
+    @classmethod
+    def write_tmp(cls, pack_file, pages):
+        for fn in [pack_file + '.tmp', pack_file + '.tmp.idx']:
+            open(fn, 'w').close()  # 清空残留的临时文件，没有页面时也得到空的打包文件
+        store = cls(pack_file + '.tmp')
+        for name, txt in pages:
+            store.write(name, txt)
+        store.close()
+
+    @staticmethod
+    def commit_tmp(pack_file):
+        os.replace(pack_file + '.tmp', pack_file)
+        os.replace(pack_file + '.tmp.idx', pack_file + '.idx')
+
+    @classmethod
+    def create(cls, pack_file, pages):
+        """ 由(页名, 内容)新建打包文件，覆盖已有的同名文件"""
+        cls.write_tmp(pack_file, pages)
+        cls.commit_tmp(pack_file)
+        return cls(pack_file)
+
+    def compact(self):
+        """ 去掉被覆盖的旧版本，返回新的PackedFolder"""
+        self.write_tmp(self.pack_file, ((name, self.read(name)) for name in self.names()))
+        self.close()
+        self.commit_tmp(self.pack_file)
+        return PackedFolder(self.pack_file)
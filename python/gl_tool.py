@@ -3,99 +3,313 @@
 
 import re
 import os
+import io
+import argparse
+import sys
+import csv
 import json
-import shutil
+import time
 import os.path as path
-from glob2 import glob
-from variant import is_variant
+from collections import Counter
+from contextlib import redirect_stdout
+from variant import get_variant_index
+from variant_graph import get_variant_graph, reload_variant_graph
+from similar import get_similar, get_similar_graph
+from manifest import Manifest, read_file
+from corpus import PackedFolder, split_lines
+from ngram_index import NgramIndex
+from concordance import Concordance
+from charstats import count_chars, get_block
+from aligner import LineAligner
+from myers import get_opcodes
+from cleaner import OriTxtCleaner, trim_wan
+from notes import transplant_marks, split_line_marks, join_line_marks, get_note_spans
+from profiler import profiler
+from asset_cache import load_cached, get_cached, invalidate
 
-try:
-    from cdifflib import CSequenceMatcher
-except ImportError:
-    # Windows上跳过安装cdifflib
-    def CSequenceMatcher(isjunk, a, b, autojunk):
-        return [isjunk, a, b, autojunk] and []
+ASSETS_DIR = path.join(path.dirname(path.abspath(__file__)), 'assets')  # 字典所在目录，与工作目录无关
 
 
 class GlTool(object):
     """ 高丽藏处理函数"""
-    DATA_DIR = '/Users/xiandu/Document/03Work/藏经数字化/校对项目/高丽藏'  # gl-data所在目录
+    DATA_DIR = os.environ.get('GL_DATA_DIR', '/Users/xiandu/Document/03Work/藏经数字化/校对项目/高丽藏')  # gl-data所在目录
+    stores = dict()  # (DATA_DIR, 文件夹) -> PackedFolder，未打包的文件夹为None
+    made_dirs = set()  # 已建立的目录，避免每次写入都检查
+    indexes = dict()  # (DATA_DIR, 文件夹, 是否归一化) -> NgramIndex
+    concordances = dict()  # (DATA_DIR, 文件夹) -> Concordance
+    notes = dict()  # (DATA_DIR, 文件夹) -> {页名: [(行序号, 偏移, 符号)]}，文件夹的夹注旁注
 
-    def __init__(self):
-        self.qzw = None  # 千字文
-        self.vt_dict1 = None  # 异体字字典1
-        self.vt_dict2 = None  # 异体字字典2
-        self.char2unicode = None  # 自造字转unicode
+    def __init__(self, jobs=1, incremental=False, profile=False):
+        self.jobs = jobs  # 并行处理的进程数，1表示串行
+        self.incremental = incremental  # 增量构建，跳过输入和所用字典均未改动的页面
+        self._cleaner = None
+        if profile:  # 记录各阶段的耗时及计数，见profiler
+            profiler.enabled = True
 
-    def load_qzw(self):
-        """ 加载千字文"""
-        with open('./assets/qzw.txt', 'r') as fn:
-            lines = [ln.strip() for ln in fn.readlines()]
-            self.qzw = ''.join(lines)
+    @staticmethod
+    def parse_qzw(fn):
+        with open(fn, 'r') as rf:
+            return ''.join([ln.strip() for ln in rf.readlines()])
 
-    def load_variant_dict(self):
-        """高丽藏异体字字典"""
-        with open('./assets/variants1.json', 'r') as rf:
-            self.vt_dict1 = json.load(rf)
-        with open('./assets/variants2.json', 'r') as rf:
-            self.vt_dict2 = json.load(rf)
+    @staticmethod
+    def parse_json(fn):
+        with open(fn, 'r') as rf:
+            return json.load(rf)
 
-    def load_char2unicode(self):
-        """ Text中的自造字的Unicode对应表"""
+    @staticmethod
+    def parse_char2unicode(fn):
         char2unicode = dict()
-        with open('./assets/SelfChar2Unicode.txt', 'r') as fn:
-            lines = fn.readlines()
+        with open(fn, 'r') as rf:
+            lines = rf.readlines()
             for ln in lines[1:]:
                 ch1, ch2 = ln.strip().split('\t')
                 char2unicode[ch1] = ch2
-        self.char2unicode = char2unicode
+        # 仅单字的自造字参与替换，目标可以是多个码位，空目标保留原字
+        return char2unicode, {ord(k): v for k, v in char2unicode.items() if len(k) == 1 and v}
+
+    QZW_FILE = path.join(ASSETS_DIR, 'qzw.txt')
+    VT_DICT1_FILE = path.join(ASSETS_DIR, 'variants1.json')
+    VT_DICT2_FILE = path.join(ASSETS_DIR, 'variants2.json')
+    CHAR2UNICODE_FILE = path.join(ASSETS_DIR, 'SelfChar2Unicode.txt')
+
+    # 以下字典均在首次使用时加载，同一进程内的各实例共用，源文件改动后由load_*或invalidate_assets重新加载
+    @property
+    def qzw(self):
+        """ 千字文"""
+        return get_cached(self.QZW_FILE, self.parse_qzw)
+
+    @property
+    def vt_dict1(self):
+        """ 异体字字典1"""
+        return get_cached(self.VT_DICT1_FILE, self.parse_json)
+
+    @property
+    def vt_dict2(self):
+        """ 异体字字典2"""
+        return get_cached(self.VT_DICT2_FILE, self.parse_json)
+
+    @property
+    def char2unicode(self):
+        """ 自造字转unicode"""
+        return get_cached(self.CHAR2UNICODE_FILE, self.parse_char2unicode)[0]
+
+    @property
+    def char2unicode_table(self):
+        """ 自造字转换表，供str.translate使用"""
+        return get_cached(self.CHAR2UNICODE_FILE, self.parse_char2unicode)[1]
+
+    @property
+    def cleaner(self):
+        """ DocxOriTxt0的清洗规则，自造字转换表重新加载后随之重建"""
+        table = self.char2unicode_table
+        if self._cleaner is None or self._cleaner.char2unicode_table is not table:
+            self._cleaner = OriTxtCleaner(table)
+        return self._cleaner
+
+    def load_qzw(self):
+        """ 加载千字文，已加载且源文件未改动时不再加载"""
+        load_cached(self.QZW_FILE, self.parse_qzw)
+
+    def load_variant_dict(self):
+        """高丽藏异体字字典，已加载的异体字图也随之检查"""
+        load_cached(self.VT_DICT1_FILE, self.parse_json)
+        load_cached(self.VT_DICT2_FILE, self.parse_json)
+        reload_variant_graph()
+
+    def load_char2unicode(self):
+        """ Text中的自造字的Unicode对应表"""
+        load_cached(self.CHAR2UNICODE_FILE, self.parse_char2unicode)
+
+    @classmethod
+    def invalidate_assets(cls):
+        """ 丢弃本进程已加载的全部字典"""
+        invalidate()
 
     def trans_char2unicode(self, txt):
         """ 替换高丽藏的自造字"""
-        ret = ''
-        for t in txt:
-            ret += self.char2unicode.get(t) or t
-        return ret
+        return txt.translate(self.char2unicode_table)
+
+    def trans_char2unicode_many(self, lines):
+        """ 批量替换多行文本中的自造字"""
+        table = self.char2unicode_table
+        return [ln.translate(table) for ln in lines]
 
     @classmethod
     def get_file_num(cls, folder='DocxStdTxt'):
-        files = glob(path.join(GlTool.DATA_DIR, folder, '**', '*.txt'))
-        return len(files)
+        return len(cls.walk_files(folder))
+
+    @classmethod
+    def walk_files(cls, folder, names=None, skip=None):
+        """ 按路径顺序列出folder下的txt文件，返回[(root, fn, name)]
+        folder已打包时从索引中列出，root为页面在原目录结构中所在的目录
+        """
+        items = []
+        store = cls.get_store(folder)
+        if store is not None:
+            for name in store.names():
+                if (names and name not in names) or (skip and name in skip):
+                    continue
+                items.append((path.join(cls.DATA_DIR, folder, name.split('_')[1]), name + '.txt', name))
+            return sorted(items)
+        for root, dirs, files in os.walk(path.join(cls.DATA_DIR, folder)):
+            for fn in files:
+                name, ext = fn.rsplit('.', 1)
+                if ext != 'txt' or (names and name not in names) or (skip and name in skip):
+                    continue
+                items.append((root, fn, name))
+        return sorted(items)
+
+    def map_files(self, func, items, *args, loaders=()):
+        """ 对items逐个调用func(*item, *args)，按items的顺序返回结果
+        jobs>1时分发至进程池，子进程通过loaders加载一次字典，其输出由主进程按顺序打印
+        """
+        if self.jobs <= 1 or len(items) < 2:
+            for item in items:
+                yield getattr(self, func)(*item, *args)
+            return
+        from concurrent.futures import ProcessPoolExecutor  # 导入较慢，串行时无需导入
+        tasks = [(func, item + args) for item in items]
+        chunksize = max(1, len(tasks) // (self.jobs * 8))
+        executor = ProcessPoolExecutor(self.jobs, initializer=_init_worker,
+                                       initargs=(self.DATA_DIR, loaders, profiler.enabled))
+        try:
+            for ret, output, prof in executor.map(_call_worker, tasks, chunksize=chunksize):
+                output and sys.stdout.write(output)
+                prof and profiler.merge(*prof)
+                yield ret
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def get_asset_map(self, asset):
+        """ 将字典表示为“字→值”的映射，以便增量构建时找出改动过的字"""
+        if asset == 'qzw.txt':
+            return dict.fromkeys(self.qzw, '')
+        if asset == 'SelfChar2Unicode.txt':
+            return self.char2unicode
+        if asset == 'variants1.json':
+            return self.vt_dict1
+        if asset == 'variants2.json':
+            return self.vt_dict2
+        if asset == 'variants.txt':
+            index = get_variant_index()
+            return {ch: index.get_group(ch) for ch in index.group_ids}
+
+    def open_manifest(self, stage, assets, options=None, whole=()):
+        """ 增量构建时打开stage的构建清单，否则返回None，options为影响输出的阶段选项，whole为改动时须全部重建的字典"""
+        if self.incremental:
+            assets = {asset: self.get_asset_map(asset) for asset in assets}
+            return Manifest(self.DATA_DIR, stage, assets, self.read_page, options, whole)
+
+    @staticmethod
+    def skip_fresh(manifest, items, get_files):
+        """ 去掉清单中已是最新的页面，get_files(item)返回该页的(输入, 输出)，均为[(页名, 文件夹)]"""
+        if not manifest:
+            return items
+        stale = [item for item in items if not manifest.is_fresh(item[-1], *get_files(item))]
+        print('[incremental]%s: %s of %s pages changed' % (path.basename(manifest.root), len(stale), len(items)))
+        return stale
 
     @staticmethod
     def trim_wan(txt):
-        txt = re.sub(r'(^[卍卐]+)([^\d字音者相下]|$)', r'\2', txt)  # 去掉行首连续的万字符
-        txt = re.sub(r'(^\d\d:)([卍卐]+)', r'\1', txt)  # 去掉行首连续的万字符
-        txt = re.sub(r'(^|[^聲作下])([卍卐]+$)', r'\1', txt)  # 去掉行尾连续的万字符
-        return txt
+        return trim_wan(txt)
 
     @classmethod
-    def get_lines(cls, name, folder='DocxStdTxt'):
+    def get_path(cls, name, folder):
         name = name.rstrip('.txt')
-        src_file = path.join(cls.DATA_DIR, folder, name.split('_')[1], name + '.txt')
+        return path.join(cls.DATA_DIR, folder, name.split('_')[1], name + '.txt')
+
+    @classmethod
+    def get_store(cls, folder):
+        """ folder已打包为folder.pack时返回其PackedFolder，否则返回None"""
+        key = (cls.DATA_DIR, folder)
+        if key not in cls.stores:
+            pack_file = path.join(cls.DATA_DIR, folder + '.pack')
+            cls.stores[key] = PackedFolder(pack_file) if path.exists(pack_file) else None
+        return cls.stores[key]
+
+    @classmethod
+    def get_lines(cls, name, folder='DocxStdTxt', encoding=None):
+        store = cls.get_store(folder)
+        if store is not None:
+            txt = store.read(name.rstrip('.txt'))
+            if txt is not None and profiler.enabled:
+                profiler.count('files_read')
+                profiler.count('bytes_read', len(txt.encode('utf-8')))
+            return None if txt is None else split_lines(txt)
+        src_file = cls.get_path(name, folder)
         if path.exists(src_file):
-            with open(src_file, 'r') as rf:
+            if profiler.enabled:
+                profiler.count('files_read')
+                profiler.count('bytes_read', path.getsize(src_file))
+            with open(src_file, 'r', encoding=encoding) as rf:
                 return rf.readlines()
 
     @classmethod
-    def write_lines(cls, name, lines, folder):
-        name = name.rstrip('.txt')
-        dst_dir = path.join(cls.DATA_DIR, folder, name.split('_')[1])
-        not path.exists(dst_dir) and os.makedirs(dst_dir)
-        with open(path.join(dst_dir, name + '.txt'), 'w') as wf:
+    def write_lines(cls, name, lines, folder, encoding=None):
+        if profiler.enabled:
+            profiler.count('files_written')
+            profiler.count('bytes_written', len(''.join(lines).encode(encoding or 'utf-8')))
+        store = cls.get_store(folder)
+        if store is not None:
+            store.write(name.rstrip('.txt'), ''.join(lines))
+            return
+        dst_file = cls.get_path(name, folder)
+        dst_dir = path.dirname(dst_file)
+        if dst_dir not in cls.made_dirs:
+            os.makedirs(dst_dir, exist_ok=True)
+            cls.made_dirs.add(dst_dir)
+        with open(dst_file, 'w', encoding=encoding) as wf:
             wf.writelines(lines)
 
+    @classmethod
+    def read_page(cls, key):
+        """ 读取(页名, 文件夹)的内容(bytes)，不存在时返回None，供增量构建清单使用"""
+        name, folder = key
+        store = cls.get_store(folder)
+        if store is not None:
+            txt = store.read(name)
+            return None if txt is None else txt.encode('utf-8')
+        return read_file(cls.get_path(name, folder))
+
+    @classmethod
+    def pack_folder(cls, folder, encoding='utf-8'):
+        """ 将folder目录下的页面导入folder.pack，此后各函数均读写该文件；已打包时去掉被覆盖的旧版本
+        原目录予以保留，确认无误后可自行删除
+        """
+        pack_file = path.join(cls.DATA_DIR, folder + '.pack')
+        store = cls.get_store(folder)
+        if store is not None:
+            cls.stores[(cls.DATA_DIR, folder)] = store.compact()
+            return
+
+        items = cls.walk_files(folder)
+
+        def get_pages():
+            for root, fn, name in items:
+                with open(path.join(root, fn), 'r', encoding=encoding) as rf:
+                    yield name, rf.read()
+        cls.stores[(cls.DATA_DIR, folder)] = PackedFolder.create(pack_file, get_pages())
+        print('[pack]%s: %s pages' % (folder, len(items)))
+
+    @classmethod
+    def unpack_folder(cls, folder, encoding='utf-8'):
+        """ 将folder.pack导出为原先的目录结构，并删除打包文件"""
+        store = cls.get_store(folder)
+        if store is None:
+            return
+        cls.stores[(cls.DATA_DIR, folder)] = None
+        names = store.names()
+        for name in names:
+            cls.write_lines(name, [store.read(name)], folder, encoding)
+        store.close()
+        os.remove(store.pack_file)
+        os.remove(store.idx_file)
+        print('[unpack]%s: %s pages' % (folder, len(names)))
+
     @classmethod
     def copy_files(cls, src_folder, dst_folder):
-        src_dir = path.join(cls.DATA_DIR, src_folder)
-        for root, dirs, files in os.walk(src_dir):
-            for fn in files:
-                name, ext = fn.rsplit('.', 1)
-                if ext != 'txt':
-                    continue
-                dst_dir = path.join(cls.DATA_DIR, dst_folder, fn.split('_')[1])
-                not path.exists(dst_dir) and os.makedirs(dst_dir)
-                shutil.copy(path.join(root, fn), path.join(dst_dir, fn))
+        for root, fn, name in cls.walk_files(src_folder):
+            cls.write_lines(name, cls.get_lines(name, src_folder), dst_folder)
 
     @classmethod
     def print_files(cls, names, folder='DocxOriTxt'):
@@ -123,127 +337,314 @@ class GlTool(object):
             print(msg)
 
     @classmethod
-    def find_txt(cls, txt, folder, encoding='utf-8', cnt=1, existed=True, names=None):
-        src_path = path.join(cls.DATA_DIR, folder)
-        for root, dirs, files in os.walk(src_path):
-            for fn in files:
-                name, ext = fn.rsplit('.', 1)
-                if ext != 'txt' or (names and name not in names):
+    def get_fold_table(cls):
+        """ 将各字归为其在异体字图中所属类的规范字，逐字替换，偏移不变
+        字典1、2中有歧义的原字不并入类中，不会把无关的字归为一字
+        """
+        return get_variant_graph().table
+
+    @classmethod
+    def get_index(cls, folder, encoding='utf-8', items=None, refresh=None, fold=False):
+        """ 返回folder的n-gram索引，索引存于DATA_DIR/.index下，fold时返回异体字归一化后的索引
+        refresh时先逐页检查，重新索引改动过的页面；为None时只按打包文件夹的索引更新，未打包的文件夹不检查，
+        无需逐页stat；索引尚未建立时总是建立
+        """
+        key = (cls.DATA_DIR, folder, fold)
+        index = cls.indexes.get(key)
+        table = cls.get_fold_table() if fold else None
+        if index is None or index.fold is not table:  # 异体字图重新编译后，归一化的索引随之重建
+            index and index.close()
+            index_dir = path.join(cls.DATA_DIR, '.index', folder + ('.fold' if fold else ''))
+            index = cls.indexes[key] = NgramIndex(index_dir, table)
+        store = cls.get_store(folder)
+        if refresh is None:
+            refresh = store is not None or not index.loaded
+        if not refresh:
+            return index
+        items = cls.walk_files(folder) if items is None else items
+        if store is not None:
+            stamps = {name: store.index[name] for root, fn, name in items}
+        else:
+            stamps = dict()
+            for root, fn, name in items:
+                st = os.stat(path.join(root, fn))
+                stamps[name] = (st.st_mtime_ns, st.st_size)
+
+        def read(name):
+            return ''.join(cls.get_lines(name, folder, encoding)).replace('\n', '')
+
+        cnt = index.update(stamps, read)
+        cnt and print('[index]%s: %s pages indexed' % (folder, cnt))
+        index.save()
+        return index
+
+    @classmethod
+    def find_txt(cls, txt, folder, encoding='utf-8', cnt=1, existed=True, names=None, regex=None, refresh=None,
+                 fold=False):
+        """ 查找含有(existed为False时不含)txt的页面，打印页名及上下文
+        regex不为空时查找其匹配，txt为匹配中必然出现的字串，仅用于通过索引筛选页面
+        fold时不区分异体字，页面与txt、regex均按异体字归一化后匹配，打印的仍是原文
+        refresh同get_index，未打包的文件夹改动后须指定refresh，否则索引的结果可能过时
+        """
+        items = cls.walk_files(folder)
+        index = cls.get_index(folder, encoding, items, refresh, fold)
+        if fold:
+            txt = txt.translate(index.fold)
+            regex = regex and regex.translate(index.fold)
+        found = index.candidates(txt)
+        sure = index.is_exact(txt) and not regex  # 索引的结果是确切的，无需读取页面核对
+        for root, fn, name in items:
+            if names and name not in names:
+                continue
+            if name not in found:
+                if existed:
                     continue
-                with open(path.join(root, fn), 'r', encoding=encoding) as rf:
-                    content = ''.join(rf.readlines()).replace('\n', '')
-                sh = re.search('(<.*>).*(<.*>)', content)
+            elif not existed and sure:
+                continue
+            content = ''.join(cls.get_lines(name, folder, encoding)).replace('\n', '')
+            target = content.translate(index.fold) if fold else content  # 与content逐字对应
+            if regex:
+                sh = re.search(regex, target)
+                if bool(sh) != existed:
+                    continue
+                msg = content[:9]
                 if sh:
-                    print('[%s#%s]%s' % (fn, cnt, '%s...%s' % (sh.group(1), sh.group(2))))
+                    spans = [sh.span(g) for g in range(1, len(sh.groups()) + 1)]
+                    msg = '...'.join(content[s:e] for s, e in spans if s > -1) or content[sh.start():sh.end()]
+            else:
+                idx = target.find(txt)
+                # existed表示查询存在或者不存在某字
+                if (idx > -1) != existed:
+                    continue
+                s = 0 if idx < 10 else idx - 10
+                msg = content[s:idx + 10]
+            print('[%s#%s]%s' % (fn, cnt, msg))
+            cnt -= 1
+            if cnt < 1:
+                return
+
+    @classmethod
+    def build_concordance(cls, folder='DocxStdTxt'):
+        """ 为folder建立语词索引，存于DATA_DIR/.concordance/folder下"""
+        key = (cls.DATA_DIR, folder)
+        cls.concordances.get(key) and cls.concordances.pop(key).close()
+        pages = ((name, cls.get_lines(name, folder)) for root, fn, name in cls.walk_files(folder))
+        cls.concordances[key] = Concordance.build(path.join(cls.DATA_DIR, '.concordance', folder), pages)
+        print('[concordance]%s: %s chars' % (folder, len(cls.concordances[key])))
+
+    @classmethod
+    def get_concordance(cls, folder='DocxStdTxt'):
+        key = (cls.DATA_DIR, folder)
+        if key not in cls.concordances:
+            cls.concordances[key] = Concordance(path.join(cls.DATA_DIR, '.concordance', folder))
+        return cls.concordances[key]
+
+    @classmethod
+    def print_kwic(cls, phrase, folder='DocxStdTxt', width=10, limit=None):
+        """ 打印phrase在folder中的全部出现及其上下文"""
+        conc = cls.get_concordance(folder)
+        print('----------%s: %s----------' % (phrase, conc.count(phrase)))
+        for name, lno, left, right in conc.kwic(phrase, width, limit):
+            print('[%s#%02d]%s【%s】%s' % (name, lno, left.rjust(width, '　'), phrase, right))
+
+    @classmethod
+    def print_repeated(cls, folder='DocxStdTxt', min_count=2, top=10, size=None):
+        """ 打印folder中至少出现min_count次的最长字串，size不为空时打印长为size的高频字串"""
+        conc = cls.get_concordance(folder)
+        rets = conc.frequent(size, top) if size else conc.repeated(min_count, top)
+        for txt, cnt in rets:
+            print('%s\t%s' % (cnt, txt))
+
+    @classmethod
+    def get_notes(cls, folder):
+        """ folder的夹注旁注{页名: [(行序号, 偏移, 符号)]}，存于DATA_DIR/folder.notes.json，不存在时返回None"""
+        key = (cls.DATA_DIR, folder)
+        if key not in cls.notes:
+            notes_file = path.join(cls.DATA_DIR, folder + '.notes.json')
+            notes = None
+            if path.exists(notes_file):
+                with open(notes_file, 'r') as rf:
+                    notes = {name: [tuple(m) for m in marks] for name, marks in json.load(rf).items()}
+            cls.notes[key] = notes
+        return cls.notes[key]
+
+    @classmethod
+    def export_notes(cls, src_folder='Text2Page', dst_folder='Text2PageClean'):
+        """ 将src_folder中的夹注符号移出，去掉符号的行写入dst_folder，符号的位置写入dst_folder的旁注"""
+        notes = dict()
+        for root, fn, name in cls.walk_files(src_folder):
+            lines, marks = split_line_marks(cls.get_lines(name, src_folder))
+            cls.write_lines(name, lines, dst_folder)
+            if marks:
+                notes[name] = marks
+        with open(path.join(cls.DATA_DIR, dst_folder + '.notes.json'), 'w') as wf:
+            json.dump(notes, wf, ensure_ascii=False)
+        cls.notes[(cls.DATA_DIR, dst_folder)] = notes
+        print('[notes]%s: %s pages with notes' % (dst_folder, len(notes)))
+
+    @classmethod
+    def import_notes(cls, src_folder='Text2PageClean', dst_folder='Text2Page'):
+        """ export_notes的逆运算，按src_folder的旁注将夹注符号插回行中，写入dst_folder"""
+        notes = cls.get_notes(src_folder) or dict()
+        for root, fn, name in cls.walk_files(src_folder):
+            lines = cls.get_lines(name, src_folder)
+            cls.write_lines(name, join_line_marks(lines, notes.get(name, [])), dst_folder)
+
+    @classmethod
+    def find_note_txt(cls, txt, folder='Text2PageClean', cnt=1):
+        """ 只在夹注中查找txt，folder须有旁注，打印页名、行号及所在的夹注"""
+        notes = cls.get_notes(folder) or dict()
+        found = cls.get_index(folder).candidates(txt)
+        for root, fn, name in cls.walk_files(folder):
+            if name not in notes or name not in found:
+                continue
+            lines = cls.get_lines(name, folder)
+            for lno, start, end in get_note_spans(lines, notes[name]):
+                note = lines[lno][start:end]
+                if txt in note:
+                    print('[%s#%s]%s: <%s>' % (fn, cnt, lines[lno][:2], note))
                     cnt -= 1
                     if cnt < 1:
                         return
-                # idx = content.find(txt)
-                # # existed表示查询存在或者不存在某字
-                # if (existed and idx > -1) or (not existed and idx == -1):
-                #     s = 0 if idx < 10 else idx - 10
-                #     print('[%s#%s]%s' % (fn, cnt, content[s:idx + 10]))
-                #     cnt -= 1
-                #     if cnt < 1:
-                #         return
-
-    def oritxt0_2_oritxt(self, fn):
-        valid = True
-        lines, lno = [], 1
-        with open(fn, 'r') as rf:
-            for ln in rf.readlines():
-                ln = re.sub(r'\s+', '', ln)
-                fname = fn.rsplit('/', 1)[1]
-                mt = re.match(r'^K\d+V\d+P\d+[Labcdef]\s?(\d+)L?;(.*)$', ln)
-                if not mt:
-                    valid = False
-                    print('[e1]%s: %s' % (fname, ln))
-                    continue
-                # 清洗文本
-                no, txt0 = mt.groups()
-                txt = self.trans_char2unicode(txt0)  # 0.替换自造字
-                txt = re.sub(r'\*\d', '', txt)  # 1.去掉“星号+数字”组合
-                txt = re.sub(r'[+#ㅜㅡㅋ◦ㅍ◑ㅁ,;*\'`\-\]\(\)\/A-Za-z]+', '', txt)  # 2.去掉特殊字符
-                txt = re.sub(r'(\d)\d+', r'\1', txt)  # 3.连续数字仅保留第一位
-                txt = re.sub(r'^\d+', '', txt)  # 4.去掉起首的连续数字
-                txt = re.sub(r'\s+', '', txt)  # 5.去掉空白
-                txt = self.trim_wan(txt)  # 6.去掉万字符
-                # 格式匹配
-                fh = '&'  # 特殊符号
-                fw = '𑖡𑖦𑖾𑖭𑖦𑖽𑖝𑖪𑖟𑖿𑖨𑖧𑖪𑖺𑖠𑖰𑖭𑖝𑖿𑖪𑖯𑖧𑖦𑖮𑖯𑖭𑖝𑖿𑖪𑖯𑖧𑖭𑖮𑖯𑖎𑖯𑖨𑗜𑖜𑖰𑖎𑖯𑖧𑖝𑖟𑖿𑖧𑖞𑖯𑖌𑖼𑖪𑖨𑖘𑖰𑖪𑖨𑖘𑖰𑖪𑖨𑖪𑖨𑖝𑖰𑖭𑖯𑖮𑖯'  # 梵文
-                mt3 = re.match(r'^[\u3400-\uFAD9\U00020000-\U0003134A\d〇%s%s]+$' % (fh, fw), txt)
-                if txt and not mt3:
-                    valid = False
-                    print('[e2]%s: %s' % (fname, ln))
-                    continue
-                # 字体编号转换
-                txt = txt.replace('3', '1').replace('4', '2')
-                txt = txt.replace('5', '').replace('6', '').replace('7', '')
-                if txt:
-                    lines.append('%02d:%s\n' % (lno, txt))
-                    lno += 1
-        return lines, valid
 
+    def count_page_chars(self, names, folder, encoding=None):
+        """ 统计folder中一组页面的字频"""
+        return count_chars(self.get_lines(name, folder, encoding) for name in names)
+
+    @profiler.profiled
+    def proc_char_freq(self, folder='DocxStdTxt', names=None, encoding=None, out_file=None, chunk=500):
+        """ 统计folder中的字种及字频，按字频降序写入CSV
+        各进程按chunk页一组统计后由主进程合并，异体字字典缺字为1表示该字不是异体字字典1、2的字头
+        """
+        self.load_variant_dict()
+        items = self.walk_files(folder, names)
+        chunks = [(tuple(item[2] for item in items[i:i + chunk]),) for i in range(0, len(items), chunk)]
+        counter = Counter()
+        for cnt in self.map_files('count_page_chars', chunks, folder, encoding):
+            counter.update(cnt)
+        out_file = out_file or 'char_freq_%s.csv' % folder
+        with open(out_file, 'w', newline='', encoding='utf-8-sig') as wf:
+            writer = csv.writer(wf)
+            writer.writerow(['序号', '字', '码位', '字频', 'Unicode区', '异体字字典缺字'])
+            for i, (ch, cnt) in enumerate(sorted(counter.items(), key=lambda x: (-x[1], x[0]))):
+                missing = ch not in self.vt_dict1 and ch not in self.vt_dict2
+                writer.writerow([i + 1, ch, 'U+%04X' % ord(ch), cnt, get_block(ch), int(missing)])
+        print('[freq]%s: %s chars, %s kinds' % (folder, sum(counter.values()), len(counter)))
+
+    def oritxt0_2_oritxt(self, name, lines0=None):
+        """ 清洗DocxOriTxt0中的一份文件，返回(DocxOriTxt的行, 是否有效)，lines0为已读入的行"""
+        lines0 = self.get_lines(name, 'DocxOriTxt0') if lines0 is None else lines0
+        if not profiler.enabled:
+            return self.cleaner.clean_lines(lines0, name + '.txt')
+        hits0 = self.cleaner.hits.copy()
+        ret = self.cleaner.clean_lines(lines0, name + '.txt')
+        profiler.count('clean.lines', len(lines0))
+        for rule, cnt in (self.cleaner.hits - hits0).items():
+            profiler.count('clean.' + rule, cnt)
+        return ret
+
+    @profiler.profiled
     def proc_oritxt0_to_oritxt(self, names=None):
         """ 将JL处理的DocxOriTxt0批量转为DocxOriTxt"""
         self.load_char2unicode()
-        src_dir = path.join(self.DATA_DIR, 'DocxOriTxt0')
-        for root, dirs, files in os.walk(src_dir):
-            for fn in files:
-                name, ext = fn.rsplit('.', 1)
-                if ext != 'txt' or (names and name not in names):
+        manifest = self.open_manifest('DocxOriTxt', ['SelfChar2Unicode.txt'])
+
+        def get_files(item):
+            return [(item[2], 'DocxOriTxt0')], [(item[2], 'DocxOriTxt')]
+
+        items = self.skip_fresh(manifest, self.walk_files('DocxOriTxt0', names), get_files)
+        rets = self.map_files('oritxt0_2_oritxt', [(name,) for root, fn, name in items],
+                              loaders=['load_char2unicode'])
+        for item, (lines, valid) in zip(items, rets):
+            valid and self.write_lines(item[2], lines, 'DocxOriTxt')
+            valid and manifest and manifest.update(item[2], *get_files(item))
+        manifest and manifest.save()
+
+    VT_LINE_RE = re.compile(r'([^0-9\n]?)([0-9]+)')  # 原字及其后的异体字类型编号
+    VT_FILE_RE = re.compile(r'(?m)^[^:\n]*:|([^0-9\n]?)([0-9]+)')  # 同上，整份文件时跳过行首的行号
+
+    def resolve_variants(self, regex, txt, fn=None, err_cnt=None):
+        """ 按正则一次性替换txt中的“原字+类型编号”，提示信息与逐字处理时相同"""
+        err_cnt = err_cnt if err_cnt is not None else dict()
+        trans = {'1': self.vt_dict1, '2': self.vt_dict2}
+        with_no = regex is self.VT_FILE_RE
+
+        def report(errno, c, pos):
+            start = txt.rfind('\n', 0, pos) + 1
+            if with_no:
+                start = txt.index(':', start) + 1
+            end = txt.find('\n', pos)
+            ln = txt[start:] if end == -1 else txt[start:end + 1]
+            print('[e%s]%s: %s@%s,%s' % (errno, fn, c, pos - start + 1, ln.strip()))
+
+        def resolve(m):
+            ch, digits = m.groups()
+            if digits is None:  # 行号
+                return m.group(0)
+            pos = m.start(2)
+            for i, c in enumerate(digits):
+                if not ch:
+                    report(1, c, pos + i)  # 首字为数字
+                    continue
+                vt = trans.get(c)
+                if not vt:
+                    report(2, c, pos + i)  # 异体字类型有误
                     continue
-                lines, valid = self.oritxt0_2_oritxt(path.join(root, fn))
-                valid and self.write_lines(name, lines, 'DocxOriTxt')
+                if ch not in vt:
+                    report(3, c, pos + i)  # 异体字字典无该字
+                    key = ch + c
+                    err_cnt[key] = err_cnt.get(key, 0) + 1
+                    continue
+                ch = vt[ch]
+            return ch
+
+        return regex.sub(resolve, txt), err_cnt
 
     def oritxt_to_stdtxt(self, txt, fn=None, err_cnt=None):
         """ 根据将高丽藏异体字字典，将原字文本转换为正字文本"""
         if not txt:
             return ''
-        chars = []
-        err_cnt = err_cnt or dict()
-        for i, c in enumerate(txt):
-            if c in '0123456789':
-                if not chars:
-                    print('[e1]%s: %s@%s,%s' % (fn, c, i + 1, txt.strip()))  # 首字为数字
-                    continue
-                trans = self.vt_dict1 if c == '1' else self.vt_dict2 if c == '2' else None
-                if not trans:
-                    print('[e2]%s: %s@%s,%s' % (fn, c, i + 1, txt.strip()))  # 异体字类型有误
-                    continue
-                if chars[-1] not in trans:
-                    print('[e3]%s: %s@%s,%s' % (fn, c, i + 1, txt.strip()))  # 异体字字典无该字
-                    key = chars[-1] + c
-                    err_cnt[key] = err_cnt.get(key, 0) + 1
-                    continue
-                chars[-1] = trans.get(chars[-1])
-            else:
-                chars.append(c)
-        return ''.join(chars), err_cnt
+        return self.resolve_variants(self.VT_LINE_RE, txt, fn, err_cnt)
+
+    def oritxt_file_to_stdtxt(self, content, fn=None, err_cnt=None):
+        """ 同oritxt_to_stdtxt，content为带行号的整份文件"""
+        return self.resolve_variants(self.VT_FILE_RE, content, fn, err_cnt)
 
+    def oritxt_2_stdtxt(self, name, lines_o=None):
+        """ 将DocxOriTxt中的一份文件转换为正字文本，返回行及该文件的异体字错误统计，lines_o为已有的DocxOriTxt的行"""
+        content = ''.join(self.get_lines(name, 'DocxOriTxt') if lines_o is None else lines_o)
+        content, err_cnt = self.oritxt_file_to_stdtxt(content, name + '.txt')
+        content = self.trans_char2unicode(content)
+        return split_lines(content), err_cnt
+
+    @profiler.profiled
     def proc_oritxt_to_stdtxt(self, names=None):
         err_cnt = dict()
         self.load_variant_dict()
         self.load_char2unicode()
-        src_dir = path.join(self.DATA_DIR, 'DocxOriTxt')
-        for root, dirs, files in os.walk(src_dir):
-            for fn in files:
-                name, ext = fn.rsplit('.', 1)
-                if ext != 'txt' or (names and name not in names):
-                    continue
-                with open(path.join(root, fn), 'r') as rf:
-                    lines = []
-                    for ln in rf.readlines():
-                        no, oritxt = ln.split(':', 2)
-                        nor_txt = self.oritxt_to_stdtxt(oritxt, fn, err_cnt)[0]
-                        nor_txt = self.trans_char2unicode(nor_txt)
-                        lines.append('%s:%s' % (no, nor_txt))
-                    self.write_lines(name, lines, 'DocxStdTxt')
+        manifest = self.open_manifest('DocxStdTxt', ['variants1.json', 'variants2.json', 'SelfChar2Unicode.txt'])
+
+        def get_files(item):
+            return [(item[2], 'DocxOriTxt')], [(item[2], 'DocxStdTxt')]
+
+        items = self.skip_fresh(manifest, self.walk_files('DocxOriTxt', names), get_files)
+        rets = self.map_files('oritxt_2_stdtxt', [(name,) for root, fn, name in items],
+                              loaders=['load_variant_dict', 'load_char2unicode'])
+        for item, (lines, errs) in zip(items, rets):
+            self.write_lines(item[2], lines, 'DocxStdTxt')
+            manifest and manifest.update(item[2], *get_files(item))
+            for err, cnt in errs.items():
+                err_cnt[err] = err_cnt.get(err, 0) + cnt
+        manifest and manifest.save()
         for err, cnt in err_cnt.items():
             print(err, cnt)
 
-    def proc_text2page0_to_text2page(self, names=None, display=1, err_cnt=100):
-        """ 根据从DocxStdTxt，检查、完善Text2Page0得到text2page"""
+    def text2page0_2_text2page(self, fn, aligner='dp', lines_t=None, lines_d=None, graph=False):
+        """ 根据DocxStdTxt检查、完善Text2Page0中的一份文件，返回整理后的行及DocxStdTxt的行
+        aligner为dp时按行做动态规划对齐，为cascade时按原先的规则逐行尝试；lines_t、lines_d为已有的两者的行
+        graph时以异体字图计算相似度，异体字字典1、2中的异体字也视为相同
+        """
+        similar = get_similar_graph if graph else get_similar
 
         def get_list(lst, i):
             if 0 <= i < len(lst):
@@ -264,27 +665,12 @@ class GlTool(object):
                 t1 = self.trans_char2unicode(t1)
             return t1
 
-        def is_equal(ch1, ch2):
-            return ch1 == ch2 or is_variant(ch1, ch2)
-
-        def get_similar(t1, t2):
-            n, t_len = 0, max(len(t1), len(t2))
-            if -4 < len(t1) - len(t2) < 4:
-                for i in range(t_len):
-                    if i < len(t1) and i < len(t2):
-                        if is_equal(t1[i], t2[i]):
-                            n += 1
-                        elif i + 1 < len(t1) and is_equal(t1[i + 1], t2[i]):
-                            t2 = t2[:i] + '■' + t2[i:]
-                        elif i + 1 < len(t2) and is_equal(t1[i], t2[i + 1]):
-                            t1 = t1[:i] + '■' + t1[i:]
-            return n / t_len
-
         def is_similar(t1, t2, strict=True, gap=2):
+            profiler.count('is_similar')
             g = -gap <= len(t1) - len(t2) <= gap
             if not g:
                 return False
-            si = get_similar(t1, t2)
+            si = similar(t1, t2)
             length = max(len(t1), len(t2))
             if not strict:
                 if si >= 0.6 or (length <= 4 and si >= 0.5):
@@ -293,16 +679,127 @@ class GlTool(object):
                 if si >= 0.75 or (length <= 4 and si >= 0.65):
                     return True
 
-        def write_file(root1, fn1, lines1):
-            not path.exists(root1) and os.makedirs(root1)
-            with open(path.join(root1, fn1), 'w') as wf:
-                lines1 and wf.writelines(lines1)
+        lines_t = (self.get_lines(fn, 'Text2Page0') if lines_t is None else lines_t) or []
+        lines_t = self.trans_char2unicode_many([trim_txt(ln, False) for ln in lines_t])
+        lines_t = [ln for ln in lines_t if get_txt(ln)]  # 去掉空行
+        txts_t = [get_txt(ln) for ln in lines_t]
+        if not lines_t:
+            print('[e1]%s' % fn)
+            return None, None
+        lines_d = (self.get_lines(fn, 'DocxStdTxt') if lines_d is None else lines_d) or []
+        lines_d = [trim_txt(ln, False) for ln in lines_d]
+        txts_d = [get_txt(ln) for ln in lines_d]  # 去掉空行
+        if not lines_d:
+            print('[e2]%s' % fn)
+            return None, None
+
+        # 行数相同且字数相同，则直接写入
+        if len(lines_d) == len(lines_t):
+            if sum([len(ln) for ln in lines_t]) == sum([len(ln) for ln in lines_d]):
+                profiler.count('align.direct')
+                return ['%02d:%s\n' % (i + 1, ln) for i, ln in enumerate(txts_d)], lines_d
+
+        lines, lno = [], 0
+        if aligner == 'dp':
+            for op, i, j, txts in LineAligner(similar, self.qzw).align(txts_t, txts_d):
+                profiler.count('dp.' + op)
+                if op == 'match' and not is_similar(txts_t[i], txts_d[j], False):
+                    print('[e3]%s#%s, not sure: %s != %s' % (fn, lno + 1, txts_d[j], txts_t[i]))
+                for txt in txts:
+                    lines.append('%02d:%s\n' % (lno + 1, txt))
+                    lno += 1
+            return lines, lines_d
+
+        # 从DocxStdTxt补入前面行
+        if not is_similar(txts_t[0], txts_d[0]):
+            if is_similar(txts_t[0], txts_d[1], False):  # 补入前1行
+                profiler.count('cascade.head1')
+                lines.append('%02d:%s\n' % (lno + 1, txts_d[lno]))
+                lno += 1
+            elif is_similar(lines_t[0], lines_d[1], False):  # 补入前1行
+                profiler.count('cascade.head1_line')
+                lines.append('%02d:%s\n' % (lno + 1, txts_d[lno]))
+                lno += 1
+            elif is_similar(txts_t[0], txts_d[2]):  # 补入前2行
+                profiler.count('cascade.head2')
+                lines.append('%02d:%s\n' % (lno + 1, txts_d[lno]))
+                lines.append('%02d:%s\n' % (lno + 2, txts_d[lno + 1]))
+                lno += 2
+
+        # 检查txts_t，逐行加入lines
+        for n, txt_t in enumerate(txts_t):
+            if not txt_t:
+                continue
+            txt_tn = get_list(txts_t, n + 1)  # txts_t下1行
+            txt_t2 = txt_t + txt_tn  # txts_t当前2行
+            txt_d = get_list(txts_d, lno)  # txts_d当前行
+            txt_dn = get_list(txts_d, lno + 1)  # txts_d下1行
+            txt_d2 = txt_d + txt_dn  # txts_d当前2行
+
+            if is_similar(txt_t, txt_d, True, 0):  # 当前行：严格相同、字数相同，直接加入
+                profiler.count('cascade.same')
+                lines.append('%02d:%s\n' % (lno + 1, txt_t))
+                lno += 1
+            elif is_similar(txt_t2, txt_d2, True, 0):  # 当前2行：严格相同、字数相同，进行重构
+                profiler.count('cascade.rebuild2')
+                lines.append('%02d:%s\n' % (lno + 1, txt_t2[:len(txt_d)]))
+                set_list(txts_t, n + 1, txt_t2[len(txt_d):])
+                lno += 1
+            elif txt_d and txt_d[-1] in self.qzw and is_similar(txt_t, txt_d[:-1], True, 0):  # 当前行：差1字，补入千字文
+                profiler.count('cascade.qzw')
+                lines.append('%02d:%s\n' % (lno + 1, txt_t + txt_d[-1]))
+                lno += 1
+            elif is_similar(txt_t, txt_d, True, 1):  # 当前行：严格相同，差1字，直接加入
+                profiler.count('cascade.same_gap1')
+                lines.append('%02d:%s\n' % (lno + 1, txt_t))
+                lno += 1
+            elif is_similar(txt_t, txt_dn, False):  # 当前行：与DocxStdTxt下1行相似，先补入，再加入
+                profiler.count('cascade.insert_next')
+                lines.append('%02d:%s\n' % (lno + 1, txt_d))
+                lines.append('%02d:%s\n' % (lno + 2, txt_t))
+                lno += 2
+            elif is_similar(txt_t2, txt_d2, True, 1):  # 当前2行：严格相同、相差1字，进行重构
+                profiler.count('cascade.rebuild2_gap1')
+                lines.append('%02d:%s\n' % (lno + 1, txt_t2[:len(txt_d)]))
+                set_list(txts_t, n + 1, txt_t2[len(txt_d):])
+                lno += 1
+            elif is_similar(txt_t, txt_d2, True, 1):  # 当前行：与DocxStdTxt当前2行相似，拆分当前行
+                profiler.count('cascade.split')
+                lines.append('%02d:%s\n' % (lno + 1, txt_t[:len(txt_d)]))
+                lines.append('%02d:%s\n' % (lno + 2, txt_t[len(txt_d):]))
+                lno += 2
+            elif is_similar(txt_t2, txt_d, True, 1):  # 当前2行：与DocxStdTxt当前1行相似，合并当前2行
+                profiler.count('cascade.merge')
+                lines.append('%02d:%s\n' % (lno + 1, txt_t2))
+                set_list(txts_t, n + 1, '')
+                lno += 1
+            else:  # 剩余情况，直接加入
+                profiler.count('cascade.unsure')
+                print('[e3]%s#%s, not sure: %s != %s' % (fn, lno + 1, txt_d, txt_t))
+                lines.append('%02d:%s\n' % (lno + 1, txt_t))
+                lno += 1
+
+        # 从DocxStdTxt补入末尾行
+        if len(lines_d) - len(lines) == 1 and is_similar(txts_d[lno - 1], get_txt(lines[-1])):
+            profiler.count('cascade.tail1')
+            lines.append('%02d:%s\n' % (lno + 1, txts_d[lno]))
+            lno += 1
+        if len(lines_d) - len(lines) == 2 and is_similar(txts_d[lno - 1], get_txt(lines[-1])):
+            profiler.count('cascade.tail2')
+            lines.append('%02d:%s\n' % (lno + 1, txts_d[lno]))
+            lines.append('%02d:%s\n' % (lno + 2, txts_d[lno + 1]))
+            lno += 2
+
+        return lines, lines_d
+
+    @profiler.profiled
+    def proc_text2page0_to_text2page(self, names=None, display=1, err_cnt=100, aligner='dp', graph=False):
+        """ 根据从DocxStdTxt，检查、完善Text2Page0得到text2page，graph时以异体字图计算相似度"""
 
         def get_fin_names():
             finished_names = []
             if not names:
-                files1 = glob(path.join(self.DATA_DIR, 'Text2PageF', '**', '*.txt'))
-                finished_names = [fn1.rsplit('/', 1)[1].strip('.txt') for fn1 in files1]
+                finished_names = [name1 for root1, fn1, name1 in self.walk_files('Text2PageF')]
             return finished_names
 
         def display_two_lines(lines1, lines2):
@@ -319,209 +816,257 @@ class GlTool(object):
         self.load_qzw()
         self.load_char2unicode()
         fin_names = get_fin_names()
-        src_path = path.join(self.DATA_DIR, 'Text2Page0')
-        for root, dirs, files in os.walk(src_path):
-            root0 = root.replace('Text2Page0', 'Text2Page')
-            for fn in files:
-                name, ext = fn.rsplit('.', 1)
-                if ext != 'txt' or name in fin_names or (names and name not in names):
-                    continue
-                # print(fn)
-                lines_t = self.get_lines(fn, 'Text2Page0') or []
-                lines_t = [trim_txt(ln, True) for ln in lines_t]
-                lines_t = [ln for ln in lines_t if get_txt(ln)]  # 去掉空行
-                txts_t = [get_txt(ln) for ln in lines_t]
-                if not lines_t:
-                    print('[e1]%s' % fn)
-                    continue
-                lines_d = self.get_lines(fn, 'DocxStdTxt') or []
-                lines_d = [trim_txt(ln, False) for ln in lines_d]
-                txts_d = [get_txt(ln) for ln in lines_d]  # 去掉空行
-                if not lines_d:
-                    print('[e2]%s' % fn)
-                    continue
+        assets = ['qzw.txt', 'SelfChar2Unicode.txt', 'variants.txt']
+        whole = []
+        loaders = ['load_qzw', 'load_char2unicode']
+        if graph:
+            # 异体字图的分类不是逐字的，任一源文件改动都可能改变未改动的字所属的类
+            get_variant_graph(True)
+            self.load_variant_dict()
+            assets += ['variants1.json', 'variants2.json']
+            whole, loaders = ['variants.txt', 'variants1.json', 'variants2.json'], loaders + ['load_variant_dict']
+        manifest = self.open_manifest('Text2Page', assets, dict(aligner=aligner, graph=graph), whole)
 
-                # 行数相同且字数相同，则直接写入
-                if len(lines_d) == len(lines_t):
-                    if sum([len(ln) for ln in lines_t]) == sum([len(ln) for ln in lines_d]):
-                        write_file(root0, fn, ['%02d:%s\n' % (i + 1, ln) for i, ln in enumerate(txts_d)])
-                        continue
-
-                lines, lno = [], 0
-                # 从DocxStdTxt补入前面行
-                if not is_similar(txts_t[0], txts_d[0]):
-                    if is_similar(txts_t[0], txts_d[1], False):  # 补入前1行
-                        lines.append('%02d:%s\n' % (lno + 1, txts_d[lno]))
-                        lno += 1
-                    elif is_similar(lines_t[0], lines_d[1], False):  # 补入前1行
-                        lines.append('%02d:%s\n' % (lno + 1, txts_d[lno]))
-                        lno += 1
-                    elif is_similar(txts_t[0], txts_d[2]):  # 补入前2行
-                        lines.append('%02d:%s\n' % (lno + 1, txts_d[lno]))
-                        lines.append('%02d:%s\n' % (lno + 2, txts_d[lno + 1]))
-                        lno += 2
-
-                # 检查txts_t，逐行加入lines
-                for n, txt_t in enumerate(txts_t):
-                    if not txt_t:
-                        continue
-                    txt_tn = get_list(txts_t, n + 1)  # txts_t下1行
-                    txt_t2 = txt_t + txt_tn  # txts_t当前2行
-                    txt_d = get_list(txts_d, lno)  # txts_d当前行
-                    txt_dn = get_list(txts_d, lno + 1)  # txts_d下1行
-                    txt_d2 = txt_d + txt_dn  # txts_d当前2行
-
-                    if is_similar(txt_t, txt_d, True, 0):  # 当前行：严格相同、字数相同，直接加入
-                        lines.append('%02d:%s\n' % (lno + 1, txt_t))
-                        lno += 1
-                    elif is_similar(txt_t2, txt_d2, True, 0):  # 当前2行：严格相同、字数相同，进行重构
-                        lines.append('%02d:%s\n' % (lno + 1, txt_t2[:len(txt_d)]))
-                        set_list(txts_t, n + 1, txt_t2[len(txt_d):])
-                        lno += 1
-                    elif txt_d and txt_d[-1] in self.qzw and is_similar(txt_t, txt_d[:-1], True, 0):  # 当前行：差1字，补入千字文
-                        lines.append('%02d:%s\n' % (lno + 1, txt_t + txt_d[-1]))
-                        lno += 1
-                    elif is_similar(txt_t, txt_d, True, 1):  # 当前行：严格相同，差1字，直接加入
-                        lines.append('%02d:%s\n' % (lno + 1, txt_t))
-                        lno += 1
-                    elif is_similar(txt_t, txt_dn, False):  # 当前行：与DocxStdTxt下1行相似，先补入，再加入
-                        lines.append('%02d:%s\n' % (lno + 1, txt_d))
-                        lines.append('%02d:%s\n' % (lno + 2, txt_t))
-                        lno += 2
-                    elif is_similar(txt_t2, txt_d2, True, 1):  # 当前2行：严格相同、相差1字，进行重构
-                        lines.append('%02d:%s\n' % (lno + 1, txt_t2[:len(txt_d)]))
-                        set_list(txts_t, n + 1, txt_t2[len(txt_d):])
-                        lno += 1
-                    elif is_similar(txt_t, txt_d2, True, 1):  # 当前行：与DocxStdTxt当前2行相似，拆分当前行
-                        lines.append('%02d:%s\n' % (lno + 1, txt_t[:len(txt_d)]))
-                        lines.append('%02d:%s\n' % (lno + 2, txt_t[len(txt_d):]))
-                        lno += 2
-                    elif is_similar(txt_t2, txt_d, True, 1):  # 当前2行：与DocxStdTxt当前1行相似，合并当前2行
-                        lines.append('%02d:%s\n' % (lno + 1, txt_t2))
-                        set_list(txts_t, n + 1, '')
-                        lno += 1
-                    else:  # 剩余情况，直接加入
-                        print('[e3]%s#%s, not sure: %s != %s' % (fn, lno + 1, txt_d, txt_t))
-                        lines.append('%02d:%s\n' % (lno + 1, txt_t))
-                        lno += 1
-
-                # 从DocxStdTxt补入末尾行
-                if len(lines_d) - len(lines) == 1 and is_similar(txts_d[lno - 1], get_txt(lines[-1])):
-                    lines.append('%02d:%s\n' % (lno + 1, txts_d[lno]))
-                    lno += 1
-                if len(lines_d) - len(lines) == 2 and is_similar(txts_d[lno - 1], get_txt(lines[-1])):
-                    lines.append('%02d:%s\n' % (lno + 1, txts_d[lno]))
-                    lines.append('%02d:%s\n' % (lno + 2, txts_d[lno + 1]))
-                    lno += 2
+        def get_files(item):
+            return [(item[2], 'Text2Page0'), (item[2], 'DocxStdTxt')], [(item[2], 'Text2Page')]
 
-                if len(lines_d) == len(lines):
-                    write_file(root0, fn, lines)
-                    continue
+        items = self.skip_fresh(manifest, self.walk_files('Text2Page0', names, fin_names), get_files)
+        rets = self.map_files('text2page0_2_text2page', [(fn,) for root, fn, name in items], aligner, None, None, graph,
+                              loaders=loaders)
+        for item, (lines, lines_d) in zip(items, rets):
+            root, fn, name = item
+            if lines is None:
+                continue
+            if len(lines_d) == len(lines):
+                self.write_lines(name, lines, 'Text2Page')
+                manifest and manifest.update(name, *get_files(item))
+                continue
+
+            print('[e4]%s, line count: %s Docx != Text %s' % (fn, len(lines_d), len(lines)))
+            display and display_two_lines(lines_d, lines)
+            e2_names.append(fn.strip('.txt'))
+            if not err_cnt:
+                print(e2_names)
+                break
+            err_cnt -= 1
+        manifest and manifest.save()
 
-                print('[e4]%s, line count: %s Docx != Text %s' % (fn, len(lines_d), len(lines)))
-                display and display_two_lines(lines_d, lines)
-                e2_names.append(fn.strip('.txt'))
-                if not err_cnt:
-                    print(e2_names)
-                    return
-                err_cnt -= 1
+    def patch_note_label(self, name, lines=None, lines0=None):
+        """ 将text2page0中的夹注小字符号回写至text2page的一份文件，返回回写后的行，lines、lines0为已有的两者的行
+        回写后去掉符号的文本与原文不同时报错，返回None
+        """
+        txt = ''.join((self.get_lines(name, 'Text2Page') if lines is None else lines) or [])
+        txt = re.sub(r'\s+', '', txt)  # 去掉换行，以便比对
+        txt0 = ''.join((self.get_lines(name, 'Text2Page0') if lines0 is None else lines0) or [])
+        txt0 = re.sub(r'\s+', '', txt0)  # 去掉换行，以便比对
+        txt0 = self.trans_char2unicode(txt0)
+        txtn, lost = transplant_marks(txt, txt0)
+        if lost:
+            print('[e1]%s, %s labels not patched' % (name, lost))
+        txt, _txt = [t.replace('<', '').replace('>', '') for t in (txt, txtn)]
+        if txt != _txt:
+            print('[e1]%s, merge error:  %s[before] != %s[after]' % (name, len(txt), len(_txt)))
+            return None
+        txtn = re.sub(r'(\d\d:)', r'\n\1', txtn)
+        return [ln + '\n' for ln in txtn.split('\n')]
 
+    @profiler.profiled
     def patch_note_label_to_text2page(self, names=None):
         """ 将text2page0中的夹注小字符号回写至text2page"""
         self.load_char2unicode()
-        src_path = path.join(self.DATA_DIR, 'Text2Page')
-        for root1, dirs, files in os.walk(src_path):
-            print(root1)
-            for fn in files:
-                name, ext = fn.rsplit('.', 1)
-                if ext != 'txt' or (names and name not in names):
-                    continue
-                txt = ''.join(self.get_lines(name, 'Text2Page'))
-                txt = re.sub(r'\s+', '', txt)  # 去掉换行，以便比对
-                txt0 = ''.join(self.get_lines(name, 'Text2Page0'))
-                txt0 = re.sub(r'\s+', '', txt0)  # 去掉换行，以便比对
-                txt0 = self.trans_char2unicode(txt0)
-                seqs = CSequenceMatcher(None, txt, txt0, autojunk=False)
-                txtn = ''
-                for tag, i1, i2, j1, j2 in seqs.get_opcodes():
-                    t1, t2 = txt[i1:i2], txt0[j1:j2]
-                    if t2 in '<>' and not t1:
-                        txtn += t2
-                    else:
-                        txtn += t1
-                _txt = txtn.replace('<', '').replace('>', '')
-                if txt != _txt:
-                    print('[e1]%s, merge error:  %s[before] != %s[after]' % (name, len(txt), len(_txt)))
-                else:
-                    txtn = re.sub(r'(\d\d:)', r'\n\1', txtn)
-                    self.write_lines(name, [ln + '\n' for ln in txtn.split('\n')], 'Text2Page')
-
-    def stdtxt_vs_text2page(self, names=None, ignore_qzw=False):
-        """ 比较两份文本"""
-        logs = []
+        root1 = None
+        manifest = self.open_manifest('Text2PageNote', ['SelfChar2Unicode.txt'])
+
+        def get_files(item):
+            dst = (item[2], 'Text2Page')  # 原地回写，Text2Page既是输入也是输出
+            return [(item[2], 'Text2Page0'), dst], [dst]
+
+        items = self.skip_fresh(manifest, self.walk_files('Text2Page', names), get_files)
+        rets = self.map_files('patch_note_label', [(name,) for root, fn, name in items],
+                              loaders=['load_char2unicode'])
+        for item, lines in zip(items, rets):
+            if item[0] != root1:
+                root1 = item[0]
+                print(root1)
+            if lines is not None:
+                self.write_lines(item[2], lines, 'Text2Page')
+                manifest and manifest.update(item[2], *get_files(item))
+        manifest and manifest.save()
+
+    PIPELINE_FOLDERS = ['DocxOriTxt', 'DocxStdTxt', 'Text2Page']  # 流水线依次产生的文件夹
+
+    def pipeline_page(self, name, finished=False, aligner='dp'):
+        """ 在内存中依次执行各阶段，将DocxOriTxt0的一份文件转为Text2Page，各阶段的提示信息与分步执行时相同
+        返回{文件夹: 行}，某阶段未通过时不再继续，finished为真(已在Text2PageF中)时只转换至DocxStdTxt
+        """
+        page = dict()
+        lines, valid = self.oritxt0_2_oritxt(name, self.get_lines(name, 'DocxOriTxt0'))
+        if not valid:
+            return page
+        page['DocxOriTxt'] = lines
+        page['DocxStdTxt'], page['errs'] = self.oritxt_2_stdtxt(name, lines)
+        if finished:
+            return page
+        lines0 = self.get_lines(name, 'Text2Page0')
+        lines, lines_d = self.text2page0_2_text2page(name + '.txt', aligner, lines0, page['DocxStdTxt'])
+        if lines is None:
+            return page
+        if len(lines_d) != len(lines):
+            print('[e4]%s.txt, line count: %s Docx != Text %s' % (name, len(lines_d), len(lines)))
+            return page
+        page['Text2Page'] = self.patch_note_label(name, lines, lines0) or lines  # 回写失败时保留未回写的行
+        return page
+
+    @profiler.profiled
+    def proc_pipeline(self, names=None, keep=None, aligner='dp'):
+        """ 将DocxOriTxt0逐页在内存中转为Text2Page，依次代替proc_oritxt0_to_oritxt、proc_oritxt_to_stdtxt、
+        proc_text2page0_to_text2page及patch_note_label_to_text2page。中间结果不再写盘后重读，
+        keep为要写入的文件夹，默认只写Text2Page；jobs>1时逐页并行，主进程写盘时子进程继续处理后续页面
+        """
+        keep = ['Text2Page'] if keep is None else keep
+        err_cnt = dict()
+        self.load_variant_dict()
+        self.load_char2unicode()
         self.load_qzw()
-        src_path = path.join(self.DATA_DIR, 'DocxStdTxt')
-        for root, dirs, files in os.walk(src_path):
-            for fn in files:
-                name, ext = fn.rsplit('.', 1)
-                if ext != 'txt' or (names and name not in names):
-                    continue
-                root2 = root.replace('DocxStdTxt', 'Text2Page')
-                if not path.exists(path.join(root2, fn)):
-                    print('[e1]%s: not exist' % fn)
-                    continue
-                with open(path.join(root, fn), 'r') as rf:
-                    lines = rf.readlines()
-                with open(path.join(root2, fn), 'r') as rf2:
-                    lines2 = rf2.readlines()
-                if len(lines) != len(lines2):
-                    print('[e2]%s lines: Docx %s != Text %s' % (fn, len(lines), len(lines2)))
-                    continue
-                for n, ln in enumerate(lines):
-                    ln = re.sub(r'\s', '', ln)
-                    ln2 = re.sub(r'[<>\s]', '', lines2[n])
-                    ds = len(ln) - len(ln2)
-                    if ds == 0:
-                        continue
-                    if ds == -1 and ln2[-1] in self.qzw:
-                        if not ignore_qzw:
-                            print('[e3]%s: %s != %s' % (fn, ln, ln2))
-                            logs.append('[e3]%s: %s != %s\n' % (fn, ln, ln2))
-                        continue
-                    if ds == 1 and ln[-1] in self.qzw:
-                        if not ignore_qzw:
-                            print('[e4]%s: %s != %s' % (fn, ln, ln2))
-                        continue
-                    # print error
-                    ln += '|' + (n < len(lines) - 1 and lines[n + 1].strip() or '$')
-                    ln2 += '|' + (n < len(lines2) - 1 and lines2[n + 1].strip() or '$')
-                    errno = 5 if len(ln) > len(ln2) else 6
-                    print('[e%s]%s: %s != %s' % (errno, fn, ln, ln2))
-                    break
-        with open('vs_e3.log', 'w') as wf:
-            wf.writelines(logs)
-
-    def patch_qzw_2_oritxt0(self):
-        if not path.exists('vs_e3.log'):
+        fin_names = set() if names else {name for root, fn, name in self.walk_files('Text2PageF')}
+        items = [(name, name in fin_names) for root, fn, name in self.walk_files('DocxOriTxt0', names)]
+        rets = self.map_files('pipeline_page', items, aligner,
+                              loaders=['load_variant_dict', 'load_char2unicode', 'load_qzw'])
+        done = 0
+        for (name, finished), page in zip(items, rets):
+            for folder in self.PIPELINE_FOLDERS:
+                folder in keep and folder in page and self.write_lines(name, page[folder], folder)
+            for err, cnt in page.get('errs', {}).items():
+                err_cnt[err] = err_cnt.get(err, 0) + cnt
+            done += 'Text2Page' in page
+        for err, cnt in err_cnt.items():
+            print(err, cnt)
+        print('[pipeline]%s of %s pages reached Text2Page' % (done, len(items)))
+
+    VS_CODES = {
+        'e1': 'Text缺页',
+        'e2': '行数不同',
+        'e3': 'Text行末多千字文',
+        'e4': 'Docx行末多千字文',
+        'e5': 'Docx字数多',
+        'e6': 'Text字数多',
+    }
+
+    def stdtxt_vs_text2page_file(self, name, ignore_qzw=False, folder='Text2Page'):
+        """ 逐行比较DocxStdTxt与folder中的一份文件，返回各处不一致的记录
+        记录含页名、行号、错误类型、去掉空白及夹注符号后的两行以及字级差异，ignore_qzw时不记录e3、e4
+        """
+        recs, fn = [], name + '.txt'
+        lines2 = self.get_lines(name, folder)
+        if lines2 is None:
+            print('[e1]%s: not exist' % fn)
+            return [dict(page=name, code='e1')]
+        lines = self.get_lines(name, 'DocxStdTxt')
+        if len(lines) != len(lines2):
+            print('[e2]%s lines: Docx %s != Text %s' % (fn, len(lines), len(lines2)))
+            return [dict(page=name, code='e2', docx=len(lines), text=len(lines2))]
+        if self.get_notes(folder) is None:  # 有旁注的文件夹中已没有夹注符号
+            lines2 = split_line_marks(lines2)[0]
+        for n, ln in enumerate(lines):
+            ln = re.sub(r'\s', '', ln)
+            ln2 = re.sub(r'\s', '', lines2[n])
+            ds = len(ln) - len(ln2)
+            if ds == 0:
+                continue
+            if ds == -1 and ln2[-1] in self.qzw:
+                code = 'e3'
+            elif ds == 1 and ln[-1] in self.qzw:
+                code = 'e4'
+            else:
+                code = 'e5' if ds > 0 else 'e6'
+            if ignore_qzw and code in ('e3', 'e4'):
+                continue
+            if code in ('e3', 'e4'):
+                print('[%s]%s: %s != %s' % (code, fn, ln, ln2))
+            else:
+                print('[%s]%s: %s|%s != %s|%s' % (code, fn, ln, n < len(lines) - 1 and lines[n + 1].strip() or '$',
+                                                  ln2, n < len(lines2) - 1 and lines2[n + 1].strip() or '$'))
+            recs.append(dict(page=name, line=n + 1, code=code, docx=ln, text=ln2, diff=get_opcodes(ln, ln2)))
+        return recs
+
+    @profiler.profiled
+    def stdtxt_vs_text2page(self, names=None, ignore_qzw=False, folder='Text2Page', report_file='vs_report.jsonl'):
+        """ 比较DocxStdTxt与folder的全部文件，各处不一致按页面顺序逐条写入report_file(JSON lines)，并打印汇总"""
+        self.load_qzw()
+        rec_cnt, page_cnt = Counter(), Counter()
+        items = [(name,) for root, fn, name in self.walk_files('DocxStdTxt', names)]
+        with open(report_file, 'w') as wf:
+            for recs in self.map_files('stdtxt_vs_text2page_file', items, ignore_qzw, folder, loaders=['load_qzw']):
+                for rec in recs:
+                    wf.write(json.dumps(rec, ensure_ascii=False) + '\n')
+                    rec_cnt[rec['code']] += 1
+                page_cnt.update({rec['code'] for rec in recs})
+        print('----------DocxStdTxt vs %s: %s pages----------' % (folder, len(items)))
+        print('code\tpages\tlines\tdesc')
+        for code, desc in self.VS_CODES.items():
+            print('%s\t%s\t%s\t%s' % (code, page_cnt[code], rec_cnt[code], desc))
+
+    @profiler.profiled
+    def patch_qzw_2_oritxt0(self, report_file='vs_report.jsonl'):
+        """ 根据比较报告中首行的e3记录，将Text行末多出的千字文补入DocxOriTxt0"""
+        if not path.exists(report_file):
             return
         self.load_qzw()
-        with open('vs_e3.log', 'r') as rf:
-            for line in rf.readlines():
-                mt = re.match(r'^.*(GL_\d+_\d+_\d+).txt:\s(\d\d):(.*)\s!=\s(\d\d):(.*)$', line.strip())
-                if not mt:
+        with open(report_file, 'r') as rf:
+            for line in rf:
+                rec = json.loads(line)
+                if rec['code'] != 'e3' or not rec['docx'].startswith('01:'):
                     continue
-                name, lno1, ln1, lno2, ln2 = mt.groups()
-                if lno1 == '01' and len(ln2) - len(ln1) == 1 and ln2[-1] in self.qzw:
+                name, ln1, ln2 = rec['page'], rec['docx'][3:], rec['text'].split(':', 1)[-1]
+                if len(ln2) - len(ln1) == 1 and ln2[-1] in self.qzw:
                     print(name, ln1, ln2)
                     lines = self.get_lines(name, 'DocxOriTxt0')
                     lines[0] = lines[0].strip('\n') + ln2[-1] + '\n'
                     self.write_lines(name, lines, 'DocxOriTxt0')
 
 
+_worker = None  # 进程池中各子进程的GlTool实例
+
+
+def _init_worker(data_dir, loaders, profile=False):
+    """ 子进程初始化，每个进程只加载一次字典"""
+    global _worker
+    GlTool.DATA_DIR = data_dir
+    GlTool.stores = dict()  # 不沿用主进程打开的打包文件
+    profiler.enabled = profile
+    profiler.reset()
+    _worker = GlTool()
+    for loader in loaders:
+        getattr(_worker, loader)()
+
+
+def _call_worker(task):
+    """ 在子进程中处理一份文件，并截获其输出，交由主进程按顺序打印"""
+    func, args = task
+    buf = io.StringIO()
+    cpu = time.process_time()
+    with redirect_stdout(buf), profiler.span(func, item=args[:1]):
+        ret = getattr(_worker, func)(*args)
+    prof = None
+    if profiler.enabled:  # 计数及事件交由主进程合并
+        profiler.count('worker_cpu', time.process_time() - cpu)
+        prof = dict(profiler.counts), profiler.events
+        profiler.reset()
+    return ret, buf.getvalue(), prof
+
+
 def main():
+    parser = argparse.ArgumentParser(description='高丽藏数据整理工具')
+    parser.add_argument('--jobs', type=int, default=1, help='并行处理的进程数')
+    parser.add_argument('--incremental', action='store_true', help='只处理输入或所用字典有改动的页面')
+    parser.add_argument('--profile', nargs='?', const='profile_trace.json',
+                        help='记录各阶段的耗时及计数，打印汇总表并写入Chrome trace文件，默认为profile_trace.json')
+    args = parser.parse_args()
+
     g_names = []
-    gt = GlTool()
+    gt = GlTool(args.jobs, args.incremental, bool(args.profile))
 
+    # gt.proc_pipeline(g_names, ['DocxStdTxt', 'Text2Page'])
     # gt.proc_oritxt0_to_oritxt(g_names)
     # gt.proc_oritxt_to_stdtxt(g_names)
     # gt.proc_text2page0_to_text2page(g_names, 1, 500)
@@ -532,8 +1077,23 @@ def main():
     # gt.cmp_file('%s.txt' % g_names[0], 'DocxStdTxt', '', 'Text2Page0')
 
     # gt.find_txt('01:', 'Text', 'utf-16', 1, False)
-    # gt.find_txt('<', 'Text2Page0', 'utf-8', 5)
+    # gt.find_txt('<', 'Text2Page0', 'utf-8', 5, regex='(<.*>).*(<.*>)')
+
+    # gt.proc_char_freq('Text2Page0')
+
+    # gt.export_notes('Text2Page', 'Text2PageClean')
+    # gt.find_note_txt('佛', 'Text2PageClean', 5)
+
+    # gt.build_concordance('DocxStdTxt')
+    # gt.print_kwic('如是我聞', 'DocxStdTxt', 10)
+    # gt.print_repeated('DocxStdTxt', 2, 20)
+
+    # gt.pack_folder('Text', 'utf-16')
+    # gt.unpack_folder('Text2Page')
 
+    if args.profile:
+        profiler.print_summary()
+        profiler.save_trace(args.profile)
     print('finished.')
 
 
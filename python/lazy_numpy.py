@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: 按需导入numpy。numpy导入较慢，similar、concordance、ngram_index只在首次用到时导入，
+       未安装numpy时各模块以纯Python处理
+@time: 2026/10/18
+"""
+_numpy = None  # 首次调用load_numpy时导入；未安装时为False
+
+
+def load_numpy():
+    """ 返回numpy模块，未安装时返回False，进程内只导入一次"""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: 增量构建清单。记录每个处理阶段中各页输入文件的摘要、所用字典的版本以及输出，
+       重新运行时只处理输入有改动，或者包含字典中改动过的字的页面
+@time: 2026/10/18
+"""
+import os
+import json
+import hashlib
+import os.path as path
+
+
+def get_digest(data):
+    """ 计算bytes、str或“字→值”映射的摘要"""
+    if isinstance(data, dict):
+        data = json.dumps(data, ensure_ascii=False, sort_keys=True)
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha1(data).hexdigest()[:16]
+
+
+def read_file(fn):
+    if path.exists(fn):
+        with open(fn, 'rb') as rf:
+            return rf.read()
+
+
+class Manifest(object):
+    """ 某一处理阶段的增量构建清单
+    assets为该阶段所用字典，形如{字典名: {字: 值}}，字典改动时，仅影响包含改动字的页面
+    reader(key)返回输入、输出文件的内容(bytes)，不存在时返回None，默认key为文件路径
+    options为影响输出的阶段选项，形如{选项名: 值}，与上次构建不同时全部页面均需重建
+    whole为不能逐字比较的字典，如改动一字即可影响其他字的字典，有任何改动时全部页面均需重建
+    """
+
+    def __init__(self, data_dir, stage, assets, reader=read_file, options=None, whole=()):
+        self.reader = reader
+        self.options = get_digest(options) if options else None
+        self.whole = set(whole)
+        self.root = path.join(data_dir, '.manifest', stage)
+        self.file_name = path.join(self.root, 'pages.json')
+        self.assets = {name: (get_digest(mapping), mapping) for name, mapping in assets.items()}
+        self.pages = dict()  # 页名 -> {'inputs': [摘要], 'outputs': [摘要], 'assets': {字典名: 摘要}, 'options': 摘要}
+        if path.exists(self.file_name):
+            with open(self.file_name, 'r') as rf:
+                self.pages = json.load(rf)
+        self.changed = dict()  # (字典名, 旧摘要) -> 改动过的字
+
+    def get_snapshot_file(self, asset, digest):
+        return path.join(self.root, '%s.%s.json' % (asset, digest))
+
+    def get_changed_chars(self, asset, digest):
+        """ 字典从digest版本至当前版本改动过的字，旧版本快照缺失时返回None"""
+        key = (asset, digest)
+        if key not in self.changed:
+            changed = None
+            snapshot = read_file(self.get_snapshot_file(asset, digest))
+            if snapshot is not None:
+                old, new = json.loads(snapshot.decode('utf-8')), self.assets[asset][1]
+                changed = {ch for ch in set(old) | set(new) if old.get(ch) != new.get(ch)}
+            self.changed[key] = changed
+        return self.changed[key]
+
+    def is_fresh(self, name, inputs, outputs):
+        """ 页面的输入、输出及所用字典相对上次构建均无影响性的改动"""
+        rec = self.pages.get(name)
+        if not rec or any(self.reader(key) is None for key in outputs):
+            return False
+        if rec.get('options') != self.options:
+            return False
+        contents = [self.reader(key) for key in inputs]
+        if [c is not None and get_digest(c) for c in contents] != rec['inputs']:
+            return False
+        chars = None
+        for asset, (digest, mapping) in self.assets.items():
+            old = rec['assets'].get(asset)
+            if old == digest:
+                continue
+            if asset in self.whole:
+                return False
+            changed = self.get_changed_chars(asset, old) if old else None
+            if changed is None:
+                return False
+            if chars is None:
+                chars = set(b''.join(c for c in contents if c).decode('utf-8', 'ignore'))
+            if chars & changed:
+                return False
+        return True
+
+    def update(self, name, inputs, outputs):
+        """ 记录页面本次构建的结果，须在写入输出之后调用"""
+        self.pages[name] = dict(
+            inputs=[c is not None and get_digest(c) for c in map(self.reader, inputs)],
+            outputs=[c is not None and get_digest(c) for c in map(self.reader, outputs)],
+            assets={asset: digest for asset, (digest, mapping) in self.assets.items()},
+        )
+        if self.options:
+            self.pages[name]['options'] = self.options
+
+    def save(self):
+        not path.exists(self.root) and os.makedirs(self.root)
+        with open(self.file_name, 'w') as wf:
+            json.dump(self.pages, wf, ensure_ascii=False)
+        # 保存当前字典的快照，并清理已无页面引用的旧快照
+        used = {self.get_snapshot_file(asset, digest) for rec in self.pages.values()
+                for asset, digest in rec['assets'].items()}
+        for asset, (digest, mapping) in self.assets.items():
+            fn = self.get_snapshot_file(asset, digest)
+            if fn in used and not path.exists(fn):
+                with open(fn, 'w') as wf:
+                    json.dump(mapping, wf, ensure_ascii=False)
+        for fn in os.listdir(self.root):
+            fn = path.join(self.root, fn)
+            if fn != self.file_name and fn not in used:
+                os.remove(fn)
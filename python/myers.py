@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: Myers的O(ND)差异算法，求两个序列的最长公共子序列，D为两者的差异数
+@time: 2026/10/18
+"""
+
+
+def get_matching_blocks(a, b, max_d=None):
+    """ a与b的公共子序列，格式同difflib.SequenceMatcher.get_matching_blocks，即[(i, j, 长度)]，
+    以(len(a), len(b), 0)结尾。差异数超过max_d时返回None
+    """
+    n, m = len(a), len(b)
+    s = 0  # 首尾相同的部分不参与比较
+    while s < n and s < m and a[s] == b[s]:
+        s += 1
+    e = 0
+    while e < n - s and e < m - s and a[n - 1 - e] == b[m - 1 - e]:
+        e += 1
+    mid = diff(a[s:n - e], b[s:m - e], max_d)
+    if mid is None:
+        return None
+    blocks = [(0, 0, s)] + [(i + s, j + s, k) for i, j, k in mid] + [(n - e, m - e, e)]
+    ret = []
+    for i, j, k in blocks:
+        if not k:
+            continue
+        if ret and ret[-1][0] + ret[-1][2] == i and ret[-1][1] + ret[-1][2] == j:
+            ret[-1] = (ret[-1][0], ret[-1][1], ret[-1][2] + k)
+        else:
+            ret.append((i, j, k))
+    return ret + [(n, m, 0)]
+
+
+def get_opcodes(a, b):
+    """ 格式同difflib.SequenceMatcher.get_opcodes，只返回不相同的部分[(tag, i1, i2, j1, j2)]"""
+    ops, i, j = [], 0, 0
+    for bi, bj, size in get_matching_blocks(a, b):
+        tag = 'replace' if i < bi and j < bj else 'delete' if i < bi else 'insert' if j < bj else None
+        tag and ops.append((tag, i, bi, j, bj))
+        i, j = bi + size, bj + size
+    return ops
+
+
+def diff(a, b, max_d=None):
+    """ 贪心地沿各条对角线前进，记录每一轮的状态以便回溯，返回[(i, j, 长度)]"""
+    n, m = len(a), len(b)
+    if not n or not m:
+        return []
+    max_d = n + m if max_d is None else min(max_d, n + m)
+    v, trace = {1: 0}, []
+    for d in range(max_d + 1):
+        trace.append(v.copy())
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]  # 自上一轮的k+1对角线插入b的一个元素
+            else:
+                x = v[k - 1] + 1  # 自上一轮的k-1对角线删除a的一个元素
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x, y = x + 1, y + 1
+            v[k] = x
+            if x >= n and y >= m:
+                return backtrack(trace, n, m)
+    return None
+
+
+def backtrack(trace, x, y):
+    blocks = []
+    for d in range(len(trace) - 1, -1, -1):
+        v, k = trace[d], x - y
+        if k == -d or (k != d and v[k - 1] < v[k + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[prev_k]
+        prev_y = prev_x - prev_k
+        size = min(x - prev_x, y - prev_y) if d else x  # 本轮沿对角线前进的长度
+        size > 0 and blocks.append((x - size, y - size, size))
+        x, y = prev_x, prev_y
+    return blocks[::-1]
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: 文件夹的n-gram倒排索引。记录每个1至N字的字串出现在哪些页面中，查询时求各字串页面的交集，
+       只需读取少数候选页面加以核对。页面改动后只重新索引改动过的页面。
+       给定逐字替换的归一化转换表时，索引页面归一化后的文本，查询时同样先归一化。
+       倒排表与concordance相同，存为定长整数数组，查询时内存映射，无需加载
+@time: 2026/10/18
+"""
+import os
+import mmap
+import pickle
+import os.path as path
+from array import array
+from bisect import bisect_left
+from manifest import get_digest
+from lazy_numpy import load_numpy
+
+N = 3  # 索引1至N字的字串
+BITS = 21  # 每字的码位所占的位数，N字的编码不超过64位
+BATCH_CHARS = 1 << 22  # 成批索引时每批的字数，限制numpy数组所占的内存
+
+
+def get_code(gram):
+    """ 字串的编码，各字的码位依次占BITS位，不足N字时低位补0"""
+    code = 0
+    for i, ch in enumerate(gram):
+        code |= ord(ch) << BITS * (N - 1 - i)
+    return code
+
+
+def get_page_codes(txt):
+    """ 一页中1至N字的各字串的编码"""
+    return {get_code(txt[i:i + k]) for k in range(1, N + 1) for i in range(len(txt) - k + 1)}
+
+
+def get_entries(np, pages):
+    """ [(页面编号, 内容)]中各页1至N字的字串，返回按(编码, 页面编号)排序、去重后的两个数组"""
+    txt = ''.join(content for pid, content in pages)
+    cps = np.frombuffer(txt.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+    owners = np.repeat(np.array([pid for pid, content in pages], dtype=np.uint32), [len(c) for pid, c in pages])
+    n, codes, pids = len(cps), [], []
+    code = np.zeros(n, dtype=np.uint64)
+    for k in range(1, N + 1):
+        m = n - k + 1
+        if m <= 0:
+            break
+        code = code[:m] | (cps[k - 1:k - 1 + m] << np.uint64(BITS * (N - k)))
+        valid = owners[:m] == owners[k - 1:k - 1 + m]  # 不跨页
+        codes.append(code[valid])
+        pids.append(owners[:m][valid])
+    if not codes:
+        return np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.uint32)
+    codes, pids = np.concatenate(codes), np.concatenate(pids)
+    order = np.lexsort((pids, codes))
+    codes, pids = codes[order], pids[order]
+    keep = np.ones(len(codes), dtype=bool)
+    keep[1:] = (codes[1:] != codes[:-1]) | (pids[1:] != pids[:-1])
+    return codes[keep], pids[keep]
+
+
+class NgramIndex(object):
+    """ 一个文件夹的倒排索引，页面内容为去掉换行后的整页文本。root下的文件：
+    meta.pkl为页名、版本标记及尚未合并的增量；keys.<代>.u64为排序后的字串编码，
+    offsets.<代>.i64为各字串在postings.<代>.u32中的起始位置，postings为各字串所在的页面编号，编号递增
+    """
+    MERGE_MIN = 1 << 16  # 增量的条目超过此数及已合并条目的1/8时，合并入倒排表
+
+    def __init__(self, root, fold=None):
+        self.root = root
+        self.meta_file = path.join(root, 'meta.pkl')
+        self.fold = fold  # 归一化转换表，须逐字替换，以使归一化前后的偏移一致
+        self.fold_digest = fold and get_digest({str(k): v for k, v in fold.items()})
+        self.names = []  # 页面编号 -> 页名，已被重新索引的旧编号为None
+        self.stamps = dict()  # 页名 -> (页面编号, 版本标记)
+        self.delta = dict()  # 字串编码 -> array(页面编号)，上次合并后索引的页面
+        self.gen = 0  # 倒排表的代，每次合并加1，旧代的文件在保存后删除，第0代为空
+        self.maps, self.keys, self.offsets, self.postings = [], (), (0,), ()
+        self.loaded = False  # 已有保存的索引
+        self.dirty = False
+        if path.exists(self.meta_file):
+            with open(self.meta_file, 'rb') as rf:
+                data = pickle.load(rf)
+            if data.get('n') == N and data.get('fold') == self.fold_digest:
+                self.names, self.stamps, self.delta = data['names'], data['stamps'], data['delta']
+                self.gen = data['gen']
+                self.gen and self.open_arrays()  # 第0代为空，尚无文件
+                self.loaded = True
+        self.delta_size = sum(len(posting) for posting in self.delta.values())
+
+    def get_file(self, fn, gen=None):
+        name, ext = fn.split('.')
+        return path.join(self.root, '%s.%s.%s' % (name, self.gen if gen is None else gen, ext))
+
+    def open_map(self, fn):
+        with open(self.get_file(fn), 'rb') as rf:
+            if not os.fstat(rf.fileno()).st_size:
+                return b''
+            mm = mmap.mmap(rf.fileno(), 0, access=mmap.ACCESS_READ)
+        self.maps.append(mm)
+        return mm
+
+    def open_arrays(self):
+        self.keys = memoryview(self.open_map('keys.u64')).cast('Q')
+        self.offsets = memoryview(self.open_map('offsets.i64')).cast('q')
+        self.postings = memoryview(self.open_map('postings.u32')).cast('I')
+
+    def close(self):
+        for view in [self.keys, self.offsets, self.postings]:
+            isinstance(view, memoryview) and view.release()
+        for mm in self.maps:
+            mm.close()
+        self.maps, self.keys, self.offsets, self.postings = [], (), (0,), ()
+
+    def new_pid(self, name, stamp):
+        """ 为改动过的页面分配新的编号，该页已有的旧编号作废"""
+        old = self.stamps.get(name)
+        if old is not None:
+            self.names[old[0]] = None
+        pid = len(self.names)
+        self.names.append(name)
+        self.stamps[name] = (pid, stamp)
+        self.dirty = True
+        return pid
+
+    def add(self, name, stamp, content):
+        """ 索引一页，存入增量"""
+        if self.fold:
+            content = content.translate(self.fold)
+        pid = self.new_pid(name, stamp)
+        for code in get_page_codes(content):
+            posting = self.delta.get(code)
+            if posting is None:
+                posting = self.delta[code] = array('I')
+            posting.append(pid)
+            self.delta_size += 1
+
+    def remove(self, name):
+        old = self.stamps.pop(name, None)
+        if old is not None:
+            self.names[old[0]] = None
+            self.dirty = True
+
+    def update(self, stamps, read):
+        """ stamps为{页名: 版本标记}，标记不同的页面通过read(页名)读取内容后重新索引，返回重新索引的页数
+        改动的页面较多且已安装numpy时成批索引，直接合并入倒排表
+        """
+        for name in [name for name in self.stamps if name not in stamps]:
+            self.remove(name)
+        changed = [name for name, stamp in stamps.items()
+                   if name not in self.stamps or self.stamps[name][1] != stamp]
+        np = len(changed) > 64 and load_numpy()
+        if np:
+            pages = []
+            for name in changed:
+                content = read(name)
+                content = content.translate(self.fold) if self.fold else content
+                pages.append((self.new_pid(name, stamps[name]), content))
+            self.merge(np, pages)
+            return len(changed)
+        for name in changed:
+            self.add(name, stamps[name], read(name))
+        too_many = self.delta_size > max(self.MERGE_MIN, len(self.postings) // 8)
+        if too_many or len(self.names) > 2 * len(self.stamps) + 1024:
+            self.merge(load_numpy())
+        return len(changed)
+
+    def merge(self, np, pages=()):
+        """ 将倒排表、增量及新索引的页面[(页面编号, 内容)]合并为新一代的倒排表，同时去掉作废的编号，无需重读页面"""
+        new_ids, names = [-1] * len(self.names), []
+        for pid, name in enumerate(self.names):
+            if name is not None:
+                new_ids[pid] = len(names)
+                names.append(name)
+        if np:
+            # 旧倒排表、增量、新页面的编号依次递增，按编码稳定排序后各字串的页面编号仍然递增
+            counts = np.diff(np.array(self.offsets, dtype=np.int64))
+            codes = [np.repeat(np.array(self.keys, dtype=np.uint64), counts)]
+            pids = [np.array(self.postings, dtype=np.uint32)]  # 复制，以便随后关闭内存映射
+            if self.delta:
+                codes.append(np.repeat(np.array(list(self.delta), dtype=np.uint64),
+                                       [len(posting) for posting in self.delta.values()]))
+                pids.append(np.concatenate([np.frombuffer(posting, dtype=np.uint32)
+                                            for posting in self.delta.values()]))
+            start, size = 0, 0
+            for i, (pid, content) in enumerate(pages):
+                size += len(content)
+                if size >= BATCH_CHARS or i == len(pages) - 1:
+                    batch_codes, batch_pids = get_entries(np, pages[start:i + 1])
+                    codes.append(batch_codes)
+                    pids.append(batch_pids)
+                    start, size = i + 1, 0
+            codes, pids = np.concatenate(codes), np.concatenate(pids)
+            pids = np.array(new_ids, dtype=np.int64)[pids] if len(pids) else pids.astype(np.int64)
+            alive = pids >= 0
+            codes, pids = codes[alive], pids[alive]
+            order = np.argsort(codes, kind='stable')
+            keys, starts = np.unique(codes[order], return_index=True)
+            offsets = np.append(starts, len(order)).astype(np.int64)
+            postings = pids[order].astype(np.uint32)
+        else:
+            grams = dict()
+            for i, code in enumerate(self.keys):
+                grams[code] = [new_ids[pid] for pid in self.postings[self.offsets[i]:self.offsets[i + 1]]]
+            for code, posting in self.delta.items():
+                grams.setdefault(code, []).extend(new_ids[pid] for pid in posting)
+            for pid, content in pages:
+                for code in get_page_codes(content):
+                    grams.setdefault(code, []).append(new_ids[pid])
+            keys, offsets, postings = array('Q'), array('q', [0]), array('I')
+            for code in sorted(grams):
+                posting = [pid for pid in grams[code] if pid >= 0]
+                if posting:
+                    keys.append(code)
+                    postings.extend(posting)
+                    offsets.append(len(postings))
+        gen = self.gen + 1
+        not path.exists(self.root) and os.makedirs(self.root)
+        for fn, values in [('keys.u64', keys), ('offsets.i64', offsets), ('postings.u32', postings)]:
+            with open(self.get_file(fn, gen), 'wb') as wf:
+                values.tofile(wf)
+        self.close()
+        self.gen = gen
+        self.open_arrays()
+        self.stamps = {name: (new_ids[pid], stamp) for name, (pid, stamp) in self.stamps.items()}
+        self.names, self.delta, self.delta_size = names, dict(), 0
+        self.dirty = True
+
+    def save(self):
+        """ 保存页名及增量，并删除旧代的倒排表"""
+        if not self.dirty:
+            return
+        not path.exists(self.root) and os.makedirs(self.root)
+        with open(self.meta_file + '.tmp', 'wb') as wf:
+            data = dict(n=N, fold=self.fold_digest, names=self.names, stamps=self.stamps, delta=self.delta,
+                        gen=self.gen)
+            pickle.dump(data, wf, pickle.HIGHEST_PROTOCOL)
+        os.replace(self.meta_file + '.tmp', self.meta_file)
+        current = {path.basename(self.get_file(fn)) for fn in ['keys.u64', 'offsets.i64', 'postings.u32']}
+        for fn in os.listdir(self.root):
+            if fn not in current and fn != 'meta.pkl':
+                os.remove(path.join(self.root, fn))
+        self.loaded = True
+        self.dirty = False
+
+    def get_posting(self, gram):
+        """ 含有gram的页面编号，gram不超过N字"""
+        code = get_code(gram)
+        keys, offsets = self.keys, self.offsets
+        i = bisect_left(keys, code)
+        posting = list(self.postings[offsets[i]:offsets[i + 1]]) if i < len(keys) and keys[i] == code else []
+        return posting + list(self.delta.get(code, ()))
+
+    def candidates(self, txt):
+        """ 可能含有txt的页名。txt不超过N字时结果是确切的，否则须读取页面核对"""
+        if self.fold:
+            txt = txt.translate(self.fold)
+        if not txt:
+            return {name for name in self.names if name is not None}
+        grams = {txt} if len(txt) <= N else {txt[i:i + N] for i in range(len(txt) - N + 1)}
+        postings = sorted((self.get_posting(gram) for gram in grams), key=len)
+        pids = set(postings[0])
+        for posting in postings[1:]:
+            if not pids:
+                break
+            pids.intersection_update(posting)
+        names = self.names
+        return {names[pid] for pid in pids if names[pid] is not None}
+
+    def is_exact(self, txt):
+        return len(txt) <= N
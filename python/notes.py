@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: 夹注小字符号<、>。Text2Page0中的夹注符号按偏移回写至Text2Page；
+       夹注符号也可以从行中移出，另存为旁注[(行序号, 偏移, 符号)]，以便比较、查找时直接使用去掉符号的文本
+@time: 2026/10/18
+"""
+import re
+from bisect import bisect_right
+from difflib import SequenceMatcher
+from myers import get_matching_blocks
+
+MARK_RE = re.compile(r'[<>]')
+LNO_RE = re.compile(r'^\d+:')  # 行首的行号，跨行的夹注从其后开始
+MAX_D = 400  # 差异数超过此值时改用difflib，以免耗时过长
+
+
+def split_marks(txt):
+    """ 去掉txt中的夹注符号，返回(去掉后的文本, [(偏移, 符号)])，偏移为符号在去掉后文本中的位置"""
+    marks = [(mt.start() - k, mt.group()) for k, mt in enumerate(MARK_RE.finditer(txt))]
+    return MARK_RE.sub('', txt) if marks else txt, marks
+
+
+def join_marks(txt, marks):
+    """ split_marks的逆运算，偏移相同的符号按原顺序插入"""
+    parts, last = [], 0
+    for offset, mark in marks:
+        parts.append(txt[last:offset])
+        parts.append(mark)
+        last = offset
+    parts.append(txt[last:])
+    return ''.join(parts)
+
+
+def transplant_marks(txt, txt0):
+    """ 将txt0中的夹注符号移植至txt，txt中原有的符号先去掉，返回(移植后的文本, 未能移植的符号数)
+    txt0去掉符号后与txt相同时直接按偏移插入，否则按两者的公共子序列换算偏移，落在不同之处内部的符号无法移植。
+    位于两段相同部分之间时，左符号随后一段，右符号随前一段；换算后的偏移不小于前一符号的偏移，
+    以免同处两段之间的“<>”颠倒后重复插入其间的文字
+    """
+    txt = split_marks(txt)[0]
+    plain, marks = split_marks(txt0)
+    if plain == txt or not marks:
+        return join_marks(txt, marks), 0
+    blocks = get_matching_blocks(txt, plain, MAX_D)
+    if blocks is None:
+        blocks = SequenceMatcher(None, txt, plain, autojunk=False).get_matching_blocks()
+    starts = [j for i, j, size in blocks]
+    moved, lost = [], 0
+    for offset, mark in marks:
+        k = bisect_right(starts, offset) - 1
+        if mark == '>' and k > 0 and blocks[k - 1][1] + blocks[k - 1][2] == offset:
+            k -= 1  # 右符号同时位于前一段之末时，紧随前一段的末字
+        i, j, size = blocks[k] if k >= 0 else (0, 0, 0)
+        if offset > j + size:
+            lost += 1
+            continue
+        pos = i + offset - j
+        moved.append((max(pos, moved[-1][0]) if moved else pos, mark))
+    return join_marks(txt, moved), lost
+
+
+def split_line_marks(lines):
+    """ 将各行中的夹注符号移出，返回(去掉符号的行, 旁注[(行序号, 偏移, 符号)])，偏移不计行末换行符"""
+    plain, marks = [], []
+    for lno, ln in enumerate(lines):
+        txt, line_marks = split_marks(ln)
+        plain.append(txt)
+        marks.extend((lno, offset, mark) for offset, mark in line_marks)
+    return plain, marks
+
+
+def join_line_marks(lines, marks):
+    """ split_line_marks的逆运算"""
+    lines, by_line = list(lines), dict()
+    for lno, offset, mark in marks:
+        by_line.setdefault(lno, []).append((offset, mark))
+    for lno, line_marks in by_line.items():
+        lines[lno] = join_marks(lines[lno], line_marks)
+    return lines
+
+
+def get_note_spans(lines, marks):
+    """ 各条夹注在去掉符号的行中的范围[(行序号, 起, 止)]，跨行的夹注按行拆分，未闭合的夹注至页末为止"""
+    def add_spans(end_lno, end):
+        for k in range(start[0], end_lno + 1):
+            mt = LNO_RE.match(lines[k])
+            s = start[1] if k == start[0] else (mt.end() if mt else 0)
+            e = end if k == end_lno else len(lines[k].rstrip('\n'))
+            s < e and spans.append((k, s, e))
+
+    spans, start = [], None
+    for lno, offset, mark in marks:
+        if mark == '<':
+            start = start or (lno, offset)
+        elif start:
+            add_spans(lno, offset)
+            start = None
+    if start:
+        add_spans(len(lines) - 1, len(lines[-1].rstrip('\n')))
+    return spans
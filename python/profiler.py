@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: 性能剖析。记录各阶段的墙钟时间、CPU时间及各项计数(读写的文件数及字节数、清洗规则的命中数、逐行比对的分支数等)，
+       输出汇总表及Chrome trace格式的JSON(可用chrome://tracing、Perfetto或speedscope查看)。
+       profiler为进程内的单例，默认关闭，关闭时各方法立即返回；子进程的计数及事件由主进程合并
+@time: 2026/10/18
+"""
+import os
+import json
+import time
+import functools
+from collections import Counter
+from contextlib import contextmanager
+
+IO_KEYS = ['files_read', 'bytes_read', 'files_written', 'bytes_written']
+
+
+class Profiler(object):
+
+    def __init__(self):
+        self.enabled = False
+        self.reset()
+
+    def reset(self):
+        self.counts = Counter()  # 当前累计的计数
+        self.stages = []  # [(阶段名, 墙钟时间, CPU时间, 该阶段的计数)]
+        self.events = []  # Chrome trace的事件
+
+    def count(self, key, n=1):
+        if self.enabled:
+            self.counts[key] += n
+
+    def merge(self, counts, events):
+        """ 合并子进程的计数及事件"""
+        self.counts.update(counts)
+        self.events.extend(events)
+
+    @contextmanager
+    def span(self, name, **args):
+        """ 记录一段代码的起止时间，作为trace中的一个事件"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.events.append(dict(name=name, ph='X', ts=start * 1e6, dur=(end - start) * 1e6,
+                                    pid=os.getpid(), tid=0, args=args))
+
+    @contextmanager
+    def stage(self, name):
+        """ 记录一个阶段的墙钟时间、CPU时间及期间新增的计数，CPU时间含子进程所用的时间"""
+        if not self.enabled:
+            yield
+            return
+        counts0 = self.counts.copy()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            with self.span(name):
+                yield
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            counts = self.counts - counts0
+            cpu += counts.pop('worker_cpu', 0)
+            self.stages.append((name, wall, cpu, counts))
+            self.events[-1]['args'] = dict(counts)
+
+    def profiled(self, func):
+        """ 装饰器，将函数的执行记为同名的阶段"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.stage(func.__name__):
+                return func(*args, **kwargs)
+        return wrapper
+
+    def print_summary(self):
+        """ 打印各阶段的汇总表，其后为各阶段的其他计数"""
+        print('%-32s%10s%10s%8s%12s%8s%12s' % ('stage', 'wall(s)', 'cpu(s)', 'read', 'bytes', 'written', 'bytes'))
+        for name, wall, cpu, counts in self.stages:
+            print('%-32s%10.3f%10.3f%8s%12s%8s%12s' % ((name, wall, cpu) + tuple(counts[k] for k in IO_KEYS)))
+        for name, wall, cpu, counts in self.stages:
+            others = sorted((k, v) for k, v in counts.items() if k not in IO_KEYS)
+            if others:
+                print('----------%s----------' % name)
+                for key, cnt in others:
+                    print('%-40s%10s' % (key, cnt))
+
+    def save_trace(self, out_file):
+        with open(out_file, 'w') as wf:
+            json.dump(dict(traceEvents=self.events, displayTimeUnit='ms'), wf, ensure_ascii=False)
+
+
+profiler = Profiler()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: 行相似度的计算。每个字编码为其首个异体字组的编号（非异体字编码为负的码位），
+       编码相同即为相同或异体字，再沿对角线成段比较，只在不匹配处逐字处理错位。
+       使用异体字图时，编码为字所属的异体字类，字典1、2中的异体关系同样视为相同
+@time: 2026/10/18
+"""
+from variant import get_variant_index, is_variant
+from variant_graph import get_variant_graph
+from lazy_numpy import load_numpy
+
+
+class SimilarKernel(object):
+    """ get_similar的计算核心，结果与逐字调用is_variant的算法相同。
+    指定graph时以异体字图的is_equivalent代替is_variant
+    """
+    CACHE_SIZE = 4096
+    NP_MIN_LEN = 48  # 短于此的行逐字比较，numpy数组的开销反而更大
+
+    def __init__(self, index=None, graph=None):
+        self.graph = graph
+        if graph is None:
+            self.index = index or get_variant_index()
+            self.keys = {ch: ids[0] for ch, ids in self.index.group_ids.items() if ord(ch) > 255}
+            # 属于多个异体字组的字，作为第二个参数时编码相同并非is_variant的充要条件，须单独检查
+            self.multi = {ch for ch, ids in self.index.group_ids.items() if len(ids) > 1}
+            self.is_variant = is_variant
+        else:
+            self.keys = {ch: graph.comp[i] for i, ch in enumerate(graph.chars)}
+            # 有边连至别类的字，无论作为哪个参数，编码不同时都须单独检查
+            self.multi = graph.get_linked_chars()
+            self.is_variant = graph.is_equivalent
+        self.cache = dict()
+        self.lut = None
+        np = load_numpy()  # 未安装numpy时逐字比较编码
+        if np:
+            size = max(ord(ch) for ch in self.keys) + 1
+            self.lut = -1 - np.arange(size, dtype=np.int32)
+            cps = np.array([ord(ch) for ch in self.keys], dtype=np.int64)
+            self.lut[cps] = np.array(list(self.keys.values()), dtype=np.int32)
+            self.multi_mask = np.zeros(size, dtype=bool)
+            self.multi_mask[[ord(ch) for ch in self.multi]] = True
+
+    def encode(self, txt):
+        """ 返回(编码, 多组字标记)"""
+        ret = self.cache.get(txt)
+        if ret is not None:
+            return ret
+        np = load_numpy()
+        if not np or len(txt) < self.NP_MIN_LEN:
+            keys, multi = self.keys, self.multi
+            ret = [keys.get(ch, -1 - ord(ch)) for ch in txt], [ch in multi for ch in txt]
+        else:
+            cps = np.frombuffer(txt.encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+            inside = cps < len(self.lut)
+            codes = np.where(inside, self.lut[np.where(inside, cps, 0)], -1 - cps).astype(np.int32)
+            ret = codes, inside & self.multi_mask[np.where(inside, cps, 0)]
+        len(self.cache) >= self.CACHE_SIZE and self.cache.clear()
+        self.cache[txt] = ret
+        return ret
+
+    def is_equal(self, t1, t2, e1, e2, x, y):
+        """ t1[x]与t2[y]相同或为异体字"""
+        if e1[0][x] == e2[0][y]:
+            return True
+        marked = e2[1][y] or (self.graph is not None and e1[1][x])
+        return bool(marked) and self.is_variant(t1[x], t2[y])
+
+    def match_run(self, t1, t2, e1, e2, x, y, limit):
+        """ 自t1[x]、t2[y]起沿对角线连续相同的字数，至多limit个"""
+        c1, c2 = e1[0], e2[0]
+        if isinstance(c1, list) or isinstance(c2, list):
+            k = 0
+            while k < limit and self.is_equal(t1, t2, e1, e2, x + k, y + k):
+                k += 1
+            return k
+        diff = load_numpy().flatnonzero(c1[x:x + limit] != c2[y:y + limit])
+        for k in diff:
+            if not self.is_equal(t1, t2, e1, e2, x + k, y + k):
+                return int(k)
+        return limit
+
+    def get_similar(self, t1, t2):
+        """ t1与t2的相似度：依次比较，遇到错位时在较短的一方补位，返回相同字数与较长行字数之比"""
+        n1, n2 = len(t1), len(t2)
+        n, t_len = 0, max(n1, n2)
+        if not -4 < n1 - n2 < 4:
+            return n / t_len
+        e1, e2 = self.encode(t1), self.encode(t2)
+        i = s1 = s2 = 0  # s1、s2为t1、t2中已补位的个数
+        while i < t_len:
+            l1, l2 = n1 + s1, n2 + s2
+            stop = min(t_len, l1, l2)
+            if i >= stop:
+                break
+            run = self.match_run(t1, t2, e1, e2, i - s1, i - s2, stop - i)
+            n, i = n + run, i + run
+            if i >= stop:
+                break
+            x, y = i - s1, i - s2
+            if i + 1 < l1 and self.is_equal(t1, t2, e1, e2, x + 1, y):
+                s2 += 1
+            elif i + 1 < l2 and self.is_equal(t1, t2, e1, e2, x, y + 1):
+                s1 += 1
+            i += 1
+        return n / t_len
+
+    def get_similar_many(self, t1, candidates):
+        """ t1与多个候选行的相似度"""
+        np = load_numpy()
+        if not np or len(candidates) < 2:
+            return [self.get_similar(t1, t2) for t2 in candidates]
+        # 先成批比较主对角线，全部相同的候选无需逐个计算
+        c1 = np.asarray(self.encode(t1)[0])
+        n1, ret, rest = len(t1), [None] * len(candidates), []
+        width = n1 + 4
+        codes = np.full((len(candidates), width), np.iinfo(np.int64).min, dtype=np.int64)
+        for k, t2 in enumerate(candidates):
+            if not -4 < n1 - len(t2) < 4:
+                ret[k] = 0 / max(n1, len(t2))
+                continue
+            codes[k, :len(t2)] = self.encode(t2)[0]
+            rest.append(k)
+        if rest:
+            rows = np.array(rest)
+            lens = np.array([min(n1, len(candidates[k])) for k in rest])
+            same = codes[rows, :n1] == c1[np.newaxis, :]
+            same |= np.arange(n1)[np.newaxis, :] >= lens[:, np.newaxis]
+            for k, n, ok in zip(rest, lens, same.all(axis=1)):
+                t_len = max(n1, len(candidates[k]))
+                ret[k] = int(n) / t_len if ok else self.get_similar(t1, candidates[k])
+        return ret
+
+
+_kernels = dict()
+
+
+def get_kernel(graph=False):
+    """ 首次使用时才建立，以免导入时即加载异体字表。graph为True时使用异体字图，图重新编译或加载后随之重建"""
+    kernel = _kernels.get(graph)
+    if graph:
+        variant_graph = get_variant_graph()
+        if kernel is None or kernel.graph is not variant_graph:
+            kernel = _kernels[graph] = SimilarKernel(graph=variant_graph)
+    elif kernel is None:
+        kernel = _kernels[graph] = SimilarKernel()
+    return kernel
+
+
+def __getattr__(name):
+    if name == 'similar_kernel':
+        return get_kernel()
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+
+def get_similar(t1, t2):
+    return get_kernel().get_similar(t1, t2)
+
+
+def get_similar_many(t1, candidates):
+    return get_kernel().get_similar_many(t1, candidates)
+
+
+def get_similar_graph(t1, t2):
+    """ 同get_similar，字典1、2中的异体关系也视为相同"""
+    return get_kernel(True).get_similar(t1, t2)
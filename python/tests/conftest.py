@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: 各模块以平铺的方式导入，测试时将python目录加入sys.path
+@time: 2026/10/18
+"""
+import sys
+import os.path as path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
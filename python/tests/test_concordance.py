@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: concordance的测试
+@time: 2026/10/18
+"""
+from concordance import Concordance, build_sa, build_lcp
+
+
+def naive_sa(text):
+    return sorted(range(len(text)), key=lambda i: text[i:])
+
+
+def naive_lcp(text, sa):
+    lcp = [0] * len(sa)
+    for r in range(1, len(sa)):
+        p, q, h = sa[r], sa[r - 1], 0
+        while p + h < len(text) and q + h < len(text) and text[p + h] == text[q + h] and text[p + h] != '\x00':
+            h += 1
+        lcp[r] = h
+    return lcp
+
+
+def test_sa_lcp():
+    text = '天地玄黄宇宙洪荒天地玄\x00玄黄宇宙\x00天地玄黄宇宙洪荒天地玄\x00\x00'
+    sa = build_sa(text)
+    assert list(sa) == naive_sa(text)
+    assert list(build_lcp(text, sa)) == naive_lcp(text, naive_sa(text))
+
+
+def test_locate_skips_empty_lines(tmp_path):
+    pages = [
+        ('GL_1_1_1', ['01:天地玄黄\n', '\n', '02:宇宙洪荒\n', '   \n', '03:日月盈昃\n']),
+        ('GL_1_1_2', ['\n', '01:辰宿列张\n', '02:\n', '03:寒来暑往\n', '\n']),
+    ]
+    conc = Concordance.build(str(tmp_path), pages)
+    assert conc.kwic('洪荒', 2) == [('GL_1_1_1', 2, '宇宙', '日月')]  # 上下文可跨行，不跨页
+    assert conc.kwic('日月', 2) == [('GL_1_1_1', 3, '洪荒', '盈昃')]
+    assert conc.kwic('辰宿', 2) == [('GL_1_1_2', 1, '', '列张')]
+    assert conc.kwic('暑往', 2) == [('GL_1_1_2', 3, '寒来', '')]
+    conc.close()
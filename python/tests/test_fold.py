@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: 不区分异体字查找的测试
+@time: 2026/10/18
+"""
+import os
+import os.path as path
+from gl_tool import GlTool
+
+PAGES = ['天地第一', '玄黄心二', '宇宙人三', '洪荒時四', '日月𠔽五', '辰宿舍六']
+
+
+def write_pages(data_dir, folder='DocxStdTxt'):
+    os.makedirs(path.join(data_dir, folder, '1'))
+    for i, txt in enumerate(PAGES):
+        with open(path.join(data_dir, folder, '1', 'GL_1_1_%d.txt' % (i + 1)), 'w') as wf:
+            wf.write('01:%s\n' % txt)
+
+
+def get_found(capsys):
+    """ find_txt打印的页名"""
+    return [ln.split('#')[0][1:] for ln in capsys.readouterr().out.splitlines() if ln.startswith('[GL_')]
+
+
+def test_fold_table():
+    table = GlTool.get_fold_table()
+    for a, b in ['第心', '人時', '時舍', '舍園', '如世']:
+        assert a.translate(table) != b.translate(table)
+    assert '𠔽'.translate(table) == '人'.translate(table)
+
+
+def test_find_fold(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(GlTool, 'DATA_DIR', str(tmp_path))
+    write_pages(str(tmp_path))
+    GlTool.find_txt('人', 'DocxStdTxt', cnt=10, fold=True)
+    found = get_found(capsys)
+    assert found == ['GL_1_1_3.txt', 'GL_1_1_5.txt']
+    GlTool.find_txt('第', 'DocxStdTxt', cnt=10, fold=True)
+    found = get_found(capsys)
+    assert found == ['GL_1_1_1.txt']
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: notes的测试
+@time: 2026/10/18
+"""
+from notes import transplant_marks
+
+
+def test_transplant_same_text():
+    assert transplant_marks('01:天地玄黄', '01:天<地玄>黄') == ('01:天<地玄>黄', 0)
+
+
+def test_transplant_empty_note_at_block_boundary():
+    # “<>”两侧分属不同的相同段时，偏移不能颠倒，否则其间的“玄”被重复插入
+    txt, lost = transplant_marks('01:天地玄黄02:宇宙洪荒', '01:天地<>黄02:宇宙洪荒')
+    assert (txt, lost) == ('01:天地玄<>黄02:宇宙洪荒', 0)
+    assert txt.replace('<', '').replace('>', '') == '01:天地玄黄02:宇宙洪荒'
+
+
+def test_transplant_keeps_text():
+    txt, lost = transplant_marks('01:天地玄黄宇宙', '01:天<地日>黄<宇>宙')
+    assert txt.replace('<', '').replace('>', '') == '01:天地玄黄宇宙'
+    assert txt.count('<') + lost == 2
@@ -4,9990 +4,90 @@
 @desc: variant
 @time: 2019/6/4
 """
-import re
+import os.path as path
 
-# 第一个字为规范用字，后面为异体字
-variants = [
-    '下𠄟丅',
-    '上丄',
-    '第苐',
-    '亥𢁳𠀅𠦇',
-    '衛𠀄卫衞䘙',
-    '丈𠀋',
-    '丑丒𠃠',
-    '且𠀇',
-    '丘丠𡊣𠀈㐀㘳𤤘𠀌',
-    '兮𠔃',
-    '專𠧡专専',
-    '世𠦔卋㔺丗',
-    '叢丛樷',
-    '平𠀭𠀒𤔁',
-    '東东',
-    '烏𤚶𠂶𡗃乌𡖗𥾪',
-    '不𠀚𠙐',
-    '兩両两',
-    '天𠀘𠑺𦴞𠀡䒶兲𠕹𩇗𩇞靝',
-    '麗𠧥𪋘𠀙䴡𠪕𡡜婯丽',
-    '所𠩄𢨷𢩇',
-    '並𡘋竝傡並',
-    '亟𠯉亟焏𠄹𦱩',
-    '棗𠐇栆𠄬枣𠂲𣕿',
-    '淵渆𣴸𡆼㴊㶜𣴺囦渊渁𣶒𠝃𣾬𡇋𠀯',
-    '箕𠀮𠴩𠥊𬙡𠔋𠀠𠔝𡿸𠥩𠔐𦋊𠔛𠵶𥫚𠷛',
-    '㐁𠀬𦧖',
-    '壼𠁕𡈋𡆵壶𡔶𠁏𠆊',
-    '畾𤳏',
-    '卜𠁢𠁡',
-    '行〢',
-    '個个𠇂亇',
-    '跨𨀗𧿾𨃖𨁣㐄',
-    '書书𦘠',
-    '中𠁩𠔈𠁦𠔗𠁧',
-    '叔𠦑𢆑𡬟𠁮𡭫',
-    '乖𠁰𦭅𠂯𦮃',
-    '事𠭏𠁱𤔇',
-    '扂𠂼',
-    '龜𪚦𤕣亀龜𠁴凸𪚨𪚿𠃾龟𪚧𧑴',
-    '丸𠁽丸',
-    '為𨤒爲𦥮𢏽𤓸为',
-    '丹㣋𠕑𠁿',
-    '終𦤒𠔾𡦿𤽘𤽬𢍐𦄖𠂂终𣈩𣧩𣊂',
-    '養𢽁𢼝䍩養养奍𩛬',
-    '五𠄡㐅',
-    '凡凢凣',
-    '久乆夂',
-    '萬𤈬𥝅㸘𠂍𥝄𤍚𢁭万',
-    '乏𠂜𠓟𣥄',
-    '乎𠂞',
-    '矢笶𠓡𠂕𥎨𥬟',
-    '丟丢',
-    '派派𠂢',
-    '眾𡿻𠱦衆𠍸𠱧𥅫𫡑',
-    '虎虝𪋕𠪳虎𠂰𪊖𢋪𧆞𧇂𢁺',
-    '氏𠂩',
-    '乘椉𣔕𠅟𠨇乗𠅞𨍱𨌤𠓸',
-    '幸幸𡴘𢆎𠂷',
-    '坏𠂾阫',
-    '思𡴓𠂺𠀓恖𠃼𢍄𢙦',
-    '奏𠭡𡘶𡲱𠭕𡳡𢽥𡴨𡴝𡙹𡲯',
-    '手𠂿𡴤',
-    '𡭐𠃃𠪻𡭍',
-    '愈𠃄',
-    '𡑈𡼻',
-    '乙𠃊',
-    '會㞧㑹𠃐𣥈𠍗屶会',
-    '丩𠃏𢒥',
-    '州𠛏𠚴𣧓𠄓𠃕',
-    '蓋𤇙盖乢葢𤇁',
-    '𡯄𠠵',
-    '禮𠃞𤔑𥘍𥘆礼',
-    '舉𠃥举㪯挙𦦙𦬠擧𠔖𣁄',
-    '荒𠃤𦮋',
-    '飛飝𠃧𦐭𦒮𩙱飞',
-    '亂𠃶𤕅釠乱𢮣',
-    '始兘𠃭',
-    '乾乹𠄊亁𨺩𣦖𠄄𠄋',
-    '截𠛍𠃲𢧵擮',
-    '馗𠄁𠃳𦔱',
-    '亄𠃸',
-    '懦𢡼𢘧愞𢘎㐡',
-    '酪𠄇嗠',
-    '亃𠄈',
-    '湩𠄉',
-    '幻𣥌𠄔㕕',
-    '乃𠚝𢏩𢎧𠄕𠧤',
-    '爭争𠄙𠫩𣌦',
-    '周周𠱬𠄗',
-    '汀𠀩𢆊',
-    '豫𠄝𠄛',
-    '二弍𠄠',
-    '四亖𦉭𠁤',
-    '歲𢧁亗𢧍𡶣嵗歳𡺪𡷼岁',
-    '亙㮓𠄣𣘰',
-    '亞亜亚',
-    '純𠄤㝄纯𥾑',
-    '貳弐貮贰',
-    '恆𠄨恒𢛢㔰',
-    '況况况',
-    '亘𠄢𠀥𠄢',
-    '齊䄢齐斉亝齊斊𠫼𡕓',
-    '老𠄰𦒳',
-    '聖𩫽聖𨲚𨉑琞𠄵𨲢𧟿𡑺𦔻𥅶𦕡𤦨',
-    '產産𨹞产',
-    '克𠅡𡱠𠧻𣳂𠧹𡱀𠅏𠧳𠅔',
-    '廩㐭𪪨𢊸𥠌廪𢊣𢈺',
-    '亮亮𠅙',
-    '夜亱𠙑𠙇',
-    '亭𠅘',
-    '亳𠅢',
-    '勝𠢧𡕲𢾶𠅫胜𠙟',
-    '孰𩪿𠅩',
-    '廉𠪊㢘𢋯亷',
-    '襄𡣿㐮𧞜𠆝𧞻𧞂',
-    '郭𨞥𨽏𨟍𠆀𩫏𩫩',
-    '奧𡪃𢍢奥𡪿𠆇',
-    '棄𣓪𢍞𠆉𨓋弃𠔚𠬇',
-    '衰𠆂𣩖𠌺𧜸',
-    '庸𠭻𠆌',
-    '泰𠆗𡙌𡙥',
-    '𦤘𠆒',
-    '丁𠆤',
-    '亡兦亾',
-    '億𠌼𠐥亿',
-    '寡𧵿𡩼𠆣',
-    '乍𠆦',
-    '倉仓倉𠆳仺𫝉',
-    '儀仪𪜧',
-    '內𡗠内',
-    '冰氷仌',
-    '孑𠆨𡤼𠆬',
-    '從苁䢨𨒀𨒁𠘬𫢴𢓅𨑢従从',
-    '初𥘉䥚𡔈𫢈𢀯𠜆𠫎𣦂',
-    '令令',
-    '仞仞',
-    '作𠈨㑅𠆯𢼎𢓓',
-    '信䚱㐰訫𡥪孞',
-    '們们',
-    '儒𠍶㐵',
-    '攀㐴𠬜𠔀𢸅',
-    '長𠔊仧𠤐𨱗𠙁𡕣𠑿𨱘镸兏长𠑻𠑷',
-    '高髙𠇃',
-    '仉𠆰',
-    '彴仢',
-    '仯仦',
-    '低仾',
-    '倫伦',
-    '偽僞伪',
-    '偉伟',
-    '傖伧',
-    '傘𡙫𠍘𠎃𠋔伞',
-    '傳传傅',
-    '傷伤傷',
-    '全𠓴全㒰𠓳',
-    '妤伃',
-    '尬魀𡯔𠆷',
-    '岡𡷇𡶩𡶬𠆼㟠𨹽𦊤㟵',
-    '帑伖',
-    '役𠈧𠈿伇',
-    '施𢼘𢒃𠤒𢻩𣁒𩒂𠆹',
-    '鬧𠆴闹𢂂閙',
-    '魂𠇌䰟',
-    '仡㐹',
-    '俓𠆻',
-    '倅伜',
-    '傴𢉴伛',
-    '奼姹𠇔',
-    '本夲𠦍𠇏𠦂',
-    '休𠇲𫹎',
-    '佛𦤲仏𠇛𠑵',
-    '似𠚦佀',
-    '你你伱𤙌儞伲',
-    '伶伶',
-    '侮侮㑄',
-    '倀伥',
-    '剛𡬺𠇝刚𠜛𣗵𠝾',
-    '努伮',
-    '命𠇭𫝇𠇮𠋒',
-    '甲𡴌𠇚',
-    '酣佄',
-    '伎𠇞',
-    '价𠇴㑘',
-    '侐䦗伵',
-    '侂𠈁𠊴',
-    '癶𠇿𣥠',
-    '仰𠈟',
-    '佇竚𡀐㑏',
-    '佞倿侫𧦣',
-    '伸𠈐',
-    '侍侍',
-    '侃𠈉',
-    '侈𠈎𣆚',
-    '侯矦隹𤧝𠨶',
-    '俠侠',
-    '保𠌀𤔃𠊻𡥀𠈃𤞥',
-    '侶侣',
-    '偵𠏄侦',
-    '側侧',
-    '備𠈍僃偹俻備',
-    '僥侥',
-    '僑侨',
-    '儂侬',
-    '儈侩',
-    '儉俭𠈏倹',
-    '儘侭',
-    '光炗灮𠈑𤎫𤉭㫕𤑋',
-    '夙𠉦𠘵𡖕𠈇𣦽𡖊',
-    '宦䆠𠋪𠈄',
-    '怨𠨝𢛪𠈢㤪㥐𢘔𠨛𢖭𢘈',
-    '戴𢨇侢𢨚𢎑',
-    '法𢌇灋佱𣳴㳒',
-    '陰𨽙𤽎侌阴𣍤𨻔𨹉𠊺阥𨼖隂',
-    '佺佺',
-    '傂𠈩',
-    '喒㑑',
-    '攸𠗆',
-    '敉侎',
-    '𠈪𠈖',
-    '伊𠜰𠈽𦯴',
-    '使𡷮𠉕',
-    '侵㑴𢔀侵',
-    '倆俩',
-    '修修俢𢔜',
-    '儔𠍻𡕑俦',
-    '儷俪𠐚𠏊㒧𠌯',
-    '兵𠡿𠈯𠉔𠦛𠬿𡲍',
-    '宰𡨔𡨧𠈾𡪤',
-    '男侽',
-    '痴癡𠈴𤶢',
-    '輔辅俌𥙷𨊽',
-    '辟𨐓𠊸𠌛𠈳𨐝𦜺',
-    '順𠈼顺㥧𠉃',
-    '龍𥪢𥪑𢅛𠉒竜㡣𥪐𥫈𢀀龙𥫆𦱉𢄫𠊋𦱸辍',
-    '佖𠉘',
-    '佸𠈲',
-    '侔𠉖',
-    '俁𠋼俣',
-    '侻侻',
-    '徠徕俫',
-    '陟𠉡𠌹徏',
-    '𠌋𠈻',
-    '例𠊖',
-    '併倂',
-    '倍𠋭𠊑',
-    '值値',
-    '倪𫢳',
-    '偌偌',
-    '債债',
-    '傾倾',
-    '劫𠛗𠉨刼刧刦',
-    '喪𡂤𠸶丧𦱺𡚏𦦭𡂧䘮𡴧𠷔',
-    '悸㑧',
-    '欣俽惞',
-    '盜盗𤋆𤑂𠪁𨹇𠩼𠉭',
-    '睬倸',
-    '胤𠉥𦛬𦙍𦞩𤗅',
-    '裸躶倮𧝹𡑤',
-    '俇𢔷𠉫',
-    '偞𠉪僷',
-    '啥𠍽倽𠺽',
-    '撦偖',
-    '鬻𢑍𩱌㣃俼',
-    '倃倃𧧖䛮',
-    '𠋵𠊒',
-    '䛁𠊌𧧛𧦦',
-    '便𠊳',
-    '倚𠋣',
-    '候𠊱𠋫',
-    '偶偶',
-    '偷偸',
-    '偏偏',
-    '倏倐𤟏',
-    '傯偬',
-    '償偿',
-    '叟𠬲𡨙𠌌叟叜𡨨𡨼𠋢𡨎傁',
-    '御𠉳𧗨𢕜𢓷𠨙𠋟',
-    '贗偐贋赝',
-    '雀𩾟䲵𠋓',
-    '倢𠌿偼',
-    '僂軁偻𨊖',
-    '僎𠊨',
-    '僝𠊩',
-    '儳𠋂𠍈𢖞',
-    '崴𠋘',
-    '霿𢝠𠍢𠊮𢝽',
-    '龠𠋁',
-    '𠋸𠋕',
-    '𠋳𠊾',
-    '媌㑤㚹',
-    '𢜩𠊭',
-    '𥉈𥈌𥉉𥊕𠊹',
-    '𧳨㑱',
-    '侖𠌈𠎚',
-    '俊儁㒞㑺',
-    '倦倦𢛗𠢏',
-    '傲𢢡㥿傲𢕟慠',
-    '儐傧',
-    '儲储',
-    '壽夀𠋮寿𡔽𦓁𤕋𡭏',
-    '夏𠍺𤴞𡔰夓𣋗𠌘𨂮𩖳𡕾𡖃𡕻',
-    '寶寳𡫷珤𡪓𡩧寚宝𠋾寳㻄𩇉𤥖',
-    '態态㑷',
-    '憑凭慿𠌩𡔟凴',
-    '煽傓',
-    '侚𠋹',
-    '侳𠋿',
-    '傜𠌠傜',
-    '僁𠋱',
-    '儺𠹈𩙎傩',
-    '儻當傥',
-    '徯𥪦𢓽𠌜',
-    '㒓㣵𠋽',
-    '傭𦟛傭',
-    '僧僧',
-    '動动働𨔝',
-    '可𠍟',
-    '執𠌷𦎃𡘺执𡙕',
-    '瘸𠌳',
-    '華𠌶𠫫蕐华𣓚𦰗䔢𡼀𧅅',
-    '倬𠍬',
-    '儽傫㒍',
-    '煢㒌茕𠎽㷀𠌻',
-    '褭䙚𠌵䮍',
-    '蹕𢕏跸𠌫',
-    '侸𠍄',
-    '傏㑽',
-    '借徣𠎥',
-    '僭僭',
-    '像像',
-    '僵僵',
-    '廝厮㒋',
-    '惡悪𢛫僫𢝏',
-    '惠𢡘𢞯𠅤𦻇恵僡𢥁𦣽𢠞',
-    '慼𠎰慽',
-    '歙㒆',
-    '蕩荡𣿘𠎯蘯𣿴',
-    '偭𫣅𠎡',
-    '倕𠍮',
-    '僦𠎂',
-    '僩僴',
-    '僰𢣡𠒹𠍷',
-    '僾𠎹𢙸',
-    '嗌𠍳𡁐',
-    '愆𧗭𠐨𢡊諐𠎝𠎱𢝐𧗺𢡊𠐷',
-    '憮怃㒇',
-    '偆𠎲',
-    '傀𧝛𠎺𠐦𠐤',
-    '傻儍',
-    '僚𠏗',
-    '化化𠯒𠏁',
-    '地𨻐𡍑𡏇坔𠏂埊𤅴𡒴嶳𡓬',
-    '藕㒖',
-    '蹙𠏔䠞',
-    '載𡙚𤱱儎𨌏𡙺𡔬𢀃𨊦载',
-    '遁𨖡𨘹𠎻',
-    '偫𠍰',
-    '僄徱𠑎𤡑𢖣𠎼',
-    '儓㒗',
-    '篽𥷉𠏣𥷲',
-    '𠐻𠎾𠏯𨼭',
-    '㒥僼',
-    '僻僻𠒱',
-    '優𢖒優',
-    '舞𦏶儛𦨅𦐀',
-    '豪𩫕𩫚儫𩫞𩫎𢑸',
-    '際𠐐际',
-    '俜𠏬',
-    '㒠𠏪',
-    '滿满滿𠐎満𡈪𣼛',
-    '論论𧪺𠐜',
-    '儇𠐛',
-    '儹儧',
-    '翫𠐢',
-    '𠑟𠐈',
-    '㵾儬𫥝濪𩇟',
-    '儚𩕫𠐧𢟼',
-    '儢𡣭𠐳',
-    '憨𤺍𤸕𠐣',
-    '倝𠐱',
-    '僊𠑣',
-    '颹𠑒𩘚𩙃',
-    '儼𫤌',
-    '傮𠑤𣩒',
-    '𠑍𠑚',
-    '僐𠑫',
-    '錫㒪锡',
-    '簪𬖂兂𥯓簮',
-    '旡𠘸𨀶㒫𠑶',
-    '充充',
-    '兌兊',
-    '堯尧𡋰',
-    '免免',
-    '兔兎兔',
-    '兒𫤗児𠒆𧠇',
-    '死𤯽死𠑾𣥴𦫺𠒁𦭀',
-    '兕𧤄𠒃𤉡𠒅𧰽𠒊𧱃𧣶',
-    '卼𠨜𠒄',
-    '羌𠒌猐𡹽𦍑𡸓𦍎',
-    '臾𠒍㬰',
-    '黿𠀻𪓒𪓗𠒞',
-    '昆㒭𧲟',
-    '兜𫥢𦋌兠𤾇𤾆㿡',
-    '夤𡖸𡖷𡖴',
-    '涼𠒨凉',
-    '嬲𢣲𠒰',
-    '圥𠒶',
-    '兢𠓆',
-    '輝灳辉𠓊𤐕',
-    '燁𤑼𤒫㷸烨㒯爗',
-    '燡𤏵曎𠓋',
-    '爌黋兤',
-    '亼𠓛',
-    '財𧸄㒲𧴶财',
-    '鞭𠓠𩌻',
-    '俞兪',
-    '𤎭𠓮',
-    '遇𠓱',
-    '別𠔁𠛰别',
-    '興𦥷㒷𨑁兴𢍯',
-    '𢍏𢍒𠔉𢍊',
-    '共𩇿𠔏𦱹',
-    '具具𥃲具𥃲',
-    '貌㹸𧳒𧳖㒵䫉𨉍',
-    '典䓦𠔩𠔓',
-    '與𢌱𢌱𠔜𦥸𢌱',
-    '齒𣦋𣦗𦦂齿𠚒𣥫歯𡽔𦥒𠔒',
-    '冬𠘗昸𠘀㫡𣆼𠔙𣅈冬',
-    '坤𠔜堃𠔧𡘩',
-    '龔龚',
-    '兼𥡝𠔥𠔥',
-    '奪夺𡙜𠔟𡙸',
-    '冀兾',
-    '異異𠔱𢄖',
-    '囅冁',
-    '晨曟𠔹㫳',
-    '期𣅆𣍣𠔸',
-    '顛㒹㒹颠顚',
-    '人𠔽𤯔',
-    '冉冄',
-    '圓円圆圎',
-    '帽帽冃𧛕㡌',
-    '冊册𠕐笧𠕋𠕋𥮫𠕁',
-    '再𠕅再𠕂',
-    '回𡇌囬囘',
-    '坰冋埛垧𡹫',
-    '网𠕃𠕈𦉳𦉫𦉯𦌅𦉮',
-    '官𡦹𡧺𠕍',
-    '剮叧剐冎',
-    '雨㲾𠕒𡷎𩁼𠕲𠕘',
-    '冒冒冐𡈘𡇾𠕬𠕚',
-    '㲋𠜌𤟭㚟𣬋',
-    '害𠕛𤇵𡧱害',
-    '次次𣬌𠕞',
-    '爵𡭌𡬠爵𠙘𩰦𩰣𩰥𠕢𩰨𥥼𩰧𥥼𠋓',
-    '㒼㒼',
-    '帢𩉉𧚧𠕣𢃫𢂿',
-    '𠕭𠕥',
-    '暨𠕨曁',
-    '㗗𠕩',
-    '冔𦀒𠕮𦊯',
-    '冗冗',
-    '寫㝍写',
-    '亢𠕵',
-    '容𠕺㝐',
-    '農𣊤农𨑇𢖢𦦤欁𨑋𣎭𨑆䢉辳𦦥',
-    '宜𠣨冝宐㝖𡪀𡨆',
-    '寇𡨥𥦲㓂宼冦𢽉',
-    '段𠩻𠖊𨱮',
-    '冤冤寃寃',
-    '冠𠖌𢃙𠙙',
-    '富冨',
-    '家𡩅𡧚𠖔𡩙',
-    '寑𠖗𡩠',
-    '宣𡩦𡨈𠖚𡪏',
-    '煙𠖜𡨾㷑𤎟烟𤊗𡇽𤏯𠖣',
-    '古𠖠𡇣',
-    '禋𥛿𥛛𥛡𡫚𡫻𠖦',
-    '蜜𦸞𧖅𠖪𧓫𧉴𧒧𠖧',
-    '決决𣲺',
-    '沃𦮮㓇',
-    '冱𠖱冴',
-    '凍冻',
-    '凔𠖸',
-    '泮𣳝冸',
-    '泯冺',
-    '冹冹',
-    '凐𠗃',
-    '𠗺𠗄',
-    '冽𠗗𠗢',
-    '莊𤖈𤖊㽵𦻊庒荘𤕶𠗎',
-    '浼凂',
-    '涂凃',
-    '清𨓽淸𠗜㵙',
-    '湊𣽵凑',
-    '減减',
-    '馮冯𠗦',
-    '滅𣹹𢦹㓕烕𢛣灭',
-    '準凖',
-    '皚皑凒𩄟',
-    '臧𡒉𡒤𫧔𢨑𤖔𦣣𡍱𠗱',
-    '印𠘄',
-    '潔㓗𣳱',
-    '凜凛𠘡澟',
-    '凓𠘍',
-    '𠘢𠘒𠘇',
-    '𩇟𩇝',
-    '瀆𤄴渎凟',
-    '盪𥂳𣻭',
-    '冷𠘤',
-    '台𠘭',
-    '無𠘩𡙻𣚨𣠮𣑨𤍍㷻𣞣无旡',
-    '鳳凤𪆍鳯𧱶𠤈鴌𪈵𢐴',
-    '否𠳝𡃠𠘶',
-    '永𣱵𠘷',
-    '風𠙊凮凨凬𠙗',
-    '商𡂦𠿧𠹧𡃬𧷞𠾃𡄚𥫐𡅟𠘾𨝗',
-    '民𠘽𡻾',
-    '𩖷𠘼',
-    '以㠯𠙋',
-    '凱凯𧇔',
-    '幾𢆼𢆻𨗂㡬',
-    '谻𠙏𧮷',
-    '賵𠙒赗',
-    '處𧇤处𩂭䖏𠙚',
-    '尷𡰉尶魐凲',
-    '蘧𠙢𧄒',
-    '子𡐫𢀉𡿹𠙭𣕓㜽𢀇𢀈',
-    '囟䪿𩔨顖𦥓𠚁𠙷𩒦',
-    '塊𡒽㙕𠚛𡉇凷𠙽块',
-    '擊击撃',
-    '王𠙻',
-    '甾𠙹畠𠚀𠚋𠙾',
-    '凶㐫𣧑',
-    '甘𤮺𠙿',
-    '畫𦘕𨽶𤰱𠚇𡇍𡱮𤲿畵𤲯画',
-    '鬯𢀺𠚍',
-    '函𦞞凾𠚗圅',
-    '圖圖圗図图𡈖𡈇𡇴𧖳𠚎',
-    '臿𦦈𦥫𢆍𦥛𠚏𦦱',
-    '曲𠚖𨴈',
-    '鑿䥣𣫩𣪲凿𨗩𨯳𣫫𪚆𣫞𣪻𦦹𨰒𨰢𨖐',
-    '笄筓𠚙',
-    '刀𠚣釖',
-    '刃刃',
-    '剝𠚩𠚬剥𠛧𠧓',
-    '刊刋',
-    '刻𠚰𠜇刻𠞫',
-    '叫𠮧𠮪𠸵𠶼叫呌訆',
-    '幼𢆲𠣎㓜𢈗',
-    '刌𠚳',
-    '㔓𠚲',
-    '刈𠛄',
-    '則𠟔𠞋𠟭则',
-    '創剏𠝀创𠟐',
-    '劉𡭈𠭱刘',
-    '用𤰆𠂵𤰃𠛁',
-    '鏟鏟𠚿𨲨𩮲铲𨪑',
-    '砑𠚾',
-    '刅𠛂',
-    '㓞𠛉',
-    '𠛎𠚸',
-    '刪𠜂删𡬬𠛹𨚿',
-    '制𠝁𠛐𠝦𠛯𠜿𠜔',
-    '剜𠛠𣪰',
-    '割割𧗶𠛷𠛢𠛛',
-    '剷剗剷𣂧刬',
-    '剄刭',
-    '𠚥刟',
-    '列𠛱𠜺',
-    '刑𠛬',
-    '刺刾㓨',
-    '刮𠜜刮',
-    '剁刴',
-    '剎𠜽刹𠛴',
-    '劑剂剤𠜸',
-    '劌刿',
-    '劊刽劊',
-    '剈𠜠𠜟𠛭',
-    '前𣥑歬𠝣前',
-    '剔𠜓掦𠠡',
-    '劍剣剑劔劒𠠆劎',
-    '劾𠜨𠡌',
-    '勁劲𠡍䑒𠡕',
-    '工㠪𠜝㣉𢒄',
-    '剆剆',
-    '郤𨛠𨜪𠜗𨚥郄',
-    '𠜒𠜥',
-    '𠝞𠜕',
-    '剖𠞌𠝒',
-    '劇剧𠟵',
-    '斷𣂱𠸿𣂢𣃔𠝅㫁𣦙𣂾𣂣断𣂸𣦕𠜷',
-    '眷𨤗𠝂𨤓',
-    '腦𦜩𠜶𦛳脑𦠤脳𦞄𠟞𦝶匘堖𦭣𦛁𦠊𩩀',
-    '刳𪟉𨴇',
-    '剺𢾨𠞲𣪤𢍛𠢐剓',
-    '劂𠜾',
-    '劙𠠞㓯𠠫',
-    '疇𤲮𢑜𢑔𠝽畴𢏚',
-    '鍥㓶䤿锲',
-    '鍬𢊙锹𠝡鍫',
-    '刲𠝥',
-    '㓼𠞻𠞘𠟴𠝱㔑',
-    '𠞭𫦉',
-    '剩剰𠟇',
-    '吻脗𠞍𬛆𦝮㗃',
-    '策箣𥳯𡁲筞𠞦萗𥮮𠞁𢄆䇿',
-    '剉𠞐',
-    '劓𨞳㓷',
-    '茢𦴟𠞝',
-    '𠜱𠞇',
-    '𠞪𠞪𠢕',
-    '㓾𠞂',
-    '剪𠞽',
-    '剿𠟘𣩓𠟾𠞰𠟿',
-    '戮𡠢𦞋𠞨𡭁𣩍𦐱',
-    '劘𠠒𠞥',
-    '㓱𠞼',
-    '罰罚𠟟罸𠟑𦋬',
-    '剒𠟏',
-    '劄劄',
-    '㓵𠟎',
-    '㔆𠟆',
-    '𠟊𠟖',
-    '㔃㔢㔃',
-    '𠠃𠟜㔐',
-    '𠠝𠟄',
-    '劃𠟱',
-    '劋𠟯',
-    '斀𣀈劅',
-    '𠞉𠟫',
-    '㔍𠟬𠠀',
-    '魝𠟮',
-    '㔌㔌',
-    '𢆚䄯䄯𠠅𡘸𢆬䅐',
-    '𠠎𠠰𠠛',
-    '靡𠠣𢌁',
-    '𠟨𠠢',
-    '副疈㨽𠠦',
-    '剽勡𡭓𠠧𡬽𠣆',
-    '刵𠠨',
-    '斸劚𣃁',
-    '刢𠠱',
-    '力𠠲',
-    '勸勧劝',
-    '辦办',
-    '務務务㳇',
-    '㔕㔕',
-    '㩻攰',
-    '勞𠣁𣬄𢥒労𣬃劳',
-    '勵励',
-    '黜㔘',
-    '勢势𫝑',
-    '效効',
-    '逸𤖍𠡓𤖚',
-    '劶㔚',
-    '勇勈𢦨㦷勇',
-    '勃𠃱㪍㔜',
-    '勛勳勋勲𠢼',
-    '年䄭𦼌𠦅𠦚秊𠡦',
-    '敏敏勄',
-    '敕𢽈𠡠勅',
-    '𠡞𠡞',
-    '勉𠢖勉',
-    '猛𠩜勐',
-    '勩𦘓𠡫',
-    '劸𠡬',
-    '𠡯𠡸',
-    '勤𠢄勤𠢀',
-    '勍𠡽',
-    '𠢉𠡾',
-    '舅𤽲𤰧𦦊𦥶𠢎',
-    '𠢅𠢅𠢍',
-    '㔡𠢒',
-    '敵文𠢗𢿪',
-    '𠣀勥𠣃',
-    '𠢤憠𠢭',
-    '勠𠢯',
-    '勦𠢶',
-    '㔦㔦',
-    '㔣𠢿',
-    '𠣊𠣋𠢻㔧',
-    '攣挛𠣈',
-    '勻匀',
-    '丐匄𠣣',
-    '包包',
-    '匆匆匇悤怱忩',
-    '翰𩙴𨍚𨌺𠣍𩙶𨎰',
-    '垂𡍮埀𡷩𠣔',
-    '旬𠣚𠣙𠣡',
-    '喟𠣠𠷝𠿥',
-    '軍𦉼𡗽𡨏军𠣦𠣞𡗺',
-    '冢𠣥',
-    '約约𠣩',
-    '芻𦱻𦷝蒭𦮊𠣧𦱪',
-    '胊𦚧𠣪',
-    '訇𠣭𧥻',
-    '𠣾𠣴𠣸𠤇',
-    '𠤄𠣮',
-    '匐𠣵𨄩𨄑',
-    '𠣿𠣽匓',
-    '匑𠤂匔',
-    '㔩𠤅𩇠',
-    '絕絶𢴭𢇍𢇑绝𠤉撧',
-    '能𦝕䏻𫧇',
-    '北北',
-    '旨𣅀𤮻𠤔𠮛𣅌𠩊旨',
-    '𠤗𠤑𠤜',
-    '卓𢂚㔬𠤟𠤚𢂦𠤞𠦝',
-    '真𡙊眞真𠤛真',
-    '廄廏廐𠤙厩𢋁',
-    '匙匙𢁈㔭',
-    '一𠤪弌',
-    '匚𠤬𠥓',
-    '也𦬀𠔄𦫴',
-    '匠匞',
-    '柩匶柾匛𣡛𠥂𠥬',
-    '抵𠥯𢪔拞',
-    '簠𧁔𦻌盙𠤳𠤱',
-    '笲匥',
-    '𩋃𠤸',
-    '匡匩',
-    '甚𤯅𠯕𠥄𥱅',
-    '桮𦈧𠥀𦈶',
-    '篋箧匧',
-    '𠤿𠤾',
-    '匢匫𠥋',
-    '匱𨙑鑎匮',
-    '簋𥁬㔲𣌽㔳𣪕',
-    '𠚘𠥒',
-    '𠤼𠥑',
-    '帷𠥛',
-    '彀𠥚𢐙',
-    '奩𨘰𢅸𨕏奁𢊴匳匲',
-    '櫝匵椟',
-    '籩𠥫𥸅𠥣𨘚',
-    '𤔱𠥪',
-    '㔶㔶',
-    '區区𥕥',
-    '𠥮㔷',
-    '㔸𠥶𠥃',
-    '䖙𠥸',
-    '升㚈𦫵',
-    '廿卄',
-    '卒䘚卆𨒳',
-    '疾𤖏𤕺𤶅𤶥𤻣𥏂𠥻𤕼𥐃𥏴',
-    '丕㔻',
-    '卅𠦃',
-    '協旪𠦢协',
-    '畢𤲜毕𤲃魓',
-    '卍卐',
-    '𠦒𠦆',
-    '𠦘𠦕',
-    '卑𡮁卑𤰞',
-    '單𠦤単单𠫹',
-    '支𠦙𣏃𢺶',
-    '𠦫𠦣',
-    '博愽𩫯博',
-    '師𠦵𠵀师𩇱𢂖𢃋',
-    '斡𠦷𨋼',
-    '榫㔼',
-    '車车𠦴𨏖',
-    '革菆𠦶',
-    '𠦪𦱧',
-    '幹𠧄',
-    '敦㪟𠧈𣀦𢼪',
-    '率卛',
-    '犨犫𠧐',
-    '壤𣩽𦦶壌𠧑',
-    '盧𥃈卢',
-    '弄𡱯挵𠧗挊㺯',
-    '歹𠧔',
-    '虔𧆛𠧘𠧺䖍',
-    '西㢴𠧜',
-    '兆𡉵𡊥𠧞',
-    '咎咎𠧨',
-    '近𣂠𣥍𣥪𠧣',
-    '卣㔽',
-    '逌𨔟𨓘𠧠𠧷',
-    '叀𡴁𡵏𠧢𡴗',
-    '衡𠧽𢖍𠧲𡙏𡘻𨏎𡙉',
-    '剋尅𠧶',
-    '粟𥟫𠧼𥸫𥹟𥾄𥻆䅇',
-    '𥜾𠨈𥝁𠨁𥜽卨',
-    '我𩇶𠨂𢦓𢦠𢦐𢦖𨈟',
-    '貞𠨀贞',
-    '𠧟𠨅',
-    '𠧪𠨋',
-    '卩卪㔾',
-    '卯𩇨𩇦戼𩇧𠨍𤕰𦕔',
-    '卬𠨐',
-    '卮𠨗巵',
-    '弼𢐈𢐡㢸𢐝弻𢐤𢏇㢶𢐀𠨒𢼥',
-    '抑𢬃𢫽𢮮𠨔',
-    '𠨎𠨓𠨖',
-    '卻却㕁',
-    '即皍即卽卽',
-    '卸䣃缷',
-    '卿卿𨜮𠨞卿卿',
-    '卷㢧𠨟巻𩁫𨤖',
-    '膝𦜔厀𦡩𦡀',
-    '𨪐𠨣𨮃',
-    '𢍱𠨧𢍹',
-    '廳㕔𤘖厛厅廰',
-    '厄𢨤𢀴𢨩𠂘',
-    '厲𢋭𠪄厉𠪿',
-    '女𠨰',
-    '宇㝢㡰𠨯㙑𢉠𡧈𡧈',
-    '辰𨑃𨑄𠨷𠂮𠨱𠩟',
-    '磔𨃮厇𡍎𢵍𨃥',
-    '仄𠨮𤴩',
-    '厭懕𢣽㦔厌',
-    '壓圧压',
-    '厙厍',
-    '嚴严厳𡅾𡃫𡅝𡅮𡆉𡅔',
-    '𠨭𡴈𠩀𩰋',
-    '席𠩛𥔆𠩌',
-    '庚𧟴𠩖',
-    '廁𨕟厕厠',
-    '應𧭭譍𠩍噟応𡄖𢇭𤻮',
-    '斥𠩋𤵍㡿',
-    '庣𠩓',
-    '𠩘𫨆',
-    '𠩪𠩆',
-    '庡㕈',
-    '𢈈㕉',
-    '厚𠩰𠩞𠪋𣆉𫝗𡦬𡦩',
-    '原𠩤𨘡𠪥𠩠',
-    '峨峩𠩙𡽥𡻍',
-    '房𣃞𠩝𢨲',
-    '庮𠩚𢈞',
-    '𠩗𣢭𠩦',
-    '堆㕍𡻛垖𡸬𣳨𡌙',
-    '存𠩯𡥅',
-    '淳𣹾𤂸湻𠩭',
-    '盾𥍿𠩮',
-    '厒𠩧𠪦𠪈',
-    '斄𠩬',
-    '璹𠩱𤩉𤩈𤩇',
-    '庶𠩽𤈲𠪜𢉙庻庶𠪤𠪌𠪛',
-    '廂厢',
-    '𠪇𠩹',
-    '厴厣',
-    '廈𢌉厦𢌂𤹉',
-    '廚㕏㕑厨',
-    '憂𢟜𨗫𠪍𠮕𡺒𩕂',
-    '嵯𠪉𡾑嵳𡽓',
-    '廒厫𠪭廒',
-    '歷厯𢊆𡿌歴',
-    '廑𢋓厪',
-    '砮𢊨𥑌𠪓',
-    '𠪚𠪔𠪘',
-    '奠𠪝',
-    '廠厰',
-    '厜𠪪',
-    '瞂𠪫𢧕',
-    '廨𪠘',
-    '厥𣅞𠪼𣅲𨈐',
-    '廛𡏂㕓㙻㢆壥𢋨䣑鄽',
-    '龐龎庞',
-    '厧𠫉',
-    '屭𡳻屃𠫍',
-    '源𠫒',
-    '肱𠬟𠫔𠫖',
-    '禸𠫗𠘯',
-    '去𠫥厺𠬑㚎𠫟',
-    '牟𠫚𢃷',
-    '穹宆𠫙',
-    '吝𠴽𠳈悋𠫤𢙵恡𠲲𠯌㖁',
-    '徒𨑒𨑡𢓂𠫠𣥲𧺔',
-    '𠫓𡿮',
-    '帝𠫦𢂇',
-    '縣县',
-    '至𡉰𦤵𦤳𡊏𦤴',
-    '六𠫪',
-    '參𠫰参𠫵㕘𠻝曑𠬅',
-    '幽𤄘𠫬',
-    '齋𥚪𠫱斎䬩𩝦斋夈𠮘㪰',
-    '𠫳𠫳',
-    '素𦅪𦃃㕖𦁘𩝥',
-    '誘䛻𦎙诱𦎅𥤃𦲃㕗',
-    '畜𠬀𤠕𤲸',
-    '𡊄𠬁𢍨𡊅𢷥𡏰𢹔𡓴',
-    '齎䝴賫賷𧷔𠬎𧛁',
-    '𠬆𠬆',
-    '𠢺𣜨𣙂',
-    '及及𨕤𢎜',
-    '反𠬡反',
-    '收収𠬧',
-    '雙㕠䨇𩀝𩀱双',
-    '宄𡧫𠬚𡧌',
-    '廾𠬞',
-    '夭𡕟𡰭叐',
-    '歿𣨨𣨏𪠲',
-    '夬𡗒叏',
-    '犮叐',
-    '𠬢㞵𠬥',
-    '𢻮𠬨',
-    '史㕜',
-    '希𠬯𠬹㠻𢂞',
-    '怪𠬭恠𪫦𢘪𢚬',
-    '若𦱢𠭚𠭞𦱡𡧻𧁇𦱶𡻦𦴈若𠭀叒',
-    '𠬬𠬬',
-    '㼱𠬫𠭼𥨏𡰺𤭀𩏈𤕱𠭠𥧐四',
-    '皮𥬖𠬱𡰻𤿤𤿌𠰎𣪉',
-    '𠬛𠬸',
-    '友𦐯𦫹𦬧𠬺',
-    '奉𣩌𠬻',
-    '奔𨁼𢍃犇𧿣𧾭𥝯𨃦𠬼𩦥奔𧾜',
-    '變𢒛𢒭变㣐𢻝𢒪變𠮓𢒦𣀵𢒟𦇥変',
-    '得𢔨𧴫𢔶𠭁',
-    '敘𣁏敍叙',
-    '𡥈𠭂',
-    '臤𠭃',
-    '假𠭊',
-    '啟唘諬闙啓𢻻啔𠭎𠶳',
-    '敢𠭖𢽤敢𢼿𣆸𢽿𣪏𪠬',
-    '更㪅𠭍',
-    '桑𣕐桒𠭌槡𠭨',
-    '申𢑚𦦀𠭜𤰶𠭙𦥔',
-    '豚𠭣豘㹠𧱯𦚌𤜨𧱮𧰭𧱸𢃻𧱔',
-    '𤔔𤔐𤔒𤔬𠭟',
-    '𠭗𠭮',
-    '康𩂮𠭳',
-    '揚𠭲𢾙敭𣈟扬',
-    '疊曡𣈍𤴁叠疉𣆹㬪',
-    '摣揸𢸉𠭯',
-    '㕢𠭸',
-    '壑𡺻𡓛𫮺𡎙𫫽𡓼㕡',
-    '㣈𠮇𠭾',
-    '趣𧺥𧼝𧻽𠮋',
-    '叡𡓝壡㲊𠮉𣦲㪫',
-    '巫𠮎𡷯𢍦𢍮𢀣',
-    '搜𢯱𠮍𢱻𢯱捜',
-    '鞠𠮑躹𩊸𩍸',
-    '𩑇𠮒',
-    '夔䕫夔𣦞𩠰𧃰𡕿𣀚',
-    '右𠮢',
-    '召𠮥𠮦',
-    '只𧙋𠮡',
-    '叱𠮟',
-    '吾𠮣𢓲',
-    '號号',
-    '𢎘𠮤',
-    '吉𠮷',
-    '吁𠮱𠯊',
-    '吆吆',
-    '呂吕',
-    '問问𠳅',
-    '嗎吗',
-    '嚇吓',
-    '舌𢀛',
-    '足𠯣𠯁',
-    '吃𠯏𡄊',
-    '吞呑𦙖',
-    '吳𡗿𡗾𠯵呉吳𤯂',
-    '告吿',
-    '吸吸',
-    '呱𠽿𫩜𠲐哌',
-    '品𠯮',
-    '員𪔅员貟',
-    '嗆呛',
-    '嘔呕',
-    '囈𡂞呓𠾁讛',
-    '詆𧦚诋𧦺𠯞𧦒𧦄',
-    '呥𠰩𠯍',
-    '咼呙',
-    '唄呗𠼕𡁭㗑',
-    '嘸呒',
-    '嚦呖',
-    '趺𨁜𠰵呋',
-    '𠯙𠯬',
-    '哯唺咞',
-    '𢙈吣吢',
-    '𦧉呚',
-    '𠱨𠽤𠲫𠯎',
-    '詾𧧗訩㕳',
-    '呃𠲪𧦠呝',
-    '咒詋呪',
-    '呼𢧶𡀛𠰗',
-    '咽𠾰𡲙𠰸𠽥',
-    '哭𠸅𡘈𡘜',
-    '嗜𩝙𦞯呩啫𨢍',
-    '嗚呜',
-    '嚀咛',
-    '嚨咙',
-    '國圀𡈑𠰧𡆿囻国囶𤦒𤦂𢧰𡇕𡆻䆐𡇎囯𡇅',
-    '詠𠰿咏',
-    '謀𢘓𧦥谋𠰔',
-    '哅㕼',
-    '复𡕨𠰞',
-    '詍䛖呭𧥨㖂',
-    '黽𦊣黾𪓖𪓝𦋍𪓑𪓕',
-    '齝𪗪𪙋𪗺呞',
-    '𠯗𠰼𠴴',
-    '𠯔𠰊',
-    '呧𠱱𠱎',
-    '君𠱰𠱩𠁈𠱭𠀹',
-    '咆𠿙𠲅𡂘',
-    '咨𪡌咨',
-    '啞瘂哑𤺘唖𣣾',
-    '喲哟',
-    '嘩哗',
-    '噹𪠽',
-    '噥哝',
-    '坐𡋲𡊎𡉡𠱯㘴',
-    '笑咲𥬇㗛',
-    '罕𢆔𦉻䍐䍑',
-    '罵𠺎𩡿骂駡𦋻',
-    '訊䛜讯𠱖𧨼',
-    '響𩐢𥖡𡨇㗽𥀾响𩐿𡪆',
-    '喌㖄',
-    '嗶𥑖哔',
-    '噠哒',
-    '噦哕𣤠',
-    '蓑𦸏𠱗𡔤',
-    '㗲咟',
-    '䪦𠲓',
-    '哉𠳆㦲',
-    '唐𪪒啺唐𡃯鄌𣉺𥏬',
-    '喚𧠮唤',
-    '喬𠳮',
-    '嘀唙',
-    '嘍𠳴喽𠶭',
-    '嘮唠哰',
-    '羋哶哶羋',
-    '誨𠲯诲',
-    '鄰𠳵𨞧𨽃隣𨞁邻',
-    '吰𠴈',
-    '呦𠲭𠸰',
-    '啢唡',
-    '嗊唝',
-    '嗩唢',
-    '嘜唛',
-    '崟碒崯㖗𡷧',
-    '咅哣㖣',
-    '㖕㖖',
-    '哵哵',
-    '唻𫪁',
-    '喗𠲰',
-    '喎㖞',
-    '𠹍𠳀𠺀',
-    '吮𠵷𦧊',
-    '哲嚞𠺤埑喆啠',
-    '哪㖠',
-    '喜𡔯𠶮𢐭',
-    '喋𠿚𠴬',
-    '嗇𠾂𠹫𤲝𤲷啬𢋦𤳋𠻮',
-    '嘖啧',
-    '噴喯噴喷',
-    '嘯𫪯歗嘨啸',
-    '囀啭',
-    '囉啰',
-    '悟𢤓𢛤忢𠵥',
-    '獸𤢚兽',
-    '玄𠵓𤇡',
-    '善善𦏟𦎍𧮟𦏯善譱𠵊𠲘𠾄𧨅',
-    '舔㖭',
-    '鄙鄙𠴿𨝣',
-    '哿𠵲',
-    '啐𠵒',
-    '唰𠴪',
-    '啒唿',
-    '啎𠵦𧺴',
-    '誻𠴲𧪟',
-    '讎雠𠵁讐𢢧𩀕𢛇',
-    '𠱙𠴫',
-    '𠱡𠵡',
-    '𠶰奝',
-    '𠷄𠶲',
-    '㗙𠴾',
-    '嚙啮噛',
-    '吹𠷕',
-    '咬𪗡𠸀齩䶧',
-    '唉㗒',
-    '唧喞',
-    '喳喳',
-    '啾𠷘',
-    '喉𦞕㗋',
-    '嗑㗐',
-    '噱𠻔㖸',
-    '營營営营',
-    '諺𠷗𧧑谚諺',
-    '茍𠷜𦲆𦰶',
-    '呰啙',
-    '咢㖾',
-    '哽𠶺',
-    '喫𡁒喫𠹙噄𠿊',
-    '喙喙',
-    '嗢嗢',
-    '嗖嗖',
-    '嚳喾',
-    '齶腭𪘰㗁𪘽',
-    '𠴨𠶽',
-    '𠷾𠷙',
-    '𤅊𠶿',
-    '𪘜𪘨㗍',
-    '咳𠺡',
-    '哄𠹅𠹒',
-    '啻𠺏',
-    '啼嗁',
-    '嗅㗜齅𪖻',
-    '嘗𨡔𠹉甞',
-    '嘆𡂥嘆',
-    '嗷嗸',
-    '噯嗳',
-    '囁嗫囁',
-    '群䭽𠹩𡲻羣',
-    '哳𠹗𠻯',
-    '啗㗖',
-    '喤𠹡',
-    '啽𠹞',
-    '喦𠹜',
-    '殂𣩋𣨖𡲂𣨐𣧫𠹨',
-    '烋𠹎𤈢',
-    '謇𧬯𠽱𧮎𠹟𧮈',
-    '頜颌𠹄',
-    '𠱘𠸺',
-    '啀𠺓嘊',
-    '嗂嗂𠿌',
-    '㘀𠻳㘀𠹠',
-    '𤕦𠹣𤕧𠽽𡄉',
-    '䞤跔㣘𠹪',
-    '啜涰諁𠼣',
-    '嗥獋獆䝥嘷噑獔',
-    '嗾𠻛𠻣',
-    '嘿嘿',
-    '噓嘘',
-    '嚏嚔𪖮𪖰𡄶㗣',
-    '嚶嘤',
-    '嚼𠻘',
-    '壺𡔥𢑹𥁖𡔫壷𠻭𡐎𡔦壷',
-    '星𤾪㽮𤴇𠻖皨𤽛𤯢曐',
-    '謨𠻚𢜯謩谟',
-    '阜𠻰𨸏𠼛',
-    '嗼𠻶',
-    '嘁㗤𡂔𡄱',
-    '嘐嘐𡀒',
-    '噉噉',
-    '嘬𠻕',
-    '囋𠼗',
-    '誂𧨙𠻩',
-    '謼𠻢嘑',
-    '齧𪘖𠼜𪘙𪘅𪙓',
-    '㖢𠹂',
-    '㗬𡖹',
-    '𠾉𠼡',
-    '𪘁𠻙',
-    '吟噖訡䪩',
-    '呢𠼱𠽬',
-    '喘𡄠𠽴',
-    '唾𠾊',
-    '器𡄛𦈯噐𠾖',
-    '噢噢',
-    '嚕噜',
-    '囂𡆔嚣𠾯𩫳𠽸嚻',
-    '囑嘱',
-    '悲𠾦',
-    '游㳺𠾈',
-    '然𤟙嘫',
-    '咥𠽧',
-    '啍𡃥噋',
-    '噅噕噅',
-    '嗒㗳',
-    '嘒嚖𠽡',
-    '噮𠾪',
-    '嚚𡓶𠿦𡁬𡂨𠽺𡅚',
-    '𠷑㗶',
-    '㗘𠽢𪚈𪙍𪚂',
-    '𠽭𠽯𠽮',
-    '𠽲𡂑𠽳',
-    '噾𠽨',
-    '𦧴噒',
-    '唸𠿍',
-    '喝𡀽𠿒',
-    '嘴𠾋',
-    '戢𢨐',
-    '道𨗓噵衟𧗞衜𧗟𨖁𡬹𨔞𨕥',
-    '釜釡𠿽𨥏',
-    '靈霛𤫊𩂊𤴤𩄀㚑𧈀灵霊𡀓䨩𢩙𢩝𩂳',
-    '嚭噽𧯻𡀆',
-    '謑𠿇𧫟𧨞䜁',
-    '謾𧫩谩𧬒𠿐',
-    '𠿕𡁗𡰑髚𠿻𡰘',
-    '𡂒𡀹䜠',
-    '㼫𠿜',
-    '咄嚉',
-    '對対对𡁨𡭊',
-    '銜㘅衔衘',
-    '韻𡁩韵',
-    '嚵𡁅',
-    '賾𡁃𡄙赜𧷤',
-    '𠽵𡁄',
-    '𠿎𡁑',
-    '㗼𡁖㱉',
-    '𡂙𡁂',
-    '𧭊𡁏𧭙',
-    '瀏浏𤄉嚠',
-    '讀𡂝读読',
-    '嘄𡂢',
-    '碣𡂶𡄌礍𣍔',
-    '㗫𡂠',
-    '嘻𡃨',
-    '戰𢧐战𣥎𣥟𡃣戦𣥭',
-    '歌𣤒𡃭謌𣤑',
-    '馨𪐕𡄈',
-    '噆𡄋',
-    '謔嚯谑𧫪',
-    '譸𡃮𡆓𧪀',
-    '𡂖𡃤',
-    '嚗𡄗',
-    '嚽嚽',
-    '齮𪙴𡄘',
-    '嘌𡄺',
-    '噰𡄸',
-    '艱𡆒𥌵囏𡅸艰𦫒',
-    '虩虩𡅗',
-    '嚂𡅞',
-    '𡂏𡅘',
-    '㘑囇',
-    '𧭤𡅜𧮔',
-    '嘈𡅰䜊',
-    '𡅻𡅽𡅱',
-    '嘾𡅿',
-    '𡁈𡅼',
-    '㘓囒',
-    '靦𧡝𩈍𧡻𥈅覥𩉊𨡁𡆎',
-    '雔㘜',
-    '𡂛𡆏',
-    '㘙𡆑',
-    '喧𧮥',
-    '日𡆠𡇗囸𡇁',
-    '起𨑓起𡆡𨑔',
-    '因囙𡆮𡆬',
-    '囤𡆰',
-    '團団',
-    '目𡆲𥆤𡇡𥃦',
-    '良𡆨𣌣𡰩𣌩𥭣𥭷',
-    '圍围𪢫',
-    '模𡆶𤏠橅',
-    '邑𡇃',
-    '囧𡇇𡆾',
-    '圇𠼩囵',
-    '曶𡇆𡆷',
-    '㘝𡆴𡇄𢬻',
-    '圃𡇊',
-    '胎囼',
-    '柙㘡𣘭',
-    '笏𡇉',
-    '婁娄𡡋𡝨𡡼𡝤𡇔𡞔𡜰𡇭',
-    '直𣖇直𣖴𥄂𣓟𡇛',
-    '𡆩𡇘',
-    '窖𡑛𡇪',
-    '面𡇢𠚑靣',
-    '月𡇹',
-    '圈𡈕圏',
-    '攫㸕𤔗',
-    '睦𡻲𥄈𡍬𡐑',
-    '看𡈟𡰶𥉏',
-    '罪𡈚𦋛',
-    '囮𡈙㘥𡈱𡈸𡈫',
-    '園薗𡈤',
-    '𩕖𡈣',
-    '獄狱𡈭',
-    '圔𡈮',
-    '稛𡈷',
-    '囿𡈹',
-    '土圡',
-    '圭圭',
-    '斟𨠇𡈿㘰酙㪸',
-    '墣㙸圤𡓙',
-    '場㘯场',
-    '壙壙圹',
-    '圱圲',
-    '坉𡉒',
-    '墺𡶮𡋸𡌱𡐟𡋮圫',
-    '在𡉠𥩴',
-    '坍𣲹㘱𡉱𣲕',
-    '均𡉲均',
-    '堅𡉢坚',
-    '基𡋵𡉝',
-    '墳𡏶坟𡼝隫',
-    '壢坜',
-    '壩坝䃻',
-    '壯𩡽壵𡉟𢩿壮',
-    '封𡉚𡉘𡊽𡊋',
-    '忌坖𪫥',
-    '經経𤔊经𦀇𤔕坕',
-    '耗㘪',
-    '阪𠭔岅坂',
-    '圮𪣀',
-    '坻𡊓𡉬𡊇𡊈𡊆𡉳𡍓𣲋坘',
-    '坳𡌝㘭垇',
-    '塈墍𡒖𡏲𡉙',
-    '壎壦坃',
-    '圪𡉛',
-    '坒㘩',
-    '巠𡿱坙𢀖',
-    '坑𡌖𡊬',
-    '坪𡊞',
-    '垢坸𡊦',
-    '堂坣㙶',
-    '塢隖𨻑䃖坞',
-    '墜𨼾䃍𨽎坠',
-    '壟壠垄',
-    '泥埿𡊴𡌰',
-    '臺㙜𡌫𡐉𡔼臺𡌬䑓㙵坮𡋛',
-    '堋𥦜𠳫𡐐𡊤',
-    '塋茔',
-    '壚垆',
-    '墌坧',
-    '𨸰㘲',
-    '垠𡏴𡋳𡊷㙬𡑃𡹊',
-    '堡𡋠堢',
-    '墊垫',
-    '宅𡧜𡊾',
-    '桀㘶',
-    '胡𡋞',
-    '艾㘷',
-    '垛𨸳垜𨹄𨹃',
-    '垔𡍯𡓓陻𡌓𡍏𡎱𡐲𡋘㘻䧣',
-    '堲堲垐㘹',
-    '垑𡋝',
-    '垡㘺',
-    '型𡌑𡌒型𡌁',
-    '城𩫨城',
-    '岸垾㟁',
-    '峻𡺲𨻅陖𡋴𨺮埈𡼕',
-    '沙𣲡𡋷',
-    '陛𨹼𨻘㙄',
-    '韓𩏑𡋶韩',
-    '埒埓',
-    '堝埚',
-    '塤𡎖埙',
-    '畬畭𡌆畲',
-    '堽𡌕',
-    '𥦌𡋱𡷟硦',
-    '坼𡍩𣂙𡍔𤖴𤇚',
-    '域䧕𡌳㽣𢨊',
-    '埤𡌸𡌹壀',
-    '培㟝𡌮',
-    '塹壍堑𡐛',
-    '淤𡌧',
-    '腆㙉䐌𥳫𥵶𣇺',
-    '埴𡑠埴𡌴𢨀𡑌',
-    '堞𡑢𡍕',
-    '堉堉',
-    '堍堍',
-    '䖵堒蜫',
-    '陯𤲕埨',
-    '埂𡎩',
-    '堪堪',
-    '塭塭',
-    '墮𡺆𨼢堕',
-    '墾𡓚𡍭',
-    '界畍𢌯堺𨺬',
-    '蟻𡎕蚁',
-    '重𡍴𡍺𨤣',
-    '野㙒𡐨壄',
-    '階堦阶',
-    '堩𡍷',
-    '塍堘𤳔𤳮畻𣎒塖',
-    '踳蝽𨅱堾',
-    '𡊻𡎗',
-    '𡋯𡍧',
-    '㘿𡍤',
-    '墢𡍰',
-    '報𡙈报報𨖪',
-    '塑塐',
-    '填𡒆塡',
-    '墀𡎰',
-    '壞𡎯𢸬𣀤壊',
-    '多多𡏗𢑰𡖩夛𢑑𡖈',
-    '拯抍𡏈𢮋',
-    '柴𡍥',
-    '葬𦵏𦴱𦱼𦸟塟𦴓𢍈𦱬𧂥𦽱',
-    '陣𣃻塦阵',
-    '鹽𨣎𪉩塩𪉟盐䀋',
-    '埳塪',
-    '堇𡎸𡏳𡐳',
-    '瘞𤺦𨻏𨻊𢊃𡎶',
-    '郛𡎽',
-    '隑𨻯𡎼',
-    '垶㙚',
-    '𡍶𡍶',
-    '㙪𡏃',
-    '堰墕隁',
-    '塔𩫊墖',
-    '墟墟',
-    '增撸𢴣増',
-    '牆墙𤖠𡫆𤖣𤖧𢉈墻',
-    '塏𧯧',
-    '懫𦥊𡏸𡒐',
-    '砦𥓽𡎵',
-    '罅㙤𤗭𧇍𨻲𥕕𨽯䖎𦉏',
-    '堭墴',
-    '堤𡐾',
-    '塵𪋻𡑁𡔚𡐪𡒲尘',
-    '罈壜𦉡𤮦墰墵罎',
-    '舜𡳉䑞𡳈𡐩',
-    '埭𥓏𡐡',
-    '埵𡑊',
-    '塯㙧',
-    '墋𡑐',
-    '墩墪',
-    '墯𫻃',
-    '畿㙨',
-    '堮𡑇𡓐',
-    '㙏𡑉𡐣',
-    '壔𡑏',
-    '壇壇',
-    '壅𡓱𡔏㙲',
-    '毀毁𡒂𣪷䃣𢾌',
-    '疆壃疅畺',
-    '窩𡑟窝',
-    '隧𨽡𡑞',
-    '墁𡑦',
-    '壒𡑷',
-    '殯殡𡒨',
-    '熟𦏧𤒆𡒒',
-    '璽玺壐𤫆',
-    '墐𡒣',
-    '墽𡒋',
-    '埾𡒍',
-    '壘㙼',
-    '墬𡒰',
-    '隤𡓤𨽟𨽠𨘿𨓾𡓤',
-    '墼𤮛𡒼',
-    '埻𡓑𡓣',
-    '壈𡓔',
-    '寅𡩟𡩪㝙𡓵𦦚𢁐𥦕',
-    '𤮱𡓳',
-    '塞㩙𡫼𡔂𡩿𡺶𡫩',
-    '塾𨶝𨷙𡔊',
-    '麤𡔙麁麄𡔘',
-    '𡈼𡔛',
-    '壹𡕋𡘵𡔾壱𡔹𡕍𡕌𫯁夁𡕄',
-    '殼壳殻',
-    '賣𧷓𧷵売𧷨卖',
-    '磬𣫆𡔝𥓕',
-    '婿聟壻𡠸𡎎𦕓𦖜',
-    '嗀𣪳𣪛𣪥𡔮',
-    '㝅𣫌𡔵',
-    '蛙𪓤鼃𡔻䵷',
-    '寰𡕅㝨',
-    '𡕒㐄',
-    '學斈𣁃𡕕',
-    '降𨹓夅𡲣',
-    '牢𡕘𡘠窂',
-    '覺覚觉覐斍𡕚𧠭𧠷',
-    '屈𡲬𡕜𡲒𡲶',
-    '黃𡕛黃黄',
-    '徙𨔀𢓊𨑭𨗬𡕝𨖤𡲴',
-    '𡰿𡕞',
-    '𡕢𡕩𡕫',
-    '𡕧𡕬',
-    '要𦥺𦥼𡕯𡢗𡕹𡚩',
-    '薦𧄟𧲛𠭶𧂑',
-    '復𡕴𢕛𢕒𢕶',
-    '敻夐',
-    '婚𡝪㛰𡕽𡖀𡕼',
-    '外𡖄',
-    '亦𡗕𡖋𥩖',
-    '些㱔𡭟',
-    '豋㽅𧯭𢍪𡖚𤮘',
-    '㩼𢻈',
-    '夠够',
-    '夢梦𦴋夢夣𧁌',
-    '螭彲𡖟',
-    '𡖔𡖝',
-    '𡖪𡖠',
-    '移䄬𥞀𡖰𧚕',
-    '夥㚌𡖿',
-    '𡖽𡖻',
-    '郺𡗌',
-    '太𣡳',
-    '夨𡗛矢',
-    '頭𥘖头',
-    '夷𡗝',
-    '夾夹',
-    '套㚐𡘷𡘂',
-    '比比𣬅夶',
-    '買买𧹒𧵽',
-    '青靑寈𡗡𤯞𡴏𡷉𡴑',
-    '夰㚏',
-    '夸𡘆𡗴',
-    '奃𡘄𡗰𡗨𣱋',
-    '奄𡘤奄𡘹',
-    '點点奌㸃',
-    '㚕𡘉𡗻𤝟',
-    '㚖𡘅𤽈',
-    '獎奬𤟌𤟒奖㢡奨',
-    '畚𣓩𠫻𡙲𤲛奙𤲙',
-    '穩穏𡘫𤯗㝧穏𥡷',
-    '𡘍𡘟',
-    '焚𡘽㷊燓𤆶',
-    '爽𠎛𤕤𡙁',
-    '瑟𡘼𤨝𩇰㻎𢊎𡚉',
-    '𡙐𡙋𧡩',
-    '奢奢',
-    '𡙠𡙛',
-    '缺𡚆𧖫𦈫𡙇',
-    '韋𥐄𥀊韦𡙝𡚈',
-    '奦奦',
-    '弊𡚁弊㢢',
-    '彆𢏨𡙼㢼',
-    '穎𩒠颖頴',
-    '㯻𡚀',
-    '奮𡚒',
-    '奯𡚓',
-    '奰𡚤',
-    '妣𡚨',
-    '妃𡚱𡝑𡝞',
-    '妝𡞓䊋粧糚妆娤𤖩',
-    '姣㚣',
-    '姬姬㚦',
-    '媽妈',
-    '嫭𡚯𡢙',
-    '𡚰奺',
-    '妥𢼻𡛎',
-    '姊𡛰姉𡛷',
-    '嫗妪',
-    '嫵妩娬𡣆',
-    '妘𡛍𪔈𡞩㜏𡤀',
-    '妎𡛐',
-    '姌㚩',
-    '姼𡚼',
-    '媸妛',
-    '𡛝𡦞𡛒㛑',
-    '媅㚮妉',
-    '𩲊㚪',
-    '妒𡛮妬',
-    '姍𡜜姗㛽',
-    '姻𤯠𡛸婣𡜭',
-    '婀娿妸',
-    '粲𡛹𥹏',
-    '妿㚳',
-    '婩𡛢',
-    '㛴𡛛𡜪𡢋𡜣𡝲',
-    '妍姸蔅',
-    '妊姙𨉃𡜟',
-    '妻𡜌𡜈𡜽𡝣𡜛',
-    '姿姿',
-    '娟姢',
-    '娛娱娯娛',
-    '嫉𡜍𢞱',
-    '嬌娇',
-    '姞𡜩',
-    '婭娅',
-    '媟𡝥𡜄𡤏',
-    '嬈娆',
-    '孌㜻𡤣𡤨𡢛娈',
-    '妅娂',
-    '𡛖𡜮㛂',
-    '姛𩒗𡜝',
-    '𡜂𡜡𡞠',
-    '㛎𡜅',
-    '𡡕㜧𡜆',
-    '姒娰',
-    '姦𢙶𡜑',
-    '娠㛛',
-    '嫂㛮㛐㛮',
-    '嫻娴嫺',
-    '嬪𡤁𡝏𡣕嫔𨊕娦𡣑',
-    '屢𡜸屡',
-    '妦㛔',
-    '妠𡜴',
-    '姡𡜶',
-    '媧娲𡢓',
-    '娎𡝊',
-    '𡞢娔',
-    '妖𡝩',
-    '妯㛩',
-    '姘姘',
-    '娩㝃娩',
-    '婦媍婦𢽰',
-    '嬋𡠐婵',
-    '嬰孆孾婴嬰',
-    '嬸婶',
-    '聘𦕊𨉯𨉂𡞐𨊀',
-    '婓婔',
-    '嫿婳',
-    '嬎𡤳嬔𡤹婏',
-    '姩𡝟',
-    '娹婱',
-    '㜷𡝡𡝠',
-    '奸𡟗',
-    '娜𡟦',
-    '婉婉',
-    '婆𡣩㜑𡟖',
-    '媼媪',
-    '孀㜀',
-    '欲𡟔',
-    '親媇𡪔𧡿𢈥',
-    '髮髪𩑛𩑱𩬕㛲𡞝𤕥𨱳𩠙𩬃𩬊𩠕𩠖',
-    '娀𡞨',
-    '婕媫',
-    '媮婾',
-    '嫥𡞤',
-    '惸𡞦',
-    '㚸媤',
-    '㛍𡞡',
-    '媣媣',
-    '㛶㛶',
-    '嬡嫒',
-    '孋𡠈',
-    '姰𡟱',
-    '㛗𡟽',
-    '媊𡠔𡡸',
-    '㛼㛼',
-    '𡟪𡠋',
-    '媐𡟮',
-    '嫩㜛𤯦𦠫𤯯嫰',
-    '嫳𡡹',
-    '嫢𡠝𡣅',
-    '嬙嫱𡣰',
-    '奻𡠛',
-    '㛒𡟳',
-    '㜍𡠠',
-    '嫙𡡍',
-    '嫟𡠷嬺',
-    '嫯㜜',
-    '𡠦𡠗𡢂𡣼',
-    '𥧽𡡃',
-    '媚𡡚𡡾',
-    '嫡𡡿',
-    '美嬍',
-    '媯嬀',
-    '嬃𡡓',
-    '嬿𡤈嬊',
-    '嬬𡢉',
-    '𡣔𡣤𡡽',
-    '孎𡠟',
-    '嬴𡢣㜲𡣍𡢔嬴',
-    '窈𡢵',
-    '妗𡢳',
-    '婘𡢸𡤡',
-    '媦𡣃',
-    '嫽𡢴',
-    '孃嬢',
-    '媄㜫',
-    '嫧𡢲',
-    '䆯𩈽𩈾𡢷',
-    '𡢕𡢝',
-    '嬤嬷',
-    '瘱𤸽𡣇',
-    '鞀𩊲鞉𩌿鼗𪔛𡣐',
-    '㜞嬱',
-    '嫸𡤮𡣌',
-    '䬐𡣉𩗯',
-    '嬛𡣱',
-    '孅𡣳',
-    '娐𡣷',
-    '㜴㜴',
-    '顰颦𩖓𡤉',
-    '嬾㦨孏嬾',
-    '孈𡣸',
-    '孽孼㜸𡦣𦽆𧃯',
-    '嫖闝𡤚',
-    '嬭𡤘',
-    '豔𦫢豓𡤩艷艳艶',
-    '鑠𡤤铄𨰤',
-    '儵𡤥𢖛',
-    '嬳𡤬',
-    '嫘𡤯',
-    '㜤𡤲',
-    '㜮𡤱',
-    '姪𡥺㜼',
-    '孫孙𡤾',
-    '好㝀𢑒𩐔𡥃',
-    '孛𡥇',
-    '嗣孠',
-    '孕𣎜𡥗𡱟𥀨㞌𨈼',
-    '字𡥜𥤪',
-    '孿㝈孪',
-    '悖𡥏愂𢟥',
-    '殊𡥛',
-    '孷𡥽',
-    '屖𡥷',
-    '孳𢀐𢇖孶',
-    '媰𡦅',
-    '孯𡦋',
-    '孻𡦌',
-    '槻𡦑',
-    '孺𡦘𡦗',
-    '堵𡦡𩫭',
-    '季𩐄𩐖𡦠',
-    '擘孹𢹐',
-    '鶉𨿡𪆾鹑㝇𩁛𪂎',
-    '𡦵𡦴𡦭𡦳',
-    '守𡬴𡬮㝊',
-    '突𥤮𡦾',
-    '𡧍𥤵𡧂',
-    '罔𡧏𠕏㒺',
-    '肉宍𠕎𡧢',
-    '貧贫𡧋',
-    '宗宗',
-    '寂𡧘𡨁𡧴𥥒𢚍𧧌𥤽𡨜𡧯',
-    '實𡾍实実',
-    '審审𡩨',
-    '寵宠',
-    '居㝒㞐𧿃',
-    '砫宔',
-    '宮宫',
-    '寧𡨴㝕寧寜𡬛𡩬寕',
-    '憲𢞩宪憲𢝮',
-    '賽赛𡧳',
-    '窔㝔𡧮',
-    '𡧖𡧰𢉣',
-    '密𡪖𡶇宻𢛬',
-    '寢寝𥨊㝲𡨦𡨞𡫒',
-    '寬寛宽',
-    '栗𣡼𡨓𣓨𣡷𣗴㮚',
-    '毫𡨉',
-    '賓𥦎𡪛𡫅𤍘賔宾𧶎𧶉',
-    '冥𣩆㝠𡨶䆩',
-    '宿㝛𡪴',
-    '窡𡨤',
-    '苗𡩈',
-    '寠𪧘',
-    '粵𡩭粤𦉿',
-    '甯寗',
-    '窱𡩢',
-    '寣𡩺',
-    '寯㝦',
-    '浸浸𣽧𥧲𣷽㴆濅𡩻𣺎𣼡',
-    '釐𡪂𨤭𨤺',
-    '㝥𡪘',
-    '㝪𡪐𡫓',
-    '𡪅𡪉',
-    '㝱𡪎',
-    '寒𡫮𡫜𡫾𣽬',
-    '窾𡪡窽',
-    '竁𡪣',
-    '㝩𡪼',
-    '㝭𡪟',
-    '𡬖𡪶',
-    '寓𡪾庽',
-    '究𥤯𥨓𥧖𡫄𥨶䆒𥦵',
-    '寷𡫋',
-    '㝰𡫛',
-    '𡫔𡫧',
-    '踰𡫞𨄫',
-    '鞫𥷤𥷴𡫭𥰬𧃈𥲩諊𥷚',
-    '𡫟𡫳',
-    '𥗀𡫱',
-    '䲽𡫰',
-    '𡬁𡬃',
-    '𡫽𡬊',
-    '𡬌𡬆',
-    '寤𡬑',
-    '擠㨈𡬚挤',
-    '寱𡬒',
-    '等𢌭䒭𡬝䓁',
-    '寺寺',
-    '尋寻㝷𢒫𡬰𡬻',
-    '導𧘀导𡭎𡭑𧘄',
-    '刓㝴',
-    '捋寽',
-    '射𨈡𡬤䠶𨉛',
-    '契𡬨𢍆𢍠',
-    '將𤕭将将𢪽',
-    '耐𡬪𦓎𩈃',
-    '京𢂋𡬱𦣿',
-    '尊𡬭𥈪𡭆𢍜',
-    '治𡭒𦠋',
-    '尒爾',
-    '當𤱭𢑐当𡭠',
-    '菽尗𦯂',
-    '貴𧸋𡭙贵肖𧶪䝿',
-    '米𡭝',
-    '尚尙',
-    '敝敝㡀',
-    '筆𡭩笔',
-    '麼庅𡮡𡭯麽𤹳尛',
-    '省𥅱䁞𥄾𡮀',
-    '𡭴𡭽𡮂',
-    '䨲㝹𢉕𩆟',
-    '小𡮐',
-    '燎𤊽𤐗𤎚𥛰𤈹㶫尞',
-    '薏𦺳𡮕',
-    '𡭾𡮑',
-    '𣄴𣄶𡮎𣄵𣄷',
-    '尟尠',
-    '𢇇𡮟𢇂',
-    '臮𡮧𦤌',
-    '隙隟𡮱隙𨻶䧍𧯊𧯈',
-    '有𢇔',
-    '尢尣𡯂',
-    '又𡯉',
-    '尤𡯊怣',
-    '尥尦',
-    '尪𡯭尩𡯪尫𡯲',
-    '㝽𡯑',
-    '𡯏𡯝',
-    '𡯜𡯠',
-    '㝾𡯛',
-    '𡯡𡯚',
-    '虺𧉇𩗝𡯥𤴄',
-    '㞁𡯣𡯧𡰃',
-    '㞃𡯮',
-    '痟𡯩𢈭',
-    '㞄𡯸',
-    '𡯴𫵑',
-    '就𡰜𡯶𡰔𡰗',
-    '尰𡰒𡰕𡰁',
-    '㞇𡰂',
-    '尵𫵒𡯺',
-    '𡰖𡯻𡰄',
-    '尳㾶𡰊',
-    '𡰌𡰍',
-    '𧇠𡰐',
-    '尸𠃜𡰣',
-    '尼尼𡰱',
-    '㞋𡰦',
-    '身𡰬',
-    '屐𡰸',
-    '層层',
-    '尻𡰼𦙷𡱧',
-    '戽𡰷𣶉',
-    '屆届',
-    '屎𡲑𡲔𡲖𦳊𡱁𥺶',
-    '屄毴𫵘𣭈',
-    '㣇𡱃𧱈𢑞㣇',
-    '尾𡱓𡱕𡲵𡱲',
-    '屑㞕',
-    '晝𦘘昼𣅯書',
-    '肩𦙪𦚑𡱎',
-    '骸𡱍䠹䯐𩩏',
-    '㢋㞔',
-    '俟𢓪𢉡䇃𡱢竢𢈟𥏳',
-    '尿㳮𣻨㞙𡱴𡲘𣭼𡱤',
-    '辜辜𤿛𢩍𨑀𡲞𡱨𦍬𢪿𢻄',
-    '蹝𡱦躧𨁾',
-    '屏屛幈',
-    '屋𡲃𦤿',
-    '屔𡲌',
-    '屙𡱻',
-    '庳𢈷𡲎庳',
-    '絇𡳍䋧𡱺',
-    '㞛𡱹',
-    '屁𥤶𡲩',
-    '屠屠',
-    '履𩕎𡳐𡲟𢔃',
-    '屬属',
-    '拽𡲝',
-    '犀𡱝𤚌犀𡳚𫵠',
-    '破𡲠',
-    '屧𧀢𡲕𡳙',
-    '徂𨖆𡲡䢐',
-    '靴𩍍𩎁𩍇𡲲鞾',
-    '㞜𡲾',
-    '屣㞞',
-    '屪𡳇',
-    '屨屦',
-    '𡰾𡳠',
-    '䵶𪓟𪓩𪓞𡳟',
-    '𡳭𡳨',
-    '樓𩫰𡳫楼',
-    '展㞡',
-    '廬庐𡳬',
-    '屩𩌡屫',
-    '之㞢𠔇𡳿',
-    '丰𡴀',
-    '市𡴄',
-    '芬㞣',
-    '每𣫭毎𡴋𡴋𡴕',
-    '㞷𡴍',
-    '南𡴖𡴟',
-    '毒𧉉𦸕𡹆𥲮毒𡴛',
-    '慎𦚉愼慎昚眘𡴜',
-    '本楍𡴡𡴩㮺',
-    '离𡴥𧴁',
-    '熏爋𡽽𤋱𡴦',
-    '𡴆𡴫',
-    '拜𣬓𡴬𢷎𢹄𢮠𢪙𢳎𣬊𨀲𢰛𨀪𢴽𢫶拝',
-    '危𡵁𡴸𡴲',
-    '嶽𡴳𡶓𡽺𡷒',
-    '扈𡴰𨝞',
-    '屴𡴽',
-    '岊𡴹𡴼𡴺𡷦𡷦',
-    '出㞮岀',
-    '嵐岚㞩',
-    '屼𡵉𡵐',
-    '屺㞯',
-    '峘𡴿𡵎𡷆',
-    '𥐞𡵀',
-    '岷㟩𣊽𡼐𡸧㞶𡹋㟭',
-    '岳𡵹',
-    '峰𡶶𡵞峯𡷅',
-    '嶇岖䧢岴',
-    '村邨𨙲𡵭',
-    '步歩𡵯歨𣥶',
-    '流流流𣹳𡵰𣹭𣻤𣴑',
-    '炭炭𡵼',
-    '谷𡵾',
-    '走𣥚赱𡹦㞫𧺆',
-    '岣𡵺',
-    '峴岘',
-    '崗𡹏岗',
-    '嵷嵸𡵷𡵝',
-    '嶸峵𡵓嵘',
-    '𡵜𡵣',
-    '岻𡵮',
-    '𡸦𡵗',
-    '丞㞼',
-    '岐㞿㟚',
-    '島㠀嶋嶌嶹岛隯隝',
-    '族𥏁𥎼𥎩𥎽㞺',
-    '邦邫𤰫𨛟𨛁䢶𨚚峀',
-    '陀陁𡶊𨹔𥞒𨹕',
-    '岯𠃂𡶌',
-    '岭岺',
-    '岢㞹',
-    '岪𡶒',
-    '岧岹',
-    '岝岞',
-    '嶨峃',
-    '岲𡶢',
-    '山𡶸',
-    '峽峡',
-    '崢𡸵峥',
-    '崩𡹌𡹔𨹹𡷌',
-    '巒峦',
-    '岍𨸦岍',
-    '峛峢',
-    '峿𡷤𡷤',
-    '嶠㠐峤',
-    '峔𡶰',
-    '峍𡷏',
-    '峮㟒',
-    '崍崃',
-    '嶗崂',
-    '竦𡷽𢱠𢷜',
-    '㟏㟔',
-    '峹𡷣',
-    '𦭮𡷚',
-    '坎𡸞',
-    '崇崈',
-    '崖崕',
-    '崑崐',
-    '崙崘',
-    '嵌㟛',
-    '嶄崭',
-    '巷𨞠㟟䣈𨞔𨜕䢽',
-    '峇𡸡',
-    '崚𪌨𡺿𡹃',
-    '崨𡹈',
-    '崦𡹮嶖𡹛',
-    '崰𡸟',
-    '崒𡸝崪',
-    '嵬㟴𡸖',
-    '嶀𡹻',
-    '嵾㠁𡼶㟥',
-    '嶞𡽃𡺆',
-    '硉𡸒',
-    '邠㟗',
-    '𡸨𡸘',
-    '㟞𡸚',
-    '崮崓',
-    '嵴𡹒',
-    '𡾱㟜',
-    '𦋅𣫴𡸔',
-    '𡸣𡸢',
-    '峙崻',
-    '峭陗𡹺',
-    '泉𤱄湶㟫𣹻𡺙洤',
-    '盈盁𡺡𫞯',
-    '崷𡺚',
-    '嵃嵃',
-    '崿𡼑㟧𡼰㠋',
-    '嵕𡽀嵏',
-    '崱𡺢',
-    '嵇嵆',
-    '嶁㟺嵝',
-    '嶢𡸳嶤',
-    '嶔䃢嵚𡼲',
-    '巃巄𡶹',
-    '𡹵𡺝',
-    '𡽅㟦',
-    '㟪嵔',
-    '巔嵮巓口𡻗巔',
-    '窟𥧊𡻋𢷈',
-    '谿嵠𥡙豀',
-    '嵫嵫',
-    '嵲𡺼',
-    '嶭𡺰𡾲𡾦',
-    '巏𡺹',
-    '豳𡺳',
-    '𡶃𡺬',
-    '㟸𡻇𡼗',
-    '㟶㟲',
-    '㠓𡺪',
-    '𡾈𡺺',
-    '嵍𡺱𥓺',
-    '嵼嵼',
-    '嶍㠄',
-    '嶅㠂',
-    '㠧𡻥𡿐',
-    '崎𡼋',
-    '潮潮𣶃𡼼',
-    '澗𡼥礀涧磵𡼏𧯎㵎',
-    '崋𡼙',
-    '嵋𡼴',
-    '崵𡼍',
-    '嶕嶣',
-    '嶜𡼫',
-    '㟅𡼔',
-    '㠆𡼯',
-    '𡾰𡼌',
-    '𦱧𡼘',
-    '寥廫𡽦𡽐',
-    '崛𡽈',
-    '路𡽘𨱴',
-    '嵞𡽚',
-    '嶟嶟',
-    '嶬㠖',
-    '嶮𡽗',
-    '嶪嶫',
-    '巘𪩘',
-    '㟽㠒',
-    '嶐嶐',
-    '𡽁𡽕',
-    '𡼾𪩚',
-    '嶴㠗',
-    '巁𡿋𡽇',
-    '嶼㠘𡽬',
-    '崤㠙',
-    '嵺𡽟',
-    '嶙𡽤',
-    '嶷㠜',
-    '巀𡽱嶻',
-    '巉𡽡𡿣',
-    '㠚𡽵',
-    '嶾𡽸𡾯',
-    '儡𡾊',
-    '峉𡾆𡿃',
-    '巑㠝',
-    '㠥𡾋𡿔𡾊',
-    '𡿖𡾐',
-    '崞䧐𡾘',
-    '嶲𡾧',
-    '巆巆',
-    '巇𡾟𡾞',
-    '𡼊𡾚𡿜',
-    '㠢𡾝',
-    '巖巗巌',
-    '磊𡾷𥗉',
-    '巍𡿁𡿆',
-    '峱巎',
-    '𡷙𡿊',
-    '𡿇𡿏',
-    '巙𡿚',
-    '嶒𡿘',
-    '災𤉣𤆲𤆎烖𡿧灾災𤆋𤈮𤉣𢎇',
-    '巡𨑾巡𡿽',
-    '巟𡿫㠩𡿬',
-    '𡿯𣅕',
-    '邕𡿷',
-    '巢巢巣𤔥',
-    '𢀁𢀁',
-    '鬣䝓鬛巤𩯝㲱𩯻𩰆𣰫𢀂',
-    '河𢀎',
-    '巨㠪𢀑𢀓',
-    '𢀜巩',
-    '新𣂺𨐏𢀝',
-    '差𢀠𢀩',
-    '肛㠮',
-    '豈岂',
-    '佋巶',
-    '巽巺𢁉巽𢁌㢲𢁅𢍳顨𢌴',
-    '朕𦨶𦩎𦩗𢀹𣍹',
-    '躋𢁃𤼥䠁',
-    '𦮹𢁀',
-    '匝𠂝帀',
-    '帥帅',
-    '帆𩗋㠶忛𤖫䑺',
-    '殺煞杀𢽅𠮁𢼢𢽺𣏂𢼯𢼡𣀎𣪆𣪩𧤿𢿹𢽆𢿔𢽯𢽮𣪖𢁛殺𤔮𢾈𢽘',
-    '𢁘𢒌𢁚',
-    '㡆㡛𢁣𢂩㡃𢂾',
-    '尹𢂬𢁨𢃁𢂟𢃹𢂫𢃂',
-    '布𫷁',
-    '帳帐',
-    '禹𢁰𥜼',
-    '系𦃟𣫦𦂞𢁴',
-    '紙纸𦀦帋',
-    '帗𢁵',
-    '幃帏',
-    '衭㠸䊿',
-    '㠲𢁦',
-    '㠴𢂻𢁯',
-    '㠷㠷',
-    '帉𢁥',
-    '幟𣄞帜旘',
-    '袋帒𣅁',
-    '𢂊𢂅',
-    '帶𢂸带帯𨗼帶𢃄',
-    '幀㡧帧㡠𢂰𥨰',
-    '拭𢩮𢂑',
-    '㠵𢂪',
-    '㡂𢂥',
-    '幫幚㿶幇帮',
-    '歸𣦨帰䢜归𤾤𢅦𡚖㱕𢅨',
-    '裙𢂽𢃆帬裠𧛬',
-    '帨帨',
-    '幬𢃖𢅱帱𢄛𢅂',
-    '綌𢂲𦃛𥿭𦃁',
-    '㠹𢂵',
-    '幗帼',
-    '帡帲',
-    '幘帻𢅙',
-    '幓㡎',
-    '纛纛𢃶𦑢𦇨',
-    '褌𢃚㡓裩',
-    '㠿𢃌',
-    '㡇𧚊𢃣',
-    '㡈㡈',
-    '帺𢃛褀',
-    '𢃎𢃤',
-    '帿𢃨',
-    '幒䙂𢃪𢃧𧛤𢃭衳𧜢𢃓',
-    '𧝴𢃝𧛔𧞶',
-    '業㸣𤎸𢄁𤑽𤗥',
-    '緙缂𢃲',
-    '㡐𢃬',
-    '𧛸𢃸',
-    '禽𠎘𢄕',
-    '絅蘏𢄗',
-    '徽䘗幑𢾰',
-    '棘𢄬𣡍',
-    '肄𢄥𥏚𢑩𦘞𧲁',
-    '逐𢄘',
-    '𢂁𢄠',
-    '𢂓𢄟',
-    '幣幤𧸁',
-    '盟𧖽𥁰𢄾𥂗𧖸',
-    '橐𢅍槖𢄿',
-    '襆幞襥',
-    '襐𢄵𧞌',
-    '𢁼𢅔',
-    '㡅𢄴',
-    '幮㡡',
-    '幔㡢',
-    '幩幩',
-    '幨𢅐',
-    '㡘𢅏𢅖',
-    '綠𢅞緑绿',
-    '𢅮𢅲',
-    '襰𢅭',
-    '欆𢅻',
-    '幠𢅿',
-    '㡪𢅼𢆃𢆃',
-    '幱𢆄',
-    '駱骆𩦼𢆇',
-    '并幷𢆙',
-    '幵𢆛',
-    '𤲒𤳊𠟳𢆟𤲒𤳫𡳧𢆟',
-    '鄉鄕郷𨞰鄊𨞸乡',
-    '𠄏𢆴',
-    '緦缌𢆿𢇆𦃞𠅛',
-    '紹綤绍𦀧𢇊',
-    '彝𦆩彞𢍵彛𦇚𧤋𢑱𢇏彝',
-    '繼𦇓継𦁚继㡭',
-    '㡮𢇓𢇒',
-    '廣廣広',
-    '慶𢝑𢙎𢞢庆',
-    '庉𢇠',
-    '廙𢇙',
-    '廡庑𢋑𢌋𢇜𢋰',
-    '府𢇯',
-    '底㡳',
-    '庫库',
-    '番畨𢇪番',
-    '庋𢇮',
-    '庍𢇩',
-    '𢋔𢇣',
-    '廢廃废',
-    '廟庙𢉱𤸠庿',
-    '鬼𣆠𩴿𢇼𩳹𩲞𩳉𩲚𩲡',
-    '扃𢇺',
-    '覂𢇫',
-    '㡼𢇸',
-    '㽿𢈅',
-    '𡧭𢈌',
-    '㧁𢈊',
-    '𢊕𢉛𢈣',
-    '座𫝶',
-    '或𢈿𢦙㦯',
-    '松梥柗㮤庺',
-    '漏𣼣𢉀',
-    '庰庰',
-    '廎䯧庼𢊼',
-    '廞𢉄',
-    '㢈𢈹',
-    '恢𢊝烣𢉸𨒭',
-    '腐𢉶焤𣩇',
-    '廋廋廀',
-    '黟𢉬𪑁',
-    '𢈠𢉨',
-    '𣎺𣐺𢉫',
-    '廊廊',
-    '庛𢊳𢉪',
-    '廌𢊁𧣾𤙪',
-    '廧𢊂𢋾𢊉𢋢',
-    '𢊀𢊐',
-    '㢚𢋡𢊔',
-    '廱㢕𢋘',
-    '秩𧰅𢊭豑',
-    '遼𨖚辽𢊻',
-    '廇𢊺',
-    '𢊄𢊿',
-    '螷𢋜',
-    '瘰𤻳𤼠𢋧𤻗',
-    '𢊰𢋮䵇',
-    '廓𢋽',
-    '𢋻𢌃',
-    '蠯𢌆',
-    '糜𩞇𢌑𪎖',
-    '廲𢌒',
-    '征徰𢌛',
-    '趁趂𢌝',
-    '迪𨔅廸',
-    '迥䢛逈㢠',
-    '迫廹',
-    '迴𢌞廽逥廻',
-    '遑𪪱',
-    '䀽𢌨',
-    '九𢌬',
-    '异异',
-    '弈𢌾𢌸',
-    '戒𢌵𢦬𢦶',
-    '筭𢌺',
-    '承𢌼𢪐𢪻',
-    '其𢍌',
-    '奐𢍅',
-    '舁𦥹𦥠舁',
-    '弁𢍙𢍍𢍘',
-    '弇𢍔𥦦',
-    '𢍚𣓑𢍖',
-    '桊𣗷𢍕',
-    '蠡𢍝𧱤𧋠䗍蟸𥯵',
-    '置𦋘𦌖𢍧𣇣𦌤𦋲𦌃',
-    '言𢍬',
-    '擎𢍸㢣',
-    '遵𨘊𢕰𢍲𨗕',
-    '曆𢍷暦',
-    '弋𢍺',
-    '戎𢍻𢦦',
-    '三弎',
-    '武𢎁',
-    '䯆𢎀骮',
-    '㢦戨𢎄',
-    '弒𢎊𢎍弑𢎓𢨓',
-    '戜𢎆臷',
-    '矰𢎒𢨉',
-    '弘𣧀𪪺𢎞',
-    '彈弹𢎲弾𢎝',
-    '𢑆𢎠',
-    '弔𢎣𢎨𢎱',
-    '引㧈𢎢𢪉',
-    '殳𢎦',
-    '𢎫𢎩',
-    '局𫸧',
-    '氐𢎶氐',
-    '弙𢎰㢪',
-    '弦𢏸𢐁𢎺',
-    '弢㢭𢎼',
-    '弤𢎸𢏁',
-    '哂𢏓𧧍',
-    '弛𢐋㢮𢐏',
-    '張张',
-    '彌𢑀弥',
-    '𠂹𢏒',
-    '弫𢏈',
-    '𢑇𢏉',
-    '彎弯',
-    '羿𦐧𢏗𢏖𢏘',
-    '㝁𢏔',
-    '弬弬',
-    '𩃸𠄴靅𩆦',
-    '髴𠔘',
-    '脞𢏬',
-    '弭𢏱',
-    '㢳𢏾',
-    '𢏯𢏶',
-    '㣅𣩳𢏵',
-    '韘𢏼弽𩏁𢏲𢐇',
-    '弱𢐅',
-    '強𧖑强',
-    '彃彃',
-    '㢻𢏴',
-    '發𤼲彂',
-    '餗𩞌𩱖𢐌𩞍',
-    '鏘𢐓𨪙锵',
-    '弨𢐕',
-    '㣁𢐖',
-    '𢐲𢐠',
-    '檠𢐧㯳',
-    '𢑄𢑈𢑉𢑂𢐥𢐬',
-    '膙𢐩膙',
-    '𩱦𢐨𩱈𢐺𤑵',
-    '羲𦏁𢐯𦏡',
-    '彉彍',
-    '玈𢐸𤣧',
-    '饘𥼷𢐹',
-    '弴𢐻',
-    '彇𢑁',
-    '羹𩱋𡙡𦎟𩱧𩱁𢑌羮',
-    '彐彑',
-    '彔录𢑗',
-    '魅𩲐𩴎𤱮𩲈𤲄𩲑𩳪䰪𣷛𩱿鬽䰨𢑘𣼙𩲿𩲀𩴈𢑛祙𩲝𩳟𢑙',
-    '彙𦴗彚𣉰𢑤',
-    '彘𥏉𢑣𠅰',
-    '狗㺃𢑪',
-    '皺𤿿皱𢑫𤿮𤿥𩈟𩊥',
-    '肆𦘨𢑨䦉',
-    '蝟𢑯𧳪猬𧒞',
-    '䝆𧰮𣊸𣊸',
-    '翻飜𢑵',
-    '豬𢑳猪',
-    '鏉𨫾𢑶',
-    '那𢑽䢷𨚉𨙻𨚗',
-    '䂍𢑾',
-    '囊𢑿𧛦𣡏',
-    '𠘱𢒁𢒀',
-    '文彣',
-    '彥𢒊彦',
-    '形形',
-    '補补𢒏䋠',
-    '彫彫',
-    '彪𢒜',
-    '諸𢒕𧭷𣦁诸',
-    '馬马𢒠𢒧𩡮𢒗',
-    '彧𢒖',
-    '靜㣏静',
-    '斕𢒞𣁣斓',
-    '溷𢒤',
-    '𣯪𢒩',
-    '影𢒬',
-    '㣎𢒮',
-    '樹树𣚤𢒳𡬾𣗳𣕒',
-    '禡𢒴',
-    '彯𢒵',
-    '䯽𩭸𩭍𩔻𢒷',
-    '色𣤻𢒸',
-    '𢒾𢒽𢓐',
-    '犯犯𢒿𤜛𤝑',
-    '徇𢔐狥𢓈',
-    '徹𢖉𦔞𢕹彻',
-    '返𢓉',
-    '退𨓤𨔫𨘍𢓴𨑧𢔕𢓇',
-    '𢓒𢓏',
-    '往𢓸迬𨓹𧗧𢔎徃',
-    '徑𢔉径',
-    '任𢓩',
-    '佻𨋫𢓝',
-    '侁𢓫𢓠',
-    '俗𢓾',
-    '很𢓼',
-    '通𨓛𢓶',
-    '逡𢓭',
-    '佾𢔍',
-    '俾𢔌',
-    '後𢔏𨒥',
-    '徬𢔚',
-    '趠𧻠𢔄',
-    '逶𨖿㣦',
-    '𢔱𢔘',
-    '健徤',
-    '遍㴜徧𨖠',
-    '徲𢔭𢔦',
-    '𢔣𧼶𢔝𧼰𨔨',
-    '遘𧽝𢔵',
-    '傱𢕇',
-    '徭徭',
-    '㣬𢕃',
-    '䟐𢔸𧽺𢖙',
-    '微𣁋𢕧𧗬㣲',
-    '德徳𢛳恴',
-    '徵𢽠徴𧗲𢾷𢽡',
-    '徛𢕗',
-    '躚蹮𨇴𨇤𢕖𨇫',
-    '傪𢕕',
-    '𢓱𢕝',
-    '𨁁𢕐',
-    '蛇𣙛𧉮虵𢕷舐',
-    '遠逺𨖸𢕱',
-    '僕䑑𢖃',
-    '避𨓶𢕾',
-    '𢓳𢖊',
-    '儦𢖐',
-    '衝𤈭𧘂𢖜',
-    '忁𢖚',
-    '𧾨𢖘',
-    '躣忂',
-    '𨇻𢖥',
-    '憶忆',
-    '𢘽𢚕怈𢖪',
-    '仁忎忈',
-    '忙𢗅',
-    '志𢗍𢖽𢗱',
-    '忍忍',
-    '念𢗁',
-    '恐𢖶㤟𢝭恐𢙷𢟃𢘠𢙢',
-    '悄𢖹',
-    '悉𢘤𢗦𢝕怸𢚊𢘻𫹯',
-    '悶㥃闷𢛩',
-    '愛𤔤𢜤𤔠𢖻𢙴爱𢛭㤅',
-    '𢖳𢗃',
-    '㤞𢖲',
-    '𢞏𢖸𢛙',
-    '忱𢗑',
-    '忝㤁',
-    '忽𢗘',
-    '怕𢘣𢗌',
-    '悴𢜙忰',
-    '愴怆',
-    '慷忼',
-    '慫怂',
-    '懊㤇懊',
-    '忕𢗗㥭忲',
-    '忣㤂忣',
-    '忷𢗮',
-    '忞𢗡忟',
-    '怐𢛑𢗕',
-    '恔㤊',
-    '恁忹㤛',
-    '惎𢤵𢗻㥍',
-    '㤉𢗬',
-    '𢗉𢗉',
-    '𢜗𢗒',
-    '愐𢗔',
-    '慪怄',
-    '憌𢗋',
-    '𢣒忶',
-    '㦛懙𢗓𢣟',
-    '快𢘦',
-    '怒𢘂',
-    '恃𢘥',
-    '恩㤙',
-    '悵𤟔怅',
-    '笨㤓',
-    '總縂𦀙𥾜惣总𤙹㹅𠂳縂總',
-    '怩𢘒',
-    '怗㤐',
-    '怛𢘇',
-    '慒𢥱𢘄',
-    '懟怼𢥓譵',
-    '㤄𢘀𢘨',
-    '忧㤑',
-    '𢗿怽',
-    '𢘼𢘁',
-    '㥮㤘',
-    '𩜍𢘐',
-    '恨𢙃𢚉',
-    '恬𢙖',
-    '恪㤩愙',
-    '恣𢙊',
-    '恭𢚈𢙄',
-    '息𧪩𢙆',
-    '悔𢙽悔',
-    '悅恱悦',
-    '愜惬㥦𪫯',
-    '惻𢝔𢢥恻',
-    '惱悩𤹻恼𤶵𢚰𢙉',
-    '慟𢣛恸憅',
-    '懇𢢽恳𢡆',
-    '狂𤝶𢙌𢚇',
-    '莎𦹈䔋𪍬𢘿',
-    '怓𢜲𢞙𢘾',
-    '恚㤬',
-    '悁𢛋悁',
-    '惲恽',
-    '愷恺',
-    '憡𢙀',
-    '懨恹',
-    '㤒𢡋𢙋',
-    '㤝㤝',
-    '㤡㤠',
-    '恮恮',
-    '㤻𢘵𢚿𢘴',
-    '㥆𢘶𢠻',
-    '𢛆𢙰',
-    '㥚㤤',
-    '俐悧',
-    '劣𢚃',
-    '怖悑',
-    '悠𢚐𢟅',
-    '情𢚏',
-    '悻𢙼',
-    '慈慈𩉋㤵',
-    '慌慌慌㤺',
-    '憫𢡥悯',
-    '懸悬𢝝',
-    '肅𦘝𦘛粛䏋𢙻肃𦘡',
-    '誤悮誤误悞',
-    '辱𢛚𢟹',
-    '俔悓',
-    '怚𢚆',
-    '怍㤰',
-    '慳悭',
-    '𢜭𪫸𢛠',
-    '𢤂㥎悡',
-    '㦦㤸',
-    '𧻺𢚯',
-    '和𠧕惒',
-    '悼𢛂',
-    '惕惖𢡕𢞫',
-    '惟𢛧',
-    '慣惯',
-    '慚惭慙',
-    '慘𢡖𢠊惨',
-    '憐㥕𢠴𢣶',
-    '憚𢠸惮',
-    '憊𢣍惫𤻚𤸶𢟡',
-    '懲惩懲',
-    '懼愳𢡔惧',
-    '怙𢛅',
-    '惉𢛈',
-    '惵𢛐𢜨',
-    '怰𢜚',
-    '㤴𢛏',
-    '㥔㥔',
-    '惪𢠀𢜖𢤊',
-    '惁𢜣',
-    '𢜳㥉',
-    '㥛𢞳㥛',
-    '𢝌𢛡',
-    '𢛉𢛊',
-    '憁憁𢛌',
-    '慂惥',
-    '哀𢜺',
-    '惜𢡽惜',
-    '惚𢝻',
-    '愁𢝲',
-    '慍愠',
-    '憤𢤬憤愤𢟠',
-    '恇𢝎',
-    '悢𢝋',
-    '悈𢜾',
-    '悀愹愑',
-    '惇㥫惇𢤈',
-    '惛惽',
-    '憒𢤳愦',
-    '諝𧩑𢝒𧫐㥠',
-    '邃㥞𥤼𢢝䆳𢤪',
-    '㛳𢝃',
-    '㤿𢜰',
-    '𢝂𢝂',
-    '𢞖𢝹',
-    '𢟊𢜼',
-    '惰𢢠𢡢𢞑憜𢣖',
-    '慇𢟝',
-    '懾慑',
-    '恂𢞧',
-    '恧𢟄𦗂',
-    '悱㥱',
-    '惄𧗂𢞤',
-    '愍𢞰',
-    '愮愮',
-    '慁㥵',
-    '𠓭𢞥',
-    '𠣤𢞛',
-    '㤮𢞪',
-    '惂慆',
-    '㥢㥢𢢕',
-    '㥟𢞶𢠟',
-    '愵𢞔',
-    '㥶𢞝𢤑𢥜𢥛',
-    '慯慯',
-    '熆㥺',
-    '𢘺𢞞',
-    '常㦂',
-    '患𢤒𢡙𢠶',
-    '慨慨',
-    '慕𢟽',
-    '慰𢟬',
-    '憎憎',
-    '憩𦧰憇𢠾𦧗',
-    '瞠𥊼憆𥊲𥊰',
-    '赧𢟻𢠱𧹞𧹠𤿜',
-    '勰𢣢',
-    '愨𢢢慤',
-    '憋𢠳',
-    '憖慭',
-    '懅𢟶',
-    '懆𢠡𢥼',
-    '昊𠕫𣆧',
-    '慏𢟫',
-    '㦃㦃',
-    '㦁慩𢣜',
-    '㦎𢟸',
-    '憈憈',
-    '𩔶𩔷㦄',
-    '愕㦍',
-    '懣懑㦖',
-    '懿㱅㦤𡕆㦉𫻚',
-    '惝𢠵',
-    '愓𢡓𢠽',
-    '惷𢡳',
-    '憀𢟺',
-    '憯㦧𢡄憯',
-    '憪𢡿',
-    '憝𢥲𢥦憞',
-    '謧𧮛㦒',
-    '𢙺𢡠',
-    '𢠿𢠿',
-    '坦憻',
-    '慄𢢙',
-    '慢𢢔',
-    '懈𢢣',
-    '懶懒',
-    '轡𦇷𢢦𨏯𢥩𣦱𦆕',
-    '愒𢢚',
-    '跾𢢱𨁀',
-    '𢜪𢢟',
-    '𢟧𢢛',
-    '憷憷',
-    '𢣊𦡗',
-    '懤㦞',
-    '懞懞',
-    '懝𢣕',
-    '㦚𢣑𢤴𨐵',
-    '懬懬',
-    '噫𢤏𧮒',
-    '懵懵',
-    '懺懴',
-    '摩摩擵𥗂𢣾𥗘𪎚𢳀',
-    '𢝁𢤀',
-    '𢢞𢤙',
-    '懖𦘌𢤌𦗾',
-    '𢣻𢣻',
-    '𢤰𢤕',
-    '𢥘𢤮',
-    '𢥰𢤉',
-    '您𠑓',
-    '懍𢤭',
-    '懂𢤦',
-    '顫颤𢥇',
-    '懘𢤅',
-    '𢣙𢤨',
-    '㦝𢤧',
-    '忡𢥕𢥞',
-    '懠𢥎',
-    '懪𢥑𢥟',
-    '𢤐𢥍',
-    '𢥄𢥐',
-    '愯𢥠',
-    '慓𢥡',
-    '願𩕮𢥧',
-    '戇戅𢥨',
-    '𢟢𢥗',
-    '㦪𢥥',
-    '𢜸𢥝',
-    '憹𢥯',
-    '㒩𢥾',
-    '戲戯戱戏',
-    '錢钱銭㦮',
-    '成𫀄𢦩成',
-    '弟𢦢',
-    '感𢦡',
-    '戕𢦤',
-    '戩戬𢦞',
-    '㦰𢦜𢦝',
-    '戚𩒛𢦫',
-    '矛𢦵𢧟𨥨𢦧𥍥𥍤',
-    '𢦚𢦻',
-    '𢧴𢦷',
-    '戛戞戛',
-    '賊𧵪贼戝',
-    '𢦟𢧆',
-    '戟𢧢㦸',
-    '蠢𢧨𢧔𢨎𢨣𧓟𧕷𢧭𧅪𢧸𢧬𢧋',
-    '斮𢧉𣃀𢨈',
-    '棨𢧊',
-    '𢽴𢧈',
-    '穢𢧹秽',
-    '𡙮𢧤',
-    '摑𢧷𢹖掴',
-    '熾𢧾炽𤎷𤐦𢨙',
-    '藏蔵𢧿𨤃',
-    '寁𢧺',
-    '韶𢨍𪔓',
-    '獝𢨌',
-    '戫㦽',
-    '識𧨺识𢨞𧬣𧥾',
-    '㱆𢨛',
-    '戶户戸𣥘',
-    '戺𢨪',
-    '扅𢨹㦾𢨴',
-    '戾𤡵𢨾𤟵',
-    '釉𥑤釉𢩃',
-    '屇㧂',
-    '𨳳𢨸',
-    '𢩘𢩅𨑅',
-    '䦘𢩆',
-    '失𢩥',
-    '拂払𣀪',
-    '扠𢩩𢹓',
-    '掃掃扫',
-    '捫扪',
-    '擴挄㨯拡擴扩',
-    '𢩱𢩱',
-    '扮𢪆',
-    '拔抜㧞拔𢪺',
-    '拋𢱹抛',
-    '拘𢳉抅',
-    '拗抝',
-    '搶抢𢷇',
-    '撲𢷏𢪗',
-    '撫𢸮𢺌抚',
-    '擇択择',
-    '於𣱏扵𤋬𤕘',
-    '物𢪱',
-    '護护謢',
-    '忪𢪌',
-    '抆𢪖',
-    '抌𢪨',
-    '抇𢪏',
-    '捽𢪄',
-    '摶𢰁抟𧽢㩛',
-    '摳抠',
-    '扚𢪰',
-    '抐抐',
-    '扴𫽜𢪅',
-    '𢪇𢪫',
-    '掆㧏',
-    '𢱶抋',
-    '㩳㨦㧐',
-    '扼㧖',
-    '拐拐',
-    '拚𢪴𢱰',
-    '抱抱𢬘𪭷',
-    '拖𢫌拕',
-    '揀拣',
-    '撥拨',
-    '據拠𢷛㩀㨿',
-    '擰拧',
-    '擬拟',
-    '攏拢',
-    '攔拦',
-    '枯𢫈𣐞𤖲',
-    '牽牵𢫀撁䊹𪺮',
-    '夯𢫉',
-    '拶㭮𢹵拃',
-    '揟𢪵',
-    '枷拁',
-    '枵𢪶',
-    '㧊𢫂',
-    '𢪾𢪾',
-    '抉挗',
-    '投𢫹',
-    '拍𢫦',
-    '指𢫾',
-    '拴拴',
-    '拿㧱',
-    '挾挟',
-    '捐捐',
-    '掙挣',
-    '揮挥𢱳𨍂𢰄',
-    '搔𢫼𢸪𤔢𢮞',
-    '摯𢴷挚',
-    '撓挠',
-    '擋挡',
-    '撻𩋅𩌉𢺂𨘈𢹗挞𢾴',
-    '旅𢰈挔𣃨𣥏',
-    '梳梳𣙳㧧𣐌𣓜𤴜',
-    '腕𦞿𢯲𦙵𢫪𢮗',
-    '遷𨙞𨒿拪𨔰𢰕𨗺𨗢𨙙䢬𨕞𢫥𨙘',
-    '挩捝𢬁',
-    '掗挜',
-    '揯搄𢬎𢫮𢳖𢰨',
-    '搊𢬞𢮢𢬆',
-    '撏挦',
-    '撾挝',
-    '薅𢫩𦼸𣐾𢬺',
-    '扏㧨',
-    '㧤㧤',
-    '𢪼𢫤',
-    '㧬㧬𢭤',
-    '𢭁𢬡',
-    '𢯼𢫱',
-    '括𢬸',
-    '挑𢬹',
-    '挈𢭋',
-    '挽挽',
-    '插挿揷𢰔',
-    '換换換𢯉',
-    '損𢿃损',
-    '搖𢳘𢭌揺摇㨱𢭊',
-    '撈捞',
-    '撿捡',
-    '抔㧵',
-    '抪𢬾',
-    '捌捌',
-    '挲𢬰',
-    '捭𢬽𢮆',
-    '揶捓',
-    '摠𢭇𢷝𢵃',
-    '㧚𢭨',
-    '𢫷𢬯',
-    '把𢺞𢮤',
-    '拼拼𢬵',
-    '拳𢮙搼',
-    '捆祵𢮖',
-    '捨捨',
-    '掣𪘔𢮓𢳐𢳅',
-    '揭𢷒𢶆掲',
-    '搗捣',
-    '擄掳',
-    '擒捦㩒',
-    '棲捿',
-    '俵䞄㧼',
-    '揲𢮕𢶅',
-    '搒𢮔',
-    '搫㨇',
-    '摻掺',
-    '摐㧿𢰑',
-    '撣掸',
-    '畀𢮧',
-    '稒㧽',
-    '掑𢮜',
-    '抦㨀',
-    '捏揑',
-    '挪𢰓',
-    '掠𢱊㨼',
-    '捷㨗𢶝𢱅',
-    '揣𢰚𢵦𢯍',
-    '摟搂',
-    '撰𢰅',
-    '擱搁',
-    '擲掷',
-    '攙搀',
-    '攬㩜𢳢𢱯擥揽',
-    '挃𢰗',
-    '挬𢰏',
-    '揤揤',
-    '摡𢷽摡',
-    '揫𢱀',
-    '搆𢰎',
-    '搵揾',
-    '搋𢯯𢲽',
-    '摝𢮑',
-    '撳搇揿',
-    '犐𢱃',
-    '𢭂㨓',
-    '挭𢯬',
-    '㧶揁',
-    '㧹𢰐',
-    '捪㨉',
-    '𢮡𢱂',
-    '𢱇𢰃',
-    '𢯻𢰉',
-    '㨏㨏',
-    '𢯫𢱈',
-    '搲攨𢱑',
-    '搙掿',
-    '𢱣𢳕𢰒',
-    '㩶𢲺𢰀𢺊',
-    '𣕂𢯭',
-    '菢㲒𢯿𣭀',
-    '扶𢻳𢺻𢱿',
-    '批𢱧',
-    '抽籕㨨㩅',
-    '挫𢲖',
-    '探𢲘',
-    '掩𥦩𢲅掩',
-    '掬𡙳𥸭',
-    '揆𢲕',
-    '揖𢱼',
-    '擁𢺠𢹭𢹬𢶜㨣',
-    '攝摄摂',
-    '攜𢹂携擕㩦㩗',
-    '攤𢺋擹摊',
-    '閂𢲙𣟴闩',
-    '捅𢳟',
-    '揎𢱱',
-    '搥𢱸',
-    '撟𢱪',
-    '擯𢷤摈',
-    '攩𫽮',
-    '㨖㨖',
-    '𢲀𢲀',
-    '㩋𢱩𢸳𢹱',
-    '擓㨤𢶘',
-    '撇撆',
-    '撮𤑧𢲻',
-    '笞𢲹𣘜',
-    '舂𦦓𦥽摏𦥴',
-    '弶𣚦摾',
-    '扦𢳍',
-    '揃𢵏𢶕㨵𢸄',
-    '揅揅',
-    '搉㩁',
-    '搣𢳒𢷄',
-    '摍𢴀𢳔',
-    '撖撖',
-    '攖撄',
-    '㑃𢲷',
-    '㨠𢳡',
-    '㨾𢵎',
-    '摖𢲉',
-    '㩍㩞㨲',
-    '𢷍𢳃',
-    '扛𢴦',
-    '措𢵄',
-    '掉𢴿',
-    '捶𢴹',
-    '撐𢴤撑',
-    '撒𢴻',
-    '攆撵',
-    '攪撹㩭',
-    '掞𢴵',
-    '掤𢵁',
-    '撝撝',
-    '搴𢷘𢺦㩃',
-    '摞𢴱',
-    '摰𢴸',
-    '撅𢴺',
-    '擫㩎擪',
-    '擷㩪𨘓撷',
-    '擸𢴫',
-    '攛撺𢺱',
-    '㨚𢵀',
-    '㨧撪',
-    '㨹𢴥',
-    '𢴧𢴠',
-    '擆𢷷撯',
-    '撉撴',
-    '𢸣𢶑𢷭𢴶',
-    '拎㩕',
-    '接擑𪉚',
-    '掘𢶵',
-    '擻擞',
-    '揄𢶖',
-    '摽𢶏𢸂𢹰',
-    '摦𢶎',
-    '摮𢶗',
-    '撢𢶁𢺬',
-    '撽𢵿',
-    '檥㩘',
-    '挒𢴴',
-    '𢯮𢶂',
-    '搎𢶛',
-    '摱𢶔',
-    '𢶀𢶓',
-    '𢶙㩓',
-    '𢹍𢶐𢸤㩬',
-    '㩵擜',
-    '橩𢶇𣜧',
-    '𥴫𥷝㩔𥷽𥳨',
-    '䉞𢶦',
-    '托𢷌𢸨',
-    '抬擡',
-    '抮𢷑',
-    '箜𢷙𣝃',
-    '捇𢷓',
-    '摷㩰摷',
-    '𢷶𢷚',
-    '搓𢷼',
-    '摘𢸈',
-    '摹𢸆',
-    '擂攂𢺢',
-    '擺𢸇',
-    '擐𢸃',
-    '攕㩥',
-    '攢攒攅',
-    '疐𨂬𨆫𢷐𨇈𤴝㚄𧁏𤴡',
-    '捃攟攈𢹲',
-    '搢𢸰',
-    '擽攊',
-    '櫺𢸲',
-    '搸𢸩',
-    '㩩𢹟',
-    '攋攋',
-    '𢸧𢸱𧅩',
-    '挸𢺃𢹕',
-    '𢷖𢹴',
-    '㩧𢹯',
-    '擾𢺕',
-    '麾𪎮𣬡𪎜',
-    '攘𢺖𣀮',
-    '𢼕𢻽𢺾',
-    '教𢼅敎𢻍𧧿',
-    '敔𢾵𢻊',
-    '散𢻎𢿷𢻦𢻞𢿨㪚',
-    '𢻚𢻏𢾪',
-    '𢾚𢻕𢾑',
-    '敮𢻗',
-    '魯𣥓𩶑𢻛鲁𨟇',
-    '操𢻥',
-    '攲𢻪',
-    '𢻬𢻲',
-    '𣀠𢻭𣀛',
-    '敗败贁𤖐𣀕',
-    '㩿㪂',
-    '𢽳𢻾',
-    '叩敂𢼒',
-    '拙𢼍',
-    '赦𥘦𤆅𢼜𢽀',
-    '敓𢼠敚',
-    '迻𢼏',
-    '𢻱𢼊𢼉',
-    '刷𢼞',
-    '敖敖𢾍',
-    '敆㪉',
-    '𢼨𢼮',
-    '斂敛',
-    '敬𢿩敬𣀖𢾠',
-    '㪏𢽛',
-    '揩𢾆',
-    '數𣀭𢿘𢿙数',
-    '穆𢿬𥟙𬓽𫀾𥡆𢿉𢾓𥠇𥢣',
-    '挌𢾏',
-    '揊𢾇',
-    '掁𢾊',
-    '㪢𢾐',
-    '𢾅𢾖',
-    '𢾜𢾎',
-    '敲㪣𣫁',
-    '敷𢾾旉𢾭',
-    '肇肈𢾹肁𦘟',
-    '㦺𢾯',
-    '𣀒𢾸',
-    '整𢿋𢿫𣦔',
-    '竊𢿑𥩓𥨱窃𥨷𥨵',
-    '貫䝺贯𢿒',
-    '畋𤝗𢿊𤱞',
-    '盭𥃊𥃁𢿐𥃎',
-    '𢿕𢿜',
-    '𣀂𣀂',
-    '播𢿥𨤏',
-    '鼖𪔵䩿𢿠𡒡𪔫鼖',
-    '𢿓𢿡',
-    '𢿲𢿣',
-    '𢿴㪧',
-    '𢿵𣪿𢿧',
-    '𣀘𣀓𢿟',
-    '㱇𢿿',
-    '𢿳𢿮𣀑',
-    '𣀡𣀜',
-    '𣀣𣀨',
-    '𥀹𣀺',
-    '𣀼𣀻',
-    '斒𣁊',
-    '譽誉𣁎',
-    '錦𣁙锦',
-    '𩖣𩖮𩖰',
-    '彩𣁝',
-    '爇𣁞𦳼𤋲𤑔',
-    '斖𣁫',
-    '斗𣂑𣁬㪷𤣫',
-    '斛㪶',
-    '斝𠬂斚䑝',
-    '𣂁𣂥𣂀𣁶𣁿',
-    '𣁷𣁻',
-    '𣂆𣁺𣁼',
-    '斞𣂂',
-    '熨𤓮𣂊',
-    '斣𣂌',
-    '㪺𨞜𨟛𣂏',
-    '斬斩',
-    '斯𣂖𣂕',
-    '析㭊𣂔',
-    '折𣂲㪿𣂟𣂫𣂹',
-    '鼎𪔂𥅀𣂰鐤䁀𣇄𣂨𣃒𣃊㫀𥇴',
-    '剞𣂦',
-    '斲𣂡𣃃𨮕𣃂斵𣃋𣃆𣃏𨯴𣂪𦘣',
-    '虢𣂭',
-    '斫𣃑𥖛𣛰斱',
-    '誓𣂶䤱𣂯',
-    '斳𣂼',
-    '粼斴𣃌𤏞',
-    '貸𣃐贷',
-    '斪𣃖',
-    '旁㫄𣃙𣃟𣃪',
-    '旌𣄀𣃢',
-    '旆斾𣃩',
-    '旗㫅',
-    '旃㫋𣃼𣃯旜',
-    '旒旒旈',
-    '瓬旊',
-    '𣃳𣃷',
-    '受𣄁',
-    '旖旑',
-    '旐𣃿',
-    '旟𣄊',
-    '㫎𣄈',
-    '𣄙𣄐',
-    '旚𣄔𣄦',
-    '𩩦𣄤𩩘𣄘',
-    '旞𣄚',
-    '幢𣄢',
-    '𣄠𣄡',
-    '祈𣄨',
-    '既旣旣',
-    '昏昬𣋯𣄾𣉈𣆾𣄼',
-    '涿𣄻𣵠𣽗𣺵',
-    '昌𣅊𣆫',
-    '時𣅱时旹',
-    '晤𣅎',
-    '曠旷𣋷𣊥曠',
-    '艮㫔',
-    '豆𣅋𤽔𧯜䇺𣅣𧯚𤽋',
-    '旻𣅐',
-    '暘旸',
-    '𣆖𣅇',
-    '昀昀',
-    '春㫩𣈤𣆊萅𣊨旾𦸬',
-    '皆𣅜',
-    '旼𪰋',
-    '昒㫚𦙑𣇤',
-    '昃𣅦𣅛昗𣅳𪰖',
-    '晬𣅢',
-    '曇昙',
-    '聃耼𦕐𨈜𣅧𨈭',
-    '𣅚𣅚',
-    '㫟昖',
-    '炄𣅴',
-    '𥄔昁',
-    '早𣅼𢑖',
-    '昂昻',
-    '昧𣆜',
-    '昶㫤',
-    '昢𣅽',
-    '昝昝',
-    '曨昽曨',
-    '昣𣆋',
-    '昪𣅹',
-    '晲𣅸',
-    '𣌧𣅾𣆩',
-    '是𣆞',
-    '晉晋𣌇㬜𣈆',
-    '晃晄',
-    '暈晕',
-    '暴㫧㬧𣊴𣋴㬥曓𣋳',
-    '曉晓𣉊暁',
-    '皎𣎣晈',
-    '顯顕𩔰𩕃㫫',
-    '昵𣆓',
-    '昫㫬',
-    '晟晠',
-    '曈晍',
-    '曄曗曅𣊚晔𣋓𣋌',
-    '眥𥈐㫮眦',
-    '㫞㫦',
-    '宵𣆺',
-    '晚晩𣇋𣆶',
-    '皓晧',
-    '昴𣇯𣆻',
-    '晁𪓨𪓲鼂𣆷',
-    '晥𣆿',
-    '晡𣇀',
-    '晙𣇚',
-    '晢晣㫼',
-    '㒻㫯',
-    '毋母',
-    '昔𣊦㫺',
-    '明𣇱朙眀',
-    '晰𣇮',
-    '晴晴暒',
-    '晶𣇵𦜳',
-    '暉暈',
-    '暫暂𣊙',
-    '曙暏龧',
-    '沒𣴬𦐲没𣇶𣳚',
-    '督𣈉𥆳',
-    '晷晷',
-    '曜𤒂𣇪𪏌',
-    '赶𢆝',
-    '敃𣇻',
-    '㫶晭',
-    '㫽㫽',
-    '曃𥊵𣇨',
-    '焟𤓔𣈏',
-    '曼㬅',
-    '映暎',
-    '景㬌',
-    '暑暑',
-    '暢暢畅𣈱',
-    '類类𣈪𩔧',
-    '旰𣈨',
-    '晅𣉖𣈶暅',
-    '𣆗㬁',
-    '㫱㬄',
-    '㬂𣈦',
-    '㬈㬈',
-    '普暜',
-    '曖暧',
-    '曝㬍𣋏𣌑𣌈',
-    '照𥊐𥋫𣉬燳瞾𣊕㷖',
-    '蒙䝉𦿢𣉭𫎇',
-    '暀𣈧',
-    '暠𣉞',
-    '曒暞',
-    '皞暭曍暤皡',
-    '𣇩𣉩',
-    '𣉚㬕𣉫',
-    '𣉜𣉜',
-    '暚暚',
-    '智𤾞𥏼𣉻',
-    '渴渇𣊆',
-    '熰𣉾',
-    '瞀𣊃',
-    '瞝𣉽',
-    '𣉪𣊀',
-    '暬𣊮𣊓',
-    '𣋞𣉼',
-    '熭𣊄𤑒',
-    '暖𤆱𣊵',
-    '熹𤎿𤏴熺暿',
-    '暐㬙',
-    '暍㷎㬞',
-    '曣㬫𣋅',
-    '舄𩊿舃𩍆𣊣',
-    '㬎𣊡',
-    '㬓𣊠',
-    '𤾥㬝',
-    '晒㬠曬',
-    '曦㬢𦡫',
-    '著着𣥧著𣋐',
-    '燠燠𤈯𣋉',
-    '昤𣌟㬡',
-    '晜𣋥𥊽',
-    '昅㬤',
-    '暳㬩',
-    '㬮𣋸𣌖',
-    '皭𤿃㬭',
-    '㸎𣌍',
-    '暾𣌘',
-    '燭𪹳爥曯',
-    '曳曵𦥙',
-    '曹𣊛𣍘𣌼曺',
-    '曾曽',
-    '冕冕',
-    '最最𣤜㝡',
-    '替𤾕㬱𤽽暜',
-    '朄𣍃',
-    '豐𧯮𣍈',
-    '朁㬱',
-    '𤚥',
-    '己已巳',
-    '僈𣍑',
-    '㬲𣍙',
-    '䍥𣌅',
-    '黌黉𣍜𪏬',
-    '舟𣍝',
-    '服𦨊𦨈肷𨈞𦨕𣍞𦨋',
-    '望望𣍢𥩿',
-    '䑣肜',
-    '朔𦚿𦙚𣍮',
-    '頒肦朌颁',
-    '朒肭',
-    '㬳𦙗',
-    '朧胧',
-    '船舩𣍬',
-    '朗𡦀𣍷朖朗',
-    '磐䃲𦛵𣍵',
-    '朡𣍶',
-    '霸覇𧟳𩄤𧈉𣍸𧟲',
-    '𣎗䐋',
-    '㬿朜',
-    '𦚹𣎄',
-    '凌𣎐',
-    '朝𣎍𦩻',
-    '朚𦟁',
-    '縮缩𦟱𦄲𣩐',
-    '鞶𣎤',
-    '杰𣎶',
-    '呆𠫡',
-    '朵𣏻朶䒳𣎿𣎻',
-    '權権𫞐权',
-    '朻𣎹',
-    '來来𧼛',
-    '扣𪱳',
-    '杞𣏌',
-    '根𣒨𣏅',
-    '梅𣒫楳梅𣏁栂槑',
-    '條樤𣒼條条',
-    '楊杨',
-    '綱𦂴䌉𣓡纲㭃',
-    '杓杓𣏐',
-    '𣖼杊𣓓',
-    '櫏𣘝杄',
-    '困𣏔',
-    '枕𣏝',
-    '棒㭋',
-    '棉㮌𣏜',
-    '楠𣔎𣏨',
-    '楓枫',
-    '槍枪𥎄',
-    '樞枢',
-    '樅枞',
-    '秉𣏲𦱮𥝐',
-    '枓𣏸𣙞',
-    '枘枘',
-    '柟枏',
-    '柎𣏘',
-    '庎楐𬂣',
-    '𣏕杮',
-    '枑𣏳𣏛',
-    '梘枧',
-    '果𣐭菒菓',
-    '柿枾',
-    '柵栅𣑭𣑭',
-    '枴柺𣐷𣐶',
-    '查査',
-    '柳桺栁𣓠',
-    '梔栀枙',
-    '梟𩾣鴵𩾒𣝨枭𩾓𩿋䲷',
-    '棟栋',
-    '棧栈',
-    '榮栄荣',
-    '標𣠙标𣗖',
-    '櫛櫛栉',
-    '欄栏𣟬',
-    '柘䂞𥦼',
-    '楙柕',
-    '橛𣐍橜',
-    '檉柽',
-    '櫱㮆𣕀𣡌𣔏𣠌枿𣖂蘖',
-    '杘𣐉',
-    '柡栐',
-    '檷𣐐',
-    '染𣑱',
-    '柏栢',
-    '桂𣑖',
-    '桃𣑯',
-    '栓栓',
-    '梵𣑽',
-    '棺𣑄',
-    '椒𣐹𣓙𣒏',
-    '楨桢',
-    '榛𦽥𣓀𣐽𦿒㰉',
-    '樁桩',
-    '槳䒂𥷃㯍桨',
-    '樺桦',
-    '橋桥槗',
-    '檔档',
-    '虐䖋𧆝𣑾𧆧𥤫𧆩𧆱䨋䖈虐',
-    '杇𣑀',
-    '枅枅𣓖',
-    '枻栧',
-    '柝𣐼𣝔𣔳𣟄',
-    '栲𣑥',
-    '栴㮵𣑪',
-    '栝桰𣐸',
-    '椏桠',
-    '榿桤',
-    '橈桡',
-    '欒栾',
-    '㭒𣏌𣐵',
-    '𣑫桗',
-    '栠栣',
-    '梠梠',
-    '𣓌桕',
-    '匣㭱',
-    '李䤚𣒶',
-    '桓𣒯',
-    '栽𣒭𥯒𣖋',
-    '梨梸棃',
-    '椰㭨',
-    '檢检検',
-    '檳槟梹',
-    '枹𣑿',
-    '栚𣒁㮳',
-    '梲棁',
-    '槱𤍕禉𥙫𣜃梄',
-    '杒梕',
-    '极㭲',
-    '㭼𣒩',
-    '𣓗𣒪',
-    '榐𣒅',
-    '槵梙',
-    '𣛺𣒬',
-    '欞棂',
-    '柄棅',
-    '棠㭻𣙟',
-    '棋櫀棊碁㯦檱',
-    '楚䠂𣗂椘𣕑𧯴',
-    '楷𣒉𣗀楷',
-    '極極',
-    '榜㮄',
-    '槨椁𥕖𣠐',
-    '碗㼝椀盌',
-    '栟栟',
-    '栔𣓇',
-    '槊𣔒矟𣓞',
-    '槮椮',
-    '槧椠',
-    '稘𥟞𣔔',
-    '輞𨋹棢辋𨊾',
-    '枖𣓎',
-    '㭙𣚅棏㯖',
-    '棛𣚥棛',
-    '𣔺𣓍',
-    '𣖾𣓂',
-    '㮲𣔖',
-    '檋𣡴𣔑',
-    '欏椤',
-    '㽕𣔴㕀𣓐',
-    '架榢𣕧',
-    '枸𣕉',
-    '梗𣖀',
-    '棕椶𣞛㯶',
-    '椅𬃪',
-    '概概槪槪',
-    '榆楡',
-    '樂𨊊楽',
-    '橢㯐楕椭㰐',
-    '櫚櫚榈',
-    '欖㰖榄',
-    '幄𧛐楃',
-    '柍楧',
-    '栯㮋',
-    '栒𣕍',
-    '椔椔',
-    '楂楂',
-    '楶㮞',
-    '榼𥃕𣖁',
-    '榍𣕋',
-    '橭𣖥',
-    '檖𣔾',
-    '櫸榉',
-    '禺𣕃',
-    '𣐒𣔲',
-    '𣐑𣖲𣓄',
-    '𣓕𣕽',
-    '棇楤樬',
-    '楌楌',
-    '椯𣖃',
-    '𣔹㮢',
-    '榲榅',
-    '桔㮮𣚃',
-    '桌槕',
-    '梓榟',
-    '槁槀',
-    '橡様',
-    '檻槛',
-    '爾𣝧𠑂𤕨',
-    '矩榘',
-    '送䢠𨕼𨕩𨕪𨔮𨓵㮸',
-    '慉槒',
-    '梫𣖽',
-    '榦𣘒',
-    '樧𣛶榝',
-    '檟槚',
-    '欃𣗸𣝊',
-    '㭚𣖺',
-    '椱𣘅',
-    '槙槇',
-    '榣榣',
-    '檾𣘑𤍔䔛',
-    '䈜𣖯',
-    '梁樑𣹷',
-    '橫横',
-    '橄橄',
-    '檀𫞍',
-    '櫓樐橹',
-    '櫻櫻樱',
-    '桹樃',
-    '梐㯇',
-    '梣𣘕',
-    '棓𣘙',
-    '椽㯌',
-    '楘𨎸𣖶𨍎',
-    '槔槹',
-    '樕㯈𣙙',
-    '樝𣙁',
-    '槲𣘳',
-    '檣𤕽艢𣞱樯𣝿',
-    '櫫橥',
-    '杫𣘩',
-    '桫𣘡',
-    '椃𣘫',
-    '榓櫁樒',
-    '樜𣙃',
-    '㯆㯆',
-    '㯱𣙲𣝐𣞉',
-    '𤬯𣘞𤬰',
-    '䆲槺',
-    '𦪈𦪰𣘢',
-    '榴橊',
-    '榭𣛘',
-    '櫥橱',
-    '麓𪋤㯟𣝹',
-    '棻𦯳𦯲㯣',
-    '榙㯚',
-    '樛𣚉',
-    '樾𣙾𣜀',
-    '橶𣛔',
-    '橤𣛚𦁞',
-    '檍𣟻𣚍',
-    '檹𣚂',
-    '檽𣚐',
-    '檮𣝷𣚑',
-    '櫪𣙽',
-    '欘𣚚',
-    '蕣𧂌橓',
-    '輴𣚆䡅',
-    '椊㯜',
-    '㭺𣚖',
-    '榺𣚗',
-    '𣖱樶',
-    '櫞橼',
-    '𣚣𣚣',
-    '杉檆',
-    '植㯰',
-    '楫艥檝',
-    '樸檏',
-    '檄𣜥',
-    '秦𣜈𥢮𥠼𥣠',
-    '雜𣜫𨿼雑襍',
-    '樗𣛲',
-    '檁檩',
-    '櫟檪',
-    '皵𣛵𥀟',
-    '萷𣜎',
-    '𣔵𣛳',
-    '𣚀𣚁',
-    '𣛹𣜅',
-    '櫲𣛿',
-    '𣟵㰕𣛼',
-    '凳櫈',
-    '柯𣝺',
-    '核𣝗',
-    '觴𤔰𣝻𨢩',
-    '杶𣠍櫄𣝙',
-    '櫋𣝼',
-    '虡𨮗𨯼簴𧇽𣝛𧆾𧇆',
-    '韎𣝖',
-    '㯛𣝄',
-    '𣝓檿',
-    '朴𣞞',
-    '蔡𣞖',
-    '杴𣞘',
-    '槎𣞚',
-    '樀㰅',
-    '槸𣞕',
-    '檇㰎',
-    '欑櫕',
-    '葚𣞵',
-    '𣘤櫒',
-    '𣚙㰄',
-    '檈𣞲',
-    '鞴𩏃𩍘韛𩍁𩏕𣠻㰆𩌎𩎻',
-    '楹𣟅',
-    '篙𥮑㰏',
-    '樻𣟨',
-    '檐𣡞櫩',
-    '櫳㰍',
-    '甍𣞑𠪹',
-    '𣟌𣟍',
-    '䀊𣟇𥂔𥃃',
-    '樵藮𦿕𣟶𧄡',
-    '𣝑𣟰',
-    '𣟋𣟯',
-    '櫾𣠡𣟾',
-    '短𣠭𥎶',
-    '鬱𣡇𣡸𦉚欎𦉠欝鬰',
-    '槭㰗',
-    '㰘㰘',
-    '輾𨋁𥗷𨋚𣡃',
-    '橠㰙',
-    '㯺𣠿',
-    '𣞙𣡆',
-    '槽𣡘',
-    '𠁃𥤔',
-    '杷欛',
-    '橝𣡣',
-    '蘽𣡺𦶖',
-    '嗤𧏬𣣷㰞',
-    '弞𣢀',
-    '𣢁𣢂',
-    '㰟𣢆',
-    '歐欧𣢨',
-    '歟欤',
-    '欿𣤉𣣻𣢌',
-    '㕧𣢎䐖',
-    '㰣𣢃𣢙',
-    '呻𣢘',
-    '欽𣣽钦',
-    '呿㰦',
-    '𣢉𣢚',
-    '𣢜𣢢',
-    '𣵷𣢟',
-    '𣣲𣤥𣢩',
-    '款𣣙欵𣤂𣢻',
-    '歃㰱𦦕𣣨',
-    '巸𦣤𣢮',
-    '𣢬𣢽',
-    '欠𣣓',
-    '欷𣣐',
-    '菡𣣖䓿',
-    '𣢒𣢧',
-    '欸𣤃',
-    '欹㿲𥀴𣣱',
-    '𣢣𣣝',
-    '𣢱𣣦',
-    '𣣌𣣰',
-    '欼㱀𣣯',
-    '𣣏𣣤',
-    '𣣈𣣣',
-    '𣣠𣣡',
-    '𣣹𣣥',
-    '𣣸𣣧𣤎',
-    '嗄𣣺',
-    '歂𣤀',
-    '㰡𣣶',
-    '𣣳𣣵𣤣𣤍',
-    '𣥀𣤁',
-    '祑帙',
-    '歡歡𧆒歓',
-    '飲𩚕飮𣵂𣤗𨡳㱃𩚜𣲎淾𨡢',
-    '歈𣤏',
-    '㰲𣤐',
-    '欻歘',
-    '歊𣤙',
-    '釂𣤚𨤊',
-    '斁歝',
-    '𣤭䌠𦆃',
-    '諤谔讍𣤲',
-    '𣤶𣤺',
-    '㱎𧥊𣤿㱎',
-    '歎𣥁',
-    '企企𧾺',
-    '此𣥅',
-    '澀𣹣𣿠歰歮𣾫澁涩𤁍渋𣥒𣴻',
-    '咫𦐖𣥉',
-    '正𫠱𣥔𧾸',
-    '𣥂𣥗',
-    '肯𦙡𠕔𦘫肎𣍟𣥤',
-    '訶𧬱诃㱒𧪆',
-    '𣥊𣥢',
-    '涉𣥿渉𣥩𣻣㴇𣶵',
-    '跟𨁞𣥦',
-    '睿𣥸𥈠𥅵𧮲',
-    '祟𣦅𥜱',
-    '虛𧆳𧟬虚𣦄虗',
-    '𨂭𣥽',
-    '踵歱',
-    '驅𩢧駈𩣌𩤀𩣕䮃驱𣦘駆',
-    '蹲𣦝𨀛蹾蹲',
-    '躇䠧𣦡',
-    '魘㱘',
-    '殄𣧠𣧢𣦺',
-    '𣦻𣦼',
-    '殲殱歼𣨦',
-    '殠𣧁',
-    '𣧂𣧅',
-    '𣧌𣧆',
-    '殬𣧃',
-    '舛𣧘',
-    '殀𣧕',
-    '㱞𣧉',
-    '殘残',
-    '殤殇',
-    '殙㱪𣧟𣨯',
-    '骴𩨱𣨁𣧨',
-    '𣧍𣧰',
-    '𣨢𣧪',
-    '𣨡𣧭',
-    '殍𣨈𦹡𦖀𣧶',
-    '腴𦚤𣨃𣧴',
-    '尯𣧼',
-    '㱚䏼𦚛𣧻',
-    '𣧸㰷',
-    '𣧷𬆔',
-    '唁𣨌𣨹',
-    '殮㱨殓',
-    '殞殒',
-    '殪𣩉𣨑',
-    '𩛨𣨆',
-    '殫殚',
-    '琰𤥎𣨬',
-    '㱤𣨗',
-    '殜𣨚𣩨𣩫𣩣',
-    '㱶𣨥',
-    '癘疠𣨸㾐𤻹𤼚',
-    '禍𧙹𥚟𥛔𥚁𥚍𧛂䄀𣨷𣨱𥙯祸',
-    '殟殟',
-    '毈㱭',
-    '薧𣨻𧂎',
-    '𣩱𣨵',
-    '湈𣨴',
-    '𣨅𣩗',
-    '㱳𣩎',
-    '癇𣩞痫𣩝𤺛癎',
-    '殩殩',
-    '㱴𣩬',
-    '㱸𣩩',
-    '殣𣩲',
-    '薤䪥𧂊𣩶𩐉',
-    '𣩴𣩴',
-    '䆍𪚗',
-    '㱫𣩼',
-    '薨𣩾',
-    '毆𣪅殴',
-    '殿𣪍𣪍',
-    '𣫐𣪾𣪐',
-    '㲃𣪙',
-    '毅䝘𣫖𣪣𣫚',
-    '玨𤤴瑴㲄珏',
-    '毄𣪠',
-    '𢾝𣪡',
-    '㺉𣪨𤠼',
-    '敱𣪱',
-    '鷇𣪸𪆪𩀠𪈞',
-    '㲉𣫘𣪹',
-    '鼕𪔝㲇𪔜𪔖',
-    '敿𣪽',
-    '𢿽𣪼𢿧',
-    '𣀔𣫑',
-    '翿𣫟𦒯𦒇𦐩𦒛',
-    '竷𣫡',
-    '鼟𣫤',
-    '毑𣫰',
-    '蹯𨆌𨅴𨆜𨁢𩕈𣫯',
-    '育育𣫺',
-    '𤿙𠂱',
-    '毗𣬖䀝𣬈𣬉毘',
-    '掍𣬑',
-    '𧳅𣬔𣬒㹬𧳡𧲬',
-    '禿𣬜秃',
-    '鬍𣬣',
-    '㲏𣬢',
-    '髯𩑺䫇𣱄𩒹𩓾𩓿髥𩑞𣬭',
-    '氀𣯫𣰢㲎',
-    '髲𣬮',
-    '旄𣭅',
-    '氈氊毡𣰔𩎄𩯤',
-    '氍𣰻𣭂𣯒𣰠𣯸𣰋㲘',
-    '䎄𣬸',
-    '䯱𩬋𣬾',
-    '毞𣭁',
-    '毦𣭞',
-    '毨𨾷𣭟',
-    '毣𣭜',
-    '氂㲠𣮋𣯷𣯛𣭭',
-    '耄𦽡𦿗𣭢𦹾𩲘𣮳㿞𦓄𧂕𦒷',
-    '睫𣮑𣮒𣮍𣰞𣮌𣮣𥇒𥇾𣯥𥊆𣭶𣯮𣯰𣰍',
-    '毬𣭳皳',
-    '毼𣭸',
-    '氄𣰲𥎜𣭲𧝢𣯍',
-    '㲙㲙',
-    '㲚𣮅',
-    '㲖𣭱',
-    '𣭺𣭽',
-    '𣭴𣭵',
-    '毯㲜㲭',
-    '諄𧭺𧩽𧭫𣮢谆',
-    '鬃𣮤',
-    '毱𣮕𣯲𣮓',
-    '眉睂𥇮𣮮𥅮',
-    '毻𣮆𣮲',
-    '毹𣰟𣯁毺𣮵',
-    '毠𣮫',
-    '毧𣮪',
-    '㲔𣮭',
-    '𣮊𣮰',
-    '𣯜𣮬㲙𣮯',
-    '㲲𣯉𣰭𣮨𣰸𧟕',
-    '𣮃𣯂',
-    '娑𣯌𣯢',
-    '毳𣯝𣰗𣯠',
-    '毾𣯾𧝅𣯈',
-    '縟𣯋缛',
-    '𣮧𣯓𣯟𤷋𣯊',
-    '髻𣯦䦇𨲡',
-    '毰𣯱',
-    '氅𣰉',
-    '㒿𣯤',
-    '毸𣯯',
-    '毿𣯺',
-    '㲪𣰆',
-    '氆𣯽',
-    '裘𣰐𧚍',
-    '鬞𣰊𣭺',
-    '𣰚𣰖',
-    '𣰡𣰣',
-    '𣯼𣰮',
-    '𦇧𦆢𠫈𦆡',
-    '氌𣱀',
-    '氓𦫋䇇𤱕𣱅',
-    '伺𣱇',
-    '㲳𣱎',
-    '𣱐𣱑𣱒',
-    '氣𣱖気炁𪸓𤽍𣱛',
-    '氛𣱦氛',
-    '刉𣱚𣱞',
-    '氤𣱜',
-    '氫氢𣱮',
-    '氬氩',
-    '霄䨭㲵',
-    '氯㲶氯',
-    '氳氲',
-    '㲴𣱯𣱪',
-    '氮㲷',
-    '溺㲻氼',
-    '漢㵄𤁉汉𣶔',
-    '貨货𧵰𣱷𧴦',
-    '沔汅',
-    '㳁汄',
-    '江𣲅',
-    '沌𣲃',
-    '泅汓',
-    '湯汤',
-    '污𣽏汚',
-    '汛𣲌',
-    '汍汎',
-    '汔𣲁',
-    '汴𪵩',
-    '汐𣴁𣲠',
-    '沛㳈沛',
-    '汲汲',
-    '泣𣲔',
-    '泄𣳘𣲟',
-    '沿㳂',
-    '洶𣶑汹',
-    '淪沦',
-    '滬沪',
-    '澤泽𤀎沢',
-    '瀝沥𤃹',
-    '汜𣲩',
-    '沍𣲨𣲐',
-    '汭汭',
-    '淬㳃',
-    '溈沩潙',
-    '漚沤',
-    '灃沣',
-    '㳐𣲞',
-    '沱𣵺沲𣴾𣵻',
-    '沸𣲴',
-    '泛𣳋',
-    '涇泾',
-    '淺浅𤄻𣻝',
-    '淚㴃泪涙',
-    '溢㳑',
-    '滄𣳁𤀅𣶟',
-    '潑𣸍泼',
-    '盥泴𣹉𤃗𥁉',
-    '厬𣽞𣲼𣽞',
-    '泧𣳡',
-    '沷沷',
-    '泲泍',
-    '泝𣴔𣳙',
-    '沴𣳅',
-    '洍泤',
-    '滎荥',
-    '澮𣴯𣲸浍',
-    '濼𤄶泺',
-    '瀧泷滝',
-    '瀘泸',
-    '灂泎𤅨𤅪',
-    '𠬦𣲿',
-    '汷泈',
-    '𣳤𣳄',
-    '涺𣲻𣶅',
-    '泡𬰀𣴊',
-    '泊湐洦𣶊',
-    '洛洜',
-    '海𣴴海',
-    '涓㳙',
-    '涎𣶜𣶛𣳧㳭𣵤𣷜𣶙𣵿湺𣹺𣶚',
-    '液洂',
-    '淨瀞浄',
-    '渡𣳥',
-    '測测𤂄',
-    '渾浑',
-    '滋滋𤂇𣳯',
-    '漿𤕯𩞟浆𤖅𩝫𩝴',
-    '澆𤀴浇𣴹𣻏𣷝',
-    '濃浓𤅁𤅛𤅌',
-    '濁浊',
-    '濟𣸓𣳵济済𣺴㴉',
-    '瀉𣿱泻',
-    '汧汧',
-    '洭㳝𣶕',
-    '洿𣳹',
-    '洸𣴕',
-    '洚𣴗',
-    '浹浃',
-    '湞浈',
-    '滻滻浐',
-    '潯浔𤃂',
-    '濜浕',
-    '㳏𣳪',
-    '㳘㳘',
-    '㳪𣳶',
-    '洖洖',
-    '澾𤀱㳠𣾣𣽑𣿔',
-    '汙𣴰',
-    '汪𣷪𣳫',
-    '波𣴫',
-    '泓𣴦',
-    '活𣴠𣽅𣿛',
-    '浴𣴲',
-    '浩𤅆浩㵆',
-    '淑㳤',
-    '渦涡',
-    '渙渙涣',
-    '溶𣵞',
-    '漩㳬',
-    '漆𣴶𣷦',
-    '漣涟',
-    '滲㵕涁渗',
-    '潤润',
-    '濱濵滨𨽗𣴩',
-    '濤𣵬𣾭涛𤁟𤃕',
-    '瀰𣶿㳽',
-    '社𥙲𥙭䄕𣴳',
-    '汒𣴭',
-    '洹𣷻𣵨',
-    '洮𣴧',
-    '涅涅湼',
-    '涗涚',
-    '淀𣵦',
-    '淢𣴤',
-    '淶涞',
-    '渽𣴮',
-    '漘滣浱',
-    '澇涝',
-    '菏𦶒𣵣',
-    '𣴖㳨',
-    '浾𣵩',
-    '𣶞𣵢',
-    '㳷𣴵𣷤',
-    '漨浲',
-    '潿涠',
-    '潷𣺱𣴡滗',
-    '洌𣶄𣸟',
-    '消㴅',
-    '淅𣶁𥺚',
-    '涵𣶬𣹢',
-    '溯𣷥',
-    '滂𣹿𣶢',
-    '溪渓',
-    '漬𣿙渍',
-    '漸渐',
-    '漲涨涱',
-    '漁𣿡渔𤀯䰻𩼪䱷',
-    '瀋渖',
-    '灑𣶇𤂢',
-    '汶𣶌',
-    '洴洴',
-    '洼𣵾',
-    '淯淯',
-    '涆𣵼',
-    '涪𣷧',
-    '涬𣸖𣷟𪶗',
-    '淥渌',
-    '渫㳿',
-    '湄𣽪𣾨𤃰𣷍𤃱',
-    '湑𣷢',
-    '漙𣷼𣶣',
-    '潁颍𣻯',
-    '澠渑',
-    '岶𣶎',
-    '沰𣶦',
-    '洕𣷩',
-    '㴵淧㵥',
-    '㵺渒𤀥',
-    '水𣸕',
-    '津𦩦𦩏𦩨𣸁𦨱',
-    '淄湽𣻲',
-    '港港𣽣𣿑',
-    '湔𣾅湔',
-    '湮𣽔湮',
-    '溘𣹆',
-    '溫温',
-    '滔㴞',
-    '滯滞𨘛',
-    '漫𣸞澷',
-    '潰𤀭𤃘溃',
-    '濡𣽉𣽈渪',
-    '濺溅𣽖',
-    '灣湾',
-    '沇渷',
-    '洒𣹍',
-    '湠湠',
-    '湫湬𣹌',
-    '溲𣸈𦦼',
-    '漵溆㵰潊',
-    '滫𣺫',
-    '潠𣹎𤂿',
-    '潗㴕',
-    '濕𤂽𦒣𤀟湿',
-    '翂𦐈𣸜',
-    '葑湗',
-    '㳦𣸂',
-    '浵𣹊',
-    '㴒湙',
-    '𣹇𣸌',
-    '𣹲𣸒漽',
-    '𣹤𣸏',
-    '𣿆𣹋',
-    '𤃸㴖',
-    '匯滙',
-    '洋𣺸',
-    '淫滛',
-    '深㴱',
-    '湛㴴',
-    '渺𣺌',
-    '滇滇',
-    '滾滚',
-    '濫𣽦滥',
-    '濾𤄦滤',
-    '灘𤅩滩𤁤𤅼',
-    '灤滦',
-    '洟𦳂',
-    '泚𣸆',
-    '浧塣𣹽',
-    '涴𣹠',
-    '淛𣹨',
-    '湀𣺍',
-    '渻𣹴',
-    '潎𣽠𣺲',
-    '澍㴻',
-    '澦𤂻滪',
-    '瀅滢',
-    '瀫𣹬',
-    '灄滠',
-    '灉㴩',
-    '灨𣹟',
-    '灩𤄝𤅿灔滟灎灧',
-    '翐𦐝𣺐',
-    '㳾溬',
-    '𣺬㵁',
-    '㴥𣹝',
-    '滶滶𣿗',
-    '𣻑𣻑',
-    '㴽㴮',
-    '洪𤀆𤅏潂',
-    '涯漄',
-    '淹淹',
-    '渤㴾',
-    '溉漑',
-    '漾𣻌',
-    '漂𤄚𣻔㵱𣿖',
-    '漱潄',
-    '滌𣼝',
-    '瀟𤂣潇𤄙',
-    '灌𤂦潅',
-    '沭𣻚',
-    '泭𣻜',
-    '淰𣻧',
-    '漉𣼟',
-    '漻𣽓𣼢𤁸㵳',
-    '滹𤀶𣿋𣼻',
-    '潢潢',
-    '潒𣻍',
-    '澔㵆𣽋',
-    '濰潍',
-    '瀦𤃣潴',
-    '瀲潋㶑',
-    '雎𣻰鴡',
-    '洔𣻞',
-    '浛澏𣻦',
-    '𣻓𣻒',
-    '漗漗',
-    '㵴𣻟',
-    '𤁰𤂥𣻩',
-    '瀶𣻙',
-    '溜𤄐澑',
-    '滴𤁷𣾪',
-    '澈𤁲澈',
-    '潛潜濳',
-    '潸澘𣽽',
-    '潺潹',
-    '澱𣾮',
-    '澳𤁌𤀈澳',
-    '澹𣽃',
-    '濬𣿰𣽊𤀹',
-    '瀾澜',
-    '汆𪷚',
-    '淈𣽶𣿲',
-    '湜㵓',
-    '滆𣽐',
-    '漒漒',
-    '潀潨灇𣽇',
-    '漼㵏',
-    '瀡𣿂㵦',
-    '瀱𤄨𣽄',
-    '洇潱',
-    '湰漋',
-    '溗𣽘',
-    '㴬𣽜',
-    '澺𣽢',
-    '㵪㵪',
-    '𤀄𣽭',
-    '演𤀋',
-    '潦𣿳',
-    '濂濓',
-    '濘𤀑',
-    '瀨濑瀨瀬',
-    '瀕𤄹濒',
-    '斿𣽩',
-    '溧𣿚',
-    '漮𣾩',
-    '濆濆',
-    '澞澞',
-    '瀙澵',
-    '盝𥂖𣿍',
-    '葴𣿎',
-    '𣽕𣿏',
-    '㵞𣿜',
-    '瀳𣿕',
-    '㶗㶗𬉯𤀇',
-    '闊𨴿阔濶𨶖𤄃',
-    '滈瀥𤀰',
-    '潕𤅅㵲',
-    '濮𤀾𤃙𤂛𤃊',
-    '瀵𤀬𤄪',
-    '瀺𤀧',
-    '瀹𤅢𤅰㵸',
-    '潣𤀳',
-    '𤅋𤀨',
-    '溠𤁺',
-    '滷瀂',
-    '濇瀒',
-    '澽𤁴',
-    '濔𤅤𤁶',
-    '瀸瀐',
-    '𠘖𤁩',
-    '濲瀔',
-    '㵻𤁨',
-    '𤃀𤁼',
-    '灒濽',
-    '𤅳𤁭',
-    '𤄺𤁻',
-    '溼𤃁',
-    '瀛瀛𤅀瀛',
-    '藥薬药𤂼',
-    '澩㶅',
-    '瀁𤂡',
-    '瀎瀎',
-    '瀯瀯',
-    '濥𤃚',
-    '𤀤𤂳',
-    '𤄫𤃳𤃃',
-    '𤃪𤂴',
-    '灠𤂺',
-    '涸𤃯',
-    '瀑𤄗𤃵',
-    '澴㶎',
-    '濦㶏',
-    '孂𥶞𤃾',
-    '潘𤄜',
-    '灊𨽨灊𤄵',
-    '灝灏',
-    '㵐灍',
-    '𤃭𤄩',
-    '㶕𤄒',
-    '㶖㶖',
-    '㶛𤄕',
-    '灞㶚',
-    '灓𤅇',
-    '漕𤅍',
-    '漷𤅻𤅝',
-    '瀼𤅭𤅑',
-    '𤅲𤅠',
-    '零𩆼𩂙零𤅫霗𩆖',
-    '𤃩𤅷',
-    '火灬㶡',
-    '蕢𤆂䕚𧷩𧂟',
-    '灰灰𤆆',
-    '炎𤆌',
-    '燈𧺄灯',
-    '炱𤐽㸀炲𤆃𤊜',
-    '灱灲',
-    '灸𤆐',
-    '炒𤌉𤌖𤌽㶤𤊛𤌝煼',
-    '炙𦜡䏑熫𤐬𬉹',
-    '煬炀',
-    '燦灿',
-    '赤灻烾𤆍',
-    '炖𤆚',
-    '叛炍𧼦',
-    '灼烵𤆥',
-    '煮𤆯䰞𩱰𤑨𤑜煑',
-    '爐炉𨈝',
-    '赫𧹘𤈉爀',
-    '煒炜',
-    '灷灷𤆽',
-    '𤆝炇',
-    '烗𤉫炌𤈪',
-    '炋㶪',
-    '炕𤇛',
-    '焉𤇟𩾏',
-    '煉𧹯𥒯炼',
-    '爍烁',
-    '爛烂爤燗',
-    '秋𤇫𥣨𪚼𥤚𪛁𪔁秌䆋龝',
-    '炔𤆿',
-    '煔炶𤊼熌',
-    '熒荧',
-    '𣅺㶭',
-    '灺炧炨',
-    '㶣𤇇',
-    '炥𤇝',
-    '炯𤈍',
-    '烈𤎾𤉩煭烮𤈘𤋴',
-    '煩烦',
-    '煥焕烉',
-    '熱热𤎮𪌌',
-    '燒烧焼𧄣𤌸',
-    '燙烫',
-    '燴烩',
-    '飪𤇲㶵𦜙餁饪𤏼䏕',
-    '炰𤈖',
-    '烝𤇶㷥',
-    '燼𤐖烬',
-    '㶴𤈕',
-    '𤇯𤐷𤇷',
-    '𤊲𤎠𤇱',
-    '烽㶻熢𤑊㷭',
-    '焰焰焔𤒰𦥿𤑑㷔熖',
-    '熙熈煕焈凞',
-    '燜焖',
-    '燬𤌋㷐𤈦',
-    '炟𤉊',
-    '烜𤉑',
-    '𤈑𤈥',
-    '㶿𤎨𤉤𤊹𤏰',
-    '焎烲𤈱',
-    '㷅𤈨',
-    '炊𣣛',
-    '烘𧇲𤉻',
-    '烹𪸿𨢶',
-    '焙𤊷𤉮',
-    '焦㸈𤓪𤓬𤊙',
-    '煜焴',
-    '象𧰼𤉢',
-    '魚𩵋鱼𤉯𤋳',
-    '煠𤉬',
-    '爝𤓡𤓄熦焳',
-    '烄𤎦𤉧𤐳',
-    '熜㷓焧𤊘𤑢燪',
-    '助𤋰',
-    '煎𤎴𤎵㷙𤌺',
-    '燧𨽵𤎩煫𤒮𤑾㸂𤓫',
-    '爆𤒁𤑥𤋪𤒺𤓊爆煿',
-    '視眡𤋇视𥄙𥅭𥄙',
-    '鍛锻煅',
-    '熅煴',
-    '爟㮡',
-    '瞁𤋀㷦',
-    '焃𤊴',
-    '烼𤊺',
-    '𤉹𤒓𤒉𤒜𤊸',
-    '煪𤋃',
-    '𤌃𤌕𤋨',
-    '𤊾𤋂',
-    '燛㷗',
-    '爃𫞡',
-    '𤐧𤑏𤎪𥻅𤏛𤌈𤏹𤓜𤐸𤓞㷶煏',
-    '㸅𤊵',
-    '卦𤌻',
-    '煌𤌼𪏥䪄',
-    '熬𤏺𪍮𪌑𪍾䵅𪌠熬',
-    '燐㷠𤐪粦',
-    '煖𤌢',
-    '熠熠',
-    '𤈩㷢𤏀',
-    '焪熍',
-    '㷟𤍐煺',
-    '𦧡𤌜',
-    '燥𤍜𤏟',
-    '爨𬋡𤏷𤑖𤓥𤓟爨𤍾𤑇',
-    '烓𤌒𧟼',
-    '焯𤎙',
-    '熛𤒾𤌑',
-    '燅𤎢𤍙𤏝',
-    '熿熿',
-    '熸𤍖',
-    '爚𤍼𤓀𤐯',
-    '𤋄熃',
-    '𤌌䨍𤍧',
-    '燕㷼䴏',
-    '燮𤎬㸉爕',
-    '鑄𨮾铸鋳𤎧𨮚',
-    '烔燑',
-    '熷𤎯𤎰',
-    '㷳𤏚𤎝',
-    '𤏸𤏲',
-    '爉𤎞',
-    '䐄𦜿𤎡',
-    '盞盏𤐒',
-    '熇𤐟燺',
-    '熯𤑆㸁',
-    '熑燫',
-    '爧燯',
-    '𦙫𨡶𤏾𩜎',
-    '偃𤑅',
-    '票𤐫',
-    '燹𤐨',
-    '齌㸄',
-    '燽𤐭',
-    '煇𤑱',
-    '熐𤑺',
-    '爒𤑗𤒧',
-    '焞𤑴',
-    '膰㸋𥛮',
-    '㷴爏',
-    '燣𤒢',
-    '䶳𤒀',
-    '𤏶𤓏𤒣',
-    '𤐀𤒬',
-    '𤒦𤒥𤒡',
-    '爓𤓁',
-    '㷹𤒽',
-    '𤓕𤓕',
-    '耿𤓐',
-    '爢㸏𤓒',
-    '㷮𤓗',
-    '𤓚𤓚',
-    '燂𤓠',
-    '爩𤓭',
-    '爪爫',
-    '糾𤓱𥾆纠𥾆糺',
-    '卵𤓲',
-    '𤔀𤓶𤓷',
-    '孚𤓽',
-    '𤔂𤓿',
-    '管𬋩',
-    '福福𤔜',
-    '辭辝𨐲𦧦辞辤𤔲𤔧',
-    '䜌𤔪',
-    '爯𤔹',
-    '戀𤕈',
-    '瓢㼼𤬡𤬣𤕉𤬢',
-    '爺爷𤕓𨈺',
-    '斧𤕑',
-    '旴𤕐',
-    '爸𤕕',
-    '俎𤕲爼',
-    '爿𤕪',
-    '疒𤕫𤴫',
-    '椸𤕮𤖌𤕴',
-    '床牀',
-    '胈𤕳',
-    '𤖦𤖥𤖜𤕵',
-    '牂𤙢䍧䍭𦎆𤖁',
-    '棵𤖇',
-    '病𤖉𤵣',
-    '𦎗𤖆',
-    '楪牃',
-    '醬𨟻𨡰醤𤖙𨡓酱𤖕',
-    '墉牅䧡𩫱𤰎',
-    '簀𤖓',
-    '句𤖮𤖵',
-    '𤗏𤖯',
-    '柇𤖱',
-    '向𥥩𤖾𤖽',
-    '𤕷㸠',
-    '窗牕𤗉窓𠂨𤗄窻䆫𥦾',
-    '𤕾𤗂',
-    '牐𤗠𤗮牐',
-    '牌𤗋',
-    '牒𤗣𤗊',
-    '牘𤘄牍',
-    '㸜𤗇',
-    '㸢𤗩𤗌',
-    '隔𤗦',
-    '牖𤗱',
-    '𤖘𤗸',
-    '𤖖𤗶',
-    '辨辧𨐾㸤',
-    '牙𨈏𤘍𤘉𤘈𤘈',
-    '齦𪙲𪘟㸧𪘄龈',
-    '齲𤘐龋𪚌𦔊',
-    '䶣𤘑',
-    '牝𤘥牝𪊯',
-    '𢍿𤘚',
-    '𤘫𤘛',
-    '㸸𤘘',
-    '牧𤘴',
-    '牴𤙊𤚃𤘳',
-    '牬𤙂𤘬㸬㸽𤙍',
-    '犍㸫𤚳',
-    '𤘹𤘢',
-    '犖𥕚荦',
-    '牁牱',
-    '𤘟𤘼',
-    '㸰𧤓𧣖㸱',
-    '𤘺𤘻',
-    '方𤙗',
-    '犧犠牺',
-    '觢㸷𧣯',
-    '束𤙨',
-    '牣㸾',
-    '牸㹀',
-    '犎㸼',
-    '騂𩥍𤛫𤙡𩤑',
-    '㹁𤚒𤙝',
-    '𧣪𤙜',
-    '犁𤛼𤛺犂䵓𥝫𤛿',
-    '犢𤛯𤙸犊',
-    '犕𤙳犕𤛟',
-    '犓𤚄𤚂',
-    '騇𤙱',
-    '振𤚾𤚿',
-    '㸶𤚕',
-    '㹄𤚠',
-    '犙𤛤𤚔',
-    '㹔𤚖',
-    '牡𤚴',
-    '特𤛀',
-    '麝𤚑𪋧',
-    '犉𤜀𤜃𤚮',
-    '犩𤛲𤛂',
-    '𤚼𤚲',
-    '𤛩𤛛',
-    '㹗𤛴𤛒',
-    '犚𤛌',
-    '𤚫𤛋',
-    '㹎𤛡𤜖',
-    '犟犟',
-    '豢㹖',
-    '獬𦏘𦎈𤛳',
-    '㹕𤛰',
-    '犡𤜏𤛶𤜒',
-    '㹊𤛹',
-    '㹛𤛾',
-    '犦𤜈𤜌',
-    '㹙㹚',
-    '犤𤜑',
-    '狀状',
-    '獷獷𥜟犷',
-    '豺犲𤝦',
-    '獁犸',
-    '狽狈',
-    '獅𤜳',
-    '猿𤝌𤠔𤟗𤠔',
-    '狖𤝨𤜴𤣛',
-    '豝𤜱',
-    '豟𤝤𤜸𧲒䝈',
-    '𤜷𤜷𤝃',
-    '犻𤝂𤜲',
-    '𤞁𤜿𤜾',
-    '𤜹𤝀𤝆',
-    '怯㹤',
-    '狷㹡',
-    '獰狞',
-    '豹𤞵𤝧',
-    '狿𤜺',
-    '獼𤝝狝猕',
-    '狛𤝡',
-    '𤠙㹢',
-    '𧲱㹧',
-    '䟣𤝞',
-    '狹狭',
-    '猙狰',
-    '獨𨊒𤢜独',
-    '貉𧳇𧲩狢𧴘𧴞𧲪𧴏貈',
-    '狔𤝺',
-    '猻狲',
-    '獪狯',
-    '貅𧲷䝗㹯',
-    '劻𤝿',
-    '𤜵𤜵𤝴',
-    '𤝬𤞈',
-    '狧𤝰',
-    '𧳙𧱇㹭',
-    '悍猂',
-    '犴𤞿𤟉',
-    '狉豾𤞜𧳏',
-    '狟𤞸',
-    '狦𧲾𤞹',
-    '狣𤞯',
-    '狶㹷',
-    '獫猃',
-    '畎𤱶',
-    '𤞲𤞙',
-    '狡𤟋',
-    '玀猡',
-    '猘𤟐',
-    '猧㹻',
-    '𤟠𤟕',
-    '䍶𤟈',
-    '猴㺅',
-    '獻𤣉𤡎𤟜献',
-    '貓猫',
-    '猒𤟶𤡜',
-    '猰𤟻',
-    '獀𤟫𤡗',
-    '貒𧳲䝎猯𧳩',
-    '𤟤𤟴',
-    '𤠎𤟺',
-    '𤠟𤟬',
-    '𤡄𤟸',
-    '獚𤟡',
-    '㺛𤟨',
-    '鍦𤟽',
-    '熊𧰯𪏛𤠗',
-    '狾𥺈𤢻𤠥',
-    '猺猺',
-    '獒𤢝獒',
-    '貔豼𧴀𤠞',
-    '㹶𤠜',
-    '㹺𤠡',
-    '㺁𧳦𤠏',
-    '㺇𤠒',
-    '㺒𤠖',
-    '獢𤠬𤢃',
-    '𧱴猽',
-    '獌𤡁䝢䝡𤢞',
-    '貙𤠾',
-    '貘獏',
-    '㹍𤠻',
-    '㺑𤡅𤡙',
-    '㺖𤡘',
-    '䝏㺏𧲕',
-    '猎𤡡',
-    '獦𤢠',
-    '豷𤡬',
-    '驉𤡣',
-    '𤠑𤡼',
-    '獜𤡩𤢯',
-    '𤡳𤡻',
-    '𤡥𤡦',
-    '𤡮𤢅',
-    '㺦𤣆𤣈𤡨',
-    '㺡𤡫𧴠',
-    '獺㺚獭獺𧴡',
-    '猲𤢔',
-    '獠𤢙䝤𤢸',
-    '獽𤢢',
-    '豦𤢓',
-    '猤𤢑',
-    '𤡪𤢩𤢍',
-    '獵𤢪',
-    '猵獱',
-    '獡𤢧',
-    '𤡂𤢹',
-    '㺤𤢷',
-    '狑𤣍𤣋𤣤',
-    '獮𥙮𤣝𤣗𤣔𤣐',
-    '䝕𤣒',
-    '㺜𤣜',
-    '㺧𤣣𤣠',
-    '𢇋𤣨',
-    '玉王𤣪',
-    '㺩㺫玌',
-    '璣玑㼄',
-    '璞㺪',
-    '𤨕玏𤨙',
-    '屹𤣮',
-    '玖㺵𤣵',
-    '瑪玛',
-    '玗㺮',
-    '玠琾𡘇𤦠',
-    '玘𤣱',
-    '誷𤣴𧦆𧧜',
-    '玟琘䂥砇䃉碈瑉珉𤤍',
-    '玫㺳',
-    '現现',
-    '瑚𤤈',
-    '瑁𤲰㺺玥',
-    '環环𤧖𤨔𤪹',
-    '鈕钮㺲',
-    '瑋玮',
-    '瑵𤣺𤨚',
-    '砆玞',
-    '玒玜',
-    '㺹玣',
-    '瑡㺰',
-    '珊𤤪珊𤩀',
-    '玻𤤭',
-    '珍鉁珎𧟪錱',
-    '琺珐',
-    '瑩莹',
-    '瓏珑𪚝',
-    '瓷珁甆𤮀𦈱',
-    '玤𤤵𤤓',
-    '玦𤤏',
-    '珬㺷',
-    '班𤦦𤤻',
-    '琴𨪖䥅珡𩰔𤩟琹𤫍𨫹𤦡䥆䦦',
-    '琿𤦳珲',
-    '瑙𤦏𥓱𥖋碯𥒤𤤼',
-    '琄㻆',
-    '琁𤥕𬍩',
-    '珫珫',
-    '𤧙㻀',
-    '㻷𤤹',
-    '球𤥲',
-    '琢𤥨',
-    '瑣琐𤨏',
-    '玕𤥚',
-    '璉琏',
-    '璊𤨸㻊',
-    '璘𤧢𤥸𤪏',
-    '珢𤥛',
-    '𤥙𤥘',
-    '珹珹',
-    '璡瑨琎',
-    '玳瑇瑇',
-    '琪𤦢',
-    '瓊𬎞琼',
-    '璁𤥼',
-    '碔珷',
-    '𤤺𤦥',
-    '琲㻗',
-    '𤦃琜',
-    '𤦼㻨𤧬𤦁',
-    '𤩱琔',
-    '瓕𤦀',
-    '琅𤨜𤦴',
-    '琊瑘',
-    '璩𤩁𤦲璖',
-    '珶瑅',
-    '璚𤦱',
-    '瓀瑌',
-    '珒𤦯',
-    '瑍瑍𤩆',
-    '瑬𤦰',
-    '瑥瑥',
-    '琉瑠璢',
-    '琵𤧰',
-    '琶𤧲',
-    '瑤𤪅瑶',
-    '璦瑷',
-    '琛𤧪𤨺',
-    '瑄𤧺',
-    '瑱𦗁瑱𦔿',
-    '瑿𤧧䃜',
-    '𤧮㻧',
-    '瑫𤨐',
-    '璈璈',
-    '斑辬𤨘',
-    '琇璓',
-    '琨瑻',
-    '瑳𤪩𤨛',
-    '璟璄',
-    '璨㻮',
-    '瓔璎',
-    '𡐔璌',
-    '瑮𤩰𤨗𤪇',
-    '𤨹㻬',
-    '瑹瑹',
-    '璏㻰',
-    '璱㻭𤪴',
-    '璿𤩅䥧𤩋𤫀',
-    '瑂𤩣',
-    '𤩮㻺𤪢𤩯',
-    '𤪌𤩒',
-    '𤪎𤩤',
-    '瑰𤩫瓌',
-    '琚𤩵𤪬𪼩',
-    '璵㼂𤫌𤪐',
-    '珦𤩬',
-    '𤩃𤪄',
-    '璮璮',
-    '𤪍𤪆',
-    '璃𬎙瓈',
-    '瑾𤪣',
-    '瑑𤪪',
-    '瓚瓉瓒',
-    '瑈瓇𤫕',
-    '碧𤫅𦃧',
-    '瓅瓑𤪾',
-    '㻝瓎',
-    '瓗㼇',
-    '㻾𤫔',
-    '瓃𤫤𤫥',
-    '玲𤫩',
-    '㼊𤫭𤫪',
-    '㼉𤫯',
-    '瓞𤫰𤬎𤫴𤫼',
-    '𦰯𤫳',
-    '䒷𦸈𤫵𦧔',
-    '𤬖𤬍𤫾',
-    '𤫱𤬈',
-    '𤫺𤬇',
-    '㼔𤬒',
-    '瓠𤬗',
-    '㼓𤬚',
-    '𤬛𤬜',
-    '㼖𤬤',
-    '甃𤭰㼙',
-    '瓶𤬮𪋋甁',
-    '甌瓯',
-    '盆瓫',
-    '缸㼚𤭺𤭛罁',
-    '鈃銒𦈵㼛𤭓㼛𨨵',
-    '盎𤭹㼜𤬺',
-    '瓴𤮮𤮹𤬻',
-    '𤬷𤭿𤭡𤬼𤭠𤭗',
-    '𥁎𤬶',
-    '銚𤭈鑃铫𨰑',
-    '㼦㼦',
-    '㼧𤭁',
-    '㼲𤭃',
-    '𤮰𤬿',
-    '㼢𤭘',
-    '瓻𤭏',
-    '甈𤭝𤮅',
-    '甒𤭎𤮢',
-    '㽄𤭦𤮓𤭣',
-    '堶𤭨',
-    '㼽𤭪',
-    '𤮋𤭳',
-    '甄𤭾',
-    '鬲𩰲㽁𩱔䰛䰜𨯱',
-    '㼺𤮂',
-    '㼸𤮇',
-    '樽罇𤮐',
-    '甗𤮝',
-    '罏𤴅𧆨𤮧𧇄',
-    '𦉐𤮫',
-    '罐罐礶𤮴',
-    '𠯑𤯁',
-    '坩㽍',
-    '甜䑚甛𥑠𦧩',
-    '蔗𤯈𤯋𧀹',
-    '馦㽐',
-    '耽躭𦕍𧴸𤯉',
-    '𤯍𤯎𤯌',
-    '生𤯓',
-    '姓𤯧𤯕𤯣𤯬',
-    '笙𤯛',
-    '夝甠',
-    '甥㽒甥',
-    '蕤𦼆甤甤',
-    '甦𤯳',
-    '隆𨹿𨻦𨼇𨺛𨹠𨺓𤯲',
-    '𤯷𤰀',
-    '麦麥',
-    '祗𤲥𥙂𣱊祬祇',
-    '畝畞畆亩畒㽗𠭇𤲧畮',
-    '留𤰛畱㽞𤲢𪽋畄',
-    '畏𤰰𤰵𠂽𤰲𤰣𤱖',
-    '甿𤰡',
-    '㽘𤰢',
-    '耕畊𥝷𦓮',
-    '畟𤰯',
-    '䎩𤰭',
-    '陸𡽷陆𨽱𤱒𨽫𨸪',
-    '畛𤱼𤱏𤱥',
-    '畹㽜',
-    '𤴙𤱐',
-    '略畧',
-    '垓畡',
-    '畇𤱬',
-    '垙𤱦𤱳𨹂',
-    '畯𤲋',
-    '㽠𤲍',
-    '𤲖𤲎',
-    '庤𤲵𤲔',
-    '䍆𤲑',
-    '糞𥻎𥻔𥼇𥼈𤲲',
-    '畽𤳿𤴋疃𤲫𤴎',
-    '校𨬛𤲽',
-    '蹊𤲺',
-    '畷𤲹',
-    '𤱨𤲻',
-    '塲𤳈',
-    '㽩𤳒',
-    '疀𤳲',
-    '𤲬㽭',
-    '𤴀𤳭',
-    '畦𤳬㽯',
-    '㽨𤳶',
-    '累𤴈𤳻',
-    '𤳯𤳼𥷿',
-    '𧐯𧐣𧐋𤴂𧕌',
-    '雷𤴐𤴑䨓靁𩄣𤴌𩂩𩇓',
-    '疌𤴗',
-    '疏䟽疎踈疏',
-    '𨄚𤴠',
-    '療𤻲疗',
-    '癤𤻛疖𤻵',
-    '㽱㽲𤶀𤴮𤴪',
-    '㽾𤴰',
-    '瘎𤴺㽸𤵔𤴴',
-    '疙𤴸',
-    '疥𤵇𤸋',
-    '瘁疩',
-    '瘋疯',
-    '瘡疮𤶷𤺨',
-    '疧𤵑㽻',
-    '胝𤵋𦙠𦙁𦙘',
-    '㾅𤴹',
-    '札𤵦',
-    '痙痉',
-    '痾疴',
-    '痻𤵤𤸅',
-    '癰㿈𦡈痈癕𤻕',
-    '庘𤵭',
-    '𤴿㾆',
-    '㾃𤵚𤵩',
-    '痃𤵢',
-    '𤶠𤵫',
-    '㾰𤵡',
-    '𤸵𤵗',
-    '痊痊',
-    '瘦𤻯𤶯𤶟𤹶𤸃𦢝𤻺膄𤺁𤶌痩𤸂',
-    '癬㾌㿅癣',
-    '瘺瘻𤵿',
-    '𤵨瘐',
-    '疶𤵺',
-    '㾔㾔',
-    '癊𤷜𤶊𤸌',
-    '疚𤶫',
-    '疫𤶣',
-    '痕𤶨',
-    '癆痨',
-    '痄𤶙',
-    '痒𦍲𤶪',
-    '癃𤸇𤶞',
-    '脙𦜵䏫𤶩',
-    '疛𤶡',
-    '𤷀𤶶',
-    '𤷽㾡',
-    '䀶𥇉㾗䁁𥈘',
-    '厝瘄𥕉',
-    '瘀𤷠',
-    '痱𤷂',
-    '盲𥇋𤷐',
-    '脹瘬痮胀',
-    '痠𤷥',
-    '瘃𤷚',
-    '痹痹',
-    '癉𤺺瘅',
-    '𤴾𤷓',
-    '𤵼𤷛𤹟',
-    '痔𤸟',
-    '痿𤸆',
-    '瘟瘟',
-    '蝕𧐂𧵳蚀𤸤',
-    '痎㾬',
-    '瘝癏𤸄',
-    '㾜𤷾',
-    '𤷈𤸏',
-    '𤸱𤸙',
-    '瘨𤸘',
-    '𤸪𤸞',
-    '𤺄瘇',
-    '癀㾮',
-    '度𤸿',
-    '癱瘫',
-    '饜𤹍𩞚𩩶餍',
-    '鷹𤼡𤸰𪇿𨿳䧹',
-    '癠𪗅𤸾',
-    '癟㿜𤻋瘪',
-    '癵𤹏𦣏癴𤼣𤼙',
-    '膇㾽',
-    '嗽瘶',
-    '痛𤹯',
-    '痞𤹦脴',
-    '瘓𤻨𤹹',
-    '瘠𤹠',
-    '癥㿂',
-    '瘏𤺈',
-    '瘕𤹱',
-    '癭瘿𦡺𩖍',
-    '㾕瘮𤺑',
-    '𤸑𤹫',
-    '疹𤺋',
-    '瘧𤺝',
-    '瘍𤻈𤺹',
-    '瘩𤺥',
-    '瘤𦠝𦞧癅𥏵',
-    '癮瘾',
-    '膚肤𦢚𤺧',
-    '膨𤺬肨',
-    '㾫𤺇',
-    '瘛𤺚',
-    '㿒𤺜',
-    '瘙㿋',
-    '訾𧬟𤺒𧩢',
-    '鴈𩾦𤻉',
-    '𤸷㿏𤺽',
-    '癛癝',
-    '𤻱𤺿',
-    '疢𤻞',
-    '痯𤻥',
-    '㿛癧𤻤',
-    '疼𤻴𦙭',
-    '瘥𤻸',
-    '癩癩',
-    '癲癫',
-    '瘭𤼄',
-    '𤹤𤼆',
-    '痋𤼖',
-    '臞癯',
-    '髍𤼑䯢',
-    '癑𤼝',
-    '㿙𤼟𤼤',
-    '癸𤼩癸',
-    '癹𤼯𦳠𨂩𤼧',
-    '登𤼷𤼪𧰍𤼼',
-    '𧶢𤼹𤼺𤼰',
-    '白𤼽𦣺',
-    '癿𤼾',
-    '的𬐄𤾠',
-    '皇𤽢𤽙𦤐𤽚𦤍𦤃𤽧',
-    '皋皐臯',
-    '籸籶𤽰䊁',
-    '𤽂皔',
-    '㿧𤽯𤾊𤾦',
-    '耀㿢',
-    '皤𤽻',
-    '㿥皬𤽼',
-    '㿩㿩𤾉',
-    '𤾸𤾡𤾡',
-    '艙𤾙',
-    '皜𤾘',
-    '皊𤾻𤿅𤾨',
-    '皝皩',
-    '𤾭𤾳',
-    '皣𤾼𤾴',
-    '𤿀𤾶',
-    '皪㿨',
-    '皯𤿊𩈅',
-    '𦢊𤿉',
-    '𤿏𤿏𤿒',
-    '襪韈𤿗𥀯韤',
-    '皽𤿘𤿝',
-    '皸𤿟皹皲',
-    '鞘鞩𤿨韒',
-    '𥀈𥀉𤿪',
-    '㿹𤿹𥀀',
-    '鼓鼔𪔎𩉲𡔷𪔐𩉨𩉩皷𩊉𪔨皼',
-    '皻皶𦟰',
-    '𥀃𥀄',
-    '𥀏𥀇',
-    '𥀖𥀋𥀑𥀜𥀒',
-    '𥀫㿵𥀭',
-    '羆罴𥀡𦌲𥀦𥀍',
-    '𥀐𥀐',
-    '㿷𥀞',
-    '㿸𥀤𥀗',
-    '𥀰𥀥',
-    '皾𥀲',
-    '𧖧𥀿𧖨',
-    '盂𥁄𥁄',
-    '盍盇𥂊𥁋',
-    '㿼㿼',
-    '監𧩾𧨭譼𧗄监',
-    '缽鉢盋钵',
-    '盄𥁏𥁜𥁛',
-    '𣖻𥁐𨡬',
-    '䀀𥁔𥁩𥁷盕',
-    '䀁𥁓',
-    '孟𥁪',
-    '盤盘鎜',
-    '盓𥁡',
-    '㿿𥁱',
-    '𥂘𥁭𥁻醓',
-    '䓜𦽘𥁼',
-    '盡䀆尽',
-    '𥊇𥂄',
-    '餔𧗉𥂈䊇𥹴',
-    '盩𥂕𧗑𥂱𥂲',
-    '𥂬𥂶𥂡𥃐',
-    '𥂹𥂠',
-    '壾𥂷',
-    '醢𨡝𥂧𧆗𧅽酼',
-    '𥂥𥂫',
-    '盦盫',
-    '盠𥂼',
-    '䀇𥂩',
-    '盨𥂾',
-    '𪕶𥂺貖',
-    '㿾𥃓𧈚',
-    '𦦫𥃖',
-    '𥃔𥃜',
-    '鹼硷鹻碱𨢑𥃡',
-    '眴䀏',
-    '𥃺𥃯',
-    '礙硋𥃷碍',
-    '融𧖓螎𥃼',
-    '首𩠐𥃻𩖐',
-    '盱𥃳𥅚𥃳',
-    '窅𥄀',
-    '貤𥅓𥃸𧷆䝯',
-    '𥃵𥃶',
-    '𥄗䀑',
-    '相𥄢',
-    '耆𦓀𨚻𦒿𥄥',
-    '昈𥄅',
-    '眽𥄄眿',
-    '睟𥄌',
-    '𥃤𥆎𥄩',
-    '𥃧䀞',
-    '𥃪𥄧',
-    '盿𥄐',
-    '䀛䀜',
-    '𥄕𦭾𦤄𦭝',
-    '𥄉𥄊',
-    '眵𥉍𥄏',
-    '䀱盽',
-    '眂𥄆',
-    '眣𥄺𥈖',
-    '眱𥅣𥄿',
-    '眪𥅙',
-    '𥄳眔',
-    '覗𥄶',
-    '睜睁',
-    '眓𥅩𧵝',
-    '眯𥅼',
-    '睊睊',
-    '瞋𥅜',
-    '瞲𥅛',
-    '䀘𥅳𥅝',
-    '睵𥅰',
-    '𥈩𥂅𥆇',
-    '䁓𥅢',
-    '䁙𥈔𥅥',
-    '𦐄𨾒䀪',
-    '眼𥆢',
-    '睞睐',
-    '膏𥆕',
-    '眒𥋀𥆓',
-    '眹𥆵',
-    '睆𥆒',
-    '睌𥇅',
-    '瞼睑',
-    '䀮𥆰𥇫𥉂',
-    '䀨𥆠',
-    '𥇇𥆝',
-    '𥈙䀳',
-    '䁩䏸𥆐',
-    '𥍉𥆍',
-    '肰𦛡𥇃𦛦𦝸',
-    '睪𦎝𥇝𥇡',
-    '睥䁹睤',
-    '眕𥇐',
-    '睔𥇊䎾',
-    '瞏睘',
-    '㥏睓𦖌',
-    '䀸𥇕',
-    '𥇵𥇤',
-    '𥇿𥇙',
-    '䁈䁉𢾥',
-    '𥇛𥈜𥈏𥈀',
-    '䁊䁊',
-    '𥌃𥇎',
-    '瞎瞎𥈎',
-    '瞍𥈃',
-    '𥄷𥈋',
-    '眗𥈈',
-    '眻䁑',
-    '𥆣𥈍',
-    '䁔睻',
-    '睺𥈑',
-    '𥉓𥈕',
-    '𥌄𥈷',
-    '眠𥉦',
-    '睡𥋍𥉚',
-    '瞞瞒䐽',
-    '矇𥉕',
-    '眅𥈼',
-    '眇𢡸𥋐𢡾',
-    '眊𥉗',
-    '睉𥉢',
-    '䁘䁘',
-    '𥉎𥉨',
-    '瞐𦋹',
-    '䚕𧢮𥉆矖𥊂',
-    '瞥瞥𧢍𥋗',
-    '瞰瞰',
-    '睚𥊅',
-    '瞢矒𥌋𥊄𦱛',
-    '覷𧠢覰覻䁦',
-    '𥆏𥊱',
-    '𥆋𥊊',
-    '䁆䁆',
-    '𥉙𥊏',
-    '𥊴𥊁',
-    '瞟𥋠𥋄𥍌𥌝',
-    '瞬瞬',
-    '矚𥋛瞩',
-    '瞷𥊺𦠥瞯',
-    '䁒𥊬',
-    '𥈉𥋂',
-    '𥊪𥊪',
-    '𥉹𥍔𥊻',
-    '䁰𥊾',
-    '瞤𥋃𥌎',
-    '䁴𥊳',
-    '䁿𥊷',
-    '瞅矁',
-    '瞚𥋰',
-    '矏𥋬𥌗𥌂',
-    '䁅𥋝',
-    '䁲𥋻䚑',
-    '䁺𥋭',
-    '䁾𥋚𧂝',
-    '䂀𥋟',
-    '𥌾𥊹',
-    '覹矀𧢓',
-    '陽𨼗𥌖阳𨼘阦',
-    '瞵𥌌',
-    '瞴𥌇',
-    '𥋢𥌪',
-    '𥌺𥌉',
-    '瞶𥌶',
-    '𥊸𥌩𦗟',
-    '䁵𥌡',
-    '𥇜𥌲',
-    '𥋞𥌼',
-    '觀観𧃼𥍕𥸑覌𩁰观𥷯𥍊𥍄',
-    '䁛𥍁',
-    '𥍆𥍏',
-    '矆䂄',
-    '瞫䚓𥍗',
-    '矜矝𥎚',
-    '䂆𥍰',
-    '䂉𥍶',
-    '𥎂𥍾',
-    '𥎋𥍷',
-    '𥍫𥎇',
-    '𥍮𥎌',
-    '矠𥎏',
-    '𥍽䂌',
-    '䂎𥎥',
-    '矧𥎧𥎪訠',
-    '鏃镞鉃𥏀𥎫',
-    '疑𦬦𥎲',
-    '知𥎿𥎵',
-    '矯矫',
-    '矪𥎻',
-    '殹𥏏',
-    '䂔𥏔𥏢',
-    '雉𥏷𨿘𪅊𪁰鶨',
-    '𥏫𥏻𥏲',
-    '石䂖𥐖𥐘䂖',
-    '砌矵磜',
-    '砭𥑁𥐗',
-    '磯矶',
-    '碇磸矴',
-    '碼码',
-    '礦鉱鋛鑛𥐫礦𥒩矿𨥥',
-    '礬矾',
-    '砎𥐤𥔅',
-    '碭砀',
-    '𥒵䂙',
-    '𥐝𥖾𥕐𥐝',
-    '砥𥐺䂡',
-    '硯砚',
-    '碎砕',
-    '磚砖',
-    '矺䂝',
-    '硇𥐼𥗸𥑚𥓁𥑩䃩',
-    '䂺𥑉',
-    '碸砜',
-    '珀砶',
-    '碾𥑊',
-    '礎础𥗈',
-    '礪砺',
-    '礫𥕴䃯砾',
-    '墠𥑲',
-    '砣砤',
-    '礱礲砻',
-    '庁𥑈',
-    '䂦䂧',
-    '𥑙𥑱',
-    '䂟𥑆',
-    '碩硕',
-    '銓铨𨩳銓硂',
-    '硤硖',
-    '磑硙',
-    '珗𥑻',
-    '𥑰䂯',
-    '䂬䂬𥒽',
-    '䂮䂮',
-    '硟𥒔',
-    '碀碀',
-    '䃋𥑷𥒏𥔢',
-    '磓𥑵',
-    '礄硚',
-    '礘硆',
-    '峪硲',
-    '硫硫',
-    '硍𥓀',
-    '硭𥒴',
-    '𥐪硡𥕗𥗞',
-    '研𥓋',
-    '碌碌',
-    '碑𥓓',
-    '磅𥓯',
-    '硎硎',
-    '碨𥓔𥔃',
-    '磃𥓚',
-    '磧碛',
-    '磣𥕺碜𥕃𥕁',
-    '䂹𥓭𨹾',
-    '䃗𥓑䃗',
-    '碳碳',
-    '磋𥔶',
-    '磕𥔐𥕤𥔽',
-    '厗𥔈',
-    '碕𥔎',
-    '礝碝𥕷',
-    '𥔉𥔑',
-    '䃔䃔',
-    '磲𥓼',
-    '磁礠𥔵',
-    '隕陨磒',
-    '砒磇',
-    '砲礟礮𥔰',
-    '确𥔳',
-    '磌磌',
-    '磝磝',
-    '𥑺磀',
-    '𥕦磙',
-    '礰𥕆',
-    '漠𥕓',
-    '砠𥕑',
-    '硜䃘',
-    '磛𥕌',
-    '硾𥖌𥖴',
-    '墡磰',
-    '𥒪磱',
-    '𥕲𥕳',
-    '險险礆',
-    '磏𥖝',
-    '磈䃬',
-    '礔礕',
-    '𡼿𥖚',
-    '砱𥘃𥖟',
-    '𥕽𥖗',
-    '䃫𥖷',
-    '礊𥖳',
-    '礗𥖶',
-    '蠹𡕎螙𥗤蠧𧓜𧋌𧖌𧑠𧔬',
-    '磶𥖽',
-    '䃸䃱',
-    '礐𥗙',
-    '䃵𥗗',
-    '䃷䃷',
-    '𥖫𥗣',
-    '礛礷',
-    '𥗭𥗱',
-    '磨䃺',
-    '砢𥗴',
-    '磥𨄱𥗼',
-    '䃹𥗺',
-    '𥗿𥘁',
-    '示𥘅',
-    '祺𥘕禥',
-    '祽𥘧',
-    '殃䄃𥙏',
-    '祀𥛴𥘰禩𥙉',
-    '祖祖',
-    '神𥜩𥙍𥛠𥛃',
-    '祝𥘱𩚶',
-    '祭𥙊𨢵',
-    '祓𥘬',
-    '禰祢𥜦𥜬𥙄',
-    '祥祥',
-    '禎祯𬓲',
-    '禱𥜣𥛇𥚜𥙸𥛈𥜹祷𥙤',
-    '祰祮禞',
-    '祿𥜅禄',
-    '裡𥚃裏',
-    '禘祶',
-    '䄆𥙱',
-    '禪䄠禅',
-    '稔䄒',
-    '稟禀𫡿',
-    '裨𧚽𥚈',
-    '褚禇',
-    '祅䄏',
-    '祼𥚌',
-    '祊𥛻𥛱𥚧',
-    '祡𥚨',
-    '祲𥛆𥛀',
-    '糈𩰠𥺳𥺸𥚩',
-    '䄐𥛁',
-    '𩳢𥚫',
-    '𥛅𥛽𧪭𥛅',
-    '詛诅𧇘',
-    '禓𥛙',
-    '醮𨣐𥛲',
-    '魖𥛳𧴆',
-    '䄚𥛼',
-    '跪𥜏𧻜𨅠',
-    '祧𥜔',
-    '禷𥜛',
-    '祣𥜠',
-    '䄤䄤',
-    '䄥𥜧',
-    '禫𥜸𥜯𧝓',
-    '禴𧆆',
-    '狒𥝃𥝋𥜿𥝇𥝈',
-    '嘼𠾧',
-    '稈秆',
-    '芑𦬊䄫𦯸芑',
-    '䴬𪍋䄩',
-    '利𥝤',
-    '穗𥝩𥣼穂',
-    '粳稉秔',
-    '耘秐𦔐𦶮𦓷',
-    '秠𥝣𥞶',
-    '稊𥝼䅠',
-    '穊穊𥝪',
-    '飫秗𩜏𩚿𩜈饫𩜢',
-    '䅆𥝭',
-    '䆉𥝧',
-    '穳𥣪𥣚𥝺',
-    '稱称穪𥟋',
-    '積积𥡯𥢼',
-    '耜𥞐𦓨𤹇𦓵䎣',
-    '黍𥞆𥞫',
-    '秫秫',
-    '稃𥞂𥹃',
-    '䄪𥞗',
-    '穀𣫗糓𥞤𥡛',
-    '稯𥞝𥠡',
-    '穭稆',
-    '䅃𥞱',
-    '稡𥞯',
-    '𥡃𦱐𥞙',
-    '𦓯䅅',
-    '稅税',
-    '稿藳稾稁',
-    '稷𥠎𥞷𥟄𥣊',
-    '粱𥞹𥹭',
-    '黎𥡓𪏱𪏭𥟦𨝟𥡚𬓪𪏯𥢀',
-    '苾𥞻',
-    '䅀𥣭𠞜𥟜𥟸',
-    '秳𥞸',
-    '𥠿𥞼',
-    '䬿𥹹䅏䊊',
-    '𥝕䅒',
-    '穌䐳稣',
-    '稰𥟮',
-    '䅍𥟐',
-    '䅑䅗',
-    '稦𥟏',
-    '䅳𥟷',
-    '穇䅟𥤇',
-    '䎧𦔑稖',
-    '稻稲',
-    '糯𥼥𥻟穤稬糥',
-    '香𪏰䅨𩡢𩠼',
-    '稞𥠁',
-    '穟𥠂𥢁',
-    '𥞴𥟾',
-    '稵𥠃',
-    '𥡟𥠔',
-    '稚穉稺𥣦䕌䆈',
-    '稽䭬𩠜𥡴𥡳𩠥䭫',
-    '蓄𧁖𦿤𧁃稸',
-    '耨䅶𦔘',
-    '秿𥠵𥡨',
-    '稢稶',
-    '䅥𥠹',
-    '𥠽𥠽',
-    '耩𥠾',
-    '𦔌䅲',
-    '蒕蒀𥠺',
-    '䭓䅱',
-    '𥠴𥡔',
-    '種𥢖𦔉𥡰',
-    '穡𥢺穯穑𥣱',
-    '糠穅糠粇',
-    '藝萟𥡩艺',
-    '穨頺𥣧𥤒',
-    '耬䅹𦔪',
-    '𥡤𥡤',
-    '𥡥𥡥',
-    '𥢎𥡡𥢞',
-    '穰穣',
-    '稴䆂',
-    '穙𥣜',
-    '䊍𥣥',
-    '擔𧭃𥣲',
-    '糧𥣷粮',
-    '秝𥤀',
-    '稕𦽑𥤁',
-    '𥡪𥤌',
-    '𥣾𥤅',
-    '䆏𥤑',
-    '𥣰𥤓',
-    '穴𥤢',
-    '空𫞹',
-    '窮穷竆𥧺𨉺',
-    '窀𥤭',
-    '竅𥤾𥦂䆻窍',
-    '阱穽𠁲',
-    '𥥍𥤷',
-    '䆕𥥞',
-    '䆗𥥎',
-    '穿䆤𥥢',
-    '窯窑𥧳窰',
-    '窌𥥹𥥺𥥤',
-    '汾𥦋',
-    '竄𥨬䞼𥨗窜𥦻',
-    '窣𥦑',
-    '𥥥𥦈',
-    '窺𥨖窥',
-    '竇窦𥩐',
-    '宧𥦪',
-    '窬𥦹𥦧',
-    '寔𥦽',
-    '窴𥧅',
-    '寮竂',
-    '𥥧𥨮𥨔',
-    '灶竈𥩋𥨫',
-    '𡫬𥨼𥩁',
-    '䇁𥩎',
-    '𥩗𥩕',
-    '奇竒',
-    '竘𥩞',
-    '䇍竐',
-    '站𥩠',
-    '𠱫𥩮𥩭',
-    '䇅𥩦𥩱',
-    '竮𥩵竮',
-    '端𥪄',
-    '䪬𥩾',
-    '誼竩𧨏𧧼谊',
-    '豎䝂䜿竪',
-    '䇑𥪎',
-    '𥪋𥪬',
-    '䇓𥪥𥪙䇕',
-    '𥪧𥪧𥪧',
-    '競𧫘𧫙竸𥪰𨐼',
-    '童𥫍𥪽𥪿',
-    '䇎𥪶',
-    '䇔䇔',
-    '𨋪𥫕𥫖',
-    '竽𥫡',
-    '篤笃䔍',
-    '篪𪛍䶵𥬌𥰽筂𪛔竾𥳠',
-    '簊𥫠',
-    '筍笋𥰿𥰴𥳦',
-    '笐𥫺',
-    '筧笕',
-    '攴䇚',
-    '䇘𥫻',
-    '笍笍',
-    '箋笺',
-    '籠𦌼𪚖笼篭',
-    '腱𦞬䇟',
-    '笮𥬚𥬛䇥',
-    '筑𥬶𥬑𥬾',
-    '箍笟',
-    '箹𥬓',
-    '䉳𥬍',
-    '箏筝𩗲',
-    '築𥯹筑𥵭築𥴁𥲒築𥭰𥰺',
-    '篩筛',
-    '笝䇱',
-    '筄𥬻',
-    '䇫𥭱',
-    '𥬲𥬸',
-    '篅𥳙𥬵',
-    '𥯮𥬽',
-    '䒼𦮒筁𧀍',
-    '算𥮅',
-    '篆𫁾蒃',
-    '簡𥳑简',
-    '籌筹𥵽',
-    '箸筯',
-    '篠𥭸𥴽𥭪',
-    '篘𥭛',
-    '䈽𥭤',
-    '茧𥭥',
-    '𪛊䇵𥭦',
-    '帚箒𦲅',
-    '箭𥳭𥲫𥮙',
-    '簫𪛕萧簘𪛖',
-    '簞箪',
-    '籮箩',
-    '匴𥮞',
-    '箘箟',
-    '篦箆',
-    '簏箓',
-    '篿𥮔',
-    '笸箥',
-    '𥮒𥷰𥮓',
-    '𥮜𥭫',
-    '𥰠𥮦𥱾𥲬𥷠',
-    '䈪𥮬',
-    '䈱𥮛',
-    '𥲈𥵥𥮩',
-    '筨𥲌䈄',
-    '筋䈥',
-    '簍篓',
-    '篾𥯣𥰓𥱡',
-    '簣籄篑',
-    '笴𥯽',
-    '笥𥯱',
-    '笳䈔',
-    '筰𥯭',
-    '箈䈚',
-    '篝𥱏𥯿𥲙𥵡',
-    '簜𥯕',
-    '簨𥯗',
-    '籔𥯴',
-    '籯籝𥯰',
-    '筅箲',
-    '𥭕𥯘',
-    '𥭖𩐟𥯷',
-    '𥭐箻',
-    '䈢𥯲',
-    '篍𥰂',
-    '𥯟𥯠',
-    '𥰦𥯼',
-    '篫𢲿',
-    '𥰣𥰷𥰤',
-    '彗𥱎',
-    '籃篮',
-    '筮𥰫𥷂𥷣',
-    '篎𥰚',
-    '篌𥰉',
-    '篸𥱄𥶟',
-    '籉𥱆',
-    '𥱍𥰳',
-    '𥰮𥰯',
-    '䈫䈫',
-    '䈿䈿',
-    '𥴀𥱐',
-    '䉠𥰙',
-    '籅𥰩',
-    '𦩶𥰥',
-    '醡𨢧𨣜𨣮𨡗𨢃𥰾',
-    '篡簒',
-    '簧簧',
-    '珓𥲯',
-    '矬𥲽',
-    '笯𥲘',
-    '箯𥲼',
-    '篹𥲻𥶊',
-    '菑𦵰𧀗𥲞葘𦸜',
-    '𥭠𥲐',
-    '箳簈',
-    '𥲠𥲠',
-    '𥲨𥲣',
-    '籪簖',
-    '箠𥴓',
-    '篔䉙',
-    '篴𥳤',
-    '篳𥴂',
-    '簁籭簛',
-    '䈆簤',
-    '䈧䈧',
-    '篃𥴔',
-    '𥲚𥵹䉘',
-    '䉂𥳮',
-    '𥱷𥳸𥳹',
-    '䉬䕠蕟𥳊',
-    '䉧𥳩𥷢',
-    '篷𥴣',
-    '籟籟籁',
-    '楬𥴭',
-    '毇𥸃𥶵𥵓𥸋',
-    '簙𥴾',
-    '簝𥵐',
-    '簢𥴲𥵴',
-    '簬簵𥸐',
-    '𥳐𥴥',
-    '䉥𥵅',
-    '𥶹𥴰',
-    '箑𥵳',
-    '羃𥵵',
-    '𥮘𥵮',
-    '𥴩𥵰',
-    '䉲𥸀𥵸𥵨',
-    '籤籖𥷪',
-    '箙𥵩',
-    '簎𥶪',
-    '籀籒',
-    '葅𥶎𦿘𦳎𦯓',
-    '筣䉫',
-    '𥳔𥶴',
-    '䉋𥶫',
-    '䉭𥶢',
-    '𥷙𥶖',
-    '𥸊䉨',
-    '籐籘',
-    '蘄蕲䕤𥷋',
-    '䉌𥶼',
-    '𥵠糓',
-    '𥷗𥶾',
-    '菹𧄗𦼬𥷟𦼬𧀽𧂚',
-    '𥳞𥷖',
-    '䉩䉱',
-    '𥷼𥷛',
-    '籍𥷸',
-    '䉈𥷭',
-    '蓵䕹𥷩',
-    '𧄾𥷾',
-    '䉷𥸇',
-    '簟𥸖',
-    '𥸡𥸜',
-    '䉁䉹',
-    '糴籴䨀',
-    '秈𦱑籼',
-    '料䉼𥸾',
-    '粹粋',
-    '飩𪌋𥸵𩚊',
-    '籺𥸽',
-    '粢𥸷',
-    '䉻𥸳',
-    '泔粓',
-    '粄䬳𥹎䉽䬳',
-    '粊𥽑䉾𥼠𥺘𥺟',
-    '糲粝䊪𥻃',
-    '糶𥽀𥺋粜',
-    '黐𪐑𥼝粚𦡬',
-    '䅢粙䊘',
-    '粣粣𥹤',
-    '𥾂𥽛𥼸𥽮𥹕𥽣',
-    '聞𦔵闻𦕁𦕌䎹𥹢𦖫',
-    '餉䊑𩜋饷𥹝',
-    '籹𥹡',
-    '䄿𥹞',
-    '䉺粠',
-    '粥𥺞𩱟',
-    '閏䦞𥹿閠闰𨳝𨷎',
-    '糝䊉糣𩞀𩞼糣𥼾糂',
-    '𥹷𥹷',
-    '精䊒',
-    '餛䊐',
-    '粺𥺛𥽚',
-    '糒𥺢𩜗𪌾糒𥼉𥼓𪍞',
-    '粶𥼙粶',
-    '粽糉',
-    '糌糌',
-    '糰𥻁䊜',
-    '糷𥽼𥻂',
-    '餈䭣糍𩜴𥻵',
-    '餱𩛫𩝍糇',
-    '餼䊠䊠',
-    '粞𥻏',
-    '隸𨾀隷𥻳𨾁',
-    '䅭𥻭',
-    '𥹻𥻪𥼢',
-    '𥻦𥼆䊛𥻦',
-    '䭔𪌤䊚𩛍',
-    '糖饄糛餹𥼽𥽻',
-    '饅𪍩馒䊡',
-    '𥡢𥼁',
-    '糨糡',
-    '𥼘𥼘',
-    '糗𥽃',
-    '饎𩞡𩛉糦𩝮𩟄𩜂',
-    '𥼟𥼟',
-    '糮𥼿𥽏',
-    '饊糤馓𩟴',
-    '𥢶糩',
-    '䊎𥽊',
-    '𥼶𥽉',
-    '𧆐𥽇',
-    '穬䊯',
-    '𥽿𥽦糳',
-    '糱𪌊糵',
-    '𥽽𥽱',
-    '䋛𥽲𪓋',
-    '糪𥽷',
-    '饠𥽺𪎆',
-    '糟醩𨣹𨤈𥽾𨠷',
-    '䊤𥾁',
-    '𩏢𥾀𩏸𩏷𩏶',
-    '絲𢇁丝',
-    '紂𩋰纣',
-    '紅红',
-    '紀紀紦纪𥿓',
-    '紉𥾠纫',
-    '紇𥾨纥',
-    '紆䊸',
-    '紃𥾖',
-    '紈纨',
-    '紖纼䊶',
-    '綦𥾦綨𥾎𥾻',
-    '纊纩',
-    '紁紁',
-    '衦𥾍',
-    '紡纺',
-    '紗𦀟纱',
-    '紋纹',
-    '級级',
-    '紜𧶊纭',
-    '納纳',
-    '紛纷',
-    '紮紥𥾱',
-    '結𥾫结',
-    '緊紧',
-    '網𦋟𦁒䋄䋞',
-    '綸纶𥿑',
-    '緯纬',
-    '縱縦𥾞𦆬纵𦄚𥾺𦂵',
-    '紝絍纴䋕',
-    '紓䋒纾䋡',
-    '紲𦁛緤绁𥾰',
-    '紱绂𥿈紱𥾧',
-    '綆䌄绠𥿒䋁',
-    '䊺𥾙',
-    '䋂𥾤𥾥',
-    '帕絈',
-    '索𥿟䌇',
-    '絆𨧘绊',
-    '紼绋𦂓𥿏',
-    '絀绌',
-    '細𥿳细',
-    '紳𦁴𩉼绅',
-    '組组',
-    '線絤綫𦇫线𦂷',
-    '縈萦',
-    '織𦁓𦀗织綕𦃎𦁋',
-    '繹𦆎绎',
-    '紘綋絋紭',
-    '紺绀',
-    '紬䌧䌷',
-    '紾𥿜',
-    '綯𥿐𦃥',
-    '縐𦆜绉䋓𥿷𥿲',
-    '𥾩𥿅',
-    '𦀉𥿰𥿱',
-    '𥿯𥾭',
-    '䋪䋍',
-    '袎𥿌',
-    '統统綂',
-    '絞绞',
-    '絨绒',
-    '絡络𦃆𦃅',
-    '給给',
-    '絢绚𦃜',
-    '緬𥿶缅',
-    '繞绕',
-    '繪绘絵',
-    '翼𦒖𦏵𩙺䋚',
-    '褲袴裤絝绔',
-    '紵𦇃𦂂𥿾𦅷',
-    '絰绖',
-    '絳绛',
-    '緀紪',
-    '綮𦄊䋯䋜',
-    '縌𥿬',
-    '縋䋘缒',
-    '縶𦅬絷',
-    '髹𥿴𩭘髤䰍',
-    '𥿼𦃑𥿪',
-    '絎绗',
-    '絽絽',
-    '絹绢',
-    '綏绥',
-    '緇𦁃緇𦃠缁',
-    '縫缝綘',
-    '繁𦃍䋣䌓𦅳',
-    '繡繍綉绣',
-    '繭蠒𧀇絸𦇂',
-    '綈绨',
-    '絛縧绦𠍞',
-    '縼𦀢',
-    '繒缯𦀓',
-    '絙𦀞',
-    '䋰𦀥𦀤',
-    '䋶𦅨綇𦅓𦄼',
-    '䋼𦀚',
-    '綻绽䘺',
-    '綰绾',
-    '綽繛绰𦅕𦈀',
-    '綾绫',
-    '綴缀𧚰',
-    '綺绮𦂶',
-    '綢绸',
-    '綿绵緜',
-    '維维',
-    '緒绪緖',
-    '緝缉𦂝',
-    '績绩',
-    '繃绷綳䙀𧚸䙖𦇜',
-    '繩䋲縄𨭘𦃰绳',
-    '續续',
-    '紟𦁌䋮',
-    '絣絣',
-    '緋绯',
-    '綬绶',
-    '綹绺',
-    '緡缗緍',
-    '縰𦁡',
-    '䋭䋭',
-    '𦁉𦁑',
-    '䋬𦁔',
-    '綥𦁰',
-    '𧝉襧𦁥𧛢',
-    '幅䋹',
-    '締缔',
-    '緘缄',
-    '編编',
-    '緣縁缘',
-    '緞缎',
-    '緩𦇻缓𦅻',
-    '縷缕𫃵𦇆',
-    '纏緾纒缠',
-    '纜䌫缆',
-    '褓緥',
-    '絁𦇲𦇼䌳𦂛',
-    '紿緿',
-    '綎𦂃',
-    '絻𦂔',
-    '綃𦂚',
-    '緪縆',
-    '緧𦃈𦂏䋺鞧',
-    '緗缃',
-    '緲缈',
-    '緹缇',
-    '緱缑𦂐',
-    '縕缊緼',
-    '縢𦂙𦅌',
-    '繸𦂁𩍚',
-    '繴𦂟𦌠',
-    '褙䋳',
-    '赬𧹚頳䞓緽𧹙',
-    '緈𦂜𦃉𦃱',
-    '䋽𧛜𦂌',
-    '縬𦂎𦇰𦄉',
-    '䙅䌁',
-    '縊缢',
-    '繅𦅒繅𦃐𦃨缫',
-    '繫縘繋',
-    '繽缤𦆯',
-    '綅𦃌',
-    '縞缟',
-    '縗縗缞䙑',
-    '縝缜',
-    '縉𦇢缙',
-    '縭缡',
-    '繉𦃻',
-    '繇𦅹䌊䌛𧪬',
-    '繑𦃣',
-    '䋷𦃤',
-    '䙎𧜋𦃝',
-    '繆缪',
-    '縲缧𦅍纝',
-    '纓缨',
-    '緁䌌𦆍',
-    '緶𦄒𦄱',
-    '縵𦆅缦',
-    '縻麿䌕',
-    '𢄌𦃏',
-    '𦀘𦄕',
-    '繓𦄎',
-    '繕𦆶繕缮𦆏',
-    '繚𦆖缭',
-    '纂繤',
-    '顈𦅐',
-    '繈繦',
-    '繻𦅏𦅎',
-    '纀𦄾',
-    '纈缬',
-    '纆𦄿',
-    '𦁎𦅊',
-    '䋾𦅁',
-    '緟𦅅褈',
-    '䋸䙉𦅑',
-    '䌥𦅂',
-    '𦇗繏',
-    '䌵𦅉𦆂',
-    '韁繮𦆊缰',
-    '緵䍟𦆛',
-    '繯𦇏缳',
-    '繳缴𦅾',
-    '繾缱𦇶',
-    '韉𦆉𩋋𦇩韀',
-    '𢍣𦅽',
-    '䋤𦆗',
-    '䌏𦆥',
-    '𦄍𦆌',
-    '𦇎繱',
-    '辮辫',
-    '襤褴繿',
-    '縒𦆧𦇈',
-    '縹𦇳𦆝',
-    '繢𦇅𦆠𦇣',
-    '纔𦆵',
-    '𦃘𦆣',
-    '綁𦆫',
-    '纖纎',
-    '繂𦆽',
-    '纘缵纉',
-    '襮𧟊𦆿',
-    '紨𦇁',
-    '綄𦆼',
-    '䋢𦆰',
-    '𦄑𦇀',
-    '䌤𦆤',
-    '鑝纄',
-    '繖𦇕',
-    '𦅃䌭',
-    '纅𦇬',
-    '繘𦈇𦇹',
-    '纁䌲䙧',
-    '䌴䌴𦇽䌱',
-    '𦆾𦈁',
-    '䌪𦇾',
-    '儾𧟘𦈃',
-    '缶𦈢缻',
-    '䍃䍃',
-    '越越𦈭𧻂',
-    '缾𦉇缾𦉇䍈',
-    '䍇𦈮',
-    '𦉢䍅𨯻𦉣',
-    '𦈨𦈨',
-    '䍍𦈴',
-    '琖𦈻𧣴',
-    '瓿䍌',
-    '瓽𦈹',
-    '罌𦉦罂',
-    '甀𦉖䍋𦈼',
-    '㼵𦉁',
-    '𤮜𦉕',
-    '䍎𦉙',
-    '𦉝𦉝',
-    '罍𦉩',
-    '羅𦋝罗𦌴',
-    '罜𦌷𦉷𦊝',
-    '罷罢𦋼𧟽',
-    '笓𦊁',
-    '𦊂𦊍',
-    '罟𦊖𦊟',
-    '笱𦊒',
-    '罠𦊞',
-    '罝𦊩𦊕𦊨',
-    '罛𦊡𦊶𦋆',
-    '罦䍖𦋄𦋵𦊠',
-    '罶𦊑𦊗𦌁𦌑羀',
-    '𦊜𦊘',
-    '𦋡𦊏𦊎䍙',
-    '䍔𦊫',
-    '𦊴𦊪𦊭',
-    '𦊾𦋑',
-    '𦋈𦋈',
-    '罩𦋇𦋚',
-    '署𦋧',
-    '罭䍞',
-    '罧𦋗',
-    '罨𦋙𦋙',
-    '罬𦋖',
-    '罽𦌞𦌗𦋋𦋺',
-    '䍜羄𦋜',
-    '罳𦋮',
-    '㒾𦋤',
-    '𠕦𦋢',
-    '罯𦋫',
-    '𦌔䠣𦋠𦌮𦌻𦋭𨂳',
-    '羈覊𩆺覉羁𦍊𦌭𦋱𦍈𦌱𧠄䩭',
-    '罹𦌐',
-    '罻𦌨𦌍',
-    '罼𦌎𦌂',
-    '䍡𦌟𦌏',
-    '罿𦌜',
-    '罾𦌝',
-    '𦌬𦌳䍢',
-    '黔𦌣',
-    '罥羂',
-    '䍤䍤',
-    '罺罺',
-    '𦊔𦌫',
-    '釃酾𦌿釃𨠴𨢷',
-    '𦍂𦍅',
-    '𦌾𦍆𦍃',
-    '邊𨘢𨑶邉𨓙边𨓉辺𦍇',
-    '羊𦍌',
-    '羍𦍐',
-    '羑羐',
-    '䍫𦍥𦍔',
-    '羔𦍚𦎴𦏠',
-    '羞𦍟',
-    '羝𦍝𦍞𦍿',
-    '羕羕𦍛𣴎',
-    '羱𦍘𦍼',
-    '䍨𦍜',
-    '䍱𦍗',
-    '羯𦍨',
-    '羖𦍩',
-    '羥羟𦎺𦎥',
-    '䍪䍪',
-    '羺𦎀𦏌𩍄',
-    '觤䍯𧣂',
-    '𦍹𦍽',
-    '𦎣𦏚䍰𦏉𦏍',
-    '𦏆𦍻',
-    '豸𧋈𧳃豸𦎋𪺏',
-    '䍮𦎉',
-    '羶䍹𦏬羴𦏫𦏭𦎞',
-    '緎𦎘𩋉𩎹',
-    '𦎫𠆆',
-    '𦎢𦎢',
-    '腥𦎬𩤵',
-    '鞣𦎤',
-    '羰羰',
-    '𦎱𦎩',
-    '𦎦𦏃',
-    '𦎯𦎼',
-    '萈𦏊𦎻',
-    '䍼𦏋',
-    '䍽𦏈𦏩',
-    '羸羸𦣉𦣄',
-    '𦎸𦏙',
-    '䍺𦏖',
-    '羬𦏣',
-    '羚𦏪麢𪋚𪋪𦏰𪋦䴫',
-    '習习',
-    '羽𦏲',
-    '羾𦏺𦏼',
-    '雩𩁹𦏴𦏻',
-    '翅𦐊翄翤',
-    '翠翆𦐜',
-    '翃𦐌翝',
-    '翇𦐗𦐓',
-    '𦐋𦐍',
-    '䎃𦐘𦐃𦐎',
-    '翍𦐢',
-    '翑𦐛',
-    '𦐕𦐪䎈𦐞',
-    '䎂𦐙',
-    '𦒟䎅𦐚𦑵',
-    '翕翖𦐬',
-    '翹𦒒翘',
-    '翬翚𫅨𦑩',
-    '䎊𦐦',
-    '䎔𦐷𦒊䎍',
-    '䎕𦑟𦐥𦐳𦒃',
-    '翛𦐻翛',
-    '翾𦒬𦐽𦑰𦑉',
-    '𦐉𦐼',
-    '翩翩𦑮',
-    '𦑲𦑶䎓',
-    '𦒎䎚𦑐𦒄',
-    '翥䎝𦑥䬡',
-    '翭𦑤𦑚',
-    '翪𪃊𦑨',
-    '翦𦑦𦒕𦑳',
-    '𦑣𦑪',
-    '螚𦑴䘅',
-    '䎗𦑽𦒓',
-    '翱翶𦒢翺',
-    '翋𦒆',
-    '翮𦒏',
-    '𦒑𦒔',
-    '翷𦒪',
-    '𩡓𦒥',
-    '𡬘𡬘𦒨',
-    '𦒦𦒩',
-    '翳𦒭',
-    '考𦒱考',
-    '𦒶𦒸𦒲',
-    '耇耉耈',
-    '者者',
-    '𦒻𦒾',
-    '耋耊𨊆𨊁',
-    '胹𦓒𩰴𦓠',
-    '黻𦓗',
-    '耏𦓘',
-    '𦓚𦓝𦓙𦓚',
-    '黼𦓞',
-    '耒𣐇',
-    '䎢𦓪',
-    '稐耣',
-    '䎤𦔁',
-    '堫䎫𦔕',
-    '耠𦔏',
-    '穮𦔗𦔩',
-    '耤𦔢𦔡',
-    '橯耮',
-    '䎮𦔝',
-    '𦓻𦔥',
-    '𦔓𦔟',
-    '𦔔𦔨',
-    '穫耯',
-    '恥𦔺𦕖耻',
-    '聊𦕼𦕅𦕵𦖂',
-    '聳𢕈耸',
-    '職軄聀',
-    '聶聂',
-    '聽聼𦔽𦕘𦕢聴',
-    '𦔼𫾬',
-    '聄𦕗𦕇𦕑',
-    '𦖉𦕋',
-    '聾𦗤聋䏊',
-    '聹𨊓聍𨊎',
-    '胇𦕚',
-    '聯聨聮𦖹𦕱联𦘈䏈聫',
-    '聰聰聦𦕻𦖻聪聡',
-    '耴𦕿',
-    '耾𦕹',
-    '聒𨈸𦕾𦗦',
-    '聎𦖅',
-    '䎺𦕶',
-    '聚𨞮𧅞聚',
-    '聠聠',
-    '䎼𦗓䎼',
-    '聵聩𦘄𦘋𦘃𦗿𦖥',
-    '䎿𦖣',
-    '𦖨䏀',
-    '䏂𦖪',
-    '𦶇𥧢',
-    '聱𤘒聱𦗷',
-    '媿聭',
-    '𦖋𦗊𦗙',
-    '𦖬𦗃',
-    '𦗕𬸽',
-    '聻𦗚',
-    '䏇𦗩',
-    '䏆𦗠',
-    '𦗢𦗢',
-    '聸𦗯',
-    '𥽳𦗶',
-    '臆𩪩𩪙𩪣肊',
-    '肴𦜚𦘬𦙩',
-    '肙䏍',
-    '飣𦘭',
-    '肓𦘻',
-    '肥𦘺',
-    '腸肠膓',
-    '肐𦘸𦙊𩨘',
-    '肒𦘾',
-    '胘𦘷',
-    '胣肔',
-    '臐𦘶𦢜',
-    '肗𦘽',
-    '肫𬂁𦙛',
-    '胥𦙃',
-    '胚肧𦙂',
-    '脅胁脇',
-    '胸𦚍𦙄胷𦛄',
-    '腎肾',
-    '腫肿',
-    '疣𪐤肬',
-    '肸肹',
-    '胙𦙐',
-    '膍肶',
-    '𦘴𦙅',
-    '䏖𦙢',
-    '𦚧䏛',
-    '䐴𦟡䏗',
-    '䏥𦙇',
-    '股𦚂',
-    '胖𦚓',
-    '脈脉衇䘑𧖹𧖴',
-    '臚胪',
-    '駝𩣾驼駞𦚐',
-    '痂𦙲',
-    '胠𦚁𦚒',
-    '胏𦚙𡋜𦙰𦛎𦚘𦚮',
-    '胗𦙳𦜌',
-    '脛𨂈踁胫',
-    '䏐𦚀',
-    '𦙀𦙹',
-    '䏠𦚎',
-    '𦞤䏤',
-    '䯊胢',
-    '胃𦛂𦞅𦝩',
-    '胞𦚽',
-    '脆脃脃',
-    '胳𦛃',
-    '膿脓',
-    '膾脍',
-    '臍𠬐脐𦠃𪗇䐡𪗌',
-    '胺𦛅',
-    '胯𦚬',
-    '脀𦚦𦛫𦞪',
-    '胔𦙼𦚚',
-    '𤷎䏨',
-    '𦙱𦚻',
-    '脢脄𩨿',
-    '脠𦚺',
-    '𦞚𦚡',
-    '䑂𦚪',
-    '痣䏯',
-    '脫脱',
-    '脩𠋛',
-    '腳脚踋𦛶',
-    '膀𦜅𦜶髈',
-    '臉脸',
-    '胾𦛹',
-    '脟𦛷',
-    '腌𦛞𦜽𦟩',
-    '膕腘𩪐',
-    '骾𩩹𦛟',
-    '腡脶',
-    '䐢𦛴𦜻',
-    '𣎓𦛔',
-    '䑃䏵',
-    '乳𦜘',
-    '皰靤𦝐𦫱𦫥𦫗䶌',
-    '脾脾𦜠',
-    '胕𦝗',
-    '胼腁',
-    '脘𦜐',
-    '腃𦝘',
-    '腊𦝙',
-    '臕脿',
-    '跽𨄲𨃡𦜕',
-    '顄𩔞𩔓𦜆',
-    '肭𦜬',
-    '䏽𦜟',
-    '䐂䐂',
-    '䏿𦜹𦜑',
-    '䐑𦜪𦜈',
-    '𨁸𦜏',
-    '𨡘𦜗𦜾𨡐',
-    '腰𦝫',
-    '膩𦡸腻𧸉𧸐',
-    '胅𦝯𩨰',
-    '腤𦝡',
-    '腩𦝧𨡯',
-    '腯𦝬',
-    '膃腽',
-    '𦝨𦞉',
-    '䐐𦝱',
-    '𦝠𦟀𣎆',
-    '腹𦞶',
-    '臏膑',
-    '膂膐',
-    '臊𦠨𦞣𦟅𦟄',
-    '饈䐰𦟤馐',
-    '𠞮𦞛',
-    '䏳𦠀𦠔𦠠𦠟',
-    '𦞙𦞱',
-    '肋𦟯',
-    '脊𦟝𦠗',
-    '脣𦟢',
-    '膜𦟦',
-    '臂𦠞𦡜𦡍',
-    '醟𦟴𨠕',
-    '醵䣰𦟳',
-    '膯膯',
-    '膳饍膳',
-    '臇𦢥𦠬',
-    '䐱膪',
-    '𦠓𦠩',
-    '𩪗𦠒𩪜',
-    '臃𦡚',
-    '臀𩪡臋',
-    '腄𦡘',
-    '膹𦡛',
-    '𦗴𦡁',
-    '𦡌𦡭',
-    '臘𦠼臘',
-    '臟臓',
-    '膁𦡶𤑃',
-    '𦢧䑅',
-    '膺𦢖𦢻𩪠',
-    '殰𦢌',
-    '膌𦢕',
-    '𦟠𦢑',
-    '𦠄𦢍',
-    '䑎𦢙',
-    '𨇖𦢛',
-    '酥𨣺䜹𨢭𦣑𦢦',
-    '臢臜',
-    '髖𦢮髋',
-    '𦠖𦢭',
-    '膊𦣈𦢸',
-    '𦞦𦢽',
-    '𦣍𦢹',
-    '膘𦣁',
-    '膴𦣌',
-    '臠𦣐',
-    '臡𦣚𦣊',
-    '𦟟𦣆',
-    '脰𦣓',
-    '頤𩑪𩒫𩠝𦣝𩠢𩠡頥𩠛𩠞颐',
-    '臥卧',
-    '𥅘䑐',
-    '臦𦣩',
-    '孤𦣮',
-    '臨𦣷𦣲',
-    '自𦣹𩐍𦣼𨈻',
-    '臭𦤀臰',
-    '皈𦤇',
-    '雲𦤆',
-    '衄衂𦤊𧖩𧗗䘐',
-    '臱𦤔𦤝',
-    '臲𦤞',
-    '䭂𦤡𨜀',
-    '𦤦𦤪',
-    '致𦤹𦤺',
-    '𢓜臵',
-    '臻𦥇𧽕',
-    '輊轾𨍀𨏡䡹𦥎𨎘𨏑',
-    '貶𦥧𡬯贬𦥕𧴷𦥘',
-    '舀𦥝𦥨𦥵𦦌𦥟𤔘𦥞',
-    '䑔𦥥𦥡',
-    '臽𥦶𦥢',
-    '鼠䑕𦥩',
-    '齯𦦃',
-    '𦥭𦦐𦥾',
-    '𪓬𪓢𪓯𪓥𦦁',
-    '𦥻𦦇',
-    '䙲𦦉𦧂',
-    '齏䪠䪣𩐎𠬘𩐊齑𩐒𩐑𩐋韲𩐓𦦏䪡𩐇䪢𩐊𧅴',
-    '𠮐𦦖𠮌',
-    '𣱓𦦛',
-    '𦦝𦦞',
-    '𦦧𦦡𦧁',
-    '讓𧮨𦦬让',
-    '𦦾𦦺',
-    '舍舎𦧶',
-    '舐舓𦧓䑛𦧪𦧑𪙶𪙬𦧇𦧧𦧫',
-    '𣁳𦧌',
-    '𦧈𦧎',
-    '話𦧚话䛡𦧵',
-    '詹𦧕',
-    '䑜𦧢𦧤',
-    '𦧟𦧥',
-    '鋪舖铺',
-    '館舘馆',
-    '舚𦧻',
-    '葟𦨄䑟𦨁𦨃',
-    '肕𦨔',
-    '舸𦨒𦨜',
-    '𦨉䑢',
-    '舦𦨐',
-    '䑦𦨓𦨛𦩷',
-    '艖𦪸𦫅䑡𦪮',
-    '般𦨗',
-    '𦨢䑭𦨝𦨠',
-    '䑴𦨘𦪆',
-    '舵䑨',
-    '舠𦨣𦩍',
-    '艒𦨧䑵',
-    '艫舻',
-    '𦨬𦨺𦨤',
-    '䑱𦨨',
-    '䒀䑧',
-    '舼𦨰𦩺',
-    '艟𦨴',
-    '䑥䑪',
-    '艇𦨿𦪅',
-    '造𨕡艁𦹢䒃𨒽',
-    '艐𦩇',
-    '䑤𦨽',
-    '𦨼𦨼',
-    '䑬𦩄𦩹',
-    '𦩉𦩈',
-    '舶艊',
-    '䑫䑫',
-    '艗𦩊',
-    '义叉',
-    '䑼𦩙',
-    '艘䑹',
-    '媵𦩩',
-    '𦨦𦩪',
-    '𦪬𦩥',
-    '幐𦩫',
-    '艏𦩽',
-    '艎𦪄',
-    '𦪙䑽',
-    '艕𦪤',
-    '䑿𦪲𦪓𦪥',
-    '舲𦫊𦫃𦫄𦪩',
-    '謄𦫁誊',
-    '賸𧷽䞉𦫂',
-    '艣艪',
-    '騰駦𩦜驣𩥱䠮𦫀𩧖腾',
-    '𦫈𦫆',
-    '皴𦫝',
-    '艴𦫛',
-    '赩𦫜',
-    '顏𦫨顔𦫤𩕝颜𦫞𩠪',
-    '䒍𦫣',
-    '䒊𦫦𦫬',
-    '䒌𦫭',
-    '節节',
-    '蘭兰',
-    '乂艾',
-    '芀䒒',
-    '䒓𦫼',
-    '𦫶芁𦫷𦰙𦱭𦭺𦬥𦱠',
-    '𦳞䒔',
-    '𦬄𦫸',
-    '芒𦬆𪌁',
-    '芋芋芌',
-    '芞䒗𦬈',
-    '茻𦬇',
-    '薌芗',
-    '芝𦭩芝',
-    '花花',
-    '苒䒣',
-    '萃𦬡',
-    '葦苇𦻪',
-    '蒼苍𦭆',
-    '莧苋',
-    '萁𦬟𧯯',
-    '藶苈',
-    '𦬚𦬜𦬤',
-    '䔂𦭄𦬷',
-    '𦸙𦬓',
-    '𦺔䒝',
-    '芽芽',
-    '苦苦𩇵',
-    '苞苞',
-    '茲兹茊𦱳',
-    '莖茎',
-    '莫䒬𦱴𦮅𢍋𦱤𦶛',
-    '萍𦭃',
-    '菅𦭂',
-    '茇𦳺茇',
-    '苡苢',
-    '苶𦬼',
-    '菋苿',
-    '葆𦬽𦽻',
-    '蘢茏',
-    '䒦𦭢',
-    '𦮻𦬾𦮌',
-    '𦳋𦰵𦬿',
-    '荔𦶭茘',
-    '荊荆𦮓',
-    '葷荤',
-    '葵𦮙𦷡',
-    '蒸䒱',
-    '蓀𦳪荪𦽙𦺈𧂍䕖',
-    '芓茡',
-    '芛𦭽',
-    '茆𦯆𦯄𦮉𦹉',
-    '莔𧏊𦴖𦳶𦱋𦮄',
-    '莌𦮀𦸍',
-    '菵䒽',
-    '葒葓荭',
-    '蓍𦮂',
-    '蒯𦮍',
-    '蕁𧀷𧁘𧂗荨',
-    '蕎荞',
-    '薈荟',
-    '薺荠萕',
-    '藎𦳒𧂰𦾗荩𧃤',
-    '蹌𦭫跄',
-    '艿𦮘',
-    '䒢𦯒',
-    '茝𦯭茝𦯱',
-    '𦸓䒹𦮇',
-    '蕒荬',
-    '薘荙',
-    '獲获',
-    '芍𦯪𦱜',
-    '芹䓅菦',
-    '草𦷣𦯑𦳱𦳕',
-    '莞𦸌𦯜萖𦼍𦺊',
-    '萵莴',
-    '蒞莅',
-    '蔭𦺼䕃荫',
-    '蔥𦯎𦴜𢚱䓗葱',
-    '藐𦯦𧂀',
-    '芣䓏',
-    '芵𦯊',
-    '茺𦯇',
-    '茿𧏤𦵶𦯋',
-    '莣𦯌',
-    '荽𦯩',
-    '菧菧',
-    '菆𦮆𦺵𦻡',
-    '葋𦮿𦶔',
-    '蒔𦱎𦱗𦸎莳',
-    '蓖𦶰𦱔𦯛',
-    '蔊䓍𦸋',
-    '蓧𦰞莜𦺰',
-    '蕕𦽈莸𦳷',
-    '薍𦽞𦯠',
-    '𥭒𦯁',
-    '荓荓𦰝',
-    '茮𦯝',
-    '荈𦯢',
-    '𦭿𦯙𦰳',
-    '𦮼𦯡',
-    '䓊茣𦹊茣𦸭',
-    '莬莬',
-    '萓𦯥',
-    '𦲯𦯘𦱏',
-    '芥𦲈',
-    '苜𦱒𦴠',
-    '莽𦷶莾',
-    '莓𦱞',
-    '菴葊𤲅',
-    '萌萠',
-    '菌𦽖菌𦵼',
-    '菊𦶗菊䕮𧂲𧃓𦵳',
-    '菜菜',
-    '董𦱦',
-    '葩𦲠𦺂',
-    '蕭䔥萧',
-    '蘿萝',
-    '麻𦲬𦱍蔴麻',
-    '芸𦱚',
-    '芴𦲇',
-    '苕萔𦴰',
-    '莋𦰼',
-    '莥𦱙𦶆',
-    '萐𦱥',
-    '葺𦱫',
-    '蒡𦱘𦾭',
-    '蔤𦰷藌𦻩',
-    '蘀萚𦿙',
-    '䒩萂',
-    '𦰲𦲰',
-    '葈𦱓',
-    '𦳫𦰻',
-    '𦳹𦯏',
-    '𦺞𦱕',
-    '䕳𦰴𦱨',
-    '𦱱𦱲',
-    '享𦴒',
-    '範𫈣',
-    '范𦴮',
-    '苟𦴳',
-    '茵䓰',
-    '萸𦳅',
-    '蔣蒋',
-    '薑䕬𧅁𦷗葁',
-    '薩萨',
-    '解𦴘',
-    '稂蓈',
-    '苴𦳘',
-    '茜𦴛𦵻𦻤',
-    '荇䓷',
-    '荾𦴅',
-    '菉菉𦾯',
-    '葖𦴯',
-    '葝𦳲',
-    '萩𦵒',
-    '蒟𦵑',
-    '蓁𦳳',
-    '藀𦳖',
-    '藨𦳤',
-    '蘼䓺',
-    '饐䬥𩚂䓹',
-    '𠌉𦴐',
-    '𥬔𦳰',
-    '篺𦴝',
-    '苠𦳜',
-    '苳𦵝',
-    '莚葕',
-    '𦰪𦳸',
-    '䓙𦴂',
-    '𦴔𦴁𦴲',
-    '𦵟𦳻',
-    '葜𦸉𦳴',
-    '蒒𦴫',
-    '䓼𦳨',
-    '䔺𧃚𧄙𦳉𧁼',
-    '𦽏𦳓',
-    '𦾵𦽓𦴇𦺺',
-    '䕦萾',
-    '茸𦶪',
-    '蔚𦵥',
-    '薛𧀼𦵮',
-    '薇𦵨',
-    '藍𦾐蓝',
-    '證𧁅𧁆䥌𨧭𨨼𨨾𨪔䥭𦷘证',
-    '軛𦷖轭',
-    '傰𦷛',
-    '芎𦵡',
-    '茥蓕',
-    '菤𦶘',
-    '菼𦽉𦵹',
-    '葥𦺍𧁄𦷱',
-    '葸𦷚',
-    '葰𦶬䕑',
-    '蔆蓤䔖',
-    '蔉蓘',
-    '蓴蒓',
-    '蓾𧀦𦷕',
-    '蓨蓚',
-    '蕡𦶁',
-    '蕻𦶓',
-    '蕷蓣',
-    '薊蓟',
-    '薶䔆',
-    '䌨𦷞',
-    '䒸𦶯',
-    '𦯈𦵲',
-    '莦𦷟',
-    '𦯖𦶄',
-    '蒄𦵤',
-    '葄𦵬',
-    '𦵫𦵫',
-    '蓛𦵪',
-    '𦶙𣘇',
-    '蒵𦷲',
-    '𦻜𦺁',
-    '䕸𧅡𦷓',
-    '𧗆䕄',
-    '𦭰𦷸',
-    '𧂘𦷠𧅍',
-    '庵蓭',
-    '朮𦸇',
-    '莘𦸯𨐍',
-    '荻蔐',
-    '荼𦹍',
-    '萄𦻦',
-    '蔬䔫',
-    '薔𧃻蔷',
-    '藹蔼',
-    '艽𦸹',
-    '苵𦼺𦸴',
-    '茈𦶉',
-    '菫𦻍𦸧𦹆𨤬𦻠𦸨𦻋',
-    '菣𦸃',
-    '菎𦸫𧃣',
-    '萆𦸣',
-    '葧𦸦',
-    '蓐𦸳',
-    '蒨蔳𦹤',
-    '蔻𦽛蔲',
-    '蔖蔖',
-    '蓽𦸩',
-    '蕞𦸤',
-    '藄𦸀𦻆',
-    '藸蕏',
-    '蘞蘝蔹',
-    '蠆𧔱䘍𧍣虿𧔐𦹌𧓵',
-    '㷬𦹪',
-    '𦮾𦸖',
-    '𦶈䔜',
-    '𦵵𦿥𦷿',
-    '𦺶𦸠',
-    '䕆𦸄',
-    '𦼫𦸵',
-    '䕈𦺯𦼶',
-    '𧀬𦸝',
-    '莠𦽧',
-    '萊𦻣',
-    '菰𦺠',
-    '菲𦻥',
-    '萼𫉞蕚',
-    '蓿𦼑',
-    '蕊𧄜蘃蕋蘂',
-    '薄𦻈',
-    '蘊藴蕴',
-    '茭𦺏𦽨',
-    '菿𦻢',
-    '菔𦻉',
-    '萑𦻧',
-    '蒍蔿',
-    '葍䔰𦽪',
-    '葌䔵',
-    '蓩𦺒',
-    '薀蕰',
-    '薞𦻂',
-    '薴𦺝',
-    '薵𦺚',
-    '蘵𧄕𦺿',
-    '蘬𧁻𦺕',
-    '菬𦻟',
-    '𦱄𦻨',
-    '葏𦻄𦽷',
-    '葇𦺤',
-    '䓯𦺇',
-    '䔌𦺆',
-    '𦻝𦺩',
-    '䔶𦻀',
-    '䔸𦼐',
-    '𦽎𦼋',
-    '䕅𦺋',
-    '䕞𦺫',
-    '𧀠𦼙',
-    '𧀨𦼤',
-    '秣䬴𦾒',
-    '舊𦾔',
-    '萱蕿藼蘐',
-    '蔓𦽦䕕𧂧',
-    '薰蘍薫',
-    '藪薮',
-    '莪䕏',
-    '萏𦽜',
-    '葭𦽸',
-    '萺𦽹',
-    '萹𦽟',
-    '蓏𦽝',
-    '蔜𦽺𦽠',
-    '蔕𧀱𦽢',
-    '藈𦿡',
-    '驊𦽊𧄋𧄪骅𩤉',
-    '菗𦼾',
-    '𦸐𦽂',
-    '䔻𦼿',
-    '𦻅𦼩',
-    '䕀𦽣',
-    '蕂䕝',
-    '䕛𦽤',
-    '𦾮𧁀𦼮',
-    '苓䕘',
-    '蒿𦿣',
-    '蔽𦿔',
-    '藻𧄩薻𧃡𧁑𧅂𧁍',
-    '蘋薲',
-    '蘇𧁨蘓',
-    '蘚藓',
-    '欂𦼭',
-    '芰𦼽',
-    '蒮𦿠',
-    '蓼𦾷',
-    '薉𦿧',
-    '藒𦿋',
-    '藣𧀛',
-    '蘮𦿦',
-    '蘩𦾴𧄫',
-    '蘥𦿈',
-    '餕𩝘𦿉',
-    '𦵷𦾼',
-    '䔄𦾾',
-    '𦵦𧀝',
-    '蔯薼',
-    '𦼷𦿓',
-    '䕙𦿐',
-    '𧀄𦿄',
-    '䕡䕡',
-    '蓬𦿪',
-    '苨䕥',
-    '蓱𧁕',
-    '蔪𧀵',
-    '蕛𧀾',
-    '蕮𧂙',
-    '薚𧀫',
-    '蕼𧀳',
-    '藑𧃜𧁰',
-    '蘘𧁁',
-    '蓸𧅝𦿩',
-    '𦺉𧀮',
-    '𦿍𧀸',
-    '䕩𧃉𧀪𧃬',
-    '𧃐𧀿',
-    '蕨𧂱',
-    '蕃𧂵',
-    '藤䕨',
-    '馳䮈驰𧂓',
-    '驥蘎𩥉骥𩦸',
-    '蕇𧂳',
-    '藷𧂤𧄔',
-    '莟𧂃',
-    '䔷𧂖',
-    '䔹𧁂',
-    '𦻃𧂴',
-    '薸䕯',
-    '𦾰䕲',
-    '𧁊𧂡',
-    '藉𧃫',
-    '歜𧃏',
-    '藆𧃕',
-    '蘛𧃠',
-    '蘪𧃧',
-    '蘳蘳',
-    '䔘𧃘',
-    '䔯𧃗',
-    '䕍𧃥',
-    '𦼪𧃺',
-    '𦾱𦾱',
-    '𧂒𧄝䕴',
-    '𧃒𧃒',
-    '𧄎蘨',
-    '蔈𧄖',
-    '藂䕺𧆁',
-    '藙𧆈𧄘𧅙',
-    '葠𧄢',
-    '𧅘𧄨',
-    '𧅖𧄷虉𧄞',
-    '藋𧅛𧅈',
-    '藭𧅉𧅓',
-    '藚𧅎',
-    '藜𧅏',
-    '虋𧄸𧅾',
-    '𧅆𧅇',
-    '䖂𧄶虊',
-    '䵵𧅌',
-    '藽𧅜',
-    '𧄠𧅟',
-    '蕈𧅸',
-    '虈䖀',
-    '𦳩𧅲',
-    '䕻𧅳',
-    '虌𧆊',
-    '𧄿𧆃',
-    '䖆𧅼',
-    '燃𧆋',
-    '蘦䖅',
-    '𧅺𧆔',
-    '䕿𧆚',
-    '虜虜虏',
-    '虖𧆜𧆪',
-    '虓𧆬',
-    '𧆦𧆫',
-    '虞𩦢虞',
-    '虘𧇇䖕',
-    '𧆥䖖',
-    '䖑𧇻𧆽𧇅',
-    '虨𧇥𧈇𧇃𩆱𨞹𧇨',
-    '𧇿𧇈𧇣',
-    '虣𧇭𧇑𧸾𧇒',
-    '虪𧇐',
-    '𧆣𧇕',
-    '虥虦',
-    '䖘𧇢𧈒',
-    '虧𧟯𧇾虧',
-    '䖗𧇱',
-    '𧆼𧈆',
-    '菟𧈋',
-    '𧈑𧈎𧈖𧈗',
-    '𧈘𧈔',
-    '蚤䗢𧈠䖣𧎮𧈡',
-    '雖虽𧐌𨿽𧈧',
-    '虫𧈰',
-    '虹𧈫𧈬𧍺𧌫',
-    '蚩蚩𧈨𧉌',
-    '蝦𧎂虾鰕',
-    '蝨𧒢𧈲𧋜',
-    '螞蚂',
-    '虻䖟蝱䗈𧌦',
-    '蚖𧈮䖠',
-    '蟘𧈺𧈩𧈱𧑰𧎢𧎬',
-    '虶𧈯',
-    '蚊螡蟁蚉𧓢𧏎䘇𧊈𧉬𧓹',
-    '蠶𧑯䗞蝅𧉏䘉𧌩𧖟䗝𧕽蠺',
-    '蚡蚠',
-    '蚕𧉕𧍦𧉂',
-    '蚺𧊨蚦',
-    '蚸𧈼',
-    '蛜𧉅𧊰',
-    '蜆𧖙蚬䗾',
-    '蚎蚏',
-    '𧉀𧉘',
-    '蚔𧵄𧉜𧓑',
-    '蛧𧈿蝄蛧𧍑',
-    '𧕟𧉐𧕺',
-    '蚌𧉳蜯𧎞𧉻',
-    '蛀𧏼𧉶',
-    '蜿䖤䗕蜿',
-    '螢萤蛍𧓌',
-    '蠣𧖄䘈蠇蛎',
-    '鮑蚫鲍',
-    '蚅𧉵',
-    '蚹𧊆',
-    '蛓𧍤䗹𧏀𧉠',
-    '蛩𧊡𧋳𧉨',
-    '蟊䖥𧎻𧕑',
-    '蟶蛏',
-    '蚮𧊇',
-    '𧑓𧒑𧉷𧒁',
-    '䱕𩶋𧉯',
-    '蛤𧊧',
-    '蜂𧊩䗦䗬蠭𧓶𧒒',
-    '蜴𧊤',
-    '蟯𧑣蛲',
-    '蠻蛮𧖖',
-    '鱷鳄𩻙𧊜𩷜鰐𩶍',
-    '蚻𧊢',
-    '蚼𧊛',
-    '蛚𧍼𧊿𧌵',
-    '蛺蛱',
-    '蜎蜎',
-    '蜩𧊓',
-    '螄蛳',
-    '蟄𧒦蛰',
-    '蠁䖮蠁',
-    '蠐𧓉𧏝蛴𧖊',
-    '珕蛠',
-    '𧊥𧊥',
-    '𧊶𧊱',
-    '䖺䖺𧌁',
-    '𧍶𧊐',
-    '蠚𧍷𧍗𧊝',
-    '蚈蚈',
-    '蛔蜖𧍚',
-    '蜈蜈',
-    '蛾䖸𧒎',
-    '蛻蜕',
-    '蝸蜗',
-    '蚳𧏔𨑉𧋗𧐏𧏁',
-    '蛬𧌪𧋯𧏒𧊮',
-    '蛷𧋛𧒔',
-    '蜭蛿𧌤',
-    '蝣䖻𧌕',
-    '螇𧕉𧋉',
-    '螝𧏩𧊫',
-    '蟌𧋙蟌䗓',
-    '蛑𧋟䗋',
-    '蜐𧋤',
-    '𧋏𧋏',
-    '虱𧌡',
-    '蚪𧌟𧐵𧐝𧏆',
-    '蜥𧌨',
-    '蜘𧌲𧐉',
-    '蝶𧋞',
-    '蟈蝈',
-    '蟬蝉',
-    '蠅蝇',
-    '舕䗊',
-    '蚋蜹',
-    '蛢蛢𧏑',
-    '蛗䘀𧌛𧌓𧋰',
-    '蜮𧌒',
-    '蜞蜝',
-    '蜙𧌻',
-    '蜱𧌠𧓎',
-    '蝂𧌿',
-    '蜰𧌘',
-    '蝑𧌊𧌖𧌋',
-    '螿𧌜',
-    '䖦𪓭𧌑',
-    '𧋐𧌐',
-    '蜟蜟',
-    '蛹𧍛',
-    '蜓𧍿',
-    '蝌𧎗',
-    '蟀𧍓',
-    '蟒𧏉𧎔蠎',
-    '螻蝼',
-    '蚧𧎁',
-    '蚴𧍘',
-    '蝫蝫',
-    '蝒𧏈𧍹𧒪',
-    '蝭𧍝',
-    '蝥𧒚𧍟',
-    '蝹蝹',
-    '螽𧍸𧒟𧑸𧕠𧑄𧑬',
-    '蟗𧍾𧏋',
-    '蠈𧒿𧍡',
-    '蠑蝾',
-    '𧍢𧎘',
-    '𧍲𧍻',
-    '螋䗏',
-    '螲𧍱',
-    '𧐔䗑',
-    '蛆𧏏𧐅',
-    '螫𧐭𧏅',
-    '虴𧎩',
-    '蝡𧔇𧏦𧔀',
-    '螔𧏕𧓗',
-    '螯𩪋𩪨𧒥螯𩪕',
-    '蟣𧎶',
-    '𧏂𧏃𧏜',
-    '𧎵𧏨',
-    '䗜𧏓',
-    '𧐞𧎲',
-    '𧑚䗙',
-    '䗯𧎽',
-    '𧔞𧏐𧕜',
-    '蟆蟇䗫',
-    '蚰𧏿',
-    '蝮𧐛',
-    '螜𧐜𧐡',
-    '蟅𧐚䗪',
-    '螰𧐳',
-    '螹𧐮',
-    '蠨蟏蟰𧑛',
-    '蠰𧐀𧖗',
-    '蠮𧏽',
-    '鰿𧐐𩼜𩼱',
-    '鱄𧐕',
-    '𧈟䘌𧏾',
-    '𧉁𧐆',
-    '䗅𧐊',
-    '䖿蟍𧑇',
-    '𧐇螱𧕈',
-    '䗩𧐶',
-    '䗥𧐱',
-    '䗠𧐗',
-    '𧎾𧐑',
-    '𧐒𧐁',
-    '蜇𧑱𧑭',
-    '蛘𧒃𧓲',
-    '蛪𧑨',
-    '蟡蟡',
-    '螣𦢅𧑥𧑞𧔶𧖍',
-    '蟦𧑈',
-    '蟛蟚',
-    '蟠𧓙𧑪',
-    '蟴蟖',
-    '蟺蟮',
-    '蠵𧓈',
-    '蠾𧑏',
-    '蝩𧑆',
-    '𧍰𧑟',
-    '䗗䗗',
-    '𧐴𧑙𧑲',
-    '𧑀𧑳',
-    '𧒂𧑉',
-    '蜃𪓧𧒏',
-    '蠍𧔄𧒤𧓚𧕔',
-    '蟹蠏',
-    '蠟䗶',
-    '蝘𧒛𧓱',
-    '蟷𧒾𧒩',
-    '蟿𧒼',
-    '鼜𧒕𥀽𪔯',
-    '𧑗𧒫',
-    '𧒽𧒜',
-    '𧔂𧔵𧔃𧒡',
-    '蜻𧓔',
-    '蜚𧓊𧕿',
-    '螾𧓒',
-    '蟥𧓛',
-    '蠛䘊𧓡',
-    '蠥𧒣𧕏',
-    '𧒘𧔽𧓞',
-    '蛭𧓳',
-    '蚍𧔯𧔆𧖎𧖈',
-    '蠉𧔘',
-    '蠲𧔈',
-    '蠽𧕾𧓷',
-    '蟱𧓼',
-    '䗷𧔁𧕢',
-    '𧓬𧓾',
-    '䘋䘂',
-    '螟𧔲',
-    '囆𧔺',
-    '蜳𧔫',
-    '蜸䘆',
-    '䗃𧔢',
-    '𧎰𧔡𧖏',
-    '𧕲𧕣𧔰',
-    '蜨𧕊',
-    '螬𧖤𧕐',
-    '𧔠𧕆',
-    '蟝𧕎',
-    '𧕛𧕦',
-    '蠃𧕳',
-    '蠿𧖀',
-    '㤏𧖂',
-    '蟫𧖋',
-    '䗸𧖇',
-    '蟭𧖝',
-    '鱣𩽱䱳𧖞𩼼鳣',
-    '卹𨜧䘏賉𨟰',
-    '衁𧖭',
-    '衃𧖯',
-    '釁衅',
-    '喀䘔衉',
-    '脧䘒𧗔',
-    '𧖺𧖶',
-    '䘓𧗐𧗛𧗜𧖾𧗀',
-    '𧗁𧗊𧗃',
-    '沬靧𫖃𧗏頮𩒌',
-    '𧗇𧗒',
-    '衋𧗙𧗚',
-    '衍𧗠',
-    '軌𧗢𨑍𧗝䡄轨',
-    '衎𧗡',
-    '術𧗱',
-    '衒䝮𧗳',
-    '禦𧗻𢕥',
-    '㣤𧗸',
-    '衠衠',
-    '衢𧘆',
-    '衣衣',
-    '裔𧜟𧛨𧛲𧘯𧘉𧘊𧚞',
-    '襻𧘋𧘙𧘵鑻𧘬𧘒䙪',
-    '巾䘜',
-    '襯衬',
-    '衧𧘎',
-    '救𧘶',
-    '表𧘦𧞱𪊘𧘝𧜫𧘰𧞧𪊬',
-    '衷衷',
-    '袞衮𫋴𧟏䙛𧟗𧚹',
-    '襖袄',
-    '邪𨚌𧘪',
-    '衲衲',
-    '衯𧘠',
-    '衾𧙐𧘭',
-    '袡袇',
-    '袧𧘤𧙎',
-    '袾𧘣',
-    '褾𧟈𧝼𧘡',
-    '䘟𧘨',
-    '衸𧘷',
-    '𧝏𧛿𧙵𧘫',
-    '袖𧙏',
-    '袍𧙘',
-    '裝𧚒𧚌装𧙜',
-    '襲𧟛𧟟袭',
-    '袚𧙄袚',
-    '袟袠𧙍',
-    '裀𧙊𧛑',
-    '𧙧𧙧𧙒',
-    '𧙃𧙑',
-    '裂𧛯𧚲𧙷',
-    '褻亵䙝',
-    '襠裆',
-    '衽袵𧙨',
-    '袽䘫',
-    '裒裒',
-    '褢𧙪',
-    '袣𧙟',
-    '䘪䘪',
-    '䘣𧙁',
-    '𧙤𧙤',
-    '𧝊𧙢',
-    '襱𧙥',
-    '䠼𧙠',
-    '裁𧚶𧚝',
-    '裕䘱',
-    '褫裭𧜑𧚜',
-    '袤𧝺袤',
-    '裗裗',
-    '裞裞',
-    '裻𧚛',
-    '褳裢',
-    '襝裣',
-    '裓𧚑𧛠',
-    '䙄𧛳𧚎',
-    '裴裵',
-    '製𧚳',
-    '褒闁裦襃𧛙𧚱𧜯𧝾',
-    '褋𧚦𧝵',
-    '襁𧝿𧟂𧚴襁',
-    '褷𧚺',
-    '裉褃',
-    '袳𧚤',
-    '䘻䘻',
-    '𧚭𧚭',
-    '𧜥䘸',
-    '𧜣𧚮',
-    '䘶𧜄𧚼',
-    '褸褛',
-    '縿𧛡',
-    '褞褞',
-    '褰𧛓𧞼𧝱䙭',
-    '襋𧛘',
-    '㡚𧛥褠',
-    '𧛞𧛫',
-    '𧜅𧛪𧞔',
-    '䙕𧛝',
-    '䙡',
-    '幦𧜀',
-    '褑褤',
-    '褽𧜷𧛽',
-    '襛𧜆𧟒',
-    '𧘓𧜕',
-    '䙙𧛺𧞽',
-    '𧝸𧜇',
-    '𩱘𩱝䙐',
-    '複𧜰',
-    '裺裺',
-    '褅䙗𧝐',
-    '𧛒𧜬',
-    '𧛾𧜡',
-    '襊𧜱𧜮',
-    '䙦𧜩',
-    '襦𧞳𧝄',
-    '𢄺𧝈',
-    '袔𧝂',
-    '䙃𧝍',
-    '𧝑𧝣',
-    '襉襇𧟉',
-    '䙟𧝕𧝖',
-    '䙱𧜭',
-    '褐𧝶𧝽',
-    '裋𧞫𧞀',
-    '𧜈𧝻',
-    '䙣𧞁',
-    '𧟙䙥',
-    '緷𧞢',
-    '襜𧞟',
-    '㡥𧞎',
-    '褍𧞖',
-    '𧞕𧞙',
-    '𪗋𧞓',
-    '襳𧞬',
-    '䙔𧞨',
-    '䙘𧞰䙯',
-    '𧞐𧞗𧞮',
-    '襫𧞲',
-    '褵䙰',
-    '䌯䙮',
-    '襩𧟎',
-    '襬𧟍',
-    '襺𧟐𧟚',
-    '褿𧟔',
-    '衫𧟖',
-    '襴襽',
-    '襾覀',
-    '𠑹𧟣',
-    '覃𪉷𧟹𪉲𧟩𪉞',
-    '覆覄',
-    '見见',
-    '㝸覍',
-    '䙾𧠉𧠜𧠡',
-    '覓觅覔',
-    '規𧠺规𧠹',
-    '覝𧡠䙺',
-    '覎𧠐',
-    '覒𧠑',
-    '覽覧览',
-    '診𧧂𧦜𧭉𧠝诊',
-    '覕𧠣',
-    '𧠏𧠞',
-    '𧠠𧠟',
-    '覬觊',
-    '覛𧡒𧠨',
-    '𧠎𧠵',
-    '𧡬𧡆䚁',
-    '䙹𧠻',
-    '𧡸𧡀',
-    '𧡹䚃',
-    '睹覩',
-    '睨𧡎',
-    '覶覼𧡓',
-    '覿觌',
-    '䚅𧡛',
-    '䚐𧡐',
-    '𧢞𧡌',
-    '覦觎',
-    '眈𧡪',
-    '𧡨𧡭',
-    '賴赖𧡽𩓃頼𩓋賴',
-    '竀𧡧',
-    '覞𧡾𧡷',
-    '覲𩌶觐𧢚',
-    '閱阅閲𧢅',
-    '瞜𧢃',
-    '𧢆䚎',
-    '𧡋𧢏',
-    '𧢜𧢣𧢎',
-    '䚍𧢔',
-    '𩵀𩵂䚖䰱𧢥𩵁',
-    '𧢄𧢨',
-    '𧢦𧢫',
-    '性𧢱',
-    '角𧢲',
-    '䚘𧢴',
-    '䚗𧢸',
-    '𧣚䚥𧢺𧣏',
-    '觸𧥘𧢻',
-    '捔𧣀',
-    '觔𧣊',
-    '觝𧣜𧣎',
-    '觚𨠋𧣋𧣗',
-    '觶𧣄𧣨',
-    '𧣁𧣍',
-    '𧢾𧣐',
-    '𧢼𧣉',
-    '䚨𧢿𧣘𧤔',
-    '觷𧣔',
-    '鯀𩩌𧣙鮌鲧',
-    '觥觵𨠵𧣥',
-    '擉𧣫',
-    '䚙𧣰',
-    '𧣼𧣱',
-    '𧤕𧣮',
-    '觱𧥑𥷑𧥀𧤅',
-    '觿觹𧤪𧥁觽𧤢𧣽',
-    '𧣒𧣻',
-    '䚢𧤇𧤈',
-    '龣𪛓觮',
-    '觰𧤺𧤌',
-    '䚣𧤘',
-    '𦥐𧤡',
-    '𧤒𧤜',
-    '𧤗𧤬',
-    '䚦𧤫𧤧',
-    '䚩𧤦',
-    '𨢐𧤞',
-    '觪𧤱',
-    '𧣭𧤷',
-    '𧤲𧤶',
-    '觼𧤾',
-    '䚧𧥂',
-    '𧤏𧥄',
-    '蟕𧥕',
-    '𧥖𧥗',
-    '𧥙𧥚',
-    '詞䛐𧥝词',
-    '計计',
-    '訂订',
-    '訃讣',
-    '認认',
-    '譏讥',
-    '記记',
-    '訐讦',
-    '討讨',
-    '訌讧',
-    '訕䚲讪𧧚𧧪',
-    '訓𧥿𧥥训',
-    '訖𧥷讫',
-    '誇𧧳𧥢',
-    '誕诞𧥡𧩙',
-    '訏𧥦',
-    '訧𧥩',
-    '詷𧥧',
-    '訉𧥭',
-    '訮𧥪詽',
-    '訯訯',
-    '訪访',
-    '訝讶',
-    '訣诀𧦾',
-    '訥𧨣讷',
-    '許许',
-    '設设',
-    '訟𧧡讼䛦',
-    '訛讹',
-    '詩诗𧥳',
-    '誑诳𧪴䚾',
-    '諱讳',
-    '諷𧩠讽',
-    '講讲𧪿',
-    '謠謡谣䚺',
-    '呬𧦁',
-    '庀䚹',
-    '訰𧦏',
-    '訢䜣',
-    '誃䛂',
-    '諅𧥽𧬗',
-    '謳讴',
-    '䚮𧥰',
-    '𧥮𧥯',
-    '䚻𧦗𧦇',
-    '䛘䚾',
-    '評评',
-    '詁诂',
-    '詔诏',
-    '詐诈',
-    '訴𧦓𧩯𧦡',
-    '詬訽诟',
-    '譯译𧬳',
-    '辯𧦬䛒𨧕辩𧮀𧩵𧦪𧭿',
-    '呺𧦢',
-    '詎讵',
-    '詙詙',
-    '詗𧨝诇',
-    '詘诎𧬲',
-    '詒𧦫',
-    '謐䛑谧𧨨',
-    '謅𧩖诌',
-    '讋𧮩詟',
-    '㤖詝',
-    '詑𧪁𧦧',
-    '䛎䛎',
-    '𧦝𧦻',
-    '䛄𧩷𧧁',
-    '詫诧',
-    '該该',
-    '詳详',
-    '試试',
-    '詰诘',
-    '詼诙',
-    '詣诣',
-    '誠誠诚',
-    '誅诛',
-    '詭诡',
-    '詢𧪂询𧩛𧪱',
-    '詮詮诠',
-    '誣诬誈',
-    '說说𧧘説',
-    '誥诰𧧙𧧞',
-    '諍諍诤',
-    '謎谜詸䛧',
-    '錄𧧱録',
-    '喏𧧏',
-    '訹𧧐',
-    '詄𧧲',
-    '詈𧩥𧧧',
-    '誆诓',
-    '詿𧭬𧫉诖',
-    '詡𧩘诩',
-    '誄䛶𧧈诔',
-    '諛䛕',
-    '諢诨𧮘',
-    '𠱚𧧎',
-    '𧧨𧧇',
-    '詯𧩤䛛',
-    '䛗𧧰',
-    '𧨱𧧫',
-    '誦诵',
-    '語语',
-    '誡𧪖䛺诫',
-    '誚诮',
-    '誒诶',
-    '譀𧧴𧫫',
-    '鬩𩰕𧨃䦧阋',
-    '唊䛟',
-    '㖏𧨤𧨚',
-    '𡔢𧦂',
-    '𧥹𧧽',
-    '詨誟',
-    '詪𧨛',
-    '䛢䛢',
-    '誺𧨇',
-    '𧩮𧨠',
-    '𧫢𧨉𧭅',
-    '𧫥誝',
-    '唱誯𪛋',
-    '諒谅',
-    '談谈',
-    '請请',
-    '課课',
-    '諉诿',
-    '諂谄讇',
-    '調调',
-    '誰谁',
-    '諜谍𧩜𧨯',
-    '諾诺',
-    '謗𧩂谤',
-    '譜谱𧫭諩𧭘',
-    '訞𧨶',
-    '詀䛸',
-    '誶谇',
-    '諏𧩻𧩞诹',
-    '諑诼',
-    '諕𧫒𧬵𧩐',
-    '諀𧨬',
-    '諡𧨦',
-    '謥𧩟𧩪謥',
-    '讜谠𧭢譡𧩡',
-    '㖟䛵',
-    '詂𧨽',
-    '𧧆𧪲𧨮',
-    '䛭𧨫',
-    '謻𧩀',
-    '諦谛',
-    '諫谏諌',
-    '諧谐',
-    '諮谘',
-    '謁谒',
-    '謂𧬴谓',
-    '諭谕諭',
-    '謊谎',
-    '謝謝𧬄谢',
-    '讒䜛谗',
-    '諳𧫧𧩸谙',
-    '諶谌',
-    '諼谖',
-    '諞谝𧫲',
-    '譔𧩿',
-    '誁𧫮𧩱',
-    '𧧻𧩳',
-    '諹諹',
-    '䛽𧬿𧪗',
-    '𧩨𧩩',
-    '䜏䜔䜐𧩭',
-    '謙谦𧫨',
-    '謹謹谨𧭩',
-    '諰𧪳',
-    '謖谡',
-    '謕𧪥',
-    '𠹃𧪪',
-    '䛩𧪛',
-    '𧩼𧩼',
-    '𧩣譅䜀',
-    '𧪘𧭨𧪰𧭯',
-    '𧪜𧫋',
-    '謚谥𧫺',
-    '謉𧫏',
-    '𧬊𧬜𧪷',
-    '嗟𧫯𩬡𨲻',
-    '謬谬𧬶',
-    '速𧫷遬𧫣',
-    '詖𧫸',
-    '諆𧫠',
-    '謫𧬍讁谪',
-    '譇𧬅',
-    '譾謭𧬫',
-    '讄𧫖𧬀𧮢',
-    '䛠𧪧',
-    '𧧺𧫔',
-    '誱𧫰',
-    '謶𧭧𧫽',
-    '嘲謿',
-    '譚谭譚䜖',
-    '譎谲',
-    '諈𧬡',
-    '謘䜄',
-    '謈𧬉',
-    '謣譃',
-    '譖谮𧮂譛',
-    '譙谯',
-    '譅𧬃',
-    '讕谰𧬘',
-    '𧥼𧬞',
-    '諎𧬢',
-    '䜉𧬠',
-    '謺𧬓',
-    '譳𧬐',
-    '讈𧬎',
-    '警䜘',
-    '譴谴',
-    '謷𧭁',
-    '讞谳',
-    '𧧸𧭀',
-    '諣𧬭',
-    '譫谵',
-    '議𧭖',
-    '譺𧭐',
-    '讂讂',
-    '𧫕𧭂',
-    '䜈𧭄',
-    '譶𨑂𧭛',
-    '𧭟𧭋',
-    '讑𧭆',
-    '讖谶䜟',
-    '讚讃',
-    '䜕𧭡𧮇𧮚𧮏',
-    '譞𧭴',
-    '讗𧮄',
-    '讌䜩𧮃',
-    '䜋𧭾',
-    '譁𧮉',
-    '謍𧮆',
-    '讔𧮐',
-    '䜚𧮅',
-    '𧮓𧮊',
-    '誩𧮣',
-    '岈𧯋𧯓谺',
-    '谽𧮰𧮳𥓂',
-    '岫䜬',
-    '𧮶𧯁𧯂',
-    '䜰𧯌𧯔',
-    '䜱𧯐',
-    '𨽍豄',
-    '𢌔𧯙',
-    '壴𧯛',
-    '豉䜻䜵',
-    '𧯷𧯢',
-    '豍𧯪',
-    '豌𧯳',
-    '䜾𧯹',
-    '䜼𧯸',
-    '鼙𧯿',
-    '豊𧯽',
-    '䝃𧰁',
-    '𧯦𧰌',
-    '𣀊𧰋',
-    '䝁𧰉',
-    '𤃶𧰥',
-    '豕𧰬',
-    '豗䝇',
-    '豛𧱕𧰶',
-    '豞𧰴',
-    '𧱏豙',
-    '豜豣𧱚𧲀',
-    '豲𧱖𧱂',
-    '豤𪙲𧳢𧱗𧱟',
-    '豠𧱑',
-    '𧱓𧱎𧳑',
-    '䝋𧱍',
-    '𧰻𧱢',
-    '𧱝䝌',
-    '䝐𧲚𧱫𧲑𧱞',
-    '䝒𧱛',
-    '豥𧱱',
-    '豱豱',
-    '豶豮',
-    '豵𧱷𧲓',
-    '蹢豴',
-    '𧴄𧱿',
-    '橧𧲅',
-    '𧲜𧲉',
-    '豩𧲏',
-    '𧲍𧲎',
-    '豰𧲐',
-    '𧲝𧲔𢆈𧲞',
-    '㺣𧲘',
-    '獾貛䝔',
-    '䭷𧲢',
-    '豽豽',
-    '狐𧲲',
-    '貊貃',
-    '𧳂𧲶',
-    '𤝻𧳁',
-    '𧱁𧳆',
-    '𧲨𧲨',
-    '豿𧲿',
-    '狻𪊴䝜',
-    '豻貋',
-    '貆𧳔',
-    '猗䝝',
-    '猊貎',
-    '貏𧳴𧳠',
-    '𧱙𧳛',
-    '𧳟𧳥',
-    '䝟𧳳',
-    '猼𧳵',
-    '獂䝠',
-    '獑𧴃𪖎',
-    '貍𧴔',
-    '𤢌𧴐',
-    '𧴂𧴟',
-    '貝贝𪚾',
-    '負负',
-    '貢贡',
-    '貣𧴮',
-    '𧴪𧴲',
-    '玩貦',
-    '責𧵩责𧶌',
-    '貯𧵒贮',
-    '貿贸𧵲𧵍𧶻𧴵',
-    '賒𧴳賒𧶟賖赊𧶗',
-    '賢贒䝨贤',
-    '質质貭𫎘',
-    '購𧶥𧸊购',
-    '蚆𧵅',
-    '貾𧵇',
-    '貰𧴹贳𧶚',
-    '貼贴',
-    '貽贻䞅',
-    '賁贲賁',
-    '費费',
-    '賀贺',
-    '賤贱𧶤賎',
-    '賬𧹔账',
-    '頂𧵜𩠑𩒆𩕢𩕩顶',
-    '貺贶𧵮𧵦',
-    '資資𣣬资𧷕𪗑',
-    '賈贾',
-    '賃赁',
-    '賂赂𧸚',
-    '賅赅',
-    '賦𧵐赋𧶣䝾𧷲',
-    '贓赃賍𧷢贜',
-    '贄贽',
-    '贐赆䝲',
-    '䞈𧵥',
-    '䨈𧵯',
-    '背𧶙',
-    '賄𧶅',
-    '賑赈',
-    '賚𧷖𧶛赉𧶘',
-    '𦛖𧶋',
-    '䞆𧶈𧷣',
-    '䞊賐𧸥',
-    '賠赔',
-    '賞赏',
-    '賭赌𧶴',
-    '賜𧶽赐',
-    '贊赞賛',
-    '贖赎𧹎',
-    '宓𧶡',
-    '蜠𧶞',
-    '賙赒',
-    '賨賩𧹆',
-    '賡赓',
-    '販𧶶',
-    '甖𧶹',
-    '賮𧷇',
-    '䝪𧶳',
-    '䝰𧶱',
-    '𧵣賯',
-    '賝𧷉',
-    '𧶵𧷊',
-    '𧷧𧷄',
-    '賺𧸖赚',
-    '贅赘𧸞贅𧸆𧷌',
-    '賻赙',
-    '䞃䞃',
-    '𧷏𧷗𧸇',
-    '贙𧷠𧹂',
-    '贈𧸑赠',
-    '遺𨗮𧸃遗𨗭𧸯𨗔𧸽𨗭',
-    '贆𧷼',
-    '贇𧸔',
-    '䞂𧸀',
-    '贏赢贏',
-    '贍𩟋𧸸',
-    '贕𧸷',
-    '贎𧹇𨲴𧸱',
-    '𧸿𧸹',
-    '贛赣𩑅𧹉贛𧹄',
-    '嚫䞋',
-    '𧸅𧹀',
-    '赨𧹝',
-    '䞔𧹧',
-    '𧹲𧹷',
-    '䞕𧹸',
-    '赳𧺇﨣𧺈',
-    '趙赵',
-    '踤𧺒',
-    '趉䞷𧺙𧺖𧺐',
-    '遲𨒈遟赿迟遅',
-    '趑赼',
-    '䞘𧺞',
-    '趆𧻎𧺦',
-    '趨趋𧼜𧻫',
-    '跇𧽁𧿱𧼪𧺿𨒧𧻸',
-    '𧻀𧼳𧻧䞣',
-    '𧼏𧺻',
-    '跬𨇪䞨',
-    '赹𧻛',
-    '𧻶𧻑',
-    '𨀕𧻔',
-    '透䞬',
-    '趄𧻾𧼀𧽀',
-    '踊𧻹',
-    '踣𧽴䞸𧻳䞳',
-    '赽𧻯',
-    '𧻚𧼉',
-    '趗𧻻',
-    '䟄䞰',
-    '踖趞𨅦𧾀',
-    '䞚𧼘',
-    '𧻕𧼕',
-    '趢趢',
-    '䞾𧼥',
-    '𧽸𧼞',
-    '䟒𧼚',
-    '𢔥𧼫',
-    '㨄𠠄',
-    '𧻓𧼲',
-    '𧻙𧼟',
-    '𧼯𧼯',
-    '猭𧽪',
-    '趪趪',
-    '蹡𧽩',
-    '𧼒𧽡',
-    '䟅𧽯',
-    '𧾢𧽳𧽭䟌',
-    '䟂𧾈',
-    '䟃𧾋',
-    '𧽶𧽶',
-    '趛𧾏',
-    '𧾁𧾓',
-    '趯𧾟䢰',
-    '䟈𧾞',
-    '𧾩𧾝',
-    '趲䟎趱',
-    '䟍𧾫',
-    '𧽾𧾬',
-    '𧽤𨅟𧾴𨄏',
-    '𧾻𧾹𧿀',
-    '趾䟖',
-    '躉趸',
-    '刖𧿁跀',
-    '踑𧿄䟚',
-    '骭𧿂',
-    '趶𧿉',
-    '跋跋䟦𧿡',
-    '蹂𧿪',
-    '蹤踨𧿛踪',
-    '躍跃',
-    '躡蹑𧿜',
-    '跗𨁵𧿤',
-    '跅𨂫𧿧',
-    '跫𧿖',
-    '躕䟞𨅒蹰',
-    '陞𧿘阩𨁠',
-    '䟘𧿦',
-    '𧿯𧿓',
-    '䟡𧿟𧿠',
-    '𨀥𧿞',
-    '跎𧿶',
-    '跚𨀢跚',
-    '跑𨀓',
-    '踐践',
-    '趹𨀆',
-    '跈䟢',
-    '蹍𨃨𧿸',
-    '髳䟥𨱨',
-    '跡𨒏䟱迹𨒪',
-    '跺跥',
-    '蹄𨂶𨀭蹏𨄪',
-    '踱𨀟',
-    '蹺跷',
-    '趼趼',
-    '跘𨀷',
-    '跐𧿿',
-    '跧跧',
-    '踧𨀚𨁕',
-    '𧻘𨀦',
-    '跳𨁓𨃜',
-    '躊踌𨅡',
-    '迒𨁈䢚',
-    '䠅𨁉',
-    '蹈𨂆𨂻',
-    '躂𨂧𨂛𨂨',
-    '剕𨅥䠊',
-    '跰跰',
-    '蹀𨁻𨅈𨂏',
-    '蹠𨂂',
-    '𨂜𨂑',
-    '𨃘𨂓',
-    '踴𨃒𨂹',
-    '躑踯躑',
-    '趥䠓',
-    '跱𨃉',
-    '遯𨘭踲',
-    '髂𩩱𨂥',
-    '腿蹆骽',
-    '蹣蹒',
-    '跿𨃝',
-    '踼𨃠𨄆𨆉',
-    '蹻𨃧',
-    '蹶蹷𨇙𨇭𨇮𨄬',
-    '躅𨄃𨅛䠱',
-    '踒𨄖',
-    '蹗𨄭',
-    '蹩䠥',
-    '腨𨄔',
-    '趩𨅜',
-    '䠑𨅆',
-    '䠟𨄧',
-    '𨅎𨄒',
-    '踏𨅵𨅍𨆀',
-    '躁𨅶',
-    '吪𨅌',
-    '蹚𨅨',
-    '蹴𨉌蹵',
-    '蹳𨅢',
-    '䎡𨅲',
-    '䟼𨖴𨅐',
-    '𨅔𨅕',
-    '䠨𨅧',
-    '𨆊𨅘',
-    '蹋𨆚',
-    '獧𨆈',
-    '跙𨆄',
-    '躄躃',
-    '躓𨆑',
-    '躐𨆍',
-    '蹼𨆯',
-    '躪躏',
-    '蹸𨆴躙',
-    '躖𨇰䠪',
-    '躠𨇨𨆳',
-    '𨅊𨇂',
-    '䠫䠫',
-    '蹉𨇏𩥙',
-    '蹐𨇋',
-    '躦𨇃',
-    '蹪𨇚',
-    '𨇆䠭',
-    '蹇䮿𨇥',
-    '踡䠰𨃪',
-    '𨇝𨇲',
-    '蹁𨇱',
-    '蹎𨈃',
-    '䠯𨈋𨈅',
-    '𨊍𨈠𨈔𨊗',
-    '肢𨈪𨈛𩨵',
-    '軀躯𨈬',
-    '躿𨈢',
-    '聆䠲',
-    '跛𨈵',
-    '躬躳𨈴',
-    '體𩪆躰軆𨉦骵',
-    '躲𩒜躱',
-    '䠸𨉀',
-    '𨈚𨉊𨉮𨉉',
-    '軇𨉔',
-    '軉𨉗',
-    '躴𨉰',
-    '軟软𨉿',
-    '軋轧',
-    '軓𨊠',
-    '軎轊𨊪𨊢𨎥䡺',
-    '軒𩋱轩𨍓',
-    '軔軔轫',
-    '軘𨊯',
-    '軵𨍷𨊶𨊭',
-    '釭𨊧𨋷',
-    '較䡈较',
-    '輪轮',
-    '輿𨏮舆𨊮',
-    '轉转転',
-    '轟𨋌轰',
-    '軏䡇',
-    '軑軚',
-    '軥𨊵',
-    '軧𨋆𨌮𨋇',
-    '轤轳䡎',
-    '鞃䩑䡌䡏𩉦',
-    '軜軜𨌣',
-    '軩𨊺',
-    '𩉥𨌉𨊼',
-    '軻轲',
-    '軸轴𨌇',
-    '軼轶',
-    '輩辈軰',
-    '軷軷',
-    '軺轺𨍳',
-    '軫𨏤𨋎𨋏',
-    '軬𨋒輽',
-    '轢轹𨏬𨍮',
-    '硨𨋓',
-    '軲轱',
-    '軤轷',
-    '䡕𨋬𨍗𨌱',
-    '䡘䡒',
-    '䡰𨋔𨎁',
-    '軾轼',
-    '輕䡖𨓷𨌷',
-    '轎𨎄轿',
-    '輅辂𨎲𨍇',
-    '輇輇',
-    '輹𨋩𨎙𨌥𨏟',
-    '鞎𩊷𨋨',
-    '軖𨌃𨋶𨌂',
-    '䡗䡗',
-    '𨌅䡨𨍁𨏇𨍃𨎯𨋿',
-    '𨌴𨋱',
-    '𨎩輄',
-    '輒辄輙',
-    '輓𬨈𨌔',
-    '輛辆輌',
-    '輯𨍣𨎵𨌖辑',
-    '輗𨌊𨌵',
-    '輶輏',
-    '𨋖𨌡',
-    '䡔𨌋',
-    '𨍖𨌞',
-    '輍𨌯',
-    '䡚𨌓',
-    '𨋜𨌌',
-    '輟𨌸辍',
-    '輦𨘧𨍻辇𨘪',
-    '輜輺𨎜辎𨎏𨍟',
-    '軿輧𨍍',
-    '輥辊',
-    '輷𩧕𨌨',
-    '轆𨌠辘𨏔',
-    '䡟𨌦',
-    '𨍌𨌲',
-    '𨍴𨌩𨎋𨎖',
-    '䡯𨌪䡯',
-    '䡮𨌰',
-    '輻辐',
-    '輸輸',
-    '轂𨍔毂',
-    '輠𨍋',
-    '輳辏',
-    '轀輼',
-    '𨋛𨍠',
-    '𨍈𨍉',
-    '轄𩏓辖',
-    '轅辕',
-    '韜𩊹轁𩏋韬鞱',
-    '輬𨎅',
-    '轃𨍬',
-    '䡆䡥',
-    '䡞𨍯',
-    '𨍿𨍺',
-    '𨏈𨍪',
-    '𩌏𨍭',
-    '轗𨎕',
-    '轍𨏣𨏁辙',
-    '轔𨏏辚',
-    '輀𨎪',
-    '轒𨎨𨎾',
-    '𨎭𨎱',
-    '鐗锏鐧𨎫',
-    '𨍩𨎧𨏰',
-    '䡣𨏂',
-    '𨎹𨎺𨏸',
-    '轈𨏋',
-    '轞𨏊',
-    '轘𨏙',
-    '䡫𨏕',
-    '𨏪𨏓',
-    '䡽𨏘',
-    '𨏵𨏝𨐂',
-    '轙𨏢',
-    '𨏴𨏴',
-    '軨䡼䡿',
-    '𨏒𨏲',
-    '𨏩𨏩',
-    '轣𨏽',
-    '䡾𨏾',
-    '輈𨏺',
-    '辛𨐌',
-    '𨐘𨐖',
-    '辣辢𨐜',
-    '䢃𠮃',
-    '𨐨𨐢',
-    '枱𨐠',
-    '𤒞𨐹𤐮',
-    '枲䢄',
-    '迄𨑐𨑵',
-    '䭀𨑏𩛓',
-    '迂迃𨑛',
-    '迅𨑙𨑷',
-    '遊逰𨔼䢊',
-    '過𨒵𨓺过',
-    '邁𨙚迈',
-    '迍𨑞',
-    '廷𨑲',
-    '徐𨑦',
-    '述𫐠䢤',
-    '這这',
-    '連𨘑连',
-    '違违',
-    '迣𨑬𨓄',
-    '达迏',
-    '迎𨒖',
-    '迭迭𨒔',
-    '逃𨓱迯𨓖𨒯',
-    '邇𨒛迩',
-    '迤迱',
-    '遄𨖺𨒎𨖇',
-    '䠜𨒆',
-    '𨑩𨒝',
-    '庭𨓀',
-    '迷𨒲',
-    '遜逊遜',
-    '𧺼𨒤',
-    '遙𨗽𨖈遥𨓧',
-    '遞递逓𨓝',
-    '适𨓈',
-    '遒逎',
-    '逖逷',
-    '逮𨗻𪮦𨓻',
-    '遂𨔱𨓸𨔲',
-    '邏逻',
-    '迸𨔧逬',
-    '迾𨔭𨔜',
-    '𠷉𨔗',
-    '逳逳',
-    '𨓲𨔃',
-    '䢡𨔋𨓫',
-    '赴𨕍',
-    '運𨔪',
-    '達𨔬𨖫逹',
-    '選𨕖',
-    '還𨖞𨕔𨘣',
-    '隨䢫随遀𨼕',
-    '遻𨕓𨕣',
-    '㣭𨔩',
-    '遫𨔤',
-    '遨𨗯遨',
-    '迮𨕠',
-    '逋𨗗𨕝',
-    '𨕛𨕨',
-    '遮𨖥𨖓',
-    '遴䢯𨖉𨗄',
-    '邀𨖟',
-    '霆𨗒𪪲𨖝𩄫',
-    '橇䢪𩌚',
-    '進𨗃𨙟',
-    '適𨗁',
-    '遭𨙠𨘜𨗐',
-    '遛𨖻',
-    '逪𨗀',
-    '𨖏𨗋',
-    '遪𨗘',
-    '邈𨘅𨘷𨙁',
-    '𢕻𨗧',
-    '遱𨘠',
-    '邋邋',
-    '𨘂𨘮',
-    '邍𨙅',
-    '𨙂邎𨙃',
-    '逭𩁧𨙕',
-    '䢱𨙜',
-    '靉𨙤',
-    '𨙔𨙦',
-    '鷸𨙧鹬𪈄',
-    '苑𨙨',
-    '邘𨙱',
-    '邔邔',
-    '鄺鄺邝',
-    '𨚴邚',
-    '邸䣌𨚏𨚎',
-    '邱𨛆𨚬𨚑',
-    '邶𨚍',
-    '郢𨙼',
-    '鄖䢵',
-    '邩𨚊𨚋',
-    '𨙸𨙾',
-    '𨙹𨚒',
-    '鄒邹𨛃𨛄',
-    '邯𨚠',
-    '郈𨚨',
-    '鄔邬',
-    '鄪𨚭',
-    '𨙷𨚢',
-    '郀𨚛𨜆',
-    '邢郉',
-    '邵𨚷',
-    '都𨟞𨜁𨛷𨚼𨛨𨜞',
-    '鄭𨞀郑',
-    '姺䢾',
-    '邽郌',
-    '邿邿',
-    '郘郘',
-    '鄆郓',
-    '鄶𨞡鄶郐',
-    '𨚶𨛻𨚽',
-    '𨹌𨛇',
-    '𨝳𨚖',
-    '郎郞𨝥',
-    '郡𨛦',
-    '邳𨛧',
-    '郲𬩾',
-    '酈𨟫𨜥郦',
-    '邮𨛕',
-    '𨚵𨛚',
-    '𨚳𨛞',
-    '䣂𨛙',
-    '𨛤𨛛',
-    '部郶',
-    '敧𨜅',
-    '郱郱',
-    '郜𨜋',
-    '鄠𨛸',
-    '鄲郸𨞏',
-    '䣊䣣𨜂',
-    '𨜷𨜤𨜃',
-    '郵𨜲𨜚𨞄',
-    '郇𨜬𨝁',
-    '郠𨜦',
-    '郹𨜯',
-    '鄋𨜛',
-    '邼𨝇',
-    '𨜒𨜣',
-    '𨜴𨝕𨜨𨞨',
-    '鄑𨝶鄑𨟕',
-    '䣕䣖',
-    '䣔𨝉',
-    '郖𨜹',
-    '鄡鄥',
-    '鄮𨞆𨞝𨞵𨝤',
-    '𨜿𨝡',
-    '𨝌𨝝',
-    '𨝋𨝠',
-    '𨟃𨝔',
-    '鄂𨞍䣞𨟨',
-    '郯𨞇',
-    '鄄𨞉',
-    '郿𨞅',
-    '鄝𨝷',
-    '鄯鄯',
-    '鄦𨝬',
-    '酄𨞂𨽧',
-    '𨛳䣟䣠',
-    '鄧鄧',
-    '鄸𨟁鄸𨞯',
-    '酃𨟯𨞖',
-    '酆鄷',
-    '䢹𨞙',
-    '𨞚𨞞',
-    '鄛鄛',
-    '䣘𨞱𨟐',
-    '𨟏𨞴',
-    '鄜𨟤𨞻',
-    '鄤𨞼𨟔',
-    '鄩𨟈',
-    '酅𨟎',
-    '酇鄼',
-    '𨛫𨟀',
-    '𨟅𨟄',
-    '𨝸𨟜𨟣𨟬',
-    '𨟑𨟟',
-    '𨛶𨟢',
-    '𨝍𨟦',
-    '𨟠䣤',
-    '𨟵䣥',
-    '醇䣩𨣳䣨𨣶醕',
-    '黓䣧',
-    '𨠍𨟲',
-    '酒𨠆𨠊',
-    '醉酔',
-    '醞醖酝',
-    '湎𨟺䤄𨡞𩈳',
-    '酖𨠁',
-    '醅𨟷𨡋',
-    '醐𨠀𨠂𨡷',
-    '䣬𨟶',
-    '𨠦𨟿𨠈',
-    '䴚𨟼𪉛𪉡',
-    '酗䣱𨠮䣴',
-    '粕𨠘',
-    '酢酢',
-    '醍𨠏',
-    '醽𨠎𨤀𨤍𨣖',
-    '䣪𨠓',
-    '䣮䣮',
-    '𨠒䣲𨠢',
-    '䤉𨠔',
-    '醠𨠗',
-    '酬酧𨠩𨢫醻',
-    '䣵䤊𨠧',
-    '䣹𨠰',
-    '酫酫',
-    '酵𨣑𨢀𨡆',
-    '釀酿',
-    '酨𨠾',
-    '醚𨡅',
-    '釅酽',
-    '醁醁',
-    '醓𨡍',
-    '醑𨢺𨡠',
-    '䣿𨡖',
-    '𨡎𨡣',
-    '醏醏',
-    '𨢡𨡕',
-    '醜𩳺𨢄魗',
-    '食𩚁𠋑𢻘𩚀𠊊𨢁𩚃',
-    '酏𨡪',
-    '醙䤇',
-    '醯𨤅䤈醯𨣓𩱗',
-    '醱𨡩',
-    '𨢋𨢤𣫈',
-    '𨢨𨣭𨣼𨡮',
-    '𨣘𨡵',
-    '醫𨢒',
-    '餡馅𨢝',
-    '醝𨣣𨢚',
-    '䤏𨢙',
-    '䤓𨢊',
-    '莤𨣡𨢲',
-    '䣽𨢱𨢰',
-    '醘𨢸',
-    '𨢦𨢦',
-    '䤍𨢥',
-    '酸𨢽𨣪',
-    '醋𨣋',
-    '醹𨢾',
-    '𨣁𨣁',
-    '醳𨣠',
-    '𪊄𨣝',
-    '䤘𨣲',
-    '䤙𨣰',
-    '𨢌𨣷',
-    '醺𨤁',
-    '醾醾𨣿醿釄',
-    '醲𨤉',
-    '醰𨤌',
-    '釋释',
-    '絭𨤙',
-    '𤳖𤳛',
-    '量𨤦𣊹𨤥',
-    '金𨥀𨥄𨤾',
-    '釔钇',
-    '釘钉',
-    '針针',
-    '釗钊',
-    '釵钗𨥁',
-    '釕钌',
-    '釙钋',
-    '釣鈟钓',
-    '釧钏',
-    '鈍䤜钝',
-    '釩钒',
-    '釤䥇钐鐥',
-    '鋩釯铓',
-    '鍆钔',
-    '鍚钖',
-    '釷钍',
-    '鋬𨥃',
-    '舒𨥤',
-    '鈔钞',
-    '鈣钙',
-    '鈉钠',
-    '鈞钧銞𨥒銁',
-    '鈐𨥩钤',
-    '鉤鈎',
-    '鋼钢',
-    '鑰钥',
-    '釳𨥊',
-    '鈁钫',
-    '鈥钬',
-    '鈦钛',
-    '鈀钯',
-    '鈒鈒',
-    '鉹𨥌',
-    '銎𨥍𨩹𨥲銎𨧎𨥢',
-    '鋇钡',
-    '鏦䤸𨦱𨥎',
-    '杽𨥋',
-    '鈄钭𨥪',
-    '鈧钪',
-    '鈂䤟',
-    '鈗䤞',
-    '銋鈓',
-    '鈷钴',
-    '鉗钳',
-    '鈸鈸𬫆钹',
-    '鉀钾',
-    '鈾铀',
-    '鉛铅',
-    '鉋𨥹',
-    '鉑铂',
-    '鈴铃',
-    '鎢钨',
-    '鎮鎭𨥵镇𨦸',
-    '鐵𨭓䥫𨬿铁𨮯𨫓',
-    '鐸铎',
-    '鑒鉴鍳',
-    '鑽𨉖钻鑚',
-    '釱鉪',
-    '鈌𨥻',
-    '鉈铊𨧯',
-    '鈰铈',
-    '鉉铉',
-    '鉍铋',
-    '鈺钰',
-    '鉦钲',
-    '鈳钶',
-    '鉞䤦钺𨬓',
-    '鈮铌',
-    '鈹铍鉟',
-    '鉭钽',
-    '鉬钼',
-    '鈿钿䥖𨰎',
-    '鉚铆',
-    '鋄𨥧𨬄錽䥑𨧴𨩵鎫',
-    '釲鈻',
-    '銏銏',
-    '𨥦𨥳𨧬',
-    '鏺𨨻𨫁',
-    '鉸铰',
-    '銬铐',
-    '銀银𨧏',
-    '銅铜',
-    '銘铭',
-    '銖铢',
-    '鉻铬',
-    '鋁鋁铝',
-    '銳锐𨦣鋭',
-    '鋒锋鎽𨦟鏠',
-    '錚铮',
-    '鐃铙',
-    '鐺铛',
-    '鑾銮',
-    '釽𨦝',
-    '銃銃铳',
-    '銨铵',
-    '銥铱',
-    '鉶𨦿𨦕䤯铏',
-    '鉺铒',
-    '銠铑',
-    '銪铕',
-    '銦铟',
-    '銑铣',
-    '銫铯',
-    '鉿铪',
-    '銣铷',
-    '鋏铗',
-    '鋘鋘鋘',
-    '鋗鋗',
-    '鍘铡𨰉',
-    '鎧铠',
-    '鎩𨨽鎩铩𨭝𨦅',
-    '鏵铧𨫽',
-    '銱铞',
-    '銩铥',
-    '銐𨦙𨧳',
-    '鋅锌',
-    '銻锑',
-    '鋤锄',
-    '銼锉',
-    '鎖鏁锁鎻',
-    '鏗铿',
-    '鏽锈鏥銹',
-    '銛𨨱銽',
-    '銍𨫐𨧓',
-    '鋃锒',
-    '鋱铽',
-    '鋟锓',
-    '鋰锂',
-    '鋝䤣𨫏鋢',
-    '鋌铤',
-    '鋯锆',
-    '鋨锇',
-    '錸铼',
-    '鏐𩗩𨦰',
-    '鑱䤫',
-    '釾鋣鎁',
-    '鈠𨦯',
-    '鉣𨦲𨧶',
-    '鋦𨧙𨦴锔',
-    '鋥锃',
-    '銴𨦬',
-    '鋚𨦷',
-    '𨧾𨧾𨨭',
-    '鐒铹',
-    '鑗錅鋫鏫𨬏',
-    '錠锭',
-    '鋸锯',
-    '錳锰',
-    '錯错䥘',
-    '錐锥',
-    '錨锚',
-    '鍊錬',
-    '錘𨭇𨫻𨪼锤',
-    '鑼锣',
-    '剚𨧫',
-    '鉥錰',
-    '鉼鉼',
-    '錏𨨙鐚',
-    '鍺锗',
-    '錛锛',
-    '錒锕',
-    '錕锟',
-    '錮锢',
-    '錁锞',
-    '錙鍿锱',
-    '鏨錾',
-    '鑕锧',
-    '𨧛𨨚',
-    '𨨮䥸𨧮',
-    '𨧨𨧨',
-    '𨧦錃',
-    '鍱𨧲𨬘',
-    '鍩锘鍩',
-    '鍍镀',
-    '鎂镁',
-    '鍵𨭙𨵭键',
-    '鏤𨩐',
-    '戣鍨',
-    '鉠鍈',
-    '鎡镃',
-    '鍤锸',
-    '鍇锴',
-    '鍶锶',
-    '鍔锷𨫘',
-    '鍑鍢𨫙',
-    '鍪𨩺䥐',
-    '鎪䤹',
-    '鐨镄',
-    '𥍻䤷',
-    '鉎鍟',
-    '錉鍲',
-    '䥀𨩪',
-    '鏓鏓鍯𨬃',
-    '鏶鍓',
-    '鐭𨩬',
-    '䥰𨨸',
-    '鎊镑',
-    '鎳镍',
-    '鍠𨪽',
-    '鎏鎏',
-    '鎵镓',
-    '鎬镐',
-    '鎰镒',
-    '鎘镉',
-    '鎦镏',
-    '鏊𨪠𨮽',
-    '鐫镌𨷫鎸',
-    '鑌镔𨮘',
-    '鑷镊',
-    '钂镋',
-    '䤬𨪍',
-    '䤴䥁',
-    '𨨰𨪳',
-    '鍣𨪓',
-    '鎐鎐',
-    '鏅鏅',
-    '鑙𨪴',
-    '鏡鏡镜',
-    '鏑𨬙镝',
-    '鏜镗',
-    '鏝镘𨭜',
-    '鏢𨰐镖',
-    '錆䥊',
-    '鏞镛',
-    '鏂𨫕',
-    '鐋𨫖',
-    '鐶𨫑镮',
-    '鋿鑜鏛',
-    '𨫔𨬝𨫦',
-    '鐅䥕',
-    '鎒鐞',
-    '鏹镪鏹',
-    '鐓鐜镦𨰩𨰮𨰯',
-    '鐠镨',
-    '鐕鐕',
-    '鐐镣𨭼',
-    '鐙𨮴𨭕镫',
-    '鏷镤𨮓',
-    '鑐𨬗',
-    '鑭钄镧',
-    '𨪗𨬎',
-    '𨬐鐝',
-    '鑹镩𨭾',
-    '䭘鐛䭗',
-    '鏍𨰊𨭞𨰠',
-    '鐮镰',
-    '鐳镭',
-    '鐲镯',
-    '鑣镳𨯄𨮄䮽𩍶',
-    '鍐鑁',
-    '鎌䥥',
-    '鎚𨮀',
-    '鏚𨭟',
-    '鐿镱',
-    '鑊镬𨯟',
-    '钀𨭹',
-    '鐴鐾',
-    '櫡𨮿',
-    '鑋𨮫',
-    '鑮䥬',
-    '𠠁䥪',
-    '鑔镲',
-    '䥨䥨',
-    '鑯𨯒',
-    '鑘𨯔',
-    '鑑𨰲鑬',
-    '錞𨯢',
-    '䥏𨯣',
-    '鑈𨯡',
-    '𨮒𨯠',
-    '鑲镶',
-    '䥝𨰅',
-    '戵鑺',
-    '𨦂𨰋',
-    '鉵𨰍',
-    '鍧𨰌',
-    '䥯𨰟',
-    '钁䦆',
-    '鐔𨰳',
-    '髦𩫷𨱞𨱢',
-    '鬆𨱛',
-    '髡髨𨱤髠',
-    '镺𨱩',
-    '镻𨱷',
-    '䦊𩭑𨲂',
-    '𨱵𨱶',
-    '鬐𨲘',
-    '鬘𨲛𨲾䰋䯶𩭈𩮒𩮺𩮉𩦧',
-    '鬉𨲔𩭤',
-    '鼞𨲗',
-    '髭𨲝𩑽頾𨲦頿',
-    '𨲋𩔾𨲥𩭧',
-    '䦋𨲶',
-    '鬢鬓𩯭鬂髩𨲺',
-    '镾𨲼',
-    '鬤𨳃',
-    '䰖𨳄𩯳',
-    '𨳁𨳅',
-    '門门閅',
-    '閃闪',
-    '𨳌𨳏',
-    '閉𨳰闭𨳓閇𨳯',
-    '闖闯𨶻',
-    '𨴖𨳖',
-    '閔闵',
-    '開開𨶷𨴆𫔭𨶘𨳩𨴂𨴉𨵹𨵑',
-    '閑閖闲',
-    '間间',
-    '閒𫔮',
-    '闈𨵾闱',
-    '闢𨳥𨵓',
-    '鬥閗闘鬦𩰖𫔡𨷖鬭𩰒𧯞𩰚𫔯鬬鬪𩰑𨷵',
-    '𩰎𨳮',
-    '祐𨳾',
-    '閘闸',
-    '關𫔢𬮦関𨶚𨳹𨷀𨵿闗',
-    '闡𨴁閳𨴝阐',
-    '閛䦕𨳵䦕',
-    '䦵𨳴',
-    '𨷰閝',
-    '閡阂𨴢',
-    '閨闺',
-    '閩闽',
-    '閣阁',
-    '閥阀',
-    '閭閭闾',
-    '闓闿',
-    '閦𨴳𨴠𨴟',
-    '閻𨴫𨵻𨶒阎𨵁𨵀',
-    '郚𨵒䦜',
-    '閬阆𨶈',
-    '閫阃',
-    '闃𨶑𨵙𨵢閴',
-    '闕𨴸𨷂阙𨵗',
-    '闥闼',
-    '鬮阄䰗𨵜',
-    '闌阑䦨',
-    '閼阏',
-    '閾𨵨阈',
-    '閹阉',
-    '閿阌',
-    '閽阍𨵽',
-    '闅䦩',
-    '𨵅𨵌',
-    '闋阕',
-    '闔阖𨵵𨵯𨶩𨵲',
-    '閶阊',
-    '𡨽𨵥',
-    '𨴒䦬',
-    '𨵤𨵎',
-    '闐阗',
-    '閵𨶄',
-    '䦯䦯',
-    '誾𨶡',
-    '闞𨶞阚',
-    '闉𨶾𨶴',
-    '闚𨶳',
-    '𨵧䦱',
-    '䦱𨷕',
-    '𩰗𩰝𨷚',
-    '闤𨷤',
-    '闠𨷪',
-    '𨷓𨷳',
-    '𨷱𨷸',
-    '𩰟𨷹𩰏𩰜',
-    '隊队',
-    '阮𨸘',
-    '扞𨸗',
-    '序䦽',
-    '陡𨺗阧',
-    '嶺阾',
-    '陳陈𨸬𨻰',
-    '隴𨼨隴陇',
-    '陘𨺄陉𨹢',
-    '𨹸䧂',
-    '限𨹎',
-    '陝𨹊',
-    '陶𨺃𨹋',
-    '垝陒𨹣',
-    '䧎𨹆',
-    '孵𨹴',
-    '陋𨹟',
-    '陵𨻪𨻎𨹧䧙',
-    '陷𨺂陥𨺻䧟',
-    '隉陧',
-    '𨛋䧉',
-    '砰𨺀',
-    '隅𨺁',
-    '昇陹',
-    '鄢𨺆𨽑',
-    '陲𨼦𨺪',
-    '鄬䧦䧦',
-    '陜陿',
-    '隈𨺯',
-    '𠳋𨺫',
-    '䦼𨼱𨺤',
-    '阭𨺥',
-    '塘䧜',
-    '陪𨻓',
-    '鄗䧚',
-    '陫𨻃',
-    '隰𨻽𨻋𨻿𨻸',
-    '𨻈𨻨',
-    '隘𨽪𨻹',
-    '隱𨼆隠',
-    '鄟䧠',
-    '𨻌𨻾',
-    '壕𨼍䧫',
-    '磴隥',
-    '䧨𨼙',
-    '隓𨼰',
-    '陑隭',
-    '陬𨽁',
-    '騭隲𨽥',
-    '䧤𨽂',
-    '隮𨽘',
-    '迨𨾃𨽿',
-    '雋隽',
-    '難𩁩難𩁲𩀡𩁘𩀏𩁤𩁬难𩀤𩁢',
-    '鳩鸠䧱𩾛䲫',
-    '鳪𨾇',
-    '𩾔𨾅',
-    '隻𨾏',
-    '隿𨾍',
-    '鳱䧲𩿫𩾝',
-    '鳲䲩𨾋𨾈',
-    '鴇𨾑䳰𨾙䳈𪁣𪀀',
-    '售𨿈𨿞𨾜',
-    '雌䧳𩾰',
-    '鴆鸩𩾺䧵䲴',
-    '奊𨾗',
-    '鳺𨾚',
-    '鴃𪁠𨾕鴂',
-    '𩾿𪄇𨾝',
-    '鴁𨾘',
-    '雄䧺',
-    '雛𨿉雏',
-    '離𩀌𨾫',
-    '鵡鹉䳇𨾥',
-    '雂𨾠',
-    '鴽𨾯𨾵鴑',
-    '鶩𨾣鹜䳱',
-    '奞𨾮',
-    '䳁䳊𨾩',
-    '䲾𨾢𩿸',
-    '𩿢𨾨',
-    '鴊𨾖',
-    '𩿧𨾪',
-    '鴟鵄𨾦鸱𩿒𨾽𩿨',
-    '𪂆𩀔𪃯𩀃𨾧𨿹𪃔',
-    '鴿鸽䧻',
-    '鴮𨾺',
-    '鴯𨾿鸸',
-    '鴱𩾘𨿆',
-    '鴸𨾲',
-    '鴰𪁝𫕛鸹',
-    '鴷䴕𨾸',
-    '鵀𨿃𪀼',
-    '鵒𩀑𨿜𪀙𨾳𪃪鹆',
-    '雃雃',
-    '𪀗𨾼',
-    '䳎𨾹',
-    '䳔𨿀䳎',
-    '鵑䳌鹃𨿔',
-    '鵝䳘䳗鹅鵞𨿍',
-    '鵠鹄䧼',
-    '雟嶲',
-    '鵏𪁭𨿌',
-    '鵛𨿋',
-    '鵗𨿕𨿛',
-    '鵔𨿓鵕',
-    '鵟𨿗',
-    '鶪䴗𩀎𨿎',
-    '鷡𨿏𪂐鵐',
-    '𨿐䧽',
-    '䳚𨿑',
-    '鵚𨿖',
-    '䳕𪃽𨿚',
-    '𪁛𨿒',
-    '鵲𩁆䧿鵲鹊',
-    '雗𨿨',
-    '鶊𨿶',
-    '鶄䴖𪂴𨿬',
-    '鶈𨿩',
-    '鵱𪂚𨿲',
-    '鶀𨿣𪅾䳢',
-    '鵸𨿫',
-    '鵫𨿧',
-    '鵴𨿥𪈓𪈢𪅞𪇢𪈅𪁁',
-    '鵵𨿮',
-    '鶅𨿴',
-    '鵳𨿱',
-    '鵯𪂃𨿵',
-    '鵹𪇺𩁟𨿯',
-    '鶤𨿪鵾',
-    '䳝𨿦',
-    '鵺𨿤',
-    '鵨𪅰䧾',
-    '𪄹𨿰𩀯',
-    '鶟𩀆',
-    '鶘𩀉鹕',
-    '鶛𩀊',
-    '鶠𩀀',
-    '鶚𩀇鹗',
-    '鶨𩀅',
-    '鶞𩀐',
-    '䳦𩀈𪃗',
-    '䳩𩀄',
-    '𪃍𩀍',
-    '𪆴𩀁',
-    '鷂鹞𩀘',
-    '鶶𩀛',
-    '鷃䨃',
-    '鶬𩀞',
-    '鷈𩀗鷉𪁦',
-    '䳴𩀚',
-    '鷛𩀬𪅟',
-    '鷐𩀭',
-    '鷜𩀮𪈜',
-    '鷑𩀩',
-    '鷟𩀥',
-    '鷩䨆',
-    '𩀨𩀰𪅜',
-    '䳻𩀧',
-    '𪄶𩀦',
-    '鷎𩀹𪈪鷱',
-    '鷯鹩䨅',
-    '鷣𩀽',
-    '鷶𩀺',
-    '鷲鹫𩾵𩀻𪆩',
-    '鷢𪆙𩀾',
-    '𡚊𡚜𩁂',
-    '𨿠𩁅',
-    '𩀿𩁀',
-    '𪅿𩀶',
-    '䴃𩀸',
-    '䴅𩿜𩀴',
-    '鷨𩀵',
-    '鷭𩀷',
-    '鷺𪆽鹭𩁐',
-    '鷾𩁈',
-    '鸇𪄟𩁉𪄃𪄡𪇮鹯𪄐',
-    '鸅𩁇',
-    '鸀𪅱𩁍',
-    '鸉𪇚𩁒',
-    '鷿鸊𪇊𩁊',
-    '鷽雤',
-    '𪆂𪆺𩁋',
-    '䴇𩁎',
-    '𪆻𩁏',
-    '雒𩁗',
-    '鸋𪆮𩁔',
-    '鸍𩿥𩁖',
-    '鸒𪇬𩁕',
-    '鸑𩁓',
-    '鸔𪇰𪈚𩁠𪈫',
-    '鸓𤴒𪉀𪈦𪆼䴎𩁜',
-    '𪇗𩁡',
-    '𪇴𩁝𪈛',
-    '𪇭𩁞',
-    '集雦雧',
-    '鸕𪈒𩁨鸬',
-    '鸚𪈤鹦䨉',
-    '䨊𩁵',
-    '雹𩅟𩄉𩇌𩆗䨔䨌𩂁𩅒',
-    '𩆷𩁺𩃔',
-    '需𩂉',
-    '靂雳',
-    '霒𩃛𩂇䨧',
-    '𩂆雬',
-    '霧雾霚𩄯𩅬',
-    '霐䨎',
-    '𩂔𩂔',
-    '電𩂵𩅏𩃿𩃓𩅎𩂬',
-    '霽䨖霁𩄄',
-    '𩂧䨕',
-    '霪䨙',
-    '霰𩄧𩃂𩆥䨷䨘𩅤𩃝',
-    '浽𩃃',
-    '霃𩂷𩂸',
-    '霕𩃌',
-    '𩃹𩃡',
-    '𩅂𩃘',
-    '靄霭䨠',
-    '霣𩇂䨶霣',
-    '霮𩅷𩅾䨢',
-    '𪋉𩃽',
-    '霾䨪𩆲',
-    '霢霡䨫',
-    '䨏𩄚𩆂𩆃',
-    '䨡𩄥𩄙',
-    '䨛𩄜',
-    '䨴𩅆𩅫𩅥𩅲𩆰𩄮',
-    '靋𩅩𩄞',
-    '雪䨮',
-    '寖𩅕',
-    '蔀𩅇',
-    '覈𩅢𩅓',
-    '霤𩅐',
-    '霙𩅊',
-    '𩄡䨬',
-    '𩄛䨯',
-    '𩆓𩅍',
-    '𩅅𩅅',
-    '靆霴',
-    '黤𩈷𩅝',
-    '灀𩅪',
-    '𩅀𩅱𩆔',
-    '𩅉𩅧',
-    '𩅨𩅮',
-    '䨺𩅣',
-    '震𩇒𩆉',
-    '龗𪚕𪚙𩆈𩆇',
-    '𩅽𩇀',
-    '𩆿𩇈',
-    '霩𩇊𩇑',
-    '靚靓',
-    '𡌦𩇭',
-    '䨽𩇯',
-    '靠𩇸',
-    '棐𩇹',
-    '䨿𩇺',
-    '䪤𩇾𩐏𩇼',
-    '忸𩈄𩈇',
-    '𩈉𩈊𩈌',
-    '𩈣𩈖',
-    '靨𩉇靥𩉂',
-    '𩈶𩈝',
-    '䩌𤎂𩉈',
-    '䩉𩒺𩈨',
-    '𩔁䩈',
-    '𩈚𩈚',
-    '䩊𩈱',
-    '懡𩉌',
-    '䩋𩉑',
-    '馘𩉕𩠲',
-    '鞗𠌙䩦',
-    '䩒𩉞',
-    '䩐𩉟',
-    '紐靵',
-    '鞮𩉱䩘',
-    '𩋠𩊘𩉣',
-    '䩸𩉪𩊐',
-    '𩎦𩎔𩉤',
-    '冑䩜𩊄',
-    '靾𩊈𩊒𩋛',
-    '鞄𩊋䩝𩎘𩋲𩍂',
-    '鞈𪔮𩊆',
-    '𩉺𩉻',
-    '狩𩊦',
-    '鞍鞌𩣑',
-    '韃鞑',
-    '䩕𩊕',
-    '𩊝𩊞',
-    '𩍅𩊗',
-    '絥𩊙',
-    '珌𩋇',
-    '𩉧𩊩',
-    '䩖𩊮',
-    '𩋈𩊼',
-    '鞢𩋑',
-    '䪎鞖',
-    '倔𩋎𡳼𩍞',
-    '鞋𩋘鞵𩋔',
-    '琫𩊌鞛',
-    '鞹𩌒𩎏鞟',
-    '韔䩨',
-    '簶𩌫䩮',
-    '緉䩫',
-    '𩌰𩋐𩌰𩍑',
-    '𩌦𩌳𩋀',
-    '鞔𩋭',
-    '𩉹𩋪',
-    '𩊅𩋶',
-    '鞕𩋸',
-    '𩋢𩋫',
-    '䪁𩋼',
-    '𩏇𩋦𩎶',
-    '瞽𥌕',
-    '鞞𩌛',
-    '鞳𩌔',
-    '韝𩏎鞲',
-    '韞韫鞰韞',
-    '䩶䩶',
-    '𩍓𩏨𩌋𩏔',
-    '韅𩎍𩌹𩌺𩏰',
-    '䩳𩌱',
-    '𩍪𩌭',
-    '韠韠鞸',
-    '靼𩍕',
-    '靷𩍟𩍫𩎋𩍱',
-    '鞨𩍛',
-    '韣䪅',
-    '䩰𩍮',
-    '鞼𩍨𩍾𩏱',
-    '𩍧𩍧',
-    '𩍿𩏯䪇',
-    '𩫠𩍯',
-    '𩎑𩎈𩍴',
-    '韗𩏅𩎨𩏆𩍹',
-    '籣䪍韊',
-    '鞬𩎅𩎀',
-    '䪌䪌',
-    '䪂𩎎',
-    '韌韧',
-    '靸𩎕',
-    '䪏䪏',
-    '韍韨',
-    '𩎺𩎝',
-    '鞇𩎪',
-    '𩊜𩎫',
-    '𩎯𩎩𩏏',
-    '韐𩎱',
-    '𩎮𠆎𩏉',
-    '韢𩎰',
-    '䪑𩎼',
-    '韙䪘韪',
-    '䪙䪖',
-    '𩎽𩏒',
-    '𣝞𩏙',
-    '𩌩𩏘',
-    '𩏲𩏚',
-    '韟𩏤',
-    '韡𩏬',
-    '𩍙𩏫',
-    '韄䪝',
-    '𩰪𩏴',
-    '𩏻𩏻',
-    '韭韮',
-    '韰𩐂',
-    '韱韯',
-    '𩐌𨽮𩐕𢌐',
-    '音𦂺',
-    '𩐲𩐯',
-    '𩐴𩐴',
-    '䪫𩐺',
-    '韸韼',
-    '𩐵𩐹',
-    '韽韽',
-    '𩑊𩇄',
-    '頁𩑋页',
-    '頃𩔥顷𩒵𩓏頃',
-    '𩑣𩑌𩑲',
-    '項项',
-    '頇頇',
-    '𩑑𩑗',
-    '𩑐𩑐',
-    '預预',
-    '頑顽',
-    '頓顿𩠫䪺',
-    '頊顼',
-    '頌𩔜颂',
-    '頏颃',
-    '頎颀',
-    '頲颋𩒞𩑙',
-    '𩑔𩑨',
-    '頋頋𩒒',
-    '頪𩑩',
-    '頗颇',
-    '領领',
-    '頸颈𩒤頚',
-    '顧頋',
-    '顱髗颅𩔺',
-    '䪱𩒁',
-    '𩑢䫊䪹',
-    '䪾𩒉𩒀𩒈',
-    '𩔈𩒋',
-    '眶𩒑',
-    '頰颊𩠗𩔯𩠣頬',
-    '額额頟𬱃',
-    '頦颏',
-    '𢄼𩒧',
-    '𩒖𩒖',
-    '𩑰𩒢',
-    '䫀𩓓𩒝',
-    '𩒯𩒪𩕅𩔟',
-    '脖𩓐',
-    '頻频𩔤𩓯𩕘',
-    '頷颔𩩂𩓱𩩊',
-    '頹颓頺頽',
-    '谾𩓅',
-    '頍𩓗',
-    '頯𩓰𩒶',
-    '𩈥𩓀',
-    '𩑦𩓔',
-    '頛𩓕',
-    '頢𩒲',
-    '䫁𩓑',
-    '𩓥𩓆',
-    '䫠𩓄𩓭𩔌',
-    '䫨𩕀𩓁𩕣',
-    '顆颗',
-    '熲𩓺',
-    '觠𩓫',
-    '頩頩',
-    '𩒾䫓',
-    '𩒱𩓽',
-    '𩓠𩔩𩓡𩓸',
-    '䫑䫏',
-    '腮顋',
-    '題题',
-    '顓颛',
-    '顒𩔔颙',
-    '顙䫙颡',
-    '䫧𩔇𩕍',
-    '顢颟',
-    '顳颞',
-    '𩔣𩔛',
-    '髏䫫',
-    '𩕲𩔽𣄫䫯',
-    '顥颢',
-    '顡𩕑𩕺',
-    '䫩𩕞',
-    '𩕔䫰𩕶𩕼',
-    '䫬𩕗',
-    '𩕳𩕋',
-    '顬䫱',
-    '䫶𩕒',
-    '髑䫳',
-    '𩖀𩕦',
-    '𩪤𩕟𩪫',
-    '顲𩕴𩖋',
-    '䫦𩕭',
-    '𩕊𩕸',
-    '𩖆𩖄',
-    '顴𩪼颧啳',
-    '𠐿𩖎',
-    '籲𥸤龥',
-    '䫸𩖙',
-    '飆飇飊颷𩖡𩗈𩖚飈飙𩖧',
-    '𩖛𩖜',
-    '𩖬颫',
-    '𩖶𩖶䫼',
-    '䬍𩖨𩘐𩙤𩗛',
-    '颯䬃𩗁飒',
-    '𩖹𩖾',
-    '颰𩖽',
-    '𩗢𩖻',
-    '𩗞𩗉',
-    '𩘋𩗇',
-    '颶𩗗飓',
-    '𩗬𩘁𩗖',
-    '飀𩗠',
-    '颲𩘃𩘛',
-    '颸𩗮飔',
-    '魑𩱹𩳀𩴭𩲶𩳩𩗨𩘉䬜',
-    '䬌𩗸',
-    '䬟𩙔𩙗𩗩𩙄',
-    '颺䬗',
-    '颼𩘦䬒飕𩘌',
-    '飄𩘔𩙞飃',
-    '䫾𩘆',
-    '𩗫𩘙',
-    '𩘑𩘕',
-    '𩘅𩘗',
-    '䬝䬖𩙁',
-    '𩙚𩘖',
-    '𩙛𩙓𩘇',
-    '颿䬚',
-    '颽𩘥',
-    '颻䬙',
-    '𩗅𩘡',
-    '䬆𩘟',
-    '䬑𩘤𩙊',
-    '飂𩘸𩘷',
-    '䬘𩘲',
-    '𩘹𩘰',
-    '飉𩙂',
-    '𩘻𩙅',
-    '𩘽𩙆',
-    '䬞𩘿',
-    '颾𩙈',
-    '霏䬠',
-    '𦒜𩙼',
-    '餐飡',
-    '饕䬭𩚓𩜻䬢𧈐𩝵飸𩞂𩞣',
-    '𩚬𩜄𩚚飢',
-    '飢𩚎𩚑𩚐',
-    '飧飱𩚏𩛈',
-    '飾𩜓饰餙𩚍',
-    '餳饧𩛿',
-    '饗飨',
-    '䬣𩚋',
-    '飯飰饭𩚳',
-    '飭饬',
-    '䬲𩚘',
-    '䬫𩚞𩛀𩚨',
-    '餺䬪𩟛𪎄馎䭦𩞽𪍡',
-    '麨𪍉𪍑𩚙𪌕',
-    '粒𩚷',
-    '飼饲',
-    '飴饴',
-    '飽𩛒𩜕䭋𩛊𩜿𩝩𩛁饱𩛞𩝰',
-    '餞䬻饯',
-    '餬𩞵䭌𩚩',
-    '餮飻𩚸𩚺',
-    '饙𩝂𩝼𩚰餴𩞑',
-    '𧯡𩜌𩚴',
-    '飿饳',
-    '餄𩛩𩚲饸',
-    '𩛻𡳋',
-    '餃饺',
-    '餅饼餠䴵',
-    '餌饵',
-    '饒饒饶',
-    '𩚯𩛐',
-    '䭐䭥䬺𩞭',
-    '餓饿',
-    '餒馁',
-    '餑饽',
-    '𩚤𩛹',
-    '𩚱𩛯',
-    '䭈𩱤𩛧𩱃𩱡',
-    '粻餦',
-    '餯𩛾',
-    '𩛌䭄',
-    '䬷𩜉',
-    '𩛢𩝧𩜔',
-    '餩餩',
-    '噎𩜺',
-    '餿𩜯馊',
-    '饞𩟖馋',
-    '餰𩜾',
-    '饁𩝉',
-    '饌馔𩜹䉵𩝁',
-    '饋𩟱馈',
-    '餷馇',
-    '餶馉',
-    '糕餻',
-    '餾𩞷馏',
-    '饔𩝹𩟀𩞠𩟷',
-    '饛𩝬',
-    '䬼𩝤𩟁',
-    '饉𩞎馑',
-    '饟𩞥𩝾',
-    '𩞆𩞐',
-    '䭕𩞏𩟗',
-    '澉饏䭛',
-    '餪𩞪',
-    '鯔𩻨鲻𩞮𩺅',
-    '䭉𪍳𩞢𩟆',
-    '𩞃𩞧',
-    '䭙𩞲',
-    '𩟨𩞺',
-    '餀饚',
-    '𩝡䭤',
-    '𩟤𩟣',
-    '饡𩟪',
-    '饃饝',
-    '飥𪌂𩟰',
-    '䭧䭩',
-    '䭮𩠷𩭻',
-    '剸𩠹',
-    '馛馛',
-    '馞䭯𩡒',
-    '䭱𩡈𩡡𩡀𩡅𩠿',
-    '馥𩡘馥𩡑𩡊䫝𪐒',
-    '𣝕馢',
-    '𩡐𩡌',
-    '馤𩡚𩡤',
-    '馭𫘅驭',
-    '䭴𩡪',
-    '馱駄驮䭾',
-    '馴驯',
-    '馹𩡲',
-    '馽𩡳𩢏',
-    '騏䭼骐䭶',
-    '𩡰𩡵',
-    '䭻𩡱',
-    '駁𩣄驳',
-    '駙𩢇驸䮛',
-    '駢骈䮁騈𩤳𩢝𩡼',
-    '驛駅驿𩦯',
-    '驢𩢉馿𩧥',
-    '駂𩣎駂𩢈',
-    '騕𩡻',
-    '䭿𩡹',
-    '𩥐𩡸',
-    '駐驻',
-    '駟驷',
-    '駛驶',
-    '駑驽',
-    '駕𩢟驾',
-    '駒驹',
-    '騁骋𩧢𩢆𩣁',
-    '馲𩢵𩢐',
-    '駔驵',
-    '駘骀𩦽𩢠',
-    '騧𩦣𩢍',
-    '騶驺𩣿',
-    '䮂𩢚',
-    '駊𩢘',
-    '駗𩢜',
-    '𩣊䮅',
-    '𩣡䮀',
-    '駭骇',
-    '驕骄',
-    '駓䮆',
-    '駉䮐駫',
-    '駪𩣂',
-    '駩駩騡',
-    '駽𩢺',
-    '騮𩤃𩥺𩥖骝驑駵𩤷𩣒',
-    '驍骁',
-    '驈䮇',
-    '䭹𩣍',
-    '𩢡𩣀',
-    '𩣇𩣐𩢯𩥒𩣈',
-    '𩢹𩣅',
-    '𩢑𩢭',
-    '𩤘𩣃',
-    '𩢾䮋𩧃',
-    '駿骏',
-    '驗騐験验',
-    '驪𩣫骊',
-    '駣𩣛',
-    '駸骎𩤿𩤨',
-    '駾駾',
-    '騄騄',
-    '驄𩣭騘𩣢',
-    '𩡾𩣟𩣠',
-    '𩢿𩣜',
-    '𩢳𩣗𩧚',
-    '䮢𩤪𩣙',
-    '騎骑',
-    '騖骛騖𩤝𩥦',
-    '騷骚騒騷',
-    '騍骒',
-    '騅骓',
-    '騣騌',
-    '驂骖',
-    '𩣹𩤓',
-    '騯𩤐',
-    '驧𩣽𩧛',
-    '騙騗骗𩤬',
-    '禂𩤫𩦑䮻',
-    '駥𩤭',
-    '騠𩤢',
-    '騱𩤻',
-    '䮗𩤧',
-    '騫骞騫',
-    '驀蓦',
-    '騞𩥟',
-    '騜𩥧䮲',
-    '驩驩𩦘𩥤',
-    '峳𩥘',
-    '𩢷𩥔䮮',
-    '䮉𩥜',
-    '䮔𩥗𩦁',
-    '𩥂𩥞',
-    '𩥅𩥓',
-    '𩧂䮥',
-    '驃𩧙骠𩦾𩦈',
-    '騾骡𩦻驘𩧣䯁',
-    '驁䮯',
-    '騺驇',
-    '驖𩦷𩥳𩧀',
-    '驦騻',
-    '𩦙𩥲',
-    '𩦄𩧋𩥴𩦅𩦀𩧠',
-    '騑𩦎',
-    '騬𩦆',
-    '驫䮶',
-    '䮵𩦍',
-    '𩦂𩦔𩦃',
-    '髒𩦦',
-    '騤𩦟',
-    '鸄𩦨',
-    '騔𩦞',
-    '驟驟骤𩧁',
-    '驎䮼',
-    '驞𩦿',
-    '𩥃𩦺',
-    '驨𩧎',
-    '䮷𩧈',
-    '驤骧',
-    '驔𩧤',
-    '肌𩨒',
-    '骫𩨖骩骪',
-    '骬𩨗',
-    '𩨠𩨕',
-    '䯔𩨛',
-    '肪𩨣',
-    '跂𩨝',
-    '骹𩨟',
-    '骱𩨢𩨦𩨶𩨧',
-    '骶𩨤',
-    '骯𩨺',
-    '䯈𩩁',
-    '𩨭𩨷𩩆',
-    '𩨳𩨸',
-    '䯚𩩓𩩣𩨴',
-    '髀𩪅𩩚䯗𩩙',
-    '髇骹𩩉',
-    '䯏𩩎',
-    '䯘𩩕',
-    '髓䯝𩪏𩪄𩩜𩪷髄𩪦',
-    '勒𩩸',
-    '腢髃',
-    '㾪𩩭',
-    '䯌𩩾',
-    '骺𩩽𩩵',
-    '髕髌',
-    '髊𩪒𩪳',
-    '𩔴𩪉',
-    '髎𩪚',
-    '䯍𩪥',
-    '𩩳𩪪',
-    '䯣𩪹',
-    '䯦𩪻',
-    '翯𩫉',
-    '髞𩫦',
-    '垣𩰵𩫧',
-    '陴𩫪𩫫𩫮',
-    '嚲䯬',
-    '𩬜𩫴',
-    '鬄𩬲髢髰',
-    '𩫿𩬒𩬓𩫹',
-    '𩬷𩬢𩫺',
-    '髺𩬁䯺',
-    '𩬀𩬀',
-    '䯰𩬉',
-    '髿䯯',
-    '𩯰𩰁𩬄䰏',
-    '𩯨𩬘',
-    '髽𩭃𩮢',
-    '鬌中𩯚𩭦',
-    '𩬛𩬰',
-    '𩮰𩬼',
-    '剃鬀',
-    '髼𩭉',
-    '騀𩭝',
-    '𩬽𩭼𩭚',
-    '𩮈𩭓',
-    '镼𩭪',
-    '𨽸𩭞',
-    '鬚䰑䰅',
-    '𩮝𩮂',
-    '𩮶𩮃𩮸',
-    '䰓𩮇',
-    '鬋𩮣',
-    '鬊𩮦𩯐',
-    '鬒鬒',
-    '䰃𩮗',
-    '䰒𩮡',
-    '鬇𩰅𩯩𩯎',
-    '𩮵𩮾',
-    '𩯏𩮽',
-    '鬖𩯑𩯟',
-    '𩭺𩯅',
-    '𩮳𩯧',
-    '㲫𩯱',
-    '䰈𩯸',
-    '䰉䰔',
-    '䰎𩯿',
-    '𩬔𩰂',
-    '𩰞𩰐',
-    '鬨𩰓',
-    '闟𩰙',
-    '秬𩰤',
-    '鍋𩰭',
-    '𩰫𩰮',
-    '鬷𩱅𩰷𩰼𩰺𩱛',
-    '鬺䵼𩰱𩱑𩱀𩱐',
-    '鬵𩱩𩰿𢑋𩱠',
-    '𩱄𩱊',
-    '𩰾𩱎𩱣',
-    '𩱍𩱒',
-    '甑䰝𩱭',
-    '𩱙𩱢',
-    '𩱳𩱥',
-    '𩱜𩱨',
-    '淋𩱬',
-    '粖𩱸𩱵𩱷',
-    '魁𩳭𩲙𩲅𩲔',
-    '𩲄𩱽',
-    '𩱺𩲂',
-    '魍𩲛䰣',
-    '𩲏𩲜',
-    '𩲳𩲣',
-    '䰡𩲫𩳂𩳦𩲥',
-    '䰧𩳰𩲼',
-    '魊䰥𩳠',
-    '魎魉𩳮',
-    '𩳵𩳖',
-    '𩴑𩳑𩴊',
-    '𩴳𩴇𩳙𩳘',
-    '鬾𩳣',
-    '䰠𩴋𩳱',
-    '騩𩥢',
-    '𩴪𩴆',
-    '𩳐𩴔',
-    '魙𩴕',
-    '䰩𩴟',
-    '䰬𩴢',
-    '䰰𩴶䰭',
-    '𩴓𩴴',
-    '䰯𩴷',
-    '𩴱𩴸',
-    '鰷鲦𩵌',
-    '𩺲𩵐',
-    '鮀䰿𩷿𩵔',
-    '魷鱿',
-    '鱸鲈魲',
-    '魧𩵸',
-    '魱𩵯',
-    '鱀鱀𩵪𩺺𩷱',
-    '鱮魣',
-    '魫𩵨',
-    '魪䰺䱄',
-    '𩷍䱛𩵤',
-    '鯕𩵧',
-    '魭𩵶',
-    '鰂䰹𩽠鱡',
-    '鰥𩶊鳏𩹌𩻴',
-    '鱔䱧鱔鱓䱇鳝',
-    '鮨𩷾䱈',
-    '鯆𩹲𩺼𩶉',
-    '鯛鮉鲷',
-    '鯰鲇鮎鲶',
-    '鱦䱆',
-    '䰽𩶚',
-    '䱏𩶃',
-    '𪗨𩶌',
-    '鮮鲜',
-    '鮫鲛',
-    '鮪鲔',
-    '魾𩶨',
-    '鮞𩶫',
-    '鮤𩶽𩹒',
-    '鯃𩶭',
-    '鰣𩶬鲥',
-    '鰨鳎𩻵鮙',
-    '鱘𩽶鱏鲟',
-    '䖳𩶱',
-    '𩶅𩶪',
-    '䱎䱭䱍',
-    '鮬𩶮',
-    '𩶶𩷮䲛鯍',
-    '䱢䱢',
-    '鰠𩷃',
-    '鯊鲨鯋',
-    '鯉𩼆𩼞鲤',
-    '鯽𩼿𩼚𩺀鲫',
-    '鰱鲢',
-    '鯁鲠𩹐',
-    '鯬𩸢䱘𩼽',
-    '鰋𩷑𩹽鰋',
-    '鯷鮷',
-    '鰹鲣',
-    '䰼𩷒',
-    '𩷗𩷬',
-    '𩸆䱒',
-    '鰡䱖𩺜',
-    '𩺵𩷔',
-    '𩽐𩼇䱗',
-    '鯨鲸䲔',
-    '鯧鱂䱽鲳',
-    '魴𩷸',
-    '魦𩸌',
-    '鮒𩸅𩷺𩺹',
-    '鮡𩸼',
-    '鯖鲭',
-    '鯪鲮',
-    '鯫鲰',
-    '鯤𩽞𩻋鲲',
-    '鯦鯦',
-    '鯢鲵',
-    '鰈鲽𩸏',
-    '鮍𩸉',
-    '鮊𩸊𩹏',
-    '鯡鲱',
-    '䱚䱚',
-    '䱥鯯䱨',
-    '䱬𩸠',
-    '鯼鯮',
-    '𩹑𩸈',
-    '䲊𩷷𩼐𩼂鰖',
-    '鰓鳃',
-    '鰍鳅',
-    '鯇鯶鰀',
-    '鰌',
-    '鰒𩼵鳆𩺽',
-    '鱍𩸿',
-    '鮏鯹',
-    '䱓𩹇',
-    '䱠𩻣𩹆',
-    '䱤䱤',
-    '䱱𩹋',
-    '鰆䲠',
-    '鯻䱫',
-    '鰉鱑鳇',
-    '鯾𩺂鯿鳊',
-    '䱮𩹃䱮',
-    '鰦鰦𩼑',
-    '鰮鰛鳁',
-    '鰭鳍',
-    '鮓𩺆𩼮𩽟',
-    '鯗鱶𩺁',
-    '鯸鯸',
-    '鰜鳒',
-    '鰬𩺇',
-    '鰲𩼡鰲鳌',
-    '魮𩹻',
-    '𩷕䱶',
-    '鮺𩻢𩺃𩼫䱹',
-    '䱞𩺚',
-    '鱎𩺙',
-    '鱯𩹹',
-    '鱉鼈鳖龞𪔀',
-    '鰾鳔𩼾',
-    '鰻鳗𩻠𩺴',
-    '鮅𩺷',
-    '鮸鰵䲄',
-    '鰫鱅',
-    '鱈鳕',
-    '鰳鳓',
-    '鰼鳛',
-    '鱋鱋',
-    '鱢鰺𩻦',
-    '鱳𩺮',
-    '鰪𩺻',
-    '鰧𩺭䲍',
-    '䲁𩻍',
-    '䲀𩻉',
-    '䲌𩺶',
-    '𩻜𩺾',
-    '鱗𩼩鳞',
-    '鱖鳜鱥',
-    '鮦𩻡',
-    '鱒鳟',
-    '鱞𩻲',
-    '䱜𩻶',
-    '鯘䲎',
-    '𩸂鱝',
-    '鰎𩻥',
-    '𩻛䲋',
-    '鱬𩻞',
-    '鱧鳢',
-    '鱨𩼝',
-    '䲒𩼠',
-    '鱵𩼘',
-    '䱡𩽘𩼥',
-    '𩽛𩼬',
-    '𩽨𩽌',
-    '𩹺𩽏',
-    '䲚𩽓',
-    '鰴𩽚',
-    '鱴𩽣',
-    '鳥𩾑鸟',
-    '雞鷄鳮鸡鶏',
-    '鳧鳬𩾖',
-    '鳨𩾜',
-    '鳴鸣',
-    '鳶𪃘䳒鸢',
-    '鶻𩿆𩾻𩾲𩾤𪆸𩾥',
-    '雇鳸𩿇',
-    '鴉鸦鵶𪀨𩿗',
-    '鷗䳼鸥',
-    '憍𩿑',
-    '牄𩿄',
-    '鴅𩿊',
-    '鴔𩾳',
-    '鶭䲱𪁢',
-    '䲸𩾴',
-    '𩿞𩿌',
-    '𪀤𩾱',
-    '鶳𩿐𪄜',
-    '鴕鸵',
-    '鴣鸪',
-    '鴦鸯',
-    '鴨𩿼𪁗鸭𪀌𪀋𪁨',
-    '鴒鸰䴒𪈝',
-    '鴛鸳',
-    '鵬鹏𩿾',
-    '鶯鸎鶑鷪莺鴬𪄙',
-    '鷥鸶',
-    '鳿𩿱',
-    '鴥鴪鴧',
-    '鴩𪀒䳀',
-    '鴝𪁖𪀊鸜',
-    '鴐𪀁',
-    '鵷𪀈𪂦',
-    '鶿鹚䲿鷀𪇔',
-    '鶵𪄞𩿮',
-    '鷤𩿷',
-    '䳅𩿦',
-    '䲹𪀇',
-    '䳙𩿭',
-    '𪃿𪀉鴚',
-    '𩿣𩿲',
-    '鴻鸿𪅯',
-    '鸞鵉鸾',
-    '鳽鳽',
-    '鵁𪁉',
-    '鴶鴶',
-    '鵂鸺𪀪',
-    '鵃鸼',
-    '鶖𪀖鹙𪃩',
-    '鷙𪁊鸷',
-    '鷘𪀦𪅍𪀸𪆵',
-    '䳓𪀧',
-    '𪂹𪁈',
-    '鵪𪂻鹌𪁟𪈍',
-    '鵜鹈',
-    '鵓鹁',
-    '鵌𪇝䳜',
-    '鶂𪁌鶃',
-    '鶺䳭𪃹䳭',
-    '鸝鹂𪈳𪅌𪈹',
-    '鼯𪁙𪕜𪕡',
-    '𪁒𪁪',
-    '鵍𪁤',
-    '䳤𪂟',
-    '鳹鵭',
-    '鳻𪂔',
-    '鵧鵧',
-    '鵰𪄄鵰',
-    '鶾𪂂',
-    '鷕𪄼𪂣',
-    '𪀚𪁿',
-    '𪂀𪂥',
-    '𪂪𪂋',
-    '鶇𪂝',
-    '䳟𪆌𪂡',
-    '𪂞𪁹𪂏',
-    '𪃓𪂾',
-    '䳃𪂭',
-    '凰䳨',
-    '鵅𪃕',
-    '鶒𪅙𪃠𪄠',
-    '鶗𪂿',
-    '鷫𪂸𪆭𪄑',
-    '𪂍𪃤',
-    '𪃐𪃦𪃧',
-    '𪃎𪃎',
-    '𪃶䳧',
-    '鶴𪇦鹤𪈯鸖䳽',
-    '雝𪄉',
-    '鶼鹣',
-    '鷮𪄘',
-    '翵𪄊',
-    '鵮𪅎',
-    '䳮𪃻𪅚',
-    '𪄅𪄅',
-    '䳵𪄪',
-    '𪃼𪄛',
-    '鷓鹧',
-    '鷚𪅡',
-    '鷖鹥',
-    '𪁽𪅄',
-    '𪃈𪅸𪄾',
-    '䳳𪅁',
-    '䳸䳸',
-    '𪅖𪆊𪄻',
-    '𪄿𪇠𪅀',
-    '鶹𪅳',
-    '鷻𪈷𪆃𪆝',
-    '鷦鹪𪆔𪆅𪇶',
-    '𪄌𪅷',
-    '𪄱𪆡',
-    '𪄮𪆚',
-    '鷧𪆖',
-    '鷳鷼',
-    '䳿𪆈',
-    '䴈䴈',
-    '𪇘𪆇',
-    '𪆁𪆗',
-    '鸃䴊',
-    '𪃀𪆹',
-    '䴉䴋',
-    '鸏䴌',
-    '鸌𪇡',
-    '𪇕𪇧',
-    '𪇳𪈁',
-    '鷞鸘',
-    '𪈟𪈙',
-    '鸛𪈻𪈩',
-    '𪇑𪈧',
-    '𪈿𪈮',
-    '鹵𠧸',
-    '鹺鹾𪉤𪊈𪊁𪉵',
-    '𪊇𪉧',
-    '鹹𪉳',
-    '𪉘𪉰',
-    '𪊉𪊃䴜𪉭',
-    '盬𪉶',
-    '䴝𪉼',
-    '䊲𪉺',
-    '䤎𪊀',
-    '鹿𢉖',
-    '麂𪊨𪊋',
-    '麋䴢',
-    '麒𪊔',
-    '麟𪊓𪊺𪊭麐𪋲𪊱𪋷',
-    '麉𪊑𪊑',
-    '𥀔𪊙',
-    '䴠𪊏',
-    '麀𪋎𪊛',
-    '麃麅',
-    '麚䴥',
-    '駼𪊸',
-    '麆𪊹',
-    '麇麏麕𪊼',
-    '麍麍',
-    '麔麔',
-    '麛𪋈𪋸',
-    '麠麖𪋔𪋥',
-    '𪊫𪋐',
-    '𪋏𪋑',
-    '獐麞',
-    '麌𪋬',
-    '麡麡',
-    '𪋚𪋳',
-    '麴𪌲𪍚麯𪌗𪋼𪌬',
-    '麵𪋽麫麪',
-    '麩麬麸䴸𪌻麱',
-    '麧𪌇',
-    '𣣋𪌒',
-    '䴭𪌎',
-    '麰𪌚𪍫𪌸',
-    '𪍛𪍕𪍐𪌔𪌯',
-    '麮𪌥',
-    '䅌𪌭',
-    '䅘麳𪎂',
-    '粸𪍀',
-    '䭃𪌿',
-    '䴯𪍃',
-    '䴻𪍆',
-    '𩜭𪍎',
-    '𪌘𪍍',
-    '𪍓𪍘',
-    '𪌈𪍜',
-    '𪍢𪍠𪍥',
-    '饆𪍪',
-    '䴹𪍯',
-    '䴾𪍰𪎀',
-    '䵀𪍨',
-    '䵂𪍼',
-    '𪍶𪍶',
-    '麷䵄',
-    '䴿䵆',
-    '䵃𪍿',
-    '𩟭𪎁',
-    '𪎕𠞧',
-    '緆𪎧𪎥',
-    '䵉𪎨',
-    '黀𪎪',
-    '黂𪎰𪎬𪎯',
-    '𪐎𪎭',
-    '𪎶𪎴',
-    '𪏆䵍䵊',
-    '𪏂𪏋𪏃',
-    '䐵𪏍',
-    '黇𪏊',
-    '𪏓𪏑',
-    '黈𪏜𪏘',
-    '䵎𪏝𪏖',
-    '䵋𪏞',
-    '𪏔𪏚',
-    '斢𪏡',
-    '䵏𪏧',
-    '䵒䵑',
-    '𪏼𪏾',
-    '𪐀𪏷',
-    '䵖䵖䵛',
-    '黑𪐫黒𪐗',
-    '黥𪐛䵞',
-    '𪒢𪐙',
-    '黫𪐜',
-    '黗𪐠',
-    '䵡𪐡',
-    '默黙',
-    '黕𪐨',
-    '䵣䵣𪐪',
-    '𪐲𪐳',
-    '䵳𪐹𪒜',
-    '𪑩𪒮𪑍𪑣𤓅',
-    '𪒄𪑎𪒐',
-    '黨黨',
-    '黴𪑛',
-    '黷黩',
-    '𪑧𪑞𪑘',
-    '𪒏𪑔',
-    '𪒛𪑫𪓁𪒡𪒸𨾄',
-    '黰𪑳',
-    '𪒔𪑴',
-    '𪒹𪒯黬',
-    '黛黱',
-    '黧𪒺𪒁𪒅𪒚',
-    '黭𪒈',
-    '黦𪒣𪑲',
-    '𪑝𪒃',
-    '𪓃𪒌',
-    '𪑭𪒖',
-    '黵黵𪒧',
-    '黶𪒞',
-    '黚𪒭',
-    '𪑖𪒰',
-    '𪒾𪓆',
-    '𪓉𪓊',
-    '黹黹',
-    '𪓏𪓍',
-    '虯𪓓',
-    '𪚮𪓘𪚫𪚳𪓚',
-    '蚾𪓜',
-    '鼀𪓵𪓡䵸𪓰',
-    '鼅䵹𪓳鼅',
-    '鼇𪓾鼇𪓶𪓴',
-    '䵴𪓱',
-    '鼉𪓸𪓽𪛄',
-    '鼒𪔄',
-    '䵻𪔊',
-    '鼛𪔌',
-    '𪔪𪔧䵿𪔤',
-    '𩐨𪔔',
-    '鼘𪔥𪔱鼝',
-    '𪔳𥀼',
-    '貂鼦𪔸',
-    '鼨𪕄𪔻',
-    '𪔿𪕂',
-    '鼬𪕏',
-    '𪕮𪕉𪕾𪕱',
-    '鼣𪕟',
-    '𪕍𪕙',
-    '𪕓𪕗',
-    '䶅𪕘',
-    '𪕊𪕑',
-    '鼶𪕬𪕧𪕽𪕻',
-    '䶃𪕛',
-    '𪕋𪕚䶉',
-    '䶆𪕪',
-    '鼴鼹',
-    '鼭𪕵',
-    '䶂𪕺',
-    '𪕷𪖃𪕸',
-    '鼢𪖅',
-    '鼩𪖏',
-    '鼻鼻𢍂',
-    '鼽𪖓𪖖𪖒',
-    '𪖐𪖘鼼𪖑',
-    '䶊𪖔',
-    '䶋䶋',
-    '䶎𪖗𪖨',
-    '鼿𪖤𪖡',
-    '𪖼𪖽𪖧',
-    '齇齄',
-    '齆𪖵',
-    '𪖕𪖾',
-    '䶩𪗊𪙘',
-    '䶒𠆜',
-    '齔龀𪗠𪗥𪗕齓',
-    '齕𪗚𪗟',
-    '齘𪗣𪗢𪗮',
-    '䶞𪗞',
-    '齟龃',
-    '齡龄𪗲',
-    '齰𪙮齚䶦',
-    '齙龅',
-    '𪗬𪗭𪗵',
-    '𪗻𪗫𪙜',
-    '齜𪗶龇𪘿',
-    '齪𪘮龊𪘛',
-    '齗𪗯𪘎',
-    '齠𪘈',
-    '䶛𪙂𪗿',
-    '𪘲𪗹',
-    '齬龉',
-    '齖𪘣',
-    '齹𪙉𪘠𪙼𪘡𪘓𪙐𪙸',
-    '𪗽𪘢',
-    '䶝𪘘',
-    '齱𪘸',
-    '齺𪙗𪘴',
-    '𪘀𪘀',
-    '齭齼𪘷',
-    '齳𪘩𪙣',
-    '𪙩𪘶',
-    '齷龌',
-    '齴齴',
-    '齵𪙃',
-    '𪘾𪙒',
-    '䶠䶢',
-    '𪙌𪙇𪙆𪙑',
-    '𪙤𪘻',
-    '䶥𪙁𪙵',
-    '齤𪙖',
-    '齛𪙚',
-    '齥𪙥',
-    '𪙞𪙞',
-    '𪙽𪙱𪙪',
-    '𪘼𪙷',
-    '䶪𪙻',
-    '齾𪚋𪙿',
-    '𪚃𪚃',
-    '𪚁𪚀𪚄',
-    '𪙊䶫',
-    '䶬𪚟𪚜𪚒',
-    '龕𪚕',
-    '龑䶮',
-    '龓𪚞',
-    '𪚭𪚵',
-    '𪚰𪚱',
-    '鼁𪚸',
-    '䶱𪚽',
-    '哮𡂉',
-    '啦𪠸',
-    '噩嚀',
-    '囚𡆥',
-    '妙竗',
-    '瘴𩅈',
-    '盔𨫿',
-    '而胹',
-    '胄胃',
-    '袂𫌆',
-    '蹦𨁝',
-    '須𬱇湏',
-    '餘𩟳',
-    '魄𥙃',
-    '鼾𪖟',
-    '呔𠯪',
-    '碴𦉆',
-    '裲裲',
-    '谹𧮴',
-    '鞡𩋷',
-    '𠊬㑢',
-    '㜪𡣎',
-    '𡿈𡾋',
-    '𢁹𣥈',
-    '𢋌𢊿',
-    '𢛦𢜕',
-    '愗愗',
-    '𢮨𦁆',
-    '𢾛𢾊',
-    '𣀆㪊',
-    '𣆒𣆭',
-    '㭰𠲿',
-    '毷𣯀',
-    '氉𣰕',
-    '𤬾𤬾',
-    '䍵䍵',
-    '𦢪膸',
-    '𧃟䔬',
-    '䖻䖻',
-    '䘳襟',
-    '䛀訯',
-    '𧮫臄',
-    '䠭䠭',
-    '䫈𩒣',
-    '𧒐𧐷',
-    '功㓛',
-    '咤吒',
-]
-variants_str = r'#%s#' % '#'.join(variants)
+VARIANTS_FILE = path.join(path.dirname(path.abspath(__file__)), 'assets', 'variants.txt')  # 每行一组，第一个字为规范用字，后面为异体字
+_variants = None
+_variant_index = None
+
+
+def get_variants():
+    """ 异体字组，首次使用时读取"""
+    global _variants
+    if _variants is None:
+        with open(VARIANTS_FILE, 'r', encoding='utf-8') as rf:
+            _variants = [ln.rstrip('\n') for ln in rf if ln.strip()]
+    return _variants
+
+
+def get_variant_index():
+    """ 异体字索引，首次使用时建立"""
+    global _variant_index
+    if _variant_index is None:
+        _variant_index = VariantIndex(get_variants())
+    return _variant_index
+
+
+def __getattr__(name):
+    # variants、variants_str、variant_index在首次访问时才加载，import variant不再读取字表
+    if name == 'variants':
+        value = get_variants()
+    elif name == 'variants_str':
+        value = r'#%s#' % '#'.join(get_variants())
+    elif name == 'variant_index':
+        value = get_variant_index()
+    else:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    globals()[name] = value  # 此后直接作为模块属性访问
+    return value
+
+
+class VariantIndex(object):
+    """ 异体字索引：字→所属异体字组的编号"""
+
+    def __init__(self, groups):
+        self.groups = list(groups)
+        self.group_ids = dict()  # 字 -> 所属各组编号（按组出现的先后，一字可属多组）
+        for gid, group in enumerate(self.groups):
+            for ch in group:
+                ids = self.group_ids.setdefault(ch, [])
+                if gid not in ids:
+                    ids.append(gid)
+        self.group_ids = {ch: tuple(ids) for ch, ids in self.group_ids.items()}
+        self.group_sets = [frozenset(g) for g in self.groups]
+        # 规范化转换表，供str.translate一次性替换（含四字节的扩展区字符）
+        self.table = dict()
+        for ch, ids in self.group_ids.items():
+            normal = self.groups[ids[0]][0]
+            if ord(ch) >= 255 and normal != ch:
+                self.table[ord(ch)] = normal
+
+    def get_group_ids(self, ch):
+        """ ch所属的全部异体字组编号"""
+        return self.group_ids.get(ch, ())
+
+    def get_group(self, ch):
+        """ ch首次出现的异体字组，与原先正则检索的结果一致"""
+        ids = self.group_ids.get(ch)
+        return ids and self.groups[ids[0]] or ''
+
+    def is_variant(self, a, b):
+        if len(a or '') != 1 or len(b or '') != 1 or a == b or ord(a) <= 255:
+            return False
+        ids = self.group_ids.get(a)
+        return bool(ids) and b in self.group_sets[ids[0]]
+
+    def get_normal(self, ch):
+        ids = self.group_ids.get(ch)
+        return self.groups[ids[0]][0] if ids and ord(ch) >= 255 else ch
+
+    def normalize(self, txt):
+        return txt.translate(self.table)
 
 
 def is_variant(a, b):
     """检查a和b是否为异体字关系"""
-    if len(a or '') != 1 or len(b or '') != 1:
-        return False
-    m = ord(a) > 255 and re.search(r'#[^#]*%s[^#]*#' % a, variants_str)
-    return a != b and m and b in m.group(0)
+    return get_variant_index().is_variant(a, b)
 
 
 def is_variants(txts):
@@ -10001,17 +101,12 @@ def is_variants(txts):
 
 
 def normalize(txt):
-    """将文档中的异体字转换为规范汉字"""
+    """将文档中的异体字转换为规范汉字，txt可以是一行、一页或整册文本"""
+    return txt.translate(get_variant_index().table)
 
-    def get_normal(ch):
-        if ord(ch) < 255:
-            return ch
-        p1 = variants_str.find(ch)
-        if p1 == -1:
-            return ch
-        p2 = variants_str.rfind('#', p1 - 100, p1)
-        if p2 == -1:
-            return ch
-        return variants_str[p2 + 1]
 
-    return ''.join([get_normal(ch) for ch in txt])
+def normalize_lines(lines):
+    """ 逐行规范化，lines可以是任意可迭代对象（如打开的文件）"""
+    table = get_variant_index().table
+    for ln in lines:
+        yield ln.translate(table)
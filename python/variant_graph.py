@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+@desc: 异体字图。将variants.txt的异体字组与异体字字典1、2合为一张图，节点为字，边为两字间的异体关系并记录其来源，
+       以并查集将可传递的边合并为异体字类，类中选定一个规范字。
+       字典1、2是“原字+类型编号→正字”的映射，同一原字在两个字典中可对应不同的正字，正字本身也可能是别的原字，
+       沿这些边传递会把上万字连成一类，故只合并无歧义的原字，其余的边保留在图中，由is_equivalent逐条判断。
+       图以定长数组存储，编译结果经asset_cache缓存，canonical、same_class均为O(1)
+@time: 2026/10/18
+"""
+import json
+import os.path as path
+from array import array
+from asset_cache import get_cached, load_cached
+from variant import VARIANTS_FILE
+
+ASSETS_DIR = path.dirname(VARIANTS_FILE)
+VT_DICT1_FILE = path.join(ASSETS_DIR, 'variants1.json')
+VT_DICT2_FILE = path.join(ASSETS_DIR, 'variants2.json')
+
+PY, TYPE1, TYPE2 = 1, 2, 4  # 边的来源，一条边可有多个来源，按位组合
+SOURCES = [(PY, 'py'), (TYPE1, 'type1'), (TYPE2, 'type2')]
+
+
+class VariantGraph(object):
+    """ 异体字图，data为build的结果：
+    chars为各节点的字，comp为节点所属分量，canon为各分量的规范字；
+    members为按分量排列的节点，member_starts[c]为分量c在其中的起始位置；
+    adj、adj_kinds为各节点的邻接节点及边的来源，adj_starts[i]为节点i在其中的起始位置
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.chars = data['chars']
+        self.comp = data['comp']
+        self.canon = data['canon']
+        self.members = data['members']
+        self.member_starts = data['member_starts']
+        self.adj = data['adj']
+        self.adj_kinds = data['adj_kinds']
+        self.adj_starts = data['adj_starts']
+        self.ids = {ch: i for i, ch in enumerate(self.chars)}
+        self._table = None
+
+    @staticmethod
+    def build(groups, dict1, dict2):
+        """ 由异体字组(首字为规范字)及异体字字典1、2({原字: 正字})建图，返回data
+        合并的边：各字与其首个异体字组的首字(同VariantIndex)；不在异体字组中、本身不是正字且只对应一个正字的原字与该正字。
+        规范字依次取异体字组的首字、字典1的正字、字典2的正字，同级时取先出现者
+        """
+        ids, chars, ranks, edges, unions = dict(), [], [], dict(), []
+
+        def get_node(ch):
+            i = ids.get(ch)
+            if i is None:
+                i = ids[ch] = len(chars)
+                chars.append(ch)
+                ranks.append((3, ord(ch)))
+            return i
+
+        def link(std, ch, kind, rank, merge):
+            if len(std) != 1 or len(ch) != 1 or ord(std) < 256 or ord(ch) < 256:
+                return  # 只收单字，且不含拉丁字符
+            i, j = get_node(std), get_node(ch)
+            ranks[i] = min(ranks[i], rank)
+            if i != j:
+                key = (i, j) if i < j else (j, i)
+                edges[key] = edges.get(key, 0) | kind
+                merge and unions.append(key)
+
+        first = dict()  # 字 -> 首个异体字组
+        for gid, group in enumerate(groups):
+            for ch in group:
+                first.setdefault(ch, gid)
+        for gid, group in enumerate(groups):
+            for ch in group[1:] or group:
+                link(group[0], ch, PY, (0, gid), first[ch] == gid)
+        stds, targets = set(dict1.values()) | set(dict2.values()), dict()
+        for vt_dict in [dict1, dict2]:
+            for ch, std in vt_dict.items():
+                targets.setdefault(ch, set()).add(std)
+        for level, kind, vt_dict in [(1, TYPE1, dict1), (2, TYPE2, dict2)]:
+            for k, (ch, std) in enumerate(vt_dict.items()):
+                merge = ch not in first and ch not in stds and len(targets[ch]) == 1
+                link(std, ch, kind, (level, k), merge)
+
+        # 并查集，按大小合并并压缩路径
+        n = len(chars)
+        parent, size = list(range(n)), [1] * n
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i, j in unions:
+            ri, rj = find(i), find(j)
+            if ri != rj:
+                if size[ri] < size[rj]:
+                    ri, rj = rj, ri
+                parent[rj] = ri
+                size[ri] += size[rj]
+
+        # 分量按首个节点的先后编号，并选出规范字
+        comp, roots, best = array('i', [0] * n), dict(), []
+        for i in range(n):
+            c = roots.setdefault(find(i), len(roots))
+            comp[i] = c
+            if c == len(best):
+                best.append(i)
+            elif ranks[i] < ranks[best[c]]:
+                best[c] = i
+        members = array('i', sorted(range(n), key=comp.__getitem__))
+        member_starts = array('i', [0] * (len(best) + 1))
+        for i in range(n):
+            member_starts[comp[i] + 1] += 1
+        for c in range(len(best)):
+            member_starts[c + 1] += member_starts[c]
+
+        # 邻接表
+        neighbors = [[] for i in range(n)]
+        for (i, j), kinds in sorted(edges.items()):
+            neighbors[i].append((j, kinds))
+            neighbors[j].append((i, kinds))
+        adj, adj_kinds, adj_starts = array('i'), array('B'), array('i', [0])
+        for lst in neighbors:
+            adj.extend(j for j, kinds in lst)
+            adj_kinds.extend(kinds for j, kinds in lst)
+            adj_starts.append(len(adj))
+        return dict(chars=''.join(chars), comp=comp, canon=''.join(chars[i] for i in best), members=members,
+                    member_starts=member_starts, adj=adj, adj_kinds=adj_kinds, adj_starts=adj_starts)
+
+    def __len__(self):
+        return len(self.chars)
+
+    def get_class(self, ch):
+        """ ch所属异体字类的编号，不在图中时返回-1"""
+        i = self.ids.get(ch)
+        return -1 if i is None else self.comp[i]
+
+    def canonical(self, ch):
+        """ ch所属异体字类的规范字，不在图中时返回ch"""
+        i = self.ids.get(ch)
+        return ch if i is None else self.canon[self.comp[i]]
+
+    def same_class(self, a, b):
+        """ a与b相同或属于同一异体字类"""
+        if a == b:
+            return True
+        i, j = self.ids.get(a), self.ids.get(b)
+        return i is not None and j is not None and self.comp[i] == self.comp[j]
+
+    def variants_of(self, ch):
+        """ 与ch同类的其他字，规范字在前，其余按加入图的先后"""
+        i = self.ids.get(ch)
+        if i is None:
+            return ''
+        c = self.comp[i]
+        canon = self.canon[c]
+        rest = [self.chars[k] for k in self.members[self.member_starts[c]:self.member_starts[c + 1]] if k != i]
+        return ''.join([canon] * (canon != ch) + [x for x in rest if x != canon])
+
+    def is_equivalent(self, a, b):
+        """ a与b同类，或a与b的类(b与a的类)之间有直接的边"""
+        if self.same_class(a, b):
+            return True
+        i, j = self.ids.get(a), self.ids.get(b)
+        if i is None or j is None:
+            return False
+        ci, cj = self.comp[i], self.comp[j]
+        adj, comp = self.adj, self.comp
+        if any(comp[k] == cj for k in adj[self.adj_starts[i]:self.adj_starts[i + 1]]):
+            return True
+        return any(comp[k] == ci for k in adj[self.adj_starts[j]:self.adj_starts[j + 1]])
+
+    def get_linked_chars(self):
+        """ 有边连至别类的字，这些字之间须以is_equivalent判断"""
+        comp, adj, starts = self.comp, self.adj, self.adj_starts
+        return {ch for i, ch in enumerate(self.chars) if any(comp[k] != comp[i] for k in adj[starts[i]:starts[i + 1]])}
+
+    def get_edges(self, ch):
+        """ ch直接相连的字及边的来源[(字, [来源])]"""
+        i = self.ids.get(ch)
+        if i is None:
+            return []
+        start, end = self.adj_starts[i], self.adj_starts[i + 1]
+        return [(self.chars[j], self.get_sources(kinds))
+                for j, kinds in zip(self.adj[start:end], self.adj_kinds[start:end])]
+
+    def get_provenance(self, a, b):
+        """ a与b之间直接的边的来源，如['py', 'type1']，无直接的边时返回[]"""
+        for ch, sources in self.get_edges(a):
+            if ch == b:
+                return sources
+        return []
+
+    @staticmethod
+    def get_sources(kinds):
+        return [name for kind, name in SOURCES if kinds & kind]
+
+    @property
+    def table(self):
+        """ 归一化转换表，供str.translate将各字替换为其规范字"""
+        if self._table is None:
+            canon, comp = self.canon, self.comp
+            self._table = {ord(ch): canon[comp[i]] for i, ch in enumerate(self.chars) if canon[comp[i]] != ch}
+        return self._table
+
+    def normalize(self, txt):
+        return txt.translate(self.table)
+
+
+def parse_graph(fn):
+    """ 编译异体字图，fn为variants.txt，另读取异体字字典1、2"""
+    with open(fn, 'r', encoding='utf-8') as rf:
+        groups = [ln.rstrip('\n') for ln in rf if ln.strip()]
+    dicts = []
+    for dict_file in [VT_DICT1_FILE, VT_DICT2_FILE]:
+        with open(dict_file, 'r') as rf:
+            dicts.append(json.load(rf))
+    return VariantGraph.build(groups, *dicts)
+
+
+_graph = None
+
+
+def get_variant_graph(check=False):
+    """ 进程内共用的异体字图，check时检查各源文件是否改动，改动后重新编译"""
+    global _graph
+    load = load_cached if check else get_cached
+    data = load(VARIANTS_FILE, parse_graph, [VT_DICT1_FILE, VT_DICT2_FILE])
+    if _graph is None or _graph.data is not data:
+        _graph = VariantGraph(data)
+    return _graph
+
+
+def reload_variant_graph():
+    """ 已加载的异体字图在源文件改动后重新编译，尚未加载时不加载"""
+    if _graph is not None:
+        get_variant_graph(True)